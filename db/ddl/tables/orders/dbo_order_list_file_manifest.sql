@@ -0,0 +1,24 @@
+-- Table: dbo.ORDER_LIST_FILE_MANIFEST
+-- Database: ORDERS
+-- Purpose: Per-workbook fingerprints for the ORDER_LIST pipeline. The blob stage skips files whose
+--          SharePoint eTag (or content hash) is unchanged; the extract stage skips files whose RAW
+--          table was already loaded from the same content; the transform re-processes a RAW table until
+--          transformed_sha256 (set after the ORDER_LIST swap) matches extracted_sha256
+--          (pipelines/scripts/load_order_list/order_list_manifest.py)
+-- Dependencies: x*_ORDER_LIST_RAW tables (raw_table)
+
+CREATE TABLE [dbo].[ORDER_LIST_FILE_MANIFEST] (
+    [file_name] NVARCHAR(255) NOT NULL,
+    [raw_table] NVARCHAR(128) NULL,
+    [sharepoint_etag] NVARCHAR(255) NULL,
+    [sharepoint_last_modified] NVARCHAR(40) NULL,
+    [content_sha256] CHAR(64) NULL,
+    [size_bytes] BIGINT NULL,
+    [uploaded_at] DATETIME2 NULL,
+    [extracted_sha256] CHAR(64) NULL,
+    [extracted_rows] INT NULL,
+    [extracted_at] DATETIME2 NULL,
+    [transformed_sha256] CHAR(64) NULL,
+    [transformed_at] DATETIME2 NULL,
+    CONSTRAINT [PK_ORDER_LIST_FILE_MANIFEST] PRIMARY KEY ([file_name])
+);
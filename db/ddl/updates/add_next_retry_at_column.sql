@@ -0,0 +1,59 @@
+-- Non-blocking retry scheduler: Add next_retry_at column to FACT_ORDER_LIST
+-- Purpose: Persist when an ERROR record is due for retry (SyncEngine.retry_failed_records)
+--          so retry passes reset due records with one UPDATE instead of sleeping per record
+-- Date: 2025-08-20
+
+USE [ORDERS];
+GO
+
+-- Check if column already exists
+IF NOT EXISTS (
+    SELECT * FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_NAME = 'FACT_ORDER_LIST'
+    AND COLUMN_NAME = 'next_retry_at'
+)
+BEGIN
+    PRINT 'Adding next_retry_at column to FACT_ORDER_LIST table...'
+
+    ALTER TABLE FACT_ORDER_LIST
+    ADD next_retry_at DATETIME2(7) NULL;
+
+    PRINT 'Successfully added next_retry_at column'
+END
+ELSE
+BEGIN
+    PRINT 'next_retry_at column already exists in FACT_ORDER_LIST table'
+END
+GO
+
+-- Create index for efficient due-retry queries
+IF NOT EXISTS (
+    SELECT * FROM sys.indexes
+    WHERE name = 'IX_FACT_ORDER_LIST_next_retry_at'
+)
+BEGIN
+    PRINT 'Creating index on next_retry_at column...'
+
+    CREATE NONCLUSTERED INDEX IX_FACT_ORDER_LIST_next_retry_at
+    ON FACT_ORDER_LIST (next_retry_at)
+    INCLUDE (api_status, retry_count)
+    WHERE api_status = 'ERROR';
+
+    PRINT 'Successfully created index IX_FACT_ORDER_LIST_next_retry_at'
+END
+ELSE
+BEGIN
+    PRINT 'Index IX_FACT_ORDER_LIST_next_retry_at already exists'
+END
+GO
+
+-- Validation query
+SELECT
+    COLUMN_NAME,
+    DATA_TYPE,
+    IS_NULLABLE
+FROM INFORMATION_SCHEMA.COLUMNS
+WHERE TABLE_NAME = 'FACT_ORDER_LIST'
+AND COLUMN_NAME = 'next_retry_at';
+
+PRINT 'Retry scheduler database schema update completed successfully'
@@ -11,12 +11,14 @@ Usage:
     python load_boards.py --board-id 9200517329
     python load_boards.py --board-id 9200517329 --generate-config-only
     python load_boards.py --board-id 9200517329 --update-registry
+    python load_boards.py --board-id 9200517329 --incremental
 
 Features:
 - JSON-based configuration (not TOML)
 - Auto-generation of missing configs with user guidance
 - Helper-based architecture using existing utils/
 - Atomic swap operations for zero-downtime
+- Incremental mode: updated_at watermark per board, MERGE + ID-harvest delete detection
 - Registry management for board tracking
 - Workflow generation for Kestra
 """
@@ -26,11 +28,13 @@ import os
 import json
 import argparse
 import time
+import re
 import requests
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
 from tqdm import tqdm as tqdm_orig
 
 # Load environment variables from .env file
@@ -196,6 +200,121 @@ def safe_string_convert(val):
     except:
         return None
 
+# ─────────────────── Vectorized Type Coercion ───────────────────
+# Column-at-a-time equivalents of safe_date_convert / safe_numeric_convert / safe_string_convert.
+# Each distinct value is converted once: the common Monday.com shapes with pandas string ops
+# and pd.to_datetime / astype, anything else through the scalar function, so outputs (values
+# and inferred dtypes) are identical to Series.apply with the scalar functions.
+
+DATE_NULL_TOKENS = ['', 'None', 'nan', 'null', 'NaT']
+STRING_NULL_TOKENS = ['None', 'nan', 'null', '']
+NUMERIC_NULL_TOKENS = ['', 'none', 'nan', 'null']  # compared lower-cased
+
+ISO_DATE_PATTERN = r'[0-9]{4}-[0-9]{2}-[0-9]{2}'
+JSON_DATE_PATTERN = r'\{"date":"(' + ISO_DATE_PATTERN + r')"(?:,"(?:icon|time|changed_at)":"[^"\\]*")*\}'
+INT_PATTERN = r'[+-]?[0-9]{1,18}'
+FLOAT_PATTERN = r'[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]{1,3})?'
+
+# Fast-path dates stay within what every pandas version parses the same way as the scalar path
+FAST_DATE_MIN_YEAR = 1753
+FAST_DATE_MAX_YEAR = 2262
+
+def _is_string_column(series: pd.Series) -> bool:
+    """True when every non-null cell is a str (object or pandas string dtype)"""
+    return pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty')
+
+def _coerce_string_column(series: pd.Series, convert_uniques, scalar_convert) -> pd.Series:
+    """
+    Convert each distinct value once, then broadcast back with the factorize codes.
+    Null cells (None/NaN) are None for every safe_*_convert. Non-string columns keep
+    the per-cell scalar path.
+    """
+    if not _is_string_column(series):
+        return series.apply(scalar_convert)
+    
+    codes, uniques = pd.factorize(series.to_numpy(dtype=object))
+    converted = convert_uniques(np.asarray(uniques, dtype=object))
+    values = np.append(converted, None)[codes]  # code -1 (null) -> trailing None
+    # Same dtype inference as Series.apply
+    return pd.Series(values.tolist(), index=series.index, name=series.name)
+
+def _apply_scalar(values: np.ndarray, original: np.ndarray, mask: np.ndarray, func) -> None:
+    """Scalar fallback for the values the fast path does not cover"""
+    for position in np.flatnonzero(mask):
+        values[position] = func(original[position])
+
+def _convert_date_uniques(uniques: np.ndarray) -> np.ndarray:
+    values = np.full(len(uniques), None, dtype=object)
+    stripped = pd.Series(uniques, dtype=object).str.strip()
+    
+    is_null = stripped.isin(DATE_NULL_TOKENS).to_numpy()
+    json_date = stripped.str.extract('^' + JSON_DATE_PATTERN + '$', expand=False)
+    is_json = json_date.notna().to_numpy()
+    is_iso_datetime = (stripped.str.match(ISO_DATE_PATTERN + 'T') & stripped.str.contains('Z', regex=False)).to_numpy()
+    is_date = stripped.str.fullmatch(ISO_DATE_PATTERN).to_numpy()
+    
+    # Same precedence as safe_date_convert: JSON, ISO datetime (date part), plain YYYY-MM-DD
+    date_text = pd.Series(np.where(is_json, json_date.to_numpy(dtype=object), stripped.str[:10].to_numpy(dtype=object)))
+    is_fast = ~is_null & (is_json | is_iso_datetime | is_date)
+    parsed = pd.to_datetime(date_text.where(is_fast), format='%Y-%m-%d', errors='coerce')
+    in_range = ((parsed.dt.year >= FAST_DATE_MIN_YEAR) & (parsed.dt.year <= FAST_DATE_MAX_YEAR)).to_numpy(dtype=bool)
+    is_parsed = is_fast & in_range
+    
+    values[is_parsed] = parsed[is_parsed].dt.date.to_numpy(dtype=object)
+    _apply_scalar(values, uniques, ~is_null & ~is_parsed, safe_date_convert)
+    return values
+
+def _convert_numeric_uniques(uniques: np.ndarray) -> np.ndarray:
+    values = np.full(len(uniques), None, dtype=object)
+    stripped = pd.Series(uniques, dtype=object).str.strip()
+    
+    is_null = stripped.str.lower().isin(NUMERIC_NULL_TOKENS).to_numpy()
+    has_dot = stripped.str.contains('.', regex=False).to_numpy()
+    is_int = ~has_dot & stripped.str.fullmatch(INT_PATTERN).to_numpy()
+    is_float = has_dot & stripped.str.fullmatch(FLOAT_PATTERN).to_numpy()
+    
+    # object -> int64/float64 goes through int()/float() per value, as the scalar path does
+    values[is_int] = stripped[is_int].astype('int64').to_numpy(dtype=object)
+    values[is_float] = stripped[is_float].astype('float64').to_numpy(dtype=object)
+    _apply_scalar(values, uniques, ~is_null & ~is_int & ~is_float, safe_numeric_convert)
+    return values
+
+def _convert_string_uniques(uniques: np.ndarray) -> np.ndarray:
+    values = np.full(len(uniques), None, dtype=object)
+    stripped = pd.Series(uniques, dtype=object).str.strip()
+    keep = ~stripped.isin(STRING_NULL_TOKENS).to_numpy()
+    values[keep] = stripped[keep].to_numpy(dtype=object)
+    return values
+
+def coerce_date_series(series: pd.Series) -> pd.Series:
+    """Vectorized safe_date_convert"""
+    return _coerce_string_column(series, _convert_date_uniques, safe_date_convert)
+
+def coerce_numeric_series(series: pd.Series) -> pd.Series:
+    """Vectorized safe_numeric_convert (numeric dtypes pass through unchanged)"""
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biuf':
+        return series.copy()
+    return _coerce_string_column(series, _convert_numeric_uniques, safe_numeric_convert)
+
+def coerce_string_series(series: pd.Series) -> pd.Series:
+    """Vectorized safe_string_convert"""
+    return _coerce_string_column(series, _convert_string_uniques, safe_string_convert)
+
+def build_coercion_plan(metadata: Dict[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """(DataFrame column, 'date'|'numeric'|'string', sql type, monday type) per included metadata column"""
+    columns_meta, _ = process_metadata_columns(metadata)
+    plan = []
+    for rule in columns_meta.values():
+        sql_type = (rule["sql"] or "").upper()
+        if "DATE" in sql_type or rule["type"] == "date":
+            kind = "date"
+        elif "DECIMAL" in sql_type or "NUMERIC" in sql_type or "INT" in sql_type or rule["type"] == "numbers":
+            kind = "numeric"
+        else:
+            kind = "string"
+        plan.append((rule["title"], kind, rule["sql"], rule["type"]))
+    return plan
+
 # ─────────────────── Environment & API Setup ───────────────────
 # Load centralized configuration (like get_board_planning.py)
 config = db.load_config()
@@ -324,7 +443,8 @@ def update_board_registry(board_id: int, metadata: Dict[str, Any], status: str =
             }
         }
     
-    # Update board entry using new metadata structure
+    # Update board entry using new metadata structure (keep the incremental watermark)
+    previous_entry = registry["boards"].get(str(board_id), {})
     registry["boards"][str(board_id)] = {
         "board_name": metadata["board_name"],
         "table_name": metadata["table_name"],
@@ -334,6 +454,8 @@ def update_board_registry(board_id: int, metadata: Dict[str, Any], status: str =
         "metadata_path": f"configs/boards/board_{board_id}_metadata.json",
         "workflow_path": f"workflows/extract_board_{board_id}.yaml"
     }
+    if "last_updated_at" in previous_entry:
+        registry["boards"][str(board_id)]["last_updated_at"] = previous_entry["last_updated_at"]
     
     registry["metadata"]["updated_at"] = datetime.now().isoformat()
     
@@ -343,6 +465,44 @@ def update_board_registry(board_id: int, metadata: Dict[str, Any], status: str =
     
     logger.info(f"SUCCESS: Updated registry for board {board_id}")
 
+def get_board_watermark(board_id: int) -> Optional[str]:
+    """Get the board's updated_at high-water mark from the registry (None = never loaded incrementally)"""
+    registry_path = get_registry_path()
+    if not registry_path.exists():
+        return None
+    
+    with open(registry_path, 'r', encoding='utf-8') as f:
+        registry = json.load(f)
+    
+    return registry.get("boards", {}).get(str(board_id), {}).get("last_updated_at")
+
+def set_board_watermark(board_id: int, updated_at: str):
+    """Store the board's updated_at high-water mark, leaving the rest of the registry entry untouched"""
+    registry_path = get_registry_path()
+    
+    if registry_path.exists():
+        with open(registry_path, 'r', encoding='utf-8') as f:
+            registry = json.load(f)
+    else:
+        registry = {
+            "boards": {},
+            "metadata": {
+                "version": "1.0",
+                "created_at": datetime.now().isoformat(),
+                "updated_at": datetime.now().isoformat()
+            }
+        }
+    
+    entry = registry["boards"].setdefault(str(board_id), {})
+    entry["last_updated_at"] = updated_at
+    entry["last_incremental_run"] = datetime.now().isoformat()
+    registry["metadata"]["updated_at"] = datetime.now().isoformat()
+    
+    with open(registry_path, 'w', encoding='utf-8') as f:
+        json.dump(registry, f, indent=2)
+    
+    logger.info(f"WATERMARK: Board {board_id} high-water mark set to {updated_at}")
+
 # ─────────────────── Monday GraphQL Requests ───────────────────
 
 def process_metadata_columns(metadata: Dict[str, Any]) -> tuple[Dict[str, Any], Dict[str, str]]:
@@ -454,17 +614,33 @@ def get_column_rule_from_metadata(column: Dict[str, Any]) -> Optional[Dict[str,
         "conversion_logic": column.get("conversion_logic")
     }
 
-def fetch_all_items(board_id: int, limit: int = 400) -> List[Dict[str, Any]]:
-    """Fetch all board items with pagination"""
+def build_updated_since_params(updated_since: str) -> str:
+    """
+    items_page query_params filtering on the board's "Last updated" attribute.
+    Monday.com compares UPDATED_AT by day, possibly in the account timezone, so the
+    query starts a day before the watermark and callers re-filter on the exact timestamp.
+    """
+    since_date = (datetime.strptime(updated_since[:10], "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
+    return (f', query_params: {{rules: [{{column_id: "__last_updated__", '
+            f'compare_value: ["EXACT", "{since_date}"], operator: greater_than_or_equals, '
+            f'compare_attribute: "UPDATED_AT"}}]}}')
+
+def fetch_all_items(board_id: int, limit: int = 400, updated_since: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Fetch all board items with pagination (only items updated since updated_since, when given)"""
     items = []
     cursor = None
     
     while True:
-        cursor_arg = f', cursor: "{cursor}"' if cursor else ''
+        if cursor:
+            page_args = f', cursor: "{cursor}"'
+        elif updated_since:
+            page_args = build_updated_since_params(updated_since)
+        else:
+            page_args = ''
         query = f'''
         query {{
             boards(ids: {board_id}) {{
-                items_page(limit: {limit}{cursor_arg}) {{
+                items_page(limit: {limit}{page_args}) {{
                     cursor
                     items {{
                         id
@@ -505,8 +681,47 @@ def fetch_all_items(board_id: int, limit: int = 400) -> List[Dict[str, Any]]:
             
         time.sleep(0.1)  # Rate limiting
     
+    if updated_since:
+        items = [item for item in items if item["updated_at"] >= updated_since]
+        logger.info(f"FETCH: {len(items)} items updated since {updated_since}")
+    
     return items
 
+def fetch_all_item_ids(board_id: int, limit: int = 500) -> List[int]:
+    """Cheap ID-only harvest of every item on the board (used for delete detection)"""
+    item_ids = []
+    cursor = None
+    
+    while True:
+        cursor_arg = f', cursor: "{cursor}"' if cursor else ''
+        query = f'''
+        query {{
+            boards(ids: {board_id}) {{
+                items_page(limit: {limit}{cursor_arg}) {{
+                    cursor
+                    items {{ id }}
+                }}
+            }}
+        }}
+        '''
+        
+        data = gql_request(query)
+        page = data["boards"][0]["items_page"]
+        batch = page["items"]
+        
+        item_ids.extend(int(item["id"]) for item in batch)
+        cursor = page.get("cursor")
+        
+        if not cursor or not batch:
+            break
+    
+    logger.info(f"HARVEST: {len(item_ids)} item IDs on board {board_id}")
+    return item_ids
+
+def get_max_updated_at(items: List[Dict[str, Any]]) -> Optional[str]:
+    """Highest updated_at among fetched items (Monday.com ISO-8601 UTC strings sort chronologically)"""
+    return max((item["updated_at"] for item in items if item.get("updated_at")), default=None)
+
 # ─────────────────── Data Processing & ETL ───────────────────
 
 def extract_column_value(column_value: Dict[str, Any], column_meta: Dict[str, Any]) -> Any:
@@ -569,75 +784,28 @@ def clean_dataframe(df: pd.DataFrame, metadata: Dict[str, Any] = None) -> pd.Dat
     
     logger.info("PROCESS: Applying data conversions...")
     
-    # Apply metadata-driven conversions if available
+    # Apply metadata-driven conversions if available (type plan from process_metadata_columns)
     if metadata and "columns" in metadata:
-        # Process conversions using successful pattern from get_board_planning.py
-        for col_info in metadata["columns"]:
-            if col_info.get("exclude", False):
-                continue
-                
-            # CRITICAL FIX: Use monday_title (DataFrame column name), not sql_column
-            monday_title = col_info.get("monday_title", "")
-            sql_type = col_info.get("custom_sql_type") or col_info.get("sql_type", "")
-            monday_type = col_info.get("monday_type", "")
-            
+        for monday_title, kind, sql_type, monday_type in build_coercion_plan(metadata):
             if monday_title not in df.columns:
                 continue
             
-            # Apply conversions based on type - following successful get_board_planning.py pattern
-            if "DATE" in sql_type.upper() or monday_type == "date":
+            if kind == "date":
                 logger.info(f"CONVERT: Converting date column '{monday_title}' from strings to datetime.date objects")
                 original_count = df[monday_title].notna().sum()
-                df[monday_title] = df[monday_title].apply(safe_date_convert)
+                df[monday_title] = coerce_date_series(df[monday_title])
                 converted_count = df[monday_title].notna().sum()
                 null_count = df[monday_title].isna().sum()
                 logger.info(f"    {monday_title}: {original_count} -> {converted_count} valid dates, {null_count} nulls")
                 
-            elif ("DECIMAL" in sql_type.upper() or "NUMERIC" in sql_type.upper() or 
-                  "INT" in sql_type.upper() or monday_type == "numbers"):
+            elif kind == "numeric":
                 logger.info(f"CONVERT: Converting numeric column '{monday_title}' (type: {sql_type}, monday_type: {monday_type})")
                 
-                # Use proven approach from get_board_planning.py - define function in scope
-                def safe_numeric_convert_scoped(val):
-                    # Handle NumPy NaN specifically
-                    if pd.isna(val) or val is None:
-                        return None
-                    # Handle numpy nan explicitly  
-                    if hasattr(val, 'dtype') and pd.isna(val):
-                        return None
-                    # Handle string representations
-                    if isinstance(val, str):
-                        clean_val = val.strip()
-                        if clean_val == '' or clean_val.lower() in ['none', 'nan', 'null']:
-                            return None
-                        try:
-                            # Try integer first, then float
-                            if '.' not in clean_val:
-                                return int(clean_val)
-                            else:
-                                return float(clean_val)
-                        except:
-                            return None
-                    # Handle numeric types
-                    try:
-                        if hasattr(val, 'dtype'):
-                            # Handle numpy types with NaN check
-                            if 'int' in str(val.dtype) and not pd.isna(val):
-                                return int(val)
-                            elif 'float' in str(val.dtype) and not pd.isna(val):
-                                return float(val)
-                            else:
-                                return None
-                        return val
-                    except:
-                        return None
-                
                 original_count = df[monday_title].notna().sum()
                 sample_values_before = [str(x) for x in df[monday_title].head(3).tolist()]
                 logger.info(f"    BEFORE: {monday_title} sample values: {sample_values_before}")
                 
-                # Apply conversion using proven pattern
-                df[monday_title] = df[monday_title].apply(safe_numeric_convert_scoped)
+                df[monday_title] = coerce_numeric_series(df[monday_title])
                 
                 converted_count = df[monday_title].notna().sum()
                 sample_values_after = [str(x) for x in df[monday_title].head(3).tolist()]
@@ -646,7 +814,7 @@ def clean_dataframe(df: pd.DataFrame, metadata: Dict[str, Any] = None) -> pd.Dat
                 logger.info(f"    AFTER: {monday_title} dtype: {df[monday_title].dtype}")
                 
             else:
-                df[monday_title] = df[monday_title].apply(safe_string_convert)
+                df[monday_title] = coerce_string_series(df[monday_title])
     
     else:
         # Fallback: Apply basic conversions
@@ -656,7 +824,7 @@ def clean_dataframe(df: pd.DataFrame, metadata: Dict[str, Any] = None) -> pd.Dat
         date_cols = [c for c in df.columns if "DATE" in c.upper() or c in ["UpdateDate"]]
         for col in date_cols:
             if col in df.columns:
-                df[col] = df[col].apply(safe_date_convert)
+                df[col] = coerce_date_series(df[col])
         
         # Try numeric conversion for object columns (excluding known text columns)
         text_cols = ["Group", "Name", "Item"]
@@ -667,9 +835,9 @@ def clean_dataframe(df: pd.DataFrame, metadata: Dict[str, Any] = None) -> pd.Dat
                 # Test if column is numeric
                 numeric_test = pd.to_numeric(df[col], errors='coerce')
                 if not numeric_test.isna().all():
-                    df[col] = df[col].apply(safe_numeric_convert)
+                    df[col] = coerce_numeric_series(df[col])
                 else:
-                    df[col] = df[col].apply(safe_string_convert)
+                    df[col] = coerce_string_series(df[col])
     
     # Final cleanup: Convert NaN to None for SQL Server
     df = df.where(pd.notna(df), None)
@@ -724,8 +892,73 @@ def atomic_swap_tables(metadata: dict):
     staging_helper.atomic_swap_tables(f"swp_{metadata['table_name']}", 
                                      metadata['table_name'], metadata['database'])
 
-def execute_etl_pipeline(board_id: int, metadata: Dict[str, Any]):
+def upsert_staging_table(metadata: dict) -> int:
+    """MERGE staging into the production table on Item ID"""
+    return staging_helper.upsert_into_production(f"swp_{metadata['table_name']}", metadata['table_name'],
+                                                 metadata['database'], ["Item ID"])
+
+def execute_incremental_pipeline(board_id: int, metadata: Dict[str, Any], watermark: str):
+    """Load only items changed since the watermark, MERGE them and remove deleted items"""
+    logger.info(f"START: Starting incremental ETL for board {board_id} (updated since {watermark})")
+    
+    table_name = metadata["table_name"]
+    db_name = metadata["database"]
+    
+    start_time = time.time()
+    
+    # 1. Load schema from metadata file
+    logger.info("SCHEMA: 1/5 Loading board schema from metadata...")
+    item_terminology, columns_meta = fetch_board_schema_from_metadata(board_id)
+    
+    # 2. Fetch changed items + ID-only harvest for delete detection
+    logger.info("FETCH 2/5 Fetching changed items and live item IDs...")
+    items = fetch_all_items(board_id, updated_since=watermark)
+    live_item_ids = fetch_all_item_ids(board_id)
+    
+    if items:
+        # 3. Build and clean DataFrame
+        logger.info("PROCESS 3/5 Processing changed data...")
+        df = build_dataframe(items, columns_meta, item_terminology)
+        df = staging_helper.apply_column_duplications(df, metadata)
+        df = clean_dataframe(df, metadata)
+        df = make_sql_safe(df)
+        
+        # 4. Stage changed rows
+        logger.info("STAGING 4/5 Preparing staging table...")
+        prepare_staging_table(df, metadata)
+        load_to_staging_table(df, metadata)
+        
+        # 5. MERGE into production
+        logger.info("SAVE 5/5 Merging changed rows...")
+        try:
+            upsert_staging_table(metadata)
+        except ValueError as e:
+            logger.warning(f"INCREMENTAL: {e} - falling back to full reload")
+            execute_etl_pipeline(board_id, metadata)
+            set_board_watermark(board_id, get_max_updated_at(items))
+            return
+    else:
+        logger.info("SKIP 3-5/5 No items changed since watermark")
+    
+    deleted = staging_helper.delete_missing_rows(table_name, db_name, "Item ID", live_item_ids)
+    
+    elapsed_time = time.time() - start_time
+    logger.info(f"SUCCESS Incremental ETL Complete: {len(items)} changed rows merged, {deleted} deleted "
+                f"in {db_name}.{table_name} ({len(live_item_ids)} items on board)")
+    logger.info(f"TIME Total time: {elapsed_time:.2f}s")
+    
+    set_board_watermark(board_id, get_max_updated_at(items) or watermark)
+    update_board_registry(board_id, metadata, "active")
+
+def execute_etl_pipeline(board_id: int, metadata: Dict[str, Any], incremental: bool = False):
     """Execute the complete ETL pipeline using single metadata file"""
+    if incremental:
+        watermark = get_board_watermark(board_id)
+        if watermark and staging_helper.get_table_columns(metadata["table_name"], metadata["database"]):
+            execute_incremental_pipeline(board_id, metadata, watermark)
+            return
+        logger.info(f"INCREMENTAL: No watermark or table for board {board_id} - running full load first")
+    
     logger.info(f"START: Starting ETL pipeline for board {board_id}")
     
     # Get configuration from metadata structure
@@ -769,6 +1002,10 @@ def execute_etl_pipeline(board_id: int, metadata: Dict[str, Any]):
     logger.info(f"SUCCESS ETL Complete: {len(df)} rows loaded to {db_name}.{table_name}")
     logger.info(f"TIME Total time: {elapsed_time:.2f}s ({rows_per_sec:.0f} rows/sec)")
     
+    # Record the high-water mark so the next --incremental run only fetches changes
+    if incremental and items:
+        set_board_watermark(board_id, get_max_updated_at(items))
+    
     # Update registry
     update_board_registry(board_id, metadata, "active")
 
@@ -783,6 +1020,7 @@ Examples:
   python load_boards.py --board-id 9200517329
   python load_boards.py --board-id 9200517329 --generate-config-only
   python load_boards.py --board-id 9200517329 --update-registry
+  python load_boards.py --board-id 9200517329 --incremental
         """
     )
     
@@ -791,6 +1029,8 @@ Examples:
                        help='Only generate config template, do not run ETL')
     parser.add_argument('--update-registry', action='store_true',
                        help='Update registry after manual config changes')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only load items changed since the registry watermark (MERGE + delete detection)')
     
     args = parser.parse_args()
     
@@ -811,7 +1051,7 @@ Examples:
             return
         
         # Execute ETL pipeline
-        execute_etl_pipeline(args.board_id, board_config)
+        execute_etl_pipeline(args.board_id, board_config, incremental=args.incremental)
         
         logger.info("COMPLETE: Board loading complete!")
         
@@ -4,8 +4,11 @@ Async Batch Monday.com Board Loader
 ===================================
 
 High-performance async loader for large Monday.com boards using two-phase extraction:
-1. Sequential cursor-based ID harvest (items_page/next_items_page)
-2. Fully async batch detail fetch (items(ids: [...]))
+1. Cursor-based ID harvest (items_page/next_items_page), one concurrent chain per group
+   (--sequential-harvest for a single board-wide chain); detail fetching starts on the
+   first harvested IDs
+2. Fully async batch detail fetch (items(ids: [...])), streamed batch-by-batch
+   through a bounded queue into the swp_ staging table, then an atomic swap
 
 Usage:
     python load_boards_async.py --board-id 9200517329
@@ -28,7 +31,7 @@ import asyncio
 import aiohttp
 import argparse
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 
@@ -67,6 +70,7 @@ import staging_helper
 # Import Monday.com configuration system
 sys.path.insert(0, str(repo_root / "src"))
 from pipelines.utils.monday_config import MondayConfig
+from pipelines.utils.monday_rate_limiter import get_shared_rate_limiter, with_complexity
 
 # Set staging mode for Monday.com boards (dirty data requires robust handling)
 staging_helper.set_staging_mode('robust')
@@ -74,6 +78,7 @@ staging_helper.set_staging_mode('robust')
 # Load configuration from centralized config
 config = db.load_config()
 monday_config = MondayConfig()
+rate_limiter = get_shared_rate_limiter(monday_config)
 
 logger = logger.get_logger("load_boards_async")
 
@@ -128,36 +133,30 @@ async def gql_request(session: aiohttp.ClientSession, query: str, variables: Dic
     if timeout is None:
         timeout = monday_config.get_timeout()
     
-    payload = {"query": query}
+    payload = {"query": with_complexity(query)}
     if variables:
         payload["variables"] = variables
     
     for attempt in range(max_retries):
         try:
-            async with session.post(API_URL, json=payload, headers=HEADERS, 
+            async with rate_limiter.slot(), session.post(API_URL, json=payload, headers=HEADERS, 
                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
                 if response.status == 200:
                     data = await response.json()
+                    rate_limited = rate_limiter.observe(data, status=response.status, headers=response.headers)
                     if "errors" in data:
-                        # Check for Monday.com rate limit errors
-                        if monday_config.is_rate_limit_error(data):
-                            retry_delay = monday_config.get_retry_delay(data)
-                            logger.warning(f"MONDAY RATE LIMIT: retry_in_seconds={retry_delay:.1f}s (attempt {attempt + 1}/{max_retries})")
-                            await asyncio.sleep(retry_delay)
+                        # Check for Monday.com rate limit errors - the limiter waits out the reset
+                        if rate_limited or monday_config.is_rate_limit_error(data):
+                            logger.warning(f"MONDAY RATE LIMIT: waiting for budget reset (attempt {attempt + 1}/{max_retries})")
                             continue
                         else:
                             logger.error(f"GraphQL errors: {data['errors']}")
                             raise Exception(f"GraphQL errors: {data['errors']}")
                     return data["data"]
                 elif response.status == 429:
-                    # HTTP 429 Rate limit - use exponential backoff
-                    retry_settings = monday_config.get_retry_settings()
-                    wait_time = min(
-                        retry_settings.base_delay * (retry_settings.exponential_multiplier ** attempt),
-                        retry_settings.max_delay
-                    )
-                    logger.warning(f"HTTP 429: Rate limit hit, waiting {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(wait_time)
+                    # HTTP 429 Rate limit - limiter pauses all requests (Retry-After) and lowers concurrency
+                    rate_limiter.observe(None, status=response.status, headers=response.headers)
+                    logger.warning(f"HTTP 429: Rate limit hit, concurrency now {rate_limiter.concurrency} (attempt {attempt + 1}/{max_retries})")
                 elif response.status >= 500:
                     # Server error - shorter retry delay
                     wait_time = 1 + attempt
@@ -180,20 +179,35 @@ async def gql_request(session: aiohttp.ClientSession, query: str, variables: Dic
             logger.warning(f"RETRY: Attempt {attempt + 1}/{max_retries} failed: {e}, waiting {wait_time}s")
             await asyncio.sleep(wait_time)
 
-# ─────────────────── Phase 1: Sequential ID Harvest ───────────────────
+# ─────────────────── Phase 1: ID Harvest ───────────────────
 
 async def fetch_cursor_page(session: aiohttp.ClientSession, board_id: int, 
-                           cursor: Optional[str] = None, limit: int = 200) -> Tuple[Optional[str], List[int]]:
-    """Fetch a single page of item IDs using cursor pagination"""
+                           cursor: Optional[str] = None, limit: int = 200,
+                           updated_since: Optional[str] = None,
+                           group_id: Optional[str] = None) -> Tuple[Optional[str], List[int]]:
+    """Fetch a single page of item IDs using cursor pagination (the cursor carries the first page's filter)"""
     if cursor is None:
-        # First page
-        query = f"""
-        query {{
-          boards(ids: {board_id}) {{
-            items_page(limit: {limit}) {{
+        # First page - optionally only items updated since the watermark (day granularity,
+        # possibly in the account timezone: start a day early so no updated item is missed)
+        query_params = ''
+        if updated_since:
+            since_date = (datetime.strptime(updated_since[:10], "%Y-%m-%d") - timedelta(days=1)).strftime("%Y-%m-%d")
+            query_params = (f', query_params: {{rules: [{{column_id: "__last_updated__", '
+                            f'compare_value: ["EXACT", "{since_date}"], '
+                            f'operator: greater_than_or_equals, compare_attribute: "UPDATED_AT"}}]}}')
+        items_page = f"""
+            items_page(limit: {limit}{query_params}) {{
               cursor
               items {{ id }}
-            }}
+            }}"""
+        if group_id:
+            # Independent cursor chain per group
+            items_page = f"""
+            groups(ids: ["{group_id}"]) {{{items_page}
+            }}"""
+        query = f"""
+        query {{
+          boards(ids: {board_id}) {{{items_page}
           }}
         }}
         """
@@ -210,7 +224,12 @@ async def fetch_cursor_page(session: aiohttp.ClientSession, board_id: int,
     
     data = await gql_request(session, query)
     
-    if cursor is None:
+    if cursor is None and group_id:
+        groups = data["boards"][0]["groups"]
+        if not groups:
+            return None, []
+        page = groups[0]["items_page"]
+    elif cursor is None:
         page = data["boards"][0]["items_page"]
     else:
         page = data["next_items_page"]
@@ -221,8 +240,8 @@ async def fetch_cursor_page(session: aiohttp.ClientSession, board_id: int,
     return next_cursor, item_ids
 
 async def harvest_all_item_ids(session: aiohttp.ClientSession, board_id: int, 
-                              page_limit: int = 500) -> List[int]:
-    """Phase 1: Sequential harvest of all item IDs using cursor pagination"""
+                              page_limit: int = 500, updated_since: Optional[str] = None) -> List[int]:
+    """Phase 1: Sequential harvest of all item IDs (or only those updated since a watermark) using cursor pagination"""
     logger.info(f"HARVEST: Starting sequential ID harvest for board {board_id}")
     
     all_ids = []
@@ -231,7 +250,7 @@ async def harvest_all_item_ids(session: aiohttp.ClientSession, board_id: int,
     
     while True:
         try:
-            cursor, batch_ids = await fetch_cursor_page(session, board_id, cursor, page_limit)
+            cursor, batch_ids = await fetch_cursor_page(session, board_id, cursor, page_limit, updated_since)
             page_count += 1
             
             if batch_ids:
@@ -250,6 +269,65 @@ async def harvest_all_item_ids(session: aiohttp.ClientSession, board_id: int,
     logger.info(f"HARVEST: Complete - {len(all_ids)} total IDs collected in {page_count} pages")
     return all_ids
 
+async def fetch_board_group_ids(session: aiohttp.ClientSession, board_id: int) -> List[str]:
+    """Fetch the board's group IDs (one harvest cursor chain per group)"""
+    query = f"""
+    query {{
+      boards(ids: {board_id}) {{
+        groups {{ id }}
+      }}
+    }}
+    """
+    data = await gql_request(session, query)
+    return [group["id"] for group in data["boards"][0]["groups"]]
+
+async def harvest_item_ids_by_group(session: aiohttp.ClientSession, board_id: int, page_limit: int = 500,
+                                    updated_since: Optional[str] = None,
+                                    id_queue: Optional[asyncio.Queue] = None) -> List[int]:
+    """
+    Phase 1 (parallel): Walk one items_page cursor chain per group concurrently.
+    
+    Requests go through gql_request, so the shared rate limiter bounds the overall
+    concurrency. IDs are deduped (items moved between groups mid-harvest) and, when
+    id_queue is given, pushed page-by-page so detail fetching can start right away;
+    a final None marks the end of the harvest.
+    """
+    seen_ids = set()
+    all_ids = []
+    page_count = 0
+    chains = []
+    
+    async def walk_group(group_id):
+        nonlocal page_count
+        cursor = None
+        while True:
+            cursor, batch_ids = await fetch_cursor_page(session, board_id, cursor, page_limit,
+                                                        updated_since, group_id)
+            page_count += 1
+            new_ids = [item_id for item_id in batch_ids if item_id not in seen_ids]
+            seen_ids.update(new_ids)
+            all_ids.extend(new_ids)
+            if new_ids and id_queue is not None:
+                await id_queue.put(new_ids)
+            if not cursor or not batch_ids:
+                break
+    
+    try:
+        group_ids = await fetch_board_group_ids(session, board_id)
+        logger.info(f"HARVEST: Starting parallel ID harvest for board {board_id} across {len(group_ids)} groups")
+        chains = [asyncio.create_task(walk_group(group_id)) for group_id in group_ids]
+        await asyncio.gather(*chains)
+    finally:
+        # A failed chain stops the others, so nothing is queued after the end marker
+        for chain in chains:
+            chain.cancel()
+        if id_queue is not None:
+            await id_queue.put(None)
+    
+    logger.info(f"HARVEST: Complete - {len(all_ids)} unique IDs collected in {page_count} pages "
+                f"from {len(group_ids)} groups")
+    return all_ids
+
 # ─────────────────── Phase 2: Async Batch Detail Fetch ───────────────────
 
 async def fetch_details_batch(session: aiohttp.ClientSession, item_ids: List[int]) -> List[Dict[str, Any]]:
@@ -407,6 +485,151 @@ def process_items_to_dataframe(items: List[Dict[str, Any]], metadata: Dict[str,
     
     return df
 
+# ─────────────────── Phase 3: Streaming Staging Load ───────────────────
+
+# Item columns added by process_items_to_dataframe ahead of the metadata columns
+STAGING_ITEM_COLUMNS = {
+    "item_id": "BIGINT",
+    "item_name": "NVARCHAR(MAX)",
+    "updated_at": "NVARCHAR(50)",
+    "group_id": "NVARCHAR(100)",
+    "group_title": "NVARCHAR(255)"
+}
+
+def get_staging_column_types(metadata: Dict[str, Any]) -> Dict[str, str]:
+    """Staging schema from metadata, so the table exists before the first batch arrives"""
+    column_types = dict(STAGING_ITEM_COLUMNS)
+    for col in metadata.get("columns", []):
+        if not col.get("exclude", False):
+            column_types[col["monday_title"]] = col.get("custom_sql_type") or col.get("sql_type") or "NVARCHAR(MAX)"
+    return column_types
+
+def coerce_batch_types(df: pd.DataFrame, column_types: Dict[str, str]) -> pd.DataFrame:
+    """Align a batch DataFrame to the staging columns and convert date/numeric text (invalid -> NULL)"""
+    df = df.reindex(columns=list(column_types))
+    for col, sql_type in column_types.items():
+        sql_type = sql_type.upper()
+        if sql_type.startswith("DATE"):
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+        elif sql_type.startswith(("DECIMAL", "NUMERIC", "FLOAT", "REAL")) or "INT" in sql_type:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+async def iter_id_batches(item_ids, batch_size: int):
+    """Yield detail-fetch batches from a list of IDs, or from an asyncio.Queue of ID lists ending with None"""
+    if not isinstance(item_ids, asyncio.Queue):
+        for i in range(0, len(item_ids), batch_size):
+            yield item_ids[i:i + batch_size]
+        return
+    
+    pending = []
+    while True:
+        ids = await item_ids.get()
+        if ids is None:
+            break
+        pending.extend(ids)
+        while len(pending) >= batch_size:
+            yield pending[:batch_size]
+            pending = pending[batch_size:]
+    if pending:
+        yield pending
+
+async def stream_items_to_staging(session: aiohttp.ClientSession, item_ids, metadata: Dict[str, Any],
+                                  staging_table: str, database: str, batch_size: int = 150,
+                                  max_concurrency: int = 5, queue_size: int = None) -> Dict[str, Any]:
+    """
+    Phase 2+3: Fetch detail batches concurrently and stream their rows into the staging table.
+    
+    Each batch is converted to rows as soon as it arrives and handed to a single
+    fast_executemany writer through a bounded queue. Fetchers block on a full queue while
+    holding their concurrency slot, so at most max_concurrency + queue_size batches are in
+    memory regardless of board size, and inserts overlap with the remaining fetches.
+    item_ids may be an asyncio.Queue fed by a running harvest (see harvest_item_ids_by_group).
+    """
+    column_types = get_staging_column_types(metadata)
+    columns = list(column_types)
+    staging_helper.prepare_staging_table(pd.DataFrame(columns=columns), staging_table, metadata["table_name"],
+                                         database, column_type_map=column_types)
+    insert_sql = staging_helper.build_insert_sql(staging_table, columns)
+    
+    queue = asyncio.Queue(maxsize=queue_size or max_concurrency * 2)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    stats = {"ids_received": 0, "items_fetched": 0, "rows_written": 0, "failed_batches": 0, "failed_items": 0,
+             "max_queue_depth": 0, "write_time_seconds": 0.0, "first_batch_seconds": None}
+    write_errors = []
+    
+    logger.info(f"STREAM: Detail batches of {batch_size} -> {database}.{staging_table} "
+                f"(concurrency {max_concurrency}, queue {queue.maxsize})")
+    
+    conn = db.get_connection(database)
+    cursor = conn.cursor()
+    cursor.fast_executemany = True
+    
+    async def writer():
+        while True:
+            rows = await queue.get()
+            if rows is None:
+                break
+            if write_errors:
+                continue  # keep draining so fetchers never block on a dead writer
+            write_start = time.time()
+            try:
+                await asyncio.to_thread(cursor.executemany, insert_sql, rows)
+                stats["rows_written"] += len(rows)
+            except Exception as e:
+                logger.error(f"STREAM: Insert of {len(rows)} rows failed: {e}")
+                write_errors.append(e)
+            stats["write_time_seconds"] += time.time() - write_start
+    
+    async def fetch_and_enqueue(batch_ids, batch_num):
+        async with semaphore:
+            try:
+                items = await fetch_details_batch(session, batch_ids)
+            except Exception as e:
+                logger.error(f"FETCH: Batch {batch_num} failed - {e}")
+                stats["failed_batches"] += 1
+                stats["failed_items"] += len(batch_ids)
+                return
+            
+            stats["items_fetched"] += len(items)
+            if len(items) < len(batch_ids):
+                stats["failed_items"] += len(batch_ids) - len(items)
+                logger.warning(f"FETCH: Batch {batch_num} partial success - {len(items)}/{len(batch_ids)} items")
+            if not items:
+                return
+            
+            df = coerce_batch_types(process_items_to_dataframe(items, metadata), column_types)
+            await queue.put(staging_helper.dataframe_to_rows(df))
+            stats["max_queue_depth"] = max(stats["max_queue_depth"], queue.qsize())
+    
+    start_time = time.time()
+    writer_task = asyncio.create_task(writer())
+    fetch_tasks = []
+    try:
+        async for batch in iter_id_batches(item_ids, batch_size):
+            if not fetch_tasks:
+                stats["first_batch_seconds"] = time.time() - start_time
+            stats["ids_received"] += len(batch)
+            fetch_tasks.append(asyncio.create_task(fetch_and_enqueue(batch, len(fetch_tasks) + 1)))
+        await asyncio.gather(*fetch_tasks)
+    finally:
+        await queue.put(None)
+        await writer_task
+    
+    try:
+        if write_errors:
+            conn.rollback()
+            raise write_errors[0]
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+    
+    stats["stream_time_seconds"] = time.time() - start_time
+    logger.info(f"STREAM: Complete - {stats['rows_written']} rows written in {stats['stream_time_seconds']:.2f}s "
+                f"(insert {stats['write_time_seconds']:.2f}s, max queue depth {stats['max_queue_depth']})")
+    return stats
+
 # ─────────────────── Database Validation ───────────────────
 
 def validate_database_records(table_name: str, database: str = None) -> int:
@@ -478,7 +701,8 @@ def update_registry(board_id: int, metadata: Dict[str, Any], performance_stats:
 # ─────────────────── Main ETL Pipeline ───────────────────
 
 async def execute_async_etl_pipeline(board_id: int, batch_size: int = None, 
-                                   max_concurrency: int = None, harvest_only: bool = False):
+                                   max_concurrency: int = None, harvest_only: bool = False,
+                                   parallel_harvest: bool = True):
     """Execute the complete async ETL pipeline"""
     logger.info(f"START: Async ETL pipeline for board {board_id}")
     
@@ -504,22 +728,49 @@ async def execute_async_etl_pipeline(board_id: int, batch_size: int = None,
     total_start_time = time.time()
     
     async with aiohttp.ClientSession() as session:
-        # Phase 1: Sequential ID harvest
+        stage_table = f"swp_{table_name}"
         harvest_start = time.time()
-        item_ids = await harvest_all_item_ids(session, board_id)
-        harvest_time = time.time() - harvest_start
-        
-        logger.info(f"HARVEST: {len(item_ids)} total IDs collected in {harvest_time:.2f}s")
         
         if harvest_only:
-            logger.info(f"HARVEST_ONLY: Complete - {len(item_ids)} IDs collected")
+            if parallel_harvest:
+                item_ids = await harvest_item_ids_by_group(session, board_id)
+            else:
+                item_ids = await harvest_all_item_ids(session, board_id)
+            logger.info(f"HARVEST_ONLY: Complete - {len(item_ids)} IDs collected in {time.time() - harvest_start:.2f}s")
             return
         
-        # Phase 2: Async detail fetch
-        items = await fetch_all_details_async(session, item_ids, batch_size, max_concurrency)
+        if parallel_harvest:
+            # Phase 1 per-group cursor chains feed Phase 2+3 while the harvest is still running
+            id_queue = asyncio.Queue()
+            
+            async def timed_harvest():
+                harvested_ids = await harvest_item_ids_by_group(session, board_id, id_queue=id_queue)
+                return harvested_ids, time.time() - harvest_start
+            
+            harvest_task = asyncio.create_task(timed_harvest())
+            try:
+                stream_stats = await stream_items_to_staging(session, id_queue, metadata, stage_table, database,
+                                                             batch_size, max_concurrency)
+            except BaseException:
+                # A failed stream must not leave the harvest running (or its exception unretrieved)
+                harvest_task.cancel()
+                await asyncio.gather(harvest_task, return_exceptions=True)
+                raise
+            item_ids, harvest_time = await harvest_task
+            logger.info(f"HARVEST: {len(item_ids)} total IDs collected in {harvest_time:.2f}s "
+                        f"(first detail batch after {stream_stats['first_batch_seconds'] or 0:.2f}s)")
+        else:
+            # Phase 1: Sequential ID harvest
+            item_ids = await harvest_all_item_ids(session, board_id)
+            harvest_time = time.time() - harvest_start
+            logger.info(f"HARVEST: {len(item_ids)} total IDs collected in {harvest_time:.2f}s")
+            
+            # Phase 2+3: Async detail fetch streamed into the staging table
+            stream_stats = await stream_items_to_staging(session, item_ids, metadata, stage_table, database,
+                                                         batch_size, max_concurrency)
         
         # Calculate success rate
-        items_fetched = len(items)
+        items_fetched = stream_stats["items_fetched"]
         total_ids = len(item_ids)
         success_rate = (items_fetched / total_ids * 100) if total_ids > 0 else 0
         failed_items = total_ids - items_fetched
@@ -528,29 +779,24 @@ async def execute_async_etl_pipeline(board_id: int, batch_size: int = None,
         if failed_items > 0:
             logger.warning(f"FETCH_SUMMARY: {failed_items} items failed to fetch")
         
-        # Phase 3: Data processing
-        df = process_items_to_dataframe(items, metadata)
-        
-        # Phase 4: Database operations (reuse from load_boards.py patterns)
-        logger.info(f"DATABASE: Preparing staging table for '{table_name}'...")
-        # TODO: Integrate staging table creation and atomic swap
-        # staging_helper.prepare_staging_table(df, f"swp_{table_name}", ...)
-        # staging_helper.load_to_staging_table(df, ...)
-        # staging_helper.atomic_swap_tables(...)
-        
         total_time = time.time() - total_start_time
         
         # Performance stats
         performance_stats = {
             "total_ids_harvested": total_ids,
             "total_items_fetched": items_fetched,
+            "rows_written": stream_stats["rows_written"],
             "success_rate_percent": success_rate,
             "failed_items": failed_items,
             "harvest_time_seconds": harvest_time,
+            "stream_time_seconds": stream_stats["stream_time_seconds"],
+            "write_time_seconds": stream_stats["write_time_seconds"],
+            "max_queue_depth": stream_stats["max_queue_depth"],
             "total_time_seconds": total_time,
             "items_per_second": items_fetched / total_time if total_time > 0 else 0,
             "batch_size": batch_size,
-            "max_concurrency": max_concurrency
+            "max_concurrency": max_concurrency,
+            "rate_limiter": rate_limiter.get_stats()
         }
         
         # Determine overall result
@@ -564,8 +810,13 @@ async def execute_async_etl_pipeline(board_id: int, batch_size: int = None,
         logger.info(f"PERFORMANCE: {performance_stats['items_per_second']:.0f} items/sec")
         logger.info(f"RESULT: {result_status} - {items_fetched}/{total_ids} items processed ({success_rate:.1f}%) in {total_time:.2f}s")
         
-        # Database validation (if database operations were completed)
-        # For now, just validate if table exists and show count
+        # Phase 4: Atomic swap (staging preserved for debugging when too many items failed)
+        if result_status == "FAILURE":
+            logger.error(f"DATABASE: Skipping swap - {stage_table} kept, '{table_name}' unchanged")
+        else:
+            staging_helper.atomic_swap_tables(stage_table, table_name, database)
+        
+        # Database validation
         try:
             db_count = validate_database_records(table_name, database)
             if db_count >= 0:
@@ -591,6 +842,7 @@ Examples:
   python load_boards_async.py --board-id 9200517329
   python load_boards_async.py --board-id 9200517329 --batch-size 25 --concurrency 8
   python load_boards_async.py --board-id 9200517329 --harvest-only
+  python load_boards_async.py --board-id 9200517329 --sequential-harvest
         """
     )
     
@@ -601,6 +853,8 @@ Examples:
                        help='Max concurrent detail fetch requests (default: from config)')
     parser.add_argument('--harvest-only', action='store_true',
                        help='Only harvest item IDs, skip detail fetch and database operations')
+    parser.add_argument('--sequential-harvest', action='store_true',
+                       help='Harvest IDs with one board-wide cursor chain instead of one chain per group')
     
     args = parser.parse_args()
     
@@ -642,7 +896,8 @@ Examples:
             args.board_id, 
             batch_size, 
             concurrency, 
-            args.harvest_only
+            args.harvest_only,
+            not args.sequential_harvest
         ))
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
@@ -4,6 +4,7 @@ Orchestrates the complete customer batch processing pipeline
 """
 
 import pandas as pd
+import asyncio
 import json
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple, Any
@@ -11,6 +12,7 @@ import logging
 import warnings
 import sys
 import os
+from pathlib import Path
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -19,6 +21,13 @@ from .staging_operations import StagingOperations
 from .monday_api_client import MondayApiClient
 from .error_handler import ErrorHandler
 from .staging_config import get_config
+from utils import db_helper
+
+# Shared Monday.com rate limiter lives in src/pipelines/utils
+repo_root = Path(__file__).resolve().parents[3]
+if str(repo_root / "src") not in sys.path:
+    sys.path.insert(0, str(repo_root / "src"))
+from pipelines.utils.monday_rate_limiter import get_shared_rate_limiter, RATE_LIMIT_ERROR_CODES
 
 # Suppress pandas warnings
 warnings.filterwarnings("ignore", message="pandas only supports SQLAlchemy")
@@ -46,6 +55,7 @@ class BatchProcessor:
         # Initialize components with config key (not connection string)
         self.staging_ops = StagingOperations(db_key)
         self.monday_client = MondayApiClient()
+        self.rate_limiter = get_shared_rate_limiter()
         self.error_handler = ErrorHandler(db_key)
         
         # Load mapping configuration once
@@ -323,42 +333,58 @@ class BatchProcessor:
         return rows_inserted
     
     def create_monday_items_from_staging(self, batch_id: str) -> Tuple[int, int]:
-        """Create Monday.com items in batches with robust error handling and optimized group creation"""
+        """Create Monday.com items in concurrent batches, with all groups resolved up front"""
+        items_success, items_errors, _, _ = asyncio.run(self._create_items_and_subitems_async(batch_id, stream_subitems=False))
+        return items_success, items_errors
+    
+    def create_monday_items_and_subitems_from_staging(self, batch_id: str) -> Tuple[int, int, int, int]:
+        """
+        Create items and subitems in one async pipeline
+        
+        Item batches run concurrently under the shared Monday.com rate limiter; as soon as a
+        batch's item IDs are written back (and propagated to its subitems), that batch's subitems
+        are created. Subitems already carrying a parent item ID are picked up at the end, exactly
+        like create_monday_subitems_from_staging().
+        
+        Returns:
+            (items_success, items_errors, subitems_success, subitems_errors)
+        """
+        items_success, items_errors, subitems_success, subitems_errors = asyncio.run(
+            self._create_items_and_subitems_async(batch_id, stream_subitems=True))
+        
+        # Subitems whose parents were created before this run
+        remaining_success, remaining_errors = self.create_monday_subitems_from_staging(batch_id)
+        return items_success, items_errors, subitems_success + remaining_success, subitems_errors + remaining_errors
+    
+    async def _create_items_and_subitems_async(self, batch_id: str, stream_subitems: bool) -> Tuple[int, int, int, int]:
+        """Item batches concurrently; optionally stream each batch's subitems once its parent IDs are stored"""
         BATCH_SIZE = 20  # Monday.com recommended batch size is 50
-        current_batch = []
-        batch_stg_ids = []
         success_count = 0
         error_count = 0
-
+        
         # Get staging records
         staging_records = self.staging_ops.get_pending_staging_orders(batch_id)
-
-        # Cache for group IDs to avoid multiple API calls
-        group_cache = {}
-
-        # Use iterrows to get row data
+        
+        # Resolve every distinct group once, before any item is sent
+        group_names = {}
         for idx, record in staging_records.iterrows():
             try:
-                # Get group name and ensure group exists (cached)
-                group_name = self.create_group_name(record)
-                
-                # Check cache first
-                if group_name not in group_cache:
-                    logger.info(f"Ensuring group exists: {group_name}")
-                    success, group_id, error = self.monday_client.ensure_group_exists(group_name)
-                    if not success:
-                        logger.error(f"Failed to ensure group exists for '{group_name}': {error}")
-                        # Use fallback group ID
-                        from .staging_config import MONDAY_CONFIG
-                        group_id = MONDAY_CONFIG.get('default_group_id', 'topics')
-                    group_cache[group_name] = group_id
-                    logger.debug(f"Cached group '{group_name}' with ID: {group_id}")
-                else:
-                    group_id = group_cache[group_name]
-
+                group_names[idx] = self.create_group_name(record)
+            except Exception as e:
+                logger.error(f"Failed to build Monday.com item for row {idx}: {e}\nRow data: {record.to_dict()}")
+                error_count += 1
+        group_cache = await self._resolve_groups(set(group_names.values()))
+        
+        batches = []
+        current_batch = []
+        batch_stg_ids = []
+        for idx, record in staging_records.iterrows():
+            if idx not in group_names:
+                continue
+            try:
                 item = {
                     "item_name": self.create_item_name(record),
-                    "group_id": group_id,
+                    "group_id": group_cache[group_names[idx]],
                     "column_values": self.get_monday_column_values_for_staged_order(record),
                     "stg_id": record["stg_id"]  # Add stg_id for tracking
                 }
@@ -368,56 +394,107 @@ class BatchProcessor:
                 logger.error(f"Failed to build Monday.com item for row {idx}: {e}\nRow data: {record.to_dict()}")
                 error_count += 1
                 continue
-
-            # Process batch when full
+            
             if len(current_batch) >= BATCH_SIZE:
-                try:
-                    success, item_ids, error = self.monday_client.create_items_batch(current_batch)
-                    if success:
-                        # Update staging with item IDs
-                        for stg_id, item_id in zip(batch_stg_ids, item_ids):
-                            if item_id:  # Only update if item_id is not None
-                                self.staging_ops.update_staging_with_monday_id(stg_id, int(item_id))
-                        successful_items = sum(1 for item_id in item_ids if item_id is not None)
-                        success_count += successful_items
-                        failed_items = len(item_ids) - successful_items
-                        error_count += failed_items
-                    else:
-                        error_count += len(current_batch)
-                        logger.error(f"Batch creation failed: {error}")
-                except Exception as e:
-                    error_count += len(current_batch)
-                    logger.error(f"Exception during batch creation: {e}")
+                batches.append((current_batch, batch_stg_ids))
                 current_batch = []
                 batch_stg_ids = []
-
         if current_batch:
+            batches.append((current_batch, batch_stg_ids))
+        
+        subitem_tasks = []
+        
+        async def run_batch(items: List[Dict], stg_ids: List[int]) -> Tuple[int, int]:
+            batch_success, batch_errors, created_stg_ids = await self._create_items_batch(items, stg_ids)
+            if stream_subitems and created_stg_ids:
+                subitem_tasks.append(asyncio.create_task(self._create_subitems_for_parents(batch_id, created_stg_ids)))
+            return batch_success, batch_errors
+        
+        logger.info(f"Creating {sum(len(items) for items, _ in batches)} Monday.com items in {len(batches)} concurrent batches")
+        for batch_success, batch_errors in await asyncio.gather(*(run_batch(items, stg_ids) for items, stg_ids in batches)):
+            success_count += batch_success
+            error_count += batch_errors
+        
+        subitems_success = subitems_errors = 0
+        for batch_success, batch_errors in await asyncio.gather(*subitem_tasks):
+            subitems_success += batch_success
+            subitems_errors += batch_errors
+        
+        logger.info(f"Group cache summary: {len(group_cache)} unique groups cached: {list(group_cache.keys())}")
+        logger.info(f"Monday.com rate limiter: {self.rate_limiter.get_stats()}")
+        return success_count, error_count, subitems_success, subitems_errors
+    
+    async def _call_monday(self, method, *args) -> Tuple[bool, Any, Optional[str]]:
+        """
+        One MondayApiClient (success, data, error) call in a shared rate-limiter slot
+        
+        The client hides the raw GraphQL response, so the limiter only learns the outcome:
+        success, or the error text (rate-limit codes and 'reset in N seconds' are recognised).
+        """
+        async with self.rate_limiter.slot():
             try:
-                success, item_ids, error = self.monday_client.create_items_batch(current_batch)
-                if success:
-                    for stg_id, item_id in zip(batch_stg_ids, item_ids):
-                        if item_id:  # Only update if item_id is not None
-                            self.staging_ops.update_staging_with_monday_id(stg_id, int(item_id))
-                    successful_items = sum(1 for item_id in item_ids if item_id is not None)
-                    success_count += successful_items
-                    failed_items = len(item_ids) - successful_items
-                    error_count += failed_items
-                else:
-                    error_count += len(current_batch)
-                    logger.error(f"Batch creation failed: {error}")
+                success, data, error = await asyncio.to_thread(method, *args)
             except Exception as e:
-                error_count += len(current_batch)
-                logger.error(f"Exception during batch creation: {e}")
-
-        logger.info(f"Group cache summary: {len(group_cache)} unique groups cached: {list(group_cache.keys())}")
-        return success_count, error_count
+                self._observe_failure(e)
+                raise
+        if success:
+            self.rate_limiter.observe(None)
+        else:
+            self._observe_failure(error)
+        return success, data, error
     
-    def create_monday_subitems_from_staging(self, batch_id: str) -> Tuple[int, int]:
-        """Step 3: Create Monday.com subitems from staging records with parent_item_id (BATCHED)"""
-        logger.info(f"Creating Monday.com subitems for batch {batch_id}...")
-
-        # Get subitems that have parent_item_id set (ready for API creation)
-        subitem_query = """
+    def _observe_failure(self, error: Any) -> None:
+        """Report a failed Monday.com call to the rate limiter as a GraphQL error response"""
+        message = str(error or "")
+        code = next((code for code in RATE_LIMIT_ERROR_CODES if code in message), None)
+        self.rate_limiter.observe({'errors': [{'message': message, 'extensions': {'code': code}}]}, status=500)
+    
+    async def _resolve_groups(self, group_names: set) -> Dict[str, str]:
+        """Ensure every group exists in one concurrent round; failed groups fall back to the default group"""
+        from .staging_config import MONDAY_CONFIG
+        
+        async def resolve(group_name: str) -> str:
+            logger.info(f"Ensuring group exists: {group_name}")
+            try:
+                success, group_id, error = await self._call_monday(self.monday_client.ensure_group_exists, group_name)
+            except Exception as e:
+                success, group_id, error = False, None, str(e)
+            if not success:
+                logger.error(f"Failed to ensure group exists for '{group_name}': {error}")
+                # Use fallback group ID
+                group_id = MONDAY_CONFIG.get('default_group_id', 'topics')
+            logger.debug(f"Cached group '{group_name}' with ID: {group_id}")
+            return group_id
+        
+        names = sorted(group_names)
+        return dict(zip(names, await asyncio.gather(*(resolve(name) for name in names))))
+    
+    async def _create_items_batch(self, items: List[Dict], stg_ids: List[int]) -> Tuple[int, int, List[int]]:
+        """Create one batch of Monday.com items and write the item IDs back to staging in one statement"""
+        try:
+            success, item_ids, error = await self._call_monday(self.monday_client.create_items_batch, items)
+            if not success:
+                logger.error(f"Batch creation failed: {error}")
+                return 0, len(items), []
+            
+            # Update staging with item IDs (only where item_id is not None), subitems in the same transaction
+            item_id_rows = [(stg_id, int(item_id), None) for stg_id, item_id in zip(stg_ids, item_ids) if item_id]
+            await asyncio.to_thread(self.staging_ops.update_staging_with_monday_ids, item_id_rows)
+            successful_items = sum(1 for item_id in item_ids if item_id is not None)
+            return successful_items, len(item_ids) - successful_items, [stg_id for stg_id, _, _ in item_id_rows]
+        except Exception as e:
+            logger.error(f"Exception during batch creation: {e}")
+            return 0, len(items), []
+    
+    def _get_pending_subitems(self, batch_id: str, parent_stg_ids: Optional[List[int]] = None) -> pd.DataFrame:
+        """PENDING subitems that have parent_item_id set (ready for API creation), optionally for some parents only"""
+        parent_filter = ""
+        params = [batch_id]
+        if parent_stg_ids is not None:
+            parent_filter = f"AND stg_parent_stg_id IN ({', '.join('?' for _ in parent_stg_ids)})"
+            params += [int(stg_id) for stg_id in parent_stg_ids]
+        
+        subitem_query = f"""
             SELECT 
                 stg_id as stg_subitem_id,
                 stg_parent_stg_id,
@@ -430,96 +507,107 @@ class BatchProcessor:
             WHERE stg_batch_id = ?
               AND stg_status = 'PENDING'
               AND stg_monday_parent_item_id IS NOT NULL
+              {parent_filter}
             ORDER BY stg_parent_stg_id, Size
         """
-
+        
         with self.staging_ops.get_connection() as conn:
-            subitems_df = pd.read_sql(subitem_query, conn, params=[batch_id])
+            return pd.read_sql(subitem_query, conn, params=params)
+    
+    async def _create_subitems_for_parents(self, batch_id: str, parent_stg_ids: List[int]) -> Tuple[int, int]:
+        """Create the subitems of parents whose Monday.com item IDs were just written back"""
+        subitems_df = await asyncio.to_thread(self._get_pending_subitems, batch_id, parent_stg_ids)
+        return await self._create_subitems_async(subitems_df)
+    
+    def create_monday_subitems_from_staging(self, batch_id: str) -> Tuple[int, int]:
+        """Step 3: Create Monday.com subitems from staging records with parent_item_id (BATCHED)"""
+        logger.info(f"Creating Monday.com subitems for batch {batch_id}...")
+
+        subitems_df = self._get_pending_subitems(batch_id)
 
         if subitems_df.empty:
             logger.info(f"No subitems ready for API creation in batch {batch_id}")
             return 0, 0
 
         logger.info(f"Found {len(subitems_df)} subitems ready for Monday.com API creation")
+        success_count, error_count = asyncio.run(self._create_subitems_async(subitems_df))
 
-        # Process in batches - FIXED LOGIC
+        logger.info(f"Subitem creation completed: {success_count} success, {error_count} errors")
+        return success_count, error_count
+    
+    async def _create_subitems_async(self, subitems_df: pd.DataFrame) -> Tuple[int, int]:
+        """Create subitems in concurrent batches under the shared rate limiter"""
         BATCH_SIZE = 10  # Reasonable batch size to avoid timeouts
+        batches = [subitems_df.iloc[batch_start:batch_start + BATCH_SIZE]
+                   for batch_start in range(0, len(subitems_df), BATCH_SIZE)]
+        
         success_count = 0
         error_count = 0
+        for batch_success, batch_errors in await asyncio.gather(*(self._create_subitems_batch(batch_df) for batch_df in batches)):
+            success_count += batch_success
+            error_count += batch_errors
+        return success_count, error_count
+    
+    async def _create_subitems_batch(self, batch_df: pd.DataFrame) -> Tuple[int, int]:
+        """Create one batch of subitems and write successes / failures back in one statement each"""
+        # Prepare batch payload for THIS BATCH ONLY
+        batch_payload = []
+        batch_stg_id_map = []
         
-        for batch_start in range(0, len(subitems_df), BATCH_SIZE):
-            batch_end = min(batch_start + BATCH_SIZE, len(subitems_df))
-            batch_df = subitems_df.iloc[batch_start:batch_end]
-            
-            logger.info(f"Processing subitems batch {batch_start//BATCH_SIZE + 1}: items {batch_start+1}-{batch_end} of {len(subitems_df)}")
+        for _, subitem in batch_df.iterrows():
+            item_name = f"Size {subitem['Size']}"
+            subitem_column_values = {
+                "dropdown_mkrak7qp": {"labels": [str(subitem['Size'])]},  # Size dropdown
+                "numeric_mkra7j8e": str(subitem['ORDER_QTY'])  # Order Qty numeric
+            }
+            batch_payload.append({
+                "parent_item_id": int(subitem['stg_monday_parent_item_id']),
+                "item_name": item_name,
+                "column_values": subitem_column_values
+            })
+            batch_stg_id_map.append({
+                "stg_subitem_id": subitem['stg_subitem_id'],
+                "AAG_ORDER_NUMBER": subitem['AAG_ORDER_NUMBER'],
+                "Size": subitem['Size']
+            })
+
+        # Call batch API for THIS BATCH ONLY
+        try:
+            batch_success, batch_results, batch_error = await self._call_monday(
+                self.monday_client.create_subitems_batch, batch_payload)
             
-            # Prepare batch payload for THIS BATCH ONLY
-            batch_payload = []
-            batch_stg_id_map = []
+            if batch_success:
+                # Process results for THIS BATCH, then write them back in one statement each
+                created, failed = [], []
+                for idx, result in enumerate(batch_results):
+                    stg_info = batch_stg_id_map[idx]  # Now correctly indexed to current batch
+                    if result and 'subitem_id' in result:
+                        subitem_id = result['subitem_id']
+                        created.append((stg_info['stg_subitem_id'], int(subitem_id)))
+                        logger.info(f"Created subitem {subitem_id} for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}")
+                    else:
+                        # Mark individual subitem as failed
+                        failed.append((stg_info['stg_subitem_id'], "No subitem ID returned from API"))
+                        logger.error(f"Failed to create subitem for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}")
+                await asyncio.to_thread(self.staging_ops.update_subitems_with_monday_ids, created)
+                await asyncio.to_thread(self.staging_ops.mark_subitems_as_failed, failed)
+                return len(created), len(failed)
             
-            for _, subitem in batch_df.iterrows():
-                item_name = f"Size {subitem['Size']}"
-                subitem_column_values = {
-                    "dropdown_mkrak7qp": {"labels": [str(subitem['Size'])]},  # Size dropdown
-                    "numeric_mkra7j8e": str(subitem['ORDER_QTY'])  # Order Qty numeric
-                }
-                batch_payload.append({
-                    "parent_item_id": int(subitem['stg_monday_parent_item_id']),
-                    "item_name": item_name,
-                    "column_values": subitem_column_values
-                })
-                batch_stg_id_map.append({
-                    "stg_subitem_id": subitem['stg_subitem_id'],
-                    "AAG_ORDER_NUMBER": subitem['AAG_ORDER_NUMBER'],
-                    "Size": subitem['Size']
-                })
-
-            # Call batch API for THIS BATCH ONLY
-            try:
-                batch_success, batch_results, batch_error = self.monday_client.create_subitems_batch(batch_payload)
+            # Only mark THIS BATCH as failed
+            await asyncio.to_thread(self.staging_ops.mark_subitems_as_failed,
+                                    [(stg_info['stg_subitem_id'], batch_error or "Batch subitem creation failed")
+                                     for stg_info in batch_stg_id_map])  # Only current batch items
+            for stg_info in batch_stg_id_map:
+                logger.error(f"Failed to create subitem for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}: {batch_error}")
+            return 0, len(batch_stg_id_map)
                 
-                if batch_success:
-                    # Process results for THIS BATCH
-                    for idx, result in enumerate(batch_results):
-                        stg_info = batch_stg_id_map[idx]  # Now correctly indexed to current batch
-                        if result and 'subitem_id' in result:
-                            subitem_id = result['subitem_id']
-                            self.staging_ops.update_subitem_with_monday_id(
-                                stg_info['stg_subitem_id'],
-                                int(subitem_id)
-                            )
-                            success_count += 1
-                            logger.info(f"Created subitem {subitem_id} for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}")
-                        else:
-                            # Mark individual subitem as failed
-                            self.staging_ops.mark_subitem_as_failed(
-                                stg_info['stg_subitem_id'],
-                                "No subitem ID returned from API"
-                            )
-                            error_count += 1
-                            logger.error(f"Failed to create subitem for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}")
-                else:
-                    # Only mark THIS BATCH as failed
-                    for stg_info in batch_stg_id_map:  # Only current batch items
-                        self.staging_ops.mark_subitem_as_failed(
-                            stg_info['stg_subitem_id'],
-                            batch_error or "Batch subitem creation failed"
-                        )
-                        error_count += 1
-                        logger.error(f"Failed to create subitem for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}: {batch_error}")
-                    
-            except Exception as e:
-                # Only mark THIS BATCH as failed
-                for stg_info in batch_stg_id_map:  # Only current batch items
-                    self.staging_ops.mark_subitem_as_failed(
-                        stg_info['stg_subitem_id'],
-                        str(e)
-                    )
-                    error_count += 1
-                    logger.error(f"Unexpected error processing subitem for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}: {e}")
-
-        logger.info(f"Subitem creation completed: {success_count} success, {error_count} errors")
-        return success_count, error_count
+        except Exception as e:
+            # Only mark THIS BATCH as failed
+            await asyncio.to_thread(self.staging_ops.mark_subitems_as_failed,
+                                    [(stg_info['stg_subitem_id'], str(e)) for stg_info in batch_stg_id_map])
+            for stg_info in batch_stg_id_map:
+                logger.error(f"Unexpected error processing subitem for order {stg_info['AAG_ORDER_NUMBER']}, size {stg_info['Size']}: {e}")
+            return 0, len(batch_stg_id_map)
     
     def process_customer_batch(self, customer_name: str) -> Dict[str, any]:
         """Main workflow orchestrator for a single customer batch"""
@@ -545,11 +633,9 @@ class BatchProcessor:
                     'message': 'No new orders found'
                 }
             
-            # Step 2: Create Monday.com items
-            items_success, items_errors = self.create_monday_items_from_staging(batch_id)
-            
-            # Step 3: Create subitems
-            subitems_success, subitems_errors = self.create_monday_subitems_from_staging(batch_id)
+            # Step 2 + 3: Create Monday.com items, streaming each batch's subitems as its parent IDs arrive
+            items_success, items_errors, subitems_success, subitems_errors = \
+                self.create_monday_items_and_subitems_from_staging(batch_id)
             
             # Step 4: Promote successful records to production MON_ tables
             orders_promoted, subitems_promoted = self.staging_ops.promote_successful_orders_to_production(batch_id)
@@ -593,6 +679,7 @@ class BatchProcessor:
             }
             
             logger.info(f"Batch processing completed for {customer_name}: {result}")
+            logger.info(f"Schema cache: {db_helper.get_schema_cache_stats()}")
             return result
             
         except Exception as e:
@@ -781,11 +868,9 @@ class BatchProcessor:
                     'errors': 0
                 }
             
-            # Step 4: Create Monday.com items
-            items_created, errors = self.create_monday_items_from_staging(batch_id)
-            
-            # Step 5: Create Monday.com subitems
-            subitems_created, subitems_errors = self.create_monday_subitems_from_staging(batch_id)
+            # Step 4 + 5: Create Monday.com items, streaming each batch's subitems as its parent IDs arrive
+            items_created, errors, subitems_created, subitems_errors = \
+                self.create_monday_items_and_subitems_from_staging(batch_id)
             
             # Step 6: Promote successful records to production MON_ tables
             orders_promoted, subitems_promoted = self.staging_ops.promote_successful_orders_to_production(batch_id)
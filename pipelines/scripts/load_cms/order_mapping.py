@@ -7,20 +7,22 @@ using the orders_unified_monday_mapping.yaml configuration file.
 Key Functions:
 - Load and parse YAML mapping configuration
 - Transform order data using mapping rules
+- Compile the mapping into column-wise operations for batch transforms
 - Apply customer name standardization
 - Calculate computed fields (TOTAL QTY, item names)
 - Format Monday.com column values
 
 Dependencies:
-- yaml, pandas, json, os
+- yaml, pandas, numpy, json, os
 """
 
 import yaml
 import pandas as pd
+import numpy as np
 import json
 import os
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 
 def load_mapping_config() -> Dict[str, Any]:
@@ -482,12 +484,191 @@ def get_monday_column_values_dict(transformed_data: Dict[str, Any]) -> Dict[str,
     
     return column_values
 
-def transform_orders_batch(orders_df: pd.DataFrame) -> pd.DataFrame:
+class _TransformError:
+    """Marks a source value the element conversion raised on (the whole order is skipped)"""
+    
+    def __init__(self, error: Exception):
+        self.error = error
+
+def _map_distinct(values: pd.Series, convert: Callable[[Any], Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Apply an element conversion once per distinct source value
+    
+    The conversions in this module depend only on a value's type and str(), so values are
+    grouped on that key; plain string columns are factorized directly.
+    
+    Args:
+        values: Source column
+        convert: Element conversion (same semantics as the row-wise path)
+        
+    Returns:
+        (object array of converted values, boolean mask of values the conversion raised on)
+    """
+    def safe_convert(value):
+        try:
+            return convert(value)
+        except Exception as e:
+            return _TransformError(e)
+    
+    cache = {}
+    
+    def lookup(value):
+        key = (type(value), str(value))
+        if key not in cache:
+            cache[key] = safe_convert(value)
+        return cache[key]
+    
+    objects = values.astype(object).to_numpy()
+    result = np.empty(len(objects), dtype=object)
+    na_mask = pd.isna(objects)
+    present = ~na_mask
+    
+    if na_mask.any():
+        result[na_mask] = [lookup(value) for value in objects[na_mask]]
+    if pd.api.types.infer_dtype(objects[present], skipna=False) == 'string':
+        codes, uniques = pd.factorize(objects[present])
+        converted = np.empty(len(uniques), dtype=object)
+        converted[:] = [safe_convert(value) for value in uniques]
+        result[present] = converted[codes]
+    else:
+        result[present] = [lookup(value) for value in objects[present]]
+    
+    failed = np.fromiter((isinstance(value, _TransformError) for value in result), dtype=bool, count=len(result))
+    return result, failed
+
+def _source_column(orders_df: pd.DataFrame, source_field: str, default: Any = None) -> pd.Series:
+    """Source column, or a constant column when ORDERS_UNIFIED does not carry the field (like order_row.get)"""
+    if source_field in orders_df.columns:
+        return orders_df[source_field]
+    return pd.Series([default] * len(orders_df), index=orders_df.index, dtype=object)
+
+def _compile_field(mapping: Dict[str, Any], field_rules: Optional[List[Dict]],
+                   customer_lookup: Dict[str, str]) -> Callable[[pd.DataFrame], Tuple[np.ndarray, np.ndarray]]:
+    """Compile one exact_matches / mapped_fields entry into a column operation"""
+    source_field = mapping['source_field']
+    target_type = mapping['target_type']
+    transformation = mapping.get('transformation', 'direct_mapping')
+    
+    if transformation == 'customer_mapping_lookup':
+        def convert(value):
+            return apply_customer_mapping(value, customer_lookup)
+    elif transformation == 'value_mapping':
+        # First matching rule wins, compared case-insensitively
+        value_map = {}
+        for rule in mapping.get('mapping_rules', []):
+            value_map.setdefault(str(rule['source_value']).upper(), rule['target_value'])
+        
+        def convert(value):
+            return clean_and_convert_value(value_map.get(str(value).upper(), value), target_type, field_rules)
+    else:
+        # direct_mapping / color_mapping
+        def convert(value):
+            return clean_and_convert_value(value, target_type, field_rules)
+    
+    plain = transformation not in ('customer_mapping_lookup', 'value_mapping') and not any(
+        rule.get('operation') == 'replace_value' for rule in field_rules or [])
+    
+    def column_op(orders_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        source = _source_column(orders_df, source_field)
+        no_failures = np.zeros(len(source), dtype=bool)
+        
+        # Typed columns convert without touching Python objects
+        if plain and target_type == 'numbers' and pd.api.types.is_numeric_dtype(source) \
+                and not pd.api.types.is_bool_dtype(source):
+            values = source.astype(float).astype(object).to_numpy()
+            values[source.isna().to_numpy()] = None
+            return values, no_failures
+        if plain and target_type == 'date' and pd.api.types.is_datetime64_any_dtype(source):
+            values = source.dt.strftime('%Y-%m-%d').astype(object).to_numpy()
+            values[source.isna().to_numpy()] = None
+            return values, no_failures
+        
+        return _map_distinct(source, convert)
+    
+    return column_op
+
+def _compile_computed_field(computed_field: Dict[str, Any]) -> Callable[[pd.DataFrame], Tuple[np.ndarray, np.ndarray]]:
+    """Compile one computed_fields entry (concatenation / sum_aggregation) into a column operation"""
+    target_field = computed_field['target_field']
+    source_fields = computed_field['source_fields']
+    transformation = computed_field['transformation']
+    
+    def column_op(orders_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        no_failures = np.zeros(len(orders_df), dtype=bool)
+        values = np.empty(len(orders_df), dtype=object)
+        
+        if transformation == 'concatenation':
+            # Title = STYLE + COLOR + ORDER_NUMBER, skipping blanks, joined with spaces
+            parts = [_map_distinct(_source_column(orders_df, source_field, ''),
+                                   lambda value: clean_and_convert_value(value, 'text'))[0]
+                     for source_field in source_fields]
+            values[:] = [' '.join(part for part in row if part) for row in zip(*parts)]
+        
+        elif transformation == 'sum_aggregation':
+            if target_field == 'TOTAL QTY' and 'TOTAL QTY' in orders_df.columns:
+                return _compile_field({'source_field': 'TOTAL QTY', 'target_type': 'numbers'}, None, {})(orders_df)
+            parts = [_map_distinct(_source_column(orders_df, source_field, 0),
+                                   lambda value: clean_and_convert_value(value, 'numbers'))[0]
+                     for source_field in source_fields]
+            totals = []
+            for row in zip(*parts):
+                total = 0
+                for value in row:
+                    total += value if value else 0
+                totals.append(total)
+            values[:] = totals
+        
+        else:
+            values[:] = ""
+        
+        return values, no_failures
+    
+    return column_op
+
+def compile_mapping_config(mapping_config: Dict[str, Any],
+                           customer_lookup: Dict[str, str]) -> List[Tuple[str, Callable[[pd.DataFrame], Tuple[np.ndarray, np.ndarray]]]]:
+    """
+    Compile the YAML mapping configuration into per-column operations
+    
+    Produces the same values as transform_order_data, one column at a time: each distinct
+    source value is converted once and broadcast back, customer names are mapped per
+    distinct name, and typed numeric / datetime columns skip Python conversion entirely.
+    
+    Args:
+        mapping_config: YAML mapping configuration
+        customer_lookup: Customer name mapping dictionary
+        
+    Returns:
+        List of (target_field, column_op) in transform_order_data's field order; a later
+        entry for the same target_field overwrites the earlier value
+    """
+    preprocessing_rules = mapping_config.get('preprocessing', {}).get('data_cleaning', [])
+    compiled = []
+    
+    for mapping in mapping_config.get('exact_matches', []):
+        field_rules = [rule for rule in preprocessing_rules if rule.get('field') == mapping['source_field']]
+        compiled.append((mapping['target_field'], _compile_field(mapping, field_rules, customer_lookup)))
+    
+    for mapping in mapping_config.get('mapped_fields', []):
+        compiled.append((mapping['target_field'], _compile_field(mapping, None, customer_lookup)))
+    
+    for computed_field in mapping_config.get('computed_fields', []):
+        compiled.append((computed_field['target_field'], _compile_computed_field(computed_field)))
+    
+    return compiled
+
+def transform_orders_batch(orders_df: pd.DataFrame, mapping_config: Optional[Dict[str, Any]] = None,
+                           customer_lookup: Optional[Dict[str, str]] = None) -> pd.DataFrame:
     """
     Transform a batch of orders using YAML mapping configuration
     
+    Column-wise equivalent of calling transform_order_data on every row and flattening the
+    values; orders whose transformation fails are skipped, as before.
+    
     Args:
         orders_df: DataFrame with order records from ORDERS_UNIFIED
+        mapping_config: YAML mapping configuration (loaded when not given)
+        customer_lookup: Customer name mapping dictionary (loaded when not given)
         
     Returns:
         DataFrame with transformed records ready for MON_CustMasterSchedule
@@ -498,37 +679,36 @@ def transform_orders_batch(orders_df: pd.DataFrame) -> pd.DataFrame:
     print(f"🔄 Transforming {len(orders_df)} orders using YAML mapping...")
     
     # Load configurations
-    mapping_config = load_mapping_config()
-    customer_lookup = load_customer_mapping()
+    if mapping_config is None:
+        mapping_config = load_mapping_config()
+    if customer_lookup is None:
+        customer_lookup = load_customer_mapping()
     
     if not mapping_config:
         print("❌ Cannot proceed without mapping configuration")
         return pd.DataFrame()
     
-    transformed_records = []
-    
-    for idx, order_row in orders_df.iterrows():
-        try:            # Transform the order
-            transformed = transform_order_data(order_row, mapping_config, customer_lookup)
-            
-            # Flatten for database insertion
-            flat_record = {}
-            
-            # Add transformed fields (these already include properly mapped field names)
-            for field_name, field_data in transformed.items():
-                if not field_name.startswith('_'):
-                    flat_record[field_name] = field_data.get('value')
-            
-            # Note: COLUMN_VALUES is not added here as it's only needed for Monday.com API calls
-            # Note: Hardcoded fields like 'CUSTOMER STYLE' are not added as they're already mapped via YAML
-            
-            transformed_records.append(flat_record)
-            
-        except Exception as e:
-            print(f"⚠️  Error transforming order {order_row.get('AAG ORDER NUMBER', 'Unknown')}: {e}")
-            continue
-    
-    result_df = pd.DataFrame(transformed_records)
+    columns = {}
+    failed = np.zeros(len(orders_df), dtype=bool)
+    errors = np.empty(len(orders_df), dtype=object)
+    
+    for target_field, column_op in compile_mapping_config(mapping_config, customer_lookup):
+        values, column_failed = column_op(orders_df)
+        new_failures = column_failed & ~failed
+        errors[new_failures] = values[new_failures]
+        failed |= column_failed
+        columns[target_field] = values
+    
+    for position in np.flatnonzero(failed):
+        order_row = orders_df.iloc[position]
+        print(f"⚠️  Error transforming order {order_row.get('AAG ORDER NUMBER', 'Unknown')}: {errors[position].error}")
+    
+    if failed.all():
+        result_df = pd.DataFrame()
+    else:
+        keep = ~failed
+        # Lists (not object arrays) so pandas infers dtypes exactly as it does for flattened records
+        result_df = pd.DataFrame({target_field: values[keep].tolist() for target_field, values in columns.items()})
     print(f"✅ Successfully transformed {len(result_df)} orders")
     
     return result_df
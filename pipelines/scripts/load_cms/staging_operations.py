@@ -38,6 +38,10 @@ class StagingOperations:
         """Get database connection using db_helper"""
         return db_helper.get_connection(self.db_key)
     
+    def get_table_columns(self, table_name: str) -> List[str]:
+        """Column names of dbo.table_name in ordinal order (process-wide schema cache)"""
+        return db_helper.get_column_names(table_name, self.db_key)
+    
     def _clean_numeric_fields(self, df: pd.DataFrame, numeric_columns: list) -> pd.DataFrame:
         """Clean numeric columns to handle empty strings and nulls for SQL Server compatibility"""
         cleaned_df = df.copy()
@@ -65,39 +69,21 @@ class StagingOperations:
     def get_dynamic_numeric_fields_with_schema(self) -> Dict[str, Dict]:
         """Get numeric columns with their exact data types and precision from staging table schema"""
         
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get detailed schema information for numeric columns
-            cursor.execute("""
-                SELECT 
-                    COLUMN_NAME,
-                    DATA_TYPE,
-                    NUMERIC_PRECISION,
-                    NUMERIC_SCALE,
-                    IS_NULLABLE
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = 'STG_MON_CustMasterSchedule' 
-                AND TABLE_SCHEMA = 'dbo'
-                AND COLUMN_NAME NOT LIKE 'stg_%'
-                AND DATA_TYPE IN ('decimal', 'numeric', 'int', 'bigint', 'float', 'real', 'money', 'smallmoney', 'smallint', 'tinyint')
-                ORDER BY COLUMN_NAME
-            """)
+        numeric_types = ('decimal', 'numeric', 'int', 'bigint', 'float', 'real', 'money', 'smallmoney', 'smallint', 'tinyint')
+        
+        # Detailed schema information for numeric columns (process-wide schema cache)
+        schema_info = {}
+        for column in sorted(db_helper.get_table_schema('STG_MON_CustMasterSchedule', self.db_key),
+                             key=lambda column: column['COLUMN_NAME']):
+            if column['COLUMN_NAME'].lower().startswith('stg_') or column['DATA_TYPE'] not in numeric_types:
+                continue
             
-            schema_info = {}
-            for row in cursor.fetchall():
-                column_name = row[0]
-                data_type = row[1]
-                precision = row[2]
-                scale = row[3]
-                is_nullable = row[4]
-                
-                schema_info[column_name] = {
-                    'data_type': data_type,
-                    'precision': precision,
-                    'scale': scale,
-                    'is_nullable': is_nullable == 'YES'
-                }
+            schema_info[column['COLUMN_NAME']] = {
+                'data_type': column['DATA_TYPE'],
+                'precision': column['NUMERIC_PRECISION'],
+                'scale': column['NUMERIC_SCALE'],
+                'is_nullable': column['IS_NULLABLE'] == 'YES'
+            }
         
         logger.info(f"Dynamically identified {len(schema_info)} numeric columns with schema info")
         return schema_info
@@ -249,42 +235,79 @@ class StagingOperations:
         
         logger.info(f"Updated batch {batch_id} status to {status}")
     
+    @staticmethod
+    def _dataframe_to_param_rows(df: pd.DataFrame, max_text_length: Optional[int] = None,
+                                 stringify_objects: bool = False) -> List[tuple]:
+        """
+        Convert a DataFrame to executemany parameter rows, one column at a time
+        
+        NaN / NaT / None / pd.NA become None, numpy scalars become native int / float / bool,
+        datetime columns become datetime.datetime. Strings longer than max_text_length are
+        truncated; with stringify_objects, object values that are not numbers or datetimes
+        are sent as str (subitem insert semantics).
+        """
+        columns = []
+        for position in range(len(df.columns)):
+            series = df.iloc[:, position]
+            
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                values = series.array.to_pydatetime()
+            else:
+                values = series.to_numpy(dtype=object, copy=True)
+            null_mask = pd.isna(values)
+            
+            if series.dtype == object and pd.api.types.infer_dtype(values[~null_mask], skipna=False) not in ('string', 'empty'):
+                # Mixed object column: normalize the odd values one by one
+                for index in np.flatnonzero(~null_mask):
+                    value = values[index]
+                    if isinstance(value, pd.Timestamp):
+                        values[index] = value.to_pydatetime()
+                    elif isinstance(value, np.generic):
+                        values[index] = value.item()
+                    elif stringify_objects and not isinstance(value, (int, float, datetime)):
+                        values[index] = str(value)
+            
+            if max_text_length is not None and pd.api.types.infer_dtype(values, skipna=True) in ('string', 'mixed', 'mixed-integer'):
+                lengths = series.astype(object).str.len().to_numpy(dtype=float, na_value=np.nan)
+                too_long = np.flatnonzero(lengths > max_text_length)
+                if len(too_long):
+                    logger.warning(f"Truncating {len(too_long)} values in column '{df.columns[position]}' "
+                                   f"to {max_text_length} chars")
+                    values[too_long] = [values[index][:max_text_length] for index in too_long]
+            
+            values[null_mask] = None
+            columns.append(values)
+        
+        if not columns:
+            return [() for _ in range(len(df))]
+        return list(zip(*columns))
+    
     def concurrent_insert_chunk(self, chunk_data, columns, table_name):
-        """Insert a chunk of data using concurrent processing"""
-        chunk_df, chunk_id = chunk_data
+        """Insert a chunk of data (DataFrame or pre-converted parameter rows) using concurrent processing"""
+        chunk, chunk_id = chunk_data
         
         try:
+            # Prepare all rows for this chunk
+            values_list = chunk if isinstance(chunk, list) else self._dataframe_to_param_rows(chunk[columns])
+            
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.fast_executemany = True
                 
                 # Build insert statement
                 placeholders = ', '.join(['?' for _ in columns])
                 column_names = ', '.join([f'[{col}]' for col in columns])
                 insert_sql = f"INSERT INTO [dbo].[{table_name}] ({column_names}) VALUES ({placeholders})"
                 
-                # Prepare all rows for this chunk
-                values_list = []
-                for _, row in chunk_df.iterrows():
-                    values = []
-                    for col in columns:
-                        value = row[col]
-                        # Handle pandas NA/NaN values for SQL Server
-                        if pd.isna(value):
-                            values.append(None)
-                        elif isinstance(value, (pd.Timestamp, pd.NaT.__class__)):
-                            values.append(value if not pd.isna(value) else None)
-                        else:
-                            values.append(value)
-                    values_list.append(tuple(values))
-                  # Use executemany for bulk insert
+                # Use executemany for bulk insert
                 cursor.executemany(insert_sql, values_list)
                 conn.commit()
                 
-                return len(chunk_df), 0, chunk_id  # success_count, fail_count, chunk_id
+                return len(chunk), 0, chunk_id  # success_count, fail_count, chunk_id
                 
         except Exception as e:
             logger.error(f"Chunk {chunk_id} insert error: {e}")
-            return 0, len(chunk_df), chunk_id  # success_count, fail_count, chunk_id
+            return 0, len(chunk), chunk_id  # success_count, fail_count, chunk_id
 
     def concurrent_bulk_insert(self, filtered_df, table_name, chunk_size=500, max_workers=4):
         """Production-grade concurrent database insert"""
@@ -293,10 +316,13 @@ class StagingOperations:
         
         columns = list(filtered_df.columns)
         
-        # Split DataFrame into chunks
+        # Convert once up front so the worker threads only wait on the database
+        rows = self._dataframe_to_param_rows(filtered_df)
+        
+        # Split rows into chunks
         chunks = []
-        for i in range(0, len(filtered_df), chunk_size):
-            chunk = filtered_df.iloc[i:i + chunk_size]
+        for i in range(0, len(rows), chunk_size):
+            chunk = rows[i:i + chunk_size]
             chunks.append((chunk, f"chunk_{i//chunk_size + 1}"))
         
         logger.info(f"Split into {len(chunks)} chunks for concurrent processing")
@@ -343,15 +369,7 @@ class StagingOperations:
             return 0
         
         # Get the actual columns that exist in the staging table
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = 'STG_MON_CustMasterSchedule' 
-                AND TABLE_SCHEMA = 'dbo'
-            """)
-            existing_columns = [row[0] for row in cursor.fetchall()]
+        existing_columns = self.get_table_columns('STG_MON_CustMasterSchedule')
 
         # --- UUID mapping logic (YAML-agnostic) ---
         # If the staging table expects a 'source_uuid', ensure it is present in the DataFrame.
@@ -438,21 +456,9 @@ class StagingOperations:
                 """
                 
                 rows_inserted = 0
-                for i, (_, row) in enumerate(filtered_df.iterrows()):
+                # Truncate very long strings to prevent issues
+                for i, values in enumerate(self._dataframe_to_param_rows(filtered_df, max_text_length=4000)):
                     try:
-                        values = []
-                        for col in columns:
-                            value = row[col]
-                            if pd.isna(value):
-                                values.append(None)
-                            elif isinstance(value, (pd.Timestamp, pd.NaT.__class__)):
-                                values.append(value if not pd.isna(value) else None)
-                            else:
-                                # Truncate very long strings to prevent issues
-                                if isinstance(value, str) and len(value) > 4000:
-                                    value = value[:4000]
-                                values.append(value)
-                        
                         cursor.execute(insert_query, values)
                         rows_inserted += 1
                         
@@ -487,33 +493,24 @@ class StagingOperations:
     def get_pending_staging_orders(self, batch_id: str) -> pd.DataFrame:
         """Get orders ready for Monday.com API with ALL production columns"""
         
+        # Get all columns from staging table, excluding staging-specific ones
+        production_columns = [col for col in self.get_table_columns('STG_MON_CustMasterSchedule')
+                              if not col.lower().startswith('stg_')]
+        
+        # Add required staging columns for processing
+        staging_columns = ['stg_id', 'stg_batch_id', 'stg_customer_batch', 'stg_status']
+        all_columns = staging_columns + production_columns
+        
+        # Build dynamic query with all available columns
+        column_list = ', '.join([f'[{col}]' for col in all_columns])
+        query = f"""
+            SELECT {column_list}
+            FROM [dbo].[STG_MON_CustMasterSchedule]
+            WHERE [stg_batch_id] = ? AND [stg_status] = 'PENDING'
+            ORDER BY [stg_id]
+        """
+        
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get all columns from staging table, excluding staging-specific ones
-            cursor.execute("""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = 'STG_MON_CustMasterSchedule' 
-                AND TABLE_SCHEMA = 'dbo'
-                AND COLUMN_NAME NOT LIKE 'stg_%'
-                ORDER BY ORDINAL_POSITION
-            """)
-            production_columns = [row[0] for row in cursor.fetchall()]
-            
-            # Add required staging columns for processing
-            staging_columns = ['stg_id', 'stg_batch_id', 'stg_customer_batch', 'stg_status']
-            all_columns = staging_columns + production_columns
-            
-            # Build dynamic query with all available columns
-            column_list = ', '.join([f'[{col}]' for col in all_columns])
-            query = f"""
-                SELECT {column_list}
-                FROM [dbo].[STG_MON_CustMasterSchedule]
-                WHERE [stg_batch_id] = ? AND [stg_status] = 'PENDING'
-                ORDER BY [stg_id]
-            """
-            
             df = pd.read_sql(query, conn, params=[batch_id])
         
         logger.info(f"Retrieved {len(df)} pending orders for batch {batch_id} (columns: {len(all_columns)} total, {len(production_columns)} production)")
@@ -522,60 +519,91 @@ class StagingOperations:
     def update_staging_with_monday_id(self, stg_id: int, monday_item_id: int, 
                                      api_payload: Optional[str] = None) -> bool:
         """Update staging record with Monday.com item ID and propagate to subitems"""
+        orders_updated, _ = self.update_staging_with_monday_ids([(stg_id, monday_item_id, api_payload)])
+        return orders_updated > 0
+    
+    def update_staging_with_monday_ids(self, item_ids: List[Tuple[int, int, Optional[str]]]) -> Tuple[int, int]:
+        """
+        Set-based update_staging_with_monday_id for a whole API batch
         
-        # Convert numpy types to native Python types
-        stg_id = int(stg_id)
-        monday_item_id = int(monday_item_id)
+        (stg_id, monday_item_id, api_payload) rows are written through a temp table with one
+        UPDATE and committed, then the Monday.com item IDs are propagated to the subitems
+        (stg_parent_stg_id). A failed propagation is logged and does not undo the item IDs.
+        
+        Returns:
+            (orders_updated, subitems_updated)
+        """
+        # Convert numpy types to native Python types (last write wins for repeated stg_ids)
+        rows = list({int(stg_id): (int(stg_id), int(monday_item_id), api_payload)
+                     for stg_id, monday_item_id, api_payload in item_ids}.values())
+        if not rows:
+            return 0, 0
+        
+        # Check if stg_api_payload column exists
+        payload_sql = ""
+        if 'stg_api_payload' in self.get_table_columns('STG_MON_CustMasterSchedule'):
+            payload_sql = ",\n                        s.[stg_api_payload] = t.[api_payload]"
         
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            try:
+                self._load_temp_table(cursor, "#stg_item_id_writeback", """
+                    [stg_id] BIGINT NOT NULL PRIMARY KEY,
+                    [monday_item_id] BIGINT NOT NULL,
+                    [api_payload] NVARCHAR(MAX) NULL
+                """, rows)
+                
+                cursor.execute(f"""
+                    UPDATE s
+                    SET s.[stg_status] = 'API_SUCCESS',
+                        s.[stg_monday_item_id] = t.[monday_item_id],
+                        s.[stg_processed_date] = GETDATE(){payload_sql}
+                    FROM [dbo].[STG_MON_CustMasterSchedule] s
+                    INNER JOIN #stg_item_id_writeback t ON s.[stg_id] = t.[stg_id]
+                """)
+                orders_updated = cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
             
-            # Check if stg_api_payload column exists
-            cursor.execute("""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = 'STG_MON_CustMasterSchedule' 
-                AND TABLE_SCHEMA = 'dbo'
-                AND COLUMN_NAME = 'stg_api_payload'
-            """)
-            has_api_payload = len(cursor.fetchall()) > 0
-            
-            if has_api_payload:
-                cursor.execute("""
-                    UPDATE [dbo].[STG_MON_CustMasterSchedule]
-                    SET [stg_status] = 'API_SUCCESS',
-                        [stg_monday_item_id] = ?,
-                        [stg_processed_date] = GETDATE(),
-                        [stg_api_payload] = ?
-                    WHERE [stg_id] = ?
-                """, (monday_item_id, api_payload, stg_id))
-            else:
-                cursor.execute("""
-                    UPDATE [dbo].[STG_MON_CustMasterSchedule]
-                    SET [stg_status] = 'API_SUCCESS',
-                        [stg_monday_item_id] = ?,
-                        [stg_processed_date] = GETDATE()
-                    WHERE [stg_id] = ?
-                """, (monday_item_id, stg_id))
-            
-            rows_affected = cursor.rowcount
-            conn.commit()
-        
-        if rows_affected > 0:
-            logger.info(f"Updated staging record {stg_id} with Monday item ID {monday_item_id}")
-            
-            # CRITICAL FIX: Propagate Monday.com item ID to subitems
+            # Propagate Monday.com item IDs to subitems
             # This enables subitems to be found by create_monday_subitems_from_staging()
+            # Separate transaction: the items already exist in Monday.com, so rolling back their
+            # IDs would re-create them on the next run
             try:
-                subitems_updated = self.update_subitems_parent_item_id(stg_id, monday_item_id)
-                logger.info(f"Propagated Monday item ID {monday_item_id} to {subitems_updated} subitems for parent stg_id {stg_id}")
+                cursor.execute("""
+                    UPDATE sub
+                    SET sub.[stg_monday_parent_item_id] = t.[monday_item_id]
+                    FROM [dbo].[STG_MON_CustMasterSchedule_Subitems] sub
+                    INNER JOIN #stg_item_id_writeback t ON sub.[stg_parent_stg_id] = t.[stg_id]
+                """)
+                subitems_updated = cursor.rowcount
+                
+                cursor.execute("DROP TABLE #stg_item_id_writeback")
+                conn.commit()
             except Exception as e:
-                logger.error(f"❌ Failed to propagate Monday item ID to subitems for stg_id {stg_id}: {e}")
+                conn.rollback()
+                subitems_updated = 0
+                logger.error(f"❌ Failed to propagate Monday item IDs to subitems for {len(rows)} parents: {e}")
                 # Don't fail the entire operation for subitem propagation issues
-            
-        else:
-            logger.warning(f"No staging record found with ID {stg_id}")
-        return rows_affected > 0
+        
+        if orders_updated != len(rows):
+            logger.warning(f"Monday item ID write-back updated {orders_updated} staging records for {len(rows)} stg_ids")
+        logger.info(f"Updated {orders_updated} staging records with Monday item IDs and propagated them to "
+                    f"{subitems_updated} subitems (set-based)")
+        return orders_updated, subitems_updated
+    
+    @staticmethod
+    def _load_temp_table(cursor, temp_table: str, columns_sql: str, rows: List[tuple]) -> None:
+        """(Re)create a #temp table on this connection and fill it with one fast_executemany"""
+        cursor.execute(f"""
+            IF OBJECT_ID('tempdb..{temp_table}') IS NOT NULL DROP TABLE {temp_table};
+            CREATE TABLE {temp_table} ({columns_sql})
+        """)
+        cursor.fast_executemany = True
+        cursor.executemany(f"INSERT INTO {temp_table} VALUES ({', '.join('?' for _ in rows[0])})", rows)
+        cursor.fast_executemany = False
     
     def mark_staging_as_failed(self, stg_id: int, error_message: str, 
                               api_payload: Optional[str] = None) -> bool:
@@ -584,22 +612,14 @@ class StagingOperations:
         # Convert numpy types to native Python types
         stg_id = int(stg_id)
         
+        # Check if optional columns exist
+        existing_columns = self.get_table_columns('STG_MON_CustMasterSchedule')
+        has_api_payload = 'stg_api_payload' in existing_columns
+        has_retry_count = 'stg_retry_count' in existing_columns
+        
         with self.get_connection() as conn:
             cursor = conn.cursor()
             
-            # Check if optional columns exist
-            cursor.execute("""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = 'STG_MON_CustMasterSchedule' 
-                AND TABLE_SCHEMA = 'dbo'
-                AND COLUMN_NAME IN ('stg_api_payload', 'stg_retry_count')
-            """)
-            existing_optional_columns = [row[0] for row in cursor.fetchall()]
-            
-            has_api_payload = 'stg_api_payload' in existing_optional_columns
-            has_retry_count = 'stg_retry_count' in existing_optional_columns
-            
             # Build update query based on available columns
             if has_api_payload and has_retry_count:
                 cursor.execute("""
@@ -641,15 +661,7 @@ class StagingOperations:
         """Get successfully created orders for subitem processing"""
         
         # Get the actual columns that exist in the staging table
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = 'STG_MON_CustMasterSchedule' 
-                AND TABLE_SCHEMA = 'dbo'
-                ORDER BY ORDINAL_POSITION            """)
-            all_columns = [row[0] for row in cursor.fetchall()]
+        all_columns = self.get_table_columns('STG_MON_CustMasterSchedule')
         
         # Define columns we want to select (Monday.com target names after transformation)
         desired_columns = [
@@ -692,16 +704,7 @@ class StagingOperations:
         insert_df['stg_retry_count'] = 0
         
         # Get the actual columns that exist in the target table
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = 'STG_MON_CustMasterSchedule_Subitems' 
-                AND TABLE_SCHEMA = 'dbo'
-                ORDER BY ORDINAL_POSITION
-            """)
-            target_columns = [row[0] for row in cursor.fetchall()]
+        target_columns = self.get_table_columns('STG_MON_CustMasterSchedule_Subitems')
         
         # Filter DataFrame to only include columns that exist in target table
         available_columns = [col for col in insert_df.columns if col in target_columns]
@@ -729,29 +732,11 @@ class StagingOperations:
                 logger.info(f"Starting bulk insert of {len(filtered_df)} records...")
                 
                 # Prepare values list with proper type handling
-                values = []
-                for i, (_, row) in enumerate(filtered_df.iterrows()):
-                    row_values = []
-                    for col in columns:
-                        val = row[col]
-                        if pd.isna(val):
-                            row_values.append(None)
-                        elif isinstance(val, (np.integer, int)):
-                            row_values.append(int(val))
-                        elif isinstance(val, (np.floating, float)):
-                            row_values.append(float(val))
-                        elif isinstance(val, pd.Timestamp):
-                            row_values.append(val.to_pydatetime())
-                        elif isinstance(val, datetime):
-                            row_values.append(val)
-                        else:
-                            row_values.append(str(val))
-                    row_values_tuple = tuple(row_values)
-                    values.append(row_values_tuple)
-                    
-                    # Log first few rows for debugging
-                    if i < 3:
-                        logger.debug(f"Row {i}: {row_values_tuple}")
+                values = self._dataframe_to_param_rows(filtered_df, stringify_objects=True)
+                
+                # Log first few rows for debugging
+                for i, row_values_tuple in enumerate(values[:3]):
+                    logger.debug(f"Row {i}: {row_values_tuple}")
                 
                 logger.info(f"Prepared {len(values)} value tuples for insertion")
                 
@@ -855,26 +840,8 @@ class StagingOperations:
                 
                 logger.info(f"Preparing bulk data for {len(filtered_df)} records...")
                 
-                # Prepare bulk data with better memory management
-                bulk_values = []
-                for i, (_, row) in enumerate(filtered_df.iterrows()):
-                    if i % 1000 == 0:  # Progress logging
-                        logger.info(f"Processed {i}/{len(filtered_df)} records for bulk insert...")
-                    
-                    values = []
-                    for col in columns:
-                        value = row[col]
-                        if pd.isna(value):
-                            values.append(None)
-                        elif isinstance(value, (pd.Timestamp, pd.NaT.__class__)):
-                            values.append(value if not pd.isna(value) else None)
-                        else:
-                            # Truncate very long strings to prevent memory issues
-                            if isinstance(value, str) and len(value) > 8000:
-                                logger.warning(f"Truncating long string in column '{col}' from {len(value)} to 8000 chars")
-                                value = value[:8000]
-                            values.append(value)
-                    bulk_values.append(tuple(values))
+                # Prepare bulk data, truncating very long strings to prevent memory issues
+                bulk_values = self._dataframe_to_param_rows(filtered_df, max_text_length=8000)
                 
                 logger.info(f"Executing bulk insert with {len(bulk_values)} records...")
                 
@@ -1038,40 +1005,77 @@ class StagingOperations:
 
     def update_subitem_with_monday_id(self, stg_subitem_id: int, monday_subitem_id: int) -> None:
         """Update staging subitem with Monday.com subitem ID"""
+        self.update_subitems_with_monday_ids([(stg_subitem_id, monday_subitem_id)])
+
+    def update_subitems_with_monday_ids(self, subitem_ids: List[Tuple[int, int]]) -> int:
+        """Set-based update_subitem_with_monday_id: (stg_subitem_id, monday_subitem_id) rows in one UPDATE"""
         
-        query = """
-            UPDATE STG_MON_CustMasterSchedule_Subitems
-            SET stg_monday_subitem_id = ?,
-                stg_status = 'API_SUCCESS',
-                stg_processed_date = GETDATE()
-            WHERE stg_id = ?
-        """
+        rows = list({int(stg_id): (int(stg_id), int(monday_subitem_id))
+                     for stg_id, monday_subitem_id in subitem_ids}.values())
+        if not rows:
+            return 0
         
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query, (monday_subitem_id, stg_subitem_id))
-            conn.commit()
+            try:
+                self._load_temp_table(cursor, "#stg_subitem_id_writeback", """
+                    [stg_id] BIGINT NOT NULL PRIMARY KEY,
+                    [monday_subitem_id] BIGINT NOT NULL
+                """, rows)
+                cursor.execute("""
+                    UPDATE sub
+                    SET sub.[stg_monday_subitem_id] = t.[monday_subitem_id],
+                        sub.[stg_status] = 'API_SUCCESS',
+                        sub.[stg_processed_date] = GETDATE()
+                    FROM [dbo].[STG_MON_CustMasterSchedule_Subitems] sub
+                    INNER JOIN #stg_subitem_id_writeback t ON sub.[stg_id] = t.[stg_id]
+                """)
+                updated = cursor.rowcount
+                cursor.execute("DROP TABLE #stg_subitem_id_writeback")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
             
-        logger.info(f"Updated subitem stg_id {stg_subitem_id} with Monday.com subitem ID {monday_subitem_id}")
+        logger.info(f"Updated {updated} staging subitems with Monday.com subitem IDs (set-based)")
+        return updated
 
     def mark_subitem_as_failed(self, stg_subitem_id: int, error_message: str) -> None:
         """Mark staging subitem as failed"""
+        self.mark_subitems_as_failed([(stg_subitem_id, error_message)])
+
+    def mark_subitems_as_failed(self, failures: List[Tuple[int, str]]) -> int:
+        """Set-based mark_subitem_as_failed: (stg_subitem_id, error_message) rows in one UPDATE"""
         
-        query = """
-            UPDATE STG_MON_CustMasterSchedule_Subitems
-            SET stg_status = 'API_FAILED',
-                stg_error_message = ?,
-                stg_processed_date = GETDATE(),
-                stg_retry_count = stg_retry_count + 1
-            WHERE stg_id = ?
-        """
+        rows = list({int(stg_id): (int(stg_id), error_message) for stg_id, error_message in failures}.values())
+        if not rows:
+            return 0
         
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(query, (error_message, stg_subitem_id))
-            conn.commit()
+            try:
+                self._load_temp_table(cursor, "#stg_subitem_failures", """
+                    [stg_id] BIGINT NOT NULL PRIMARY KEY,
+                    [error_message] NVARCHAR(MAX) NULL
+                """, rows)
+                cursor.execute("""
+                    UPDATE sub
+                    SET sub.[stg_status] = 'API_FAILED',
+                        sub.[stg_error_message] = t.[error_message],
+                        sub.[stg_processed_date] = GETDATE(),
+                        sub.[stg_retry_count] = sub.[stg_retry_count] + 1
+                    FROM [dbo].[STG_MON_CustMasterSchedule_Subitems] sub
+                    INNER JOIN #stg_subitem_failures t ON sub.[stg_id] = t.[stg_id]
+                """)
+                updated = cursor.rowcount
+                cursor.execute("DROP TABLE #stg_subitem_failures")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
             
-        logger.warning(f"Marked subitem stg_id {stg_subitem_id} as failed: {error_message}")
+        logger.warning(f"Marked {updated} staging subitems as failed: {sorted({message for _, message in rows})}")
+        return updated
 
     def generate_and_insert_subitems(self, batch_id: str) -> int:
         """Generate subitems using SQL JOIN + smart column detection"""
@@ -1102,72 +1106,79 @@ class StagingOperations:
         logger.info(f"Found {len(combined_df)} orders for subitem generation")
         
         # Apply smart column detection (borrowed from get_subitems_for_order)
-        all_subitems = []
-        
-        for _, row in combined_df.iterrows():
-            # Identify candidate size columns by slicing between markers
-            cols = combined_df.columns.tolist()
-            try:
-                start = cols.index('UNIT OF MEASURE') + 1
-                end = cols.index('TOTAL QTY')
-                candidate_cols = cols[start:end]
-            except ValueError:
-                # Fallback: everything except the known key fields
-                candidate_cols = [c for c in cols
-                                  if c not in
-                                  ['AAG ORDER NUMBER', 'CUSTOMER STYLE',
-                                   'CUSTOMER COLOUR DESCRIPTION', 'stg_parent_stg_id',
-                                   'stg_batch_id', 'stg_status', 'stg_created_date']]
-            
-            # Create a single-row DataFrame for melting
-            row_df = pd.DataFrame([row])
-            
-            # Unpivot & filter in one go
-            melted = (
-                row_df
-                .melt(
-                    id_vars=['AAG ORDER NUMBER', 'CUSTOMER STYLE', 'CUSTOMER COLOUR DESCRIPTION', 
-                             'stg_parent_stg_id', 'stg_batch_id', 'stg_status', 'stg_created_date'],
-                    value_vars=candidate_cols,
-                    var_name='Size',
-                    value_name='Qty'
-                )
-                # coerce to numeric and drop zeros / NaN
-                .assign(
-                    Qty=lambda df: pd.to_numeric(df['Qty'], errors='coerce')
-                )
-                .query("Qty > 0")
+        # Identify candidate size columns by slicing between markers
+        cols = combined_df.columns.tolist()
+        try:
+            start = cols.index('UNIT OF MEASURE') + 1
+            end = cols.index('TOTAL QTY')
+            candidate_cols = cols[start:end]
+        except ValueError:
+            # Fallback: everything except the known key fields
+            candidate_cols = [c for c in cols
+                              if c not in
+                              ['AAG ORDER NUMBER', 'CUSTOMER STYLE',
+                               'CUSTOMER COLOUR DESCRIPTION', 'stg_parent_stg_id',
+                               'stg_batch_id', 'stg_status', 'stg_created_date']]
+        
+        id_vars = ['AAG ORDER NUMBER', 'CUSTOMER STYLE', 'CUSTOMER COLOUR DESCRIPTION',
+                   'stg_parent_stg_id', 'stg_batch_id', 'stg_status', 'stg_created_date']
+        
+        # Unpivot all orders at once (object values, so every quantity keeps its source type)
+        size_df = combined_df[candidate_cols].astype(object)
+        melted = (
+            pd.concat([combined_df[id_vars], size_df], axis=1)
+            .assign(_order_pos=np.arange(len(combined_df)))
+            .melt(
+                id_vars=id_vars + ['_order_pos'],
+                value_vars=candidate_cols,
+                var_name='Size',
+                value_name='Qty'
             )
-            
-            if not melted.empty:
-                # Map columns for staging table
-                melted = melted.rename(columns={
-                    'CUSTOMER STYLE': 'STYLE',
-                    'CUSTOMER COLOUR DESCRIPTION': 'COLOR',
-                    'Qty': 'ORDER_QTY'
-                })
-                
-                # Add required staging columns
-                melted['AAG_ORDER_NUMBER'] = melted['AAG ORDER NUMBER'] 
-                melted['Order Qty'] = melted['ORDER_QTY'].astype(str)
-                
-                # Keep only required columns for staging insert
-                final_cols = [
-                    'stg_parent_stg_id', 'stg_batch_id', 'stg_status', 'stg_created_date',
-                    'AAG_ORDER_NUMBER', 'STYLE', 'COLOR', 'Size', 'ORDER_QTY', 'Order Qty'
-                ]
-                
-                subitem_df = melted[final_cols]
-                all_subitems.append(subitem_df)
-
-
-        
-        if not all_subitems:
+        )
+        # coerce to numeric and drop zeros / NaN
+        melted['ORDER_QTY'] = pd.to_numeric(melted['Qty'], errors='coerce')
+        
+        # 'Order Qty' keeps the per-order text format: integers only when every size
+        # quantity of that order parses as an integer, otherwise float text ('12.0')
+        integer_kind = {}
+        
+        def is_integer_qty(value):
+            key = (type(value), str(value))
+            if key not in integer_kind:
+                integer_kind[key] = pd.to_numeric(pd.Series([value], dtype=object), errors='coerce').dtype.kind in 'iu'
+            return integer_kind[key]
+        
+        integer_order = (
+            melted['Qty'].map(is_integer_qty, na_action=None).astype(bool)
+            .groupby(melted['_order_pos']).transform('all')
+        )
+        melted = melted[melted['ORDER_QTY'] > 0].sort_values('_order_pos', kind='stable')
+        integer_order = integer_order.loc[melted.index]
+        
+        if melted.empty:
             logger.info("No subitems generated (no positive quantities found)")
             return 0
         
-        # Combine all subitems and insert
-        final_subitems_df = pd.concat(all_subitems, ignore_index=True)
+        # Map columns for staging table
+        melted = melted.rename(columns={
+            'CUSTOMER STYLE': 'STYLE',
+            'CUSTOMER COLOUR DESCRIPTION': 'COLOR'
+        })
+        
+        # Add required staging columns
+        melted['AAG_ORDER_NUMBER'] = melted['AAG ORDER NUMBER']
+        melted['Order Qty'] = np.where(integer_order,
+                                       melted['ORDER_QTY'].astype('int64').astype(str),
+                                       melted['ORDER_QTY'].astype(str))
+        if integer_order.all():
+            melted['ORDER_QTY'] = melted['ORDER_QTY'].astype('int64')
+        
+        # Keep only required columns for staging insert
+        final_cols = [
+            'stg_parent_stg_id', 'stg_batch_id', 'stg_status', 'stg_created_date',
+            'AAG_ORDER_NUMBER', 'STYLE', 'COLOR', 'Size', 'ORDER_QTY', 'Order Qty'
+        ]
+        final_subitems_df = melted[final_cols].reset_index(drop=True)
         logger.info(f"Generated {len(final_subitems_df)} subitems for insertion")
         
         # Use existing insert method (which already adds stg_batch_id, etc.)
@@ -9,6 +9,7 @@ import io
 import sys
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import List, Dict
@@ -42,6 +43,9 @@ import auth_helper  # noqa: E402 (from pipelines/utils/)
 import logger_helper  # noqa: E402 (from pipelines/utils/)
 import db_helper as db  # noqa: E402 (from pipelines/utils/)
 
+sys.path.insert(0, str(Path(__file__).parent))
+from order_list_manifest import OrderListManifest, content_hash  # noqa: E402
+
 # Create logger instance for consistent usage
 logger = logger_helper.get_logger(__name__)
 
@@ -69,18 +73,23 @@ DRIVE_ID = "b!Aw3US9PgWEqI3AsHsnFh4VDpZqG7xMZFvusMriy0vjlVvmF4ME5wR6vdOy90ye56"
 MAX_DEPTH = 2  # Increased depth to find files in deeper folders like ROC
 ORDER_LIST_FOLDER_MATCHES = ["order list", "roc"]  # Search in folders containing these terms
 ORDER_LIST_FILE_MATCH = "order list (m3)"
+UPLOAD_WORKERS = int(os.getenv('ORDER_LIST_UPLOAD_WORKERS', '4'))  # concurrent SharePoint → blob transfers
+UPLOAD_MAX_ATTEMPTS = 2  # per-file attempts
 
 results = []
 
 class OrderListBlobUploader:
     """Upload ORDER_LIST XLSX files from SharePoint to Azure Blob Storage"""
     
-    def __init__(self, auth_cache_key: str = "order_list_pipeline"):
+    def __init__(self, auth_cache_key: str = "order_list_pipeline", force: bool = False, use_manifest: bool = True):
         self.results = []
         self.uploaded_files = []
         self.blob_client = None
         self.headers = None
         self.auth_cache_key = auth_cache_key  # Unique cache key for this pipeline
+        self.force = force  # re-transfer every file even if the manifest says it is unchanged
+        self.use_manifest = use_manifest
+        self.manifest = None
         
     def initialize_services(self):
         """Initialize Microsoft Graph and Azure Blob Storage clients"""
@@ -103,6 +112,11 @@ class OrderListBlobUploader:
         )
         self.blob_client = blob_svc.get_container_client(SOURCE_CONTAINER)
         
+        # File fingerprints from the last run (skip unchanged workbooks)
+        if self.use_manifest:
+            self.manifest = OrderListManifest()
+            self.manifest.load()
+        
         logger.info("[SUCCESS] Services initialized successfully")
     
     def search_for_order_list_files(self, drive_id: str, folder_id: str, region: str, parent_name: str, subfolder_name: str):
@@ -127,7 +141,8 @@ class OrderListBlobUploader:
                         "DownloadURL": item.get("@microsoft.graph.downloadUrl"),
                         "ItemId": item.get("id"),
                         "Size": item.get("size", 0),
-                        "LastModified": item.get("lastModifiedDateTime")
+                        "LastModified": item.get("lastModifiedDateTime"),
+                        "ETag": item.get("eTag")
                     }
                     
                     self.results.append(file_info)
@@ -186,10 +201,23 @@ class OrderListBlobUploader:
             except:
                 logger.info(f"[NEW] New file will be uploaded: {blob_name}")
             
+            # Same SharePoint version as the last upload: nothing to transfer
+            if (file_exists and not self.force and self.manifest is not None and
+                    self.manifest.is_source_unchanged(blob_name, file_info.get('ETag'), file_info.get('LastModified'))):
+                logger.info(f"[SKIP] Unchanged since last upload (SharePoint eTag): {blob_name}")
+                return self._skipped_result(file_info, blob_name, start_time)
+            
             # Download file from SharePoint
             logger.info(f"[DOWNLOAD] Downloading: {file_info['FileName']}")
             download_resp = requests.get(file_info['DownloadURL'], headers=self.headers)
             download_resp.raise_for_status()
+            sha256 = content_hash(download_resp.content)
+            
+            # New eTag but identical bytes (e.g. metadata-only edit): keep the existing blob
+            if file_exists and not self.force and (blob_props.metadata or {}).get('content_sha256') == sha256:
+                logger.info(f"[SKIP] Content unchanged since last upload (sha256): {blob_name}")
+                self._record_upload(file_info, blob_name, sha256)
+                return self._skipped_result(file_info, blob_name, start_time)
             
             # Upload to Azure Blob Storage
             logger.info(f"[UPLOAD] Uploading to blob storage: {blob_name}")
@@ -202,9 +230,11 @@ class OrderListBlobUploader:
                     'source_folder': file_info['Subfolder'],
                     'upload_timestamp': timestamp,
                     'source_url': file_info['FileURL'],
-                    'file_size': str(file_info['Size'])
+                    'file_size': str(file_info['Size']),
+                    'content_sha256': sha256
                 }
             )
+            self._record_upload(file_info, blob_name, sha256)
             
             elapsed = time.time() - start_time
             size_mb = file_info['Size'] / (1024 * 1024) if file_info['Size'] else 0
@@ -229,6 +259,31 @@ class OrderListBlobUploader:
                 'elapsed': time.time() - start_time
             }
     
+    def _record_upload(self, file_info: Dict, blob_name: str, sha256: str):
+        """Remember this SharePoint version + content hash in the manifest"""
+        if self.manifest is not None:
+            self.manifest.record_upload(blob_name, file_info.get('ETag'), file_info.get('LastModified'),
+                                        sha256, file_info.get('Size') or 0)
+    
+    def _skipped_result(self, file_info: Dict, blob_name: str, start_time: float) -> Dict:
+        return {
+            'success': True,
+            'skipped': True,
+            'file_info': file_info,
+            'blob_name': blob_name,
+            'size_mb': 0,
+            'elapsed': time.time() - start_time
+        }
+    
+    def download_and_upload_with_retry(self, file_info: Dict) -> Dict:
+        """download_and_upload_file, retried up to UPLOAD_MAX_ATTEMPTS times"""
+        for attempt in range(1, UPLOAD_MAX_ATTEMPTS + 1):
+            result = self.download_and_upload_file(file_info)
+            result['attempts'] = attempt
+            if result['success'] or attempt == UPLOAD_MAX_ATTEMPTS:
+                return result
+            logger.warning(f"[RETRY] Retrying {file_info['FileName']} (attempt {attempt + 1}/{UPLOAD_MAX_ATTEMPTS})")
+
     def process_all_files(self):
         """Find all ORDER_LIST files and upload them to blob storage"""
         logger.info("[START] Starting ORDER_LIST file discovery and upload process")
@@ -248,15 +303,17 @@ class OrderListBlobUploader:
         
         logger.info(f"[FOUND] Found {len(self.results)} ORDER_LIST files")
         
-        # Upload files to blob storage
-        logger.info("[UPLOAD] Starting file uploads to Azure Blob Storage...")
-        for file_info in self.results:
-            result = self.download_and_upload_file(file_info)
-            self.uploaded_files.append(result)
+        # Upload files to blob storage (UPLOAD_WORKERS transfers in flight, results in discovery order)
+        logger.info(f"[UPLOAD] Starting file uploads to Azure Blob Storage ({UPLOAD_WORKERS} workers)...")
+        wall_start = time.time()
+        with ThreadPoolExecutor(max_workers=max(1, UPLOAD_WORKERS), thread_name_prefix="order_list_blob") as pool:
+            self.uploaded_files.extend(pool.map(self.download_and_upload_with_retry, self.results))
+        wall_time = time.time() - wall_start
         
         # Generate summary report
         successful_uploads = [r for r in self.uploaded_files if r['success']]
         failed_uploads = [r for r in self.uploaded_files if not r['success']]
+        skipped_uploads = [r for r in successful_uploads if r.get('skipped')]
         
         total_size_mb = sum(r.get('size_mb', 0) for r in successful_uploads)
         total_time = sum(r.get('elapsed', 0) for r in self.uploaded_files)
@@ -265,11 +322,11 @@ class OrderListBlobUploader:
         logger.info("[SUMMARY] UPLOAD SUMMARY")
         logger.info("-" * 50)
         logger.info(f"Files found: {len(self.results)}")
-        logger.info(f"Successful uploads: {len(successful_uploads)}")
+        logger.info(f"Successful uploads: {len(successful_uploads)} ({len(skipped_uploads)} unchanged, skipped)")
         logger.info(f"Failed uploads: {len(failed_uploads)}")
         logger.info(f"Success rate: {success_rate:.1f}%")
         logger.info(f"Total size: {total_size_mb:.2f} MB")
-        logger.info(f"Total time: {total_time:.2f}s")
+        logger.info(f"Total time: {total_time:.2f}s (wall {wall_time:.2f}s)")
         
         if failed_uploads:
             logger.warning("[FAILURES] Failed uploads:")
@@ -279,8 +336,10 @@ class OrderListBlobUploader:
         return {
             'files_found': len(self.results),
             'files_uploaded': len(successful_uploads),
+            'files_skipped': len(skipped_uploads),
             'success_rate': success_rate,
             'total_size_mb': total_size_mb,
+            'wall_time': wall_time,
             'results': self.uploaded_files
         }
 
@@ -7,13 +7,16 @@
 #   else in your repo changes.
 # * ENHANCED: Robust retry logic and explicit Excel engine specification
 
-import os, io, re, sys, time, csv, warnings
+import os, io, re, sys, time, csv, warnings, zipfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import random
 
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
 from azure.identity import ClientSecretCredential
 from azure.storage.blob import BlobServiceClient, generate_container_sas, ContainerSasPermissions
 
@@ -47,6 +50,9 @@ import db_helper                 # noqa: E402
 import schema_helper             # noqa: E402
 import logger_helper             # noqa: E402
 
+sys.path.insert(0, str(Path(__file__).parent))
+from order_list_manifest import OrderListManifest, content_hash  # noqa: E402
+
 # Create logger instance for consistent usage
 logger = logger_helper.get_logger(__name__)
 
@@ -64,7 +70,19 @@ TARGET_CONTAINER = "orderlistcsv"
 
 DB_KEY            = "orders"
 OVERWRITE_DB      = True
-MAX_WORKERS       = 4  # keep sequential if you suspect throttling
+MAX_WORKERS       = int(os.getenv('ORDER_LIST_MAX_WORKERS', '4'))  # files in flight (blob I/O + DB load threads); 1 = sequential
+PARSE_WORKERS     = int(os.getenv('ORDER_LIST_PARSE_WORKERS', str(min(MAX_WORKERS, os.cpu_count() or 1))))  # Excel parsing processes; 0 = parse in the file thread
+FILE_MAX_ATTEMPTS = 2  # whole-file attempts on top of the per-step retries below
+EXCEL_READER      = os.getenv('ORDER_LIST_EXCEL_READER', 'streaming')  # 'streaming' (single-pass openpyxl) or 'pandas'
+LOAD_METHOD       = os.getenv('ORDER_LIST_LOAD_METHOD', 'blob')  # 'blob' (CSV → blob → BULK INSERT) or 'direct' (fast_executemany)
+DIRECT_CHUNK_ROWS = int(os.getenv('ORDER_LIST_DIRECT_CHUNK_ROWS', '20000'))  # rows converted + sent per executemany
+LOAD_METHODS      = ('blob', 'direct')
+
+# Header cells that identify an ORDER_LIST sheet when a workbook has no MASTER sheet
+ORDER_LIST_KEY_HEADERS = {
+    "AAG ORDER NUMBER", "CUSTOMER NAME", "PO NUMBER", "CUSTOMER STYLE",
+    "ORDER TYPE", "ORDER QTY", "TOTAL QTY", "AAG SEASON", "CUSTOMER SEASON",
+}
 
 # ---------------- RETRY CONFIGURATION ----------------------------------------
 MAX_RETRIES = 3
@@ -115,6 +133,19 @@ def validate_excel_file(xlsx_bytes: bytes, filename: str) -> bool:
             logger.warning(f"File {filename} does not have valid Excel signature")
             return False
         
+        # .xlsx: a readable zip with a workbook part is enough - the sheets are parsed once, later
+        if file_start.startswith(b'PK\x03\x04'):
+            try:
+                with zipfile.ZipFile(io.BytesIO(xlsx_bytes)) as archive:
+                    if 'xl/workbook.xml' not in archive.namelist():
+                        logger.warning(f"File {filename} has no workbook part")
+                        return False
+                logger.info(f"File {filename} validation passed: xlsx package")
+                return True
+            except zipfile.BadZipFile as e:
+                logger.warning(f"File {filename} is not a valid xlsx package: {e}")
+                return False
+        
         # Try to create ExcelFile object with explicit engine
         try:
             excel_file = pd.ExcelFile(io.BytesIO(xlsx_bytes), engine='openpyxl')
@@ -164,6 +195,15 @@ def best_sheet_with_retry(xlsx_bytes: bytes, filename: str) -> str:
                 logger.error(f"Failed to determine best sheet for {filename} after {MAX_RETRIES} attempts")
                 raise
 
+def blob_content_hash(blob_name: str, src_client) -> Optional[str]:
+    """content_sha256 stamped on the blob by order_list_blob (None if missing or unreadable)"""
+    try:
+        properties = src_client.get_blob_client(blob_name).get_blob_properties()
+        return (properties.metadata or {}).get('content_sha256')
+    except Exception as e:
+        logger.warning(f"Could not read blob properties for {blob_name}: {e}")
+        return None
+
 def download_blob_with_retry(blob_name: str, src_client) -> bytes:
     """Download blob with retry logic and validation"""
     for attempt in range(MAX_RETRIES):
@@ -224,6 +264,120 @@ def read_excel_with_retry(xlsx_bytes: bytes, sheet_name: str, filename: str) ->
                 logger.error(f"Failed to read Excel {filename} after {MAX_RETRIES} attempts")
                 raise
 
+# ---------------- single-pass streaming reader (.xlsx) -------------------------
+
+def _cell_value(cell):
+    """Cell → value the way pd.read_excel(dtype=str, na_filter=False) sees it (openpyxl engine)"""
+    value = cell.value
+    if value is None:
+        return ""
+    if cell.data_type == 'e':  # #N/A, #REF! ...
+        return np.nan
+    if cell.data_type == 'n':
+        as_int = int(value)
+        return as_int if as_int == value else float(value)
+    return value
+
+def _header_names(header_row: list) -> list:
+    """
+    Column labels as pandas builds them: blanks → 'Unnamed: i', duplicates → 'X.1', 'X.2',
+    every other header cell keeps its value (a 2026 header stays the int 2026)
+    """
+    names, counts = [], {}
+    for i, value in enumerate(header_row):
+        name = f"Unnamed: {i}" if value == "" or value is np.nan else value
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        counts[name] = count + 1
+        names.append(name)
+    return names
+
+def score_sheet(worksheet) -> Tuple[int, int]:
+    """(ORDER_LIST header cells in row 1, rows from the sheet dimensions) - reads only the first row"""
+    header = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ()) or ()
+    matches = sum(1 for value in header
+                  if value is not None and re.sub(r"\s+", " ", str(value)).strip().upper() in ORDER_LIST_KEY_HEADERS)
+    return matches, worksheet.max_row or 0
+
+def pick_sheet(workbook, filename: str) -> str:
+    """MASTER if present, else the sheet with most ORDER_LIST headers (then most rows), else the first sheet"""
+    sheet_names = [worksheet.title for worksheet in workbook.worksheets]  # chartsheets excluded, as in pandas
+    if "MASTER" in sheet_names:
+        logger.info(f"Using MASTER sheet from {filename}")
+        return "MASTER"
+    
+    scores = {name: score_sheet(workbook[name]) for name in sheet_names}
+    best_sheet = max(sheet_names, key=lambda name: scores[name])
+    if scores[best_sheet][0] == 0:
+        best_sheet = sheet_names[0]
+        logger.info(f"Using first sheet '{best_sheet}' from {filename} (no ORDER_LIST headers found)")
+    else:
+        logger.info(f"Using sheet '{best_sheet}' from {filename} "
+                    f"({scores[best_sheet][0]} ORDER_LIST headers, ~{scores[best_sheet][1]:,} rows)")
+    return best_sheet
+
+def sheet_to_dataframe(worksheet) -> pd.DataFrame:
+    """
+    Stream one read-only worksheet into a string DataFrame, matching
+    pd.read_excel(sheet_name=..., dtype=str, na_filter=False, engine='openpyxl')
+    """
+    worksheet.reset_dimensions()  # stored dimensions can be wrong; read every cell that is there
+    data, last_row_with_data = [], -1
+    for row_number, row in enumerate(worksheet.iter_rows()):
+        values = [_cell_value(cell) for cell in row]
+        while values and values[-1] == "":
+            values.pop()
+        if values:
+            last_row_with_data = row_number
+        data.append(values)
+    data = data[:last_row_with_data + 1]
+    if not data:
+        return pd.DataFrame()
+    
+    width = max(len(values) for values in data)
+    data = [values + [""] * (width - len(values)) for values in data]
+    header, rows = data[0], data[1:]
+    if width == 1:  # pandas skips blank lines, which only a single-column sheet can have
+        rows = [values for values in rows if not (isinstance(values[0], str) and not values[0].strip())]
+    
+    df = pd.DataFrame(rows, columns=_header_names(header), dtype=object)
+    for column in df.columns:
+        # dtype=str: every non-null value becomes its string form, errors stay NaN
+        values = df[column].to_numpy(copy=True)
+        not_null = ~pd.isna(values)
+        values[not_null] = values[not_null].astype(str)
+        df[column] = values
+    return df
+
+def read_workbook_single_pass(xlsx_bytes: bytes, filename: str) -> Tuple[str, pd.DataFrame]:
+    """Open the workbook once (read-only/streaming), pick the best sheet and read only that sheet"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            workbook = load_workbook(io.BytesIO(xlsx_bytes), read_only=True, data_only=True, keep_links=False)
+            try:
+                best_sheet = pick_sheet(workbook, filename)
+                df = sheet_to_dataframe(workbook[best_sheet])
+            finally:
+                workbook.close()
+            
+            logger.info(f"Successfully read {filename} sheet '{best_sheet}': {len(df)} rows, {len(df.columns)} columns")
+            return best_sheet, df
+            
+        except Exception as e:
+            logger.warning(f"Streaming read attempt {attempt + 1}/{MAX_RETRIES} failed for {filename}: {e}")
+            if attempt < MAX_RETRIES - 1:
+                delay = RETRY_DELAY_BASE * (RETRY_BACKOFF_MULTIPLIER ** attempt)
+                jitter = random.uniform(0, JITTER_MAX)
+                sleep_time = delay + jitter
+                logger.info(f"Retrying streaming read of {filename} in {sleep_time:.2f} seconds...")
+                time.sleep(sleep_time)
+            else:
+                logger.error(f"Failed to read Excel {filename} after {MAX_RETRIES} attempts")
+                raise
+
 def clean_df(df: pd.DataFrame) -> pd.DataFrame:
     """Clean DataFrame with enhanced validation"""
     original_rows = len(df)
@@ -239,8 +393,12 @@ def clean_df(df: pd.DataFrame) -> pd.DataFrame:
     # Remove completely empty rows
     df = df.dropna(how="all")
     
-    # Remove rows where all values are empty strings
-    df = df.loc[~df.apply(lambda r: r.astype(str).str.strip().eq("").all(), axis=1)]
+    # Remove rows where all values are empty strings (one vectorized mask per column)
+    if len(df.columns):
+        blank = np.ones(len(df), dtype=bool)
+        for column in df.columns:
+            blank &= df[column].astype(str).str.strip().eq("").to_numpy()
+        df = df.loc[~blank]
     
     logger.info(f"DataFrame cleaning: {original_rows}→{len(df)} rows, {original_cols}→{len(df.columns)} columns")
     return df
@@ -280,7 +438,20 @@ def ensure_external_ds() -> None:
     conn.commit()
     cur.close(); conn.close()
 
-# ---------------- core loader --------------------------------------------------
+# ---------------- core loaders -------------------------------------------------
+
+def create_raw_table(df: pd.DataFrame, table: str, conn, cur) -> Dict:
+    """(Re)create dbo.table with types inferred from df; returns the schema_helper schema"""
+    if OVERWRITE_DB:
+        cur.execute(f"IF OBJECT_ID('dbo.{table}','U') IS NOT NULL DROP TABLE dbo.{table}")
+        conn.commit()
+
+    cols_sql, schema = schema_helper.generate_table_schema(df)
+    cur.execute(f"CREATE TABLE dbo.{table} ({', '.join(cols_sql)})")
+    conn.commit()
+    # DDL on a raw cursor bypasses db_helper.execute - drop the cached column list ourselves
+    db_helper.invalidate_schema(DB_KEY, table)
+    return schema
 
 def bulk_load(df: pd.DataFrame, table: str, trg_client) -> int:
     """Bulk load with enhanced error handling"""
@@ -288,13 +459,7 @@ def bulk_load(df: pd.DataFrame, table: str, trg_client) -> int:
     cur  = conn.cursor()
 
     try:
-        if OVERWRITE_DB:
-            cur.execute(f"IF OBJECT_ID('dbo.{table}','U') IS NOT NULL DROP TABLE dbo.{table}")
-            conn.commit()
-
-        cols_sql, schema = schema_helper.generate_table_schema(df)
-        cur.execute(f"CREATE TABLE dbo.{table} ({', '.join(cols_sql)})")
-        conn.commit()
+        schema = create_raw_table(df, table, conn, cur)
 
         df_sql = schema_helper.convert_df_for_sql(df, schema)
 
@@ -337,26 +502,125 @@ def bulk_load(df: pd.DataFrame, table: str, trg_client) -> int:
         cur.close()
         conn.close()
 
+def raw_table_rows(df_sql: pd.DataFrame) -> List[tuple]:
+    """
+    convert_df_for_sql output → executemany rows, with the NULLs the CSV path produces:
+    empty strings, NaN and NaT load as NULL; datetimes as naive UTC
+    """
+    columns = []
+    for column in df_sql.columns:
+        series = df_sql[column]
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            series = series.dt.tz_convert('UTC').dt.tz_localize(None)
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values = series.array.to_pydatetime()
+        else:
+            values = series.to_numpy(dtype=object, copy=True)
+        null_mask = pd.isna(values)
+        if series.dtype == object:
+            null_mask |= (series == "").to_numpy()
+        values[null_mask] = None
+        columns.append(values)
+    return list(zip(*columns))
+
+def direct_load(df: pd.DataFrame, table: str, trg_client=None) -> int:
+    """
+    Load df straight into dbo.table with fast_executemany - no CSV, no blob, no external
+    data source. Converts and sends DIRECT_CHUNK_ROWS rows at a time in one transaction,
+    so only one chunk of row tuples is in memory next to the DataFrame.
+    """
+    conn = db_helper.get_connection(DB_KEY)
+    cur  = conn.cursor()
+
+    try:
+        schema = create_raw_table(df, table, conn, cur)
+
+        collist = ", ".join(f"[{c}]" for c in df.columns)
+        placeholders = ", ".join("?" for _ in df.columns)
+        insert_sql = f"INSERT INTO dbo.{table} ({collist}) VALUES ({placeholders})"
+
+        cur.fast_executemany = True
+        for start in range(0, len(df), DIRECT_CHUNK_ROWS):
+            chunk = schema_helper.convert_df_for_sql(df.iloc[start:start + DIRECT_CHUNK_ROWS], schema)
+            cur.executemany(insert_sql, raw_table_rows(chunk))
+        conn.commit()
+
+        cur.execute(f"SELECT COUNT(*) FROM dbo.{table}")
+        rows = cur.fetchone()[0]
+
+        logger.info(f"[{table}] DIRECT INSERT: {rows:,} rows loaded in chunks of {DIRECT_CHUNK_ROWS:,}")
+
+        return rows
+
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        conn.close()
+
 # ---------------- enhanced per‑file pipeline --------------------------------
 
-def process_blob(blob_name: str, src_client, trg_client) -> Dict:
-    """Enhanced process_blob with comprehensive retry and error handling"""
+def parse_workbook(xlsx_bytes: bytes, blob_name: str) -> Tuple[pd.DataFrame, float]:
+    """
+    Best sheet → DataFrame → clean_df, returning (df, parse seconds).
+    Top-level so it can run in the parse process pool.
+    """
+    start = time.perf_counter()
+    if EXCEL_READER == 'streaming' and blob_name.lower().endswith('.xlsx'):
+        _, df = read_workbook_single_pass(xlsx_bytes, blob_name)
+    else:
+        best_sheet = best_sheet_with_retry(xlsx_bytes, blob_name)
+        df = read_excel_with_retry(xlsx_bytes, best_sheet, blob_name)
+    df = clean_df(df)
+    return df, time.perf_counter() - start
+
+def skipped_result(blob_name: str, start: float) -> Dict:
+    """Result for a file whose RAW table is already loaded from identical content"""
+    logger.info(f"⏭️ {blob_name} unchanged since last extract - keeping {safe_table_name(blob_name)}")
+    return {
+        'file': blob_name,
+        'table': safe_table_name(blob_name),
+        'rows_src': 0,
+        'rows_db': 0,
+        'match': True,
+        'elapsed': time.time() - start,
+        'parse_time': 0.0,
+        'success': True,
+        'skipped': True
+    }
+
+def process_blob(blob_name: str, src_client, trg_client, parse_pool: Optional[ProcessPoolExecutor] = None,
+                 manifest: Optional[OrderListManifest] = None, force: bool = False,
+                 load_method: str = LOAD_METHOD) -> Dict:
+    """
+    Enhanced process_blob with comprehensive retry and error handling.
+    With a manifest, files whose content hash matches the last successful extract are skipped
+    (unless force) and successful loads are recorded. load_method picks bulk_load ('blob')
+    or direct_load ('direct').
+    """
     start = time.time()
+    skip_unchanged = manifest is not None and not force
     
     try:
         logger.info(f"Processing blob: {blob_name}")
         
+        # Hash stamped at upload time: skip without downloading
+        if skip_unchanged and manifest.is_extract_current(blob_name, blob_content_hash(blob_name, src_client)):
+            return skipped_result(blob_name, start)
+        
         # Download with retry and validation
         data = download_blob_with_retry(blob_name, src_client)
+        sha256 = content_hash(data)
+        if skip_unchanged and manifest.is_extract_current(blob_name, sha256):
+            return skipped_result(blob_name, start)
         
-        # Get best sheet with retry
-        best_sheet = best_sheet_with_retry(data, blob_name)
-        
-        # Read Excel with retry and explicit engine
-        df = read_excel_with_retry(data, best_sheet, blob_name)
-        
-        # Clean DataFrame
-        df = clean_df(df)
+        # Pick sheet, read and clean (CPU-bound: in the parse process pool when given)
+        if parse_pool is not None:
+            df, parse_time = parse_pool.submit(parse_workbook, data, blob_name).result()
+        else:
+            df, parse_time = parse_workbook(data, blob_name)
+        del data
         
         # Add metadata columns
         df['_SOURCE_FILE'] = blob_name
@@ -366,7 +630,8 @@ def process_blob(blob_name: str, src_client, trg_client) -> Dict:
         table = safe_table_name(blob_name)
         
         # Load to database with retry
-        loaded = bulk_load(df, table, trg_client)
+        loader = direct_load if load_method == 'direct' else bulk_load
+        loaded = loader(df, table, trg_client)
 
         processing_time = time.time() - start
         
@@ -377,11 +642,14 @@ def process_blob(blob_name: str, src_client, trg_client) -> Dict:
             'rows_db': loaded,
             'match': len(df) == loaded,
             'elapsed': processing_time,
+            'parse_time': parse_time,
             'success': True
         }
         
         if result['match']:
-            logger.info(f"✅ {blob_name} → {table}: {loaded:,} rows in {processing_time:.1f}s")
+            logger.info(f"✅ {blob_name} → {table}: {loaded:,} rows in {processing_time:.1f}s (parse {parse_time:.1f}s)")
+            if manifest is not None:
+                manifest.record_extract(blob_name, table, sha256, loaded)
         else:
             logger.warning(f"⚠️ {blob_name} → {table}: Row count mismatch ({len(df)} vs {loaded})")
             
@@ -398,14 +666,86 @@ def process_blob(blob_name: str, src_client, trg_client) -> Dict:
             'rows_db': 0,
             'match': False,
             'elapsed': processing_time,
+            'parse_time': 0.0,
             'success': False,
             'error': str(e)
         }
 
+def process_blob_with_retry(blob_name: str, src_client, trg_client,
+                            parse_pool: Optional[ProcessPoolExecutor] = None,
+                            manifest: Optional[OrderListManifest] = None, force: bool = False,
+                            load_method: str = LOAD_METHOD) -> Dict:
+    """process_blob, retrying the whole file (download → parse → load) up to FILE_MAX_ATTEMPTS times"""
+    for attempt in range(1, FILE_MAX_ATTEMPTS + 1):
+        result = process_blob(blob_name, src_client, trg_client, parse_pool, manifest, force, load_method)
+        result['attempts'] = attempt
+        if result['success'] or attempt == FILE_MAX_ATTEMPTS:
+            return result
+        logger.warning(f"Retrying {blob_name} (file attempt {attempt + 1}/{FILE_MAX_ATTEMPTS})")
+
+def start_parse_pool(parse_workers: int = PARSE_WORKERS) -> Optional[ProcessPoolExecutor]:
+    """
+    Excel parse process pool with its workers already running.
+
+    Under fork (the Linux default) the first submit forks every worker at once, so a no-op
+    submit here does it while the caller is still single-threaded: workers forked later,
+    from a file thread, could inherit locks (logging, DB driver) held by another thread.
+    Spawn / forkserver pools start workers from a clean interpreter and are unaffected.
+    """
+    if parse_workers <= 0:
+        return None
+    parse_pool = ProcessPoolExecutor(max_workers=parse_workers)
+    parse_pool.submit(int).result()
+    return parse_pool
+
+def process_blobs(blobs: List[str], src_client, trg_client,
+                  max_workers: int = MAX_WORKERS, parse_workers: int = PARSE_WORKERS,
+                  manifest: Optional[OrderListManifest] = None, force: bool = False,
+                  load_method: str = LOAD_METHOD) -> List[Dict]:
+    """
+    Process files concurrently: a thread per file in flight for blob download and
+    DB load, Excel parsing in a process pool. Results are returned in blobs order.
+    """
+    results: List[Optional[Dict]] = [None] * len(blobs)
+    parse_pool = start_parse_pool(parse_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="order_list") as pool:
+            futures = {pool.submit(process_blob_with_retry, blob_name, src_client, trg_client, parse_pool,
+                                   manifest, force, load_method): index
+                       for index, blob_name in enumerate(blobs)}
+            successful_files = failed_files = 0
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[futures[future]] = result
+                if result['success'] and result['match']:
+                    successful_files += 1
+                else:
+                    failed_files += 1
+                logger.info(f"[{done}/{len(blobs)}] Finished: {result['file']}")
+
+                # Progress update every 10 files
+                if done % 10 == 0:
+                    logger.info(f"Progress: {done}/{len(blobs)} files processed ({successful_files} success, {failed_files} failed)")
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown(wait=True)
+    return results
+
 # ---------------- driver ------------------------------------------------------
 
-def main():
-    """ORDER_LIST Extract Phase: Blob storage → SQL tables with enhanced reliability"""
+def main(force: bool = False, use_manifest: bool = True, load_method: str = None):
+    """
+    ORDER_LIST Extract Phase: Blob storage → SQL tables with enhanced reliability
+
+    Args:
+        force: Reload every file even if the manifest says its RAW table is current
+        use_manifest: Skip unchanged files / record loads in ORDER_LIST_FILE_MANIFEST
+        load_method: 'blob' (CSV via blob storage + BULK INSERT) or 'direct' (fast_executemany);
+            default ORDER_LIST_LOAD_METHOD
+    """
+    load_method = load_method or LOAD_METHOD
+    if load_method not in LOAD_METHODS:
+        raise ValueError(f"Unknown load method '{load_method}' (expected one of {LOAD_METHODS})")
     
     try:
         # Get blob clients (lazy initialization for better performance)
@@ -414,36 +754,41 @@ def main():
         logger.info("[*] ORDER_LIST - RAW Landing Pipeline (extract-only)")
         logger.info("=" * 60)
         logger.info(f"Retry configuration: {MAX_RETRIES} attempts, {RETRY_DELAY_BASE}s base delay")
+        logger.info(f"Load method: {load_method}")
         
-        ensure_external_ds()
+        # The CSV staging container is only read through the external data source
+        if load_method == 'blob':
+            ensure_external_ds()
+
+        manifest = None
+        if use_manifest:
+            manifest = OrderListManifest(DB_KEY)
+            manifest.load()
 
         # Get list of Excel files
         blobs = [b.name for b in src_client.list_blobs() if b.name.lower().endswith(('.xlsx', '.xls'))]
         logger.info(f"Found {len(blobs)} Excel files to process")
         
-        # Process files sequentially with enhanced error handling
-        results = []
-        successful_files = 0
-        failed_files = 0
-        
-        for i, blob_name in enumerate(blobs, 1):
-            logger.info(f"[{i}/{len(blobs)}] Processing: {blob_name}")
-            
-            result = process_blob(blob_name, src_client, trg_client)
-            results.append(result)
-            
-            if result['success'] and result['match']:
-                successful_files += 1
-            else:
-                failed_files += 1
-                
-            # Progress update every 10 files
-            if i % 10 == 0:
-                logger.info(f"Progress: {i}/{len(blobs)} files processed ({successful_files} success, {failed_files} failed)")
+        # Process files concurrently (MAX_WORKERS files in flight, PARSE_WORKERS parse processes)
+        logger.info(f"Concurrency: {MAX_WORKERS} file workers, {PARSE_WORKERS} parse processes, "
+                    f"{FILE_MAX_ATTEMPTS} attempts per file")
+        wall_start = time.time()
+        results = process_blobs(blobs, src_client, trg_client, manifest=manifest, force=force,
+                                load_method=load_method)
+        wall_time = time.time() - wall_start
+
+        successful_files = sum(1 for r in results if r['success'] and r['match'])
+        failed_files = len(results) - successful_files
+        skipped_files = sum(1 for r in results if r.get('skipped'))
+        changed_tables = [r['table'] for r in results if r['success'] and r['match'] and not r.get('skipped')]
+        if manifest is not None:
+            # Plus RAW tables loaded by an earlier run whose transform / swap never completed
+            changed_tables += [t for t in manifest.pending_transform_tables() if t not in changed_tables]
 
         # Calculate final statistics
         total_rows = sum(r['rows_db'] for r in results if r['success'])
         total_time = sum(r['elapsed'] for r in results)
+        total_parse_time = sum(r.get('parse_time', 0.0) for r in results)
         success_rate = (successful_files / len(results) * 100) if results else 0
 
         # Final report
@@ -458,21 +803,24 @@ def main():
         logger.info(f"Files processed: {len(results)}")
         logger.info(f"Successful     : {successful_files}")
         logger.info(f"Failed         : {failed_files}")
+        logger.info(f"Unchanged      : {skipped_files} (skipped)")
         logger.info(f"Success rate   : {success_rate:.1f}%")
         logger.info(f"Rows loaded    : {total_rows:,}")
-        logger.info(f"Total time     : {total_time:.2f}s")
+        logger.info(f"Total time     : {total_time:.2f}s (sum of per-file times)")
+        logger.info(f"Wall time      : {wall_time:.2f}s")
+        logger.info(f"Parse time     : {total_parse_time:.2f}s (sum, {EXCEL_READER} reader)")
         
-        if total_time > 0 and total_rows > 0:
-            logger.info(f"Throughput     : {total_rows/total_time:,.0f} rows/s")
+        if wall_time > 0 and total_rows > 0:
+            logger.info(f"Throughput     : {total_rows/wall_time:,.0f} rows/s")
 
         # Detailed file report
         logger.info("\nDetailed Results:")
-        logger.info("File | Src | DB | Match | Status | Secs")
+        logger.info("File | Src | DB | Match | Secs | Parse secs")
         logger.info("-" * 60)
         for r in results:
-            status_icon = "✅" if r['success'] and r['match'] else "❌"
+            status_icon = ("⏭️" if r.get('skipped') else "✅") if r['success'] and r['match'] else "❌"
             error_msg = f" ({r.get('error', 'Unknown error')})" if not r['success'] else ""
-            logger.info(f"{status_icon} {r['file']} | {r['rows_src']} | {r['rows_db']} | {r['match']} | {r['elapsed']:.1f}s{error_msg}")
+            logger.info(f"{status_icon} {r['file']} | {r['rows_src']} | {r['rows_db']} | {r['match']} | {r['elapsed']:.1f}s | {r.get('parse_time', 0.0):.1f}s{error_msg}")
 
         return {
             'files_processed': len(results),
@@ -480,6 +828,10 @@ def main():
             'failed_count': failed_files,
             'success_rate': success_rate,
             'total_rows': total_rows,
+            'skipped_count': skipped_files,
+            'changed_tables': changed_tables,
+            'wall_time': wall_time,
+            'parse_time': total_parse_time,
             'results': results
         }
         
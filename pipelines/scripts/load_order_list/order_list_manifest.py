@@ -0,0 +1,188 @@
+"""
+ORDER_LIST File Manifest
+Purpose: Remember which version of each customer workbook was last uploaded, extracted and
+         transformed, so the blob, extract and transform stages can skip files that have not changed
+
+One row per workbook in dbo.ORDER_LIST_FILE_MANIFEST:
+- SharePoint eTag / lastModifiedDateTime → blob stage skips the download entirely
+- SHA-256 of the workbook bytes           → blob stage skips re-uploading identical content,
+                                            extract stage skips parse + reload of the RAW table
+- SHA-256 the last ORDER_LIST swap used   → transform re-processes a RAW table until the content
+                                            it was loaded from has been published to ORDER_LIST
+"""
+
+import sys
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))  # pipelines/utils ONLY
+
+import logger_helper  # noqa: E402 (from pipelines/utils/)
+import db_helper as db  # noqa: E402 (from pipelines/utils/)
+
+logger = logger_helper.get_logger(__name__)
+
+MANIFEST_TABLE = "ORDER_LIST_FILE_MANIFEST"
+
+# Matches db/ddl/tables/orders/dbo_order_list_file_manifest.sql
+CREATE_MANIFEST_SQL = f"""
+    IF OBJECT_ID('dbo.{MANIFEST_TABLE}', 'U') IS NULL
+    CREATE TABLE dbo.{MANIFEST_TABLE} (
+        [file_name] NVARCHAR(255) NOT NULL,
+        [raw_table] NVARCHAR(128) NULL,
+        [sharepoint_etag] NVARCHAR(255) NULL,
+        [sharepoint_last_modified] NVARCHAR(40) NULL,
+        [content_sha256] CHAR(64) NULL,
+        [size_bytes] BIGINT NULL,
+        [uploaded_at] DATETIME2 NULL,
+        [extracted_sha256] CHAR(64) NULL,
+        [extracted_rows] INT NULL,
+        [extracted_at] DATETIME2 NULL,
+        [transformed_sha256] CHAR(64) NULL,
+        [transformed_at] DATETIME2 NULL,
+        CONSTRAINT [PK_{MANIFEST_TABLE}] PRIMARY KEY ([file_name])
+    )
+"""
+
+# Manifests created before the transform columns existed
+ADD_TRANSFORM_COLUMNS_SQL = f"""
+    IF COL_LENGTH('dbo.{MANIFEST_TABLE}', 'transformed_sha256') IS NULL
+    ALTER TABLE dbo.{MANIFEST_TABLE} ADD [transformed_sha256] CHAR(64) NULL, [transformed_at] DATETIME2 NULL
+"""
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest of a workbook's bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class OrderListManifest:
+    """
+    Per-file fingerprints for the ORDER_LIST blob + extract stages.
+
+    The whole manifest is read once per run (load()); record_* calls write
+    through to the table and the in-memory copy, and are safe from worker threads.
+    """
+
+    def __init__(self, db_key: str = "orders"):
+        self.db_key = db_key
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def ensure_table(self) -> None:
+        """Create the manifest table on first use"""
+        db.execute(CREATE_MANIFEST_SQL, self.db_key)
+        db.execute(ADD_TRANSFORM_COLUMNS_SQL, self.db_key)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Read every manifest row, flagging whether its RAW table still exists"""
+        self.ensure_table()
+        df = db.run_query(f"""
+            SELECT m.*,
+                   CASE WHEN m.[raw_table] IS NOT NULL AND OBJECT_ID('dbo.' + m.[raw_table], 'U') IS NOT NULL
+                        THEN 1 ELSE 0 END AS raw_table_exists
+            FROM dbo.{MANIFEST_TABLE} m
+        """, self.db_key)
+        with self._lock:
+            self.entries = {row['file_name']: row for row in df.to_dict('records')}
+        logger.info(f"[MANIFEST] Loaded {len(self.entries)} file fingerprints from {MANIFEST_TABLE}")
+        return self.entries
+
+    def get(self, file_name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.entries.get(file_name)
+
+    # ---------------- blob stage -----------------------------------------------
+
+    def is_source_unchanged(self, file_name: str, etag: Optional[str], last_modified: Optional[str]) -> bool:
+        """True when SharePoint reports the same eTag (or lastModified, if no eTag) as the last upload"""
+        entry = self.get(file_name)
+        if not entry or not entry.get('content_sha256'):
+            return False
+        if etag:
+            return entry.get('sharepoint_etag') == etag
+        return bool(last_modified) and entry.get('sharepoint_last_modified') == last_modified
+
+    def record_upload(self, file_name: str, etag: Optional[str], last_modified: Optional[str],
+                      sha256: str, size_bytes: int) -> None:
+        """Store the SharePoint version + content hash of a workbook now in blob storage"""
+        db.execute(f"""
+            MERGE dbo.{MANIFEST_TABLE} WITH (HOLDLOCK) AS tgt
+            USING (SELECT ? AS [file_name]) AS src ON tgt.[file_name] = src.[file_name]
+            WHEN MATCHED THEN UPDATE SET
+                [sharepoint_etag] = ?, [sharepoint_last_modified] = ?,
+                [content_sha256] = ?, [size_bytes] = ?, [uploaded_at] = SYSUTCDATETIME()
+            WHEN NOT MATCHED THEN INSERT
+                ([file_name], [sharepoint_etag], [sharepoint_last_modified],
+                 [content_sha256], [size_bytes], [uploaded_at])
+                VALUES (src.[file_name], ?, ?, ?, ?, SYSUTCDATETIME());
+        """, self.db_key, params=(file_name,
+                                  etag, last_modified, sha256, size_bytes,
+                                  etag, last_modified, sha256, size_bytes))
+        with self._lock:
+            entry = self.entries.setdefault(file_name, {'file_name': file_name})
+            entry.update({'sharepoint_etag': etag, 'sharepoint_last_modified': last_modified,
+                          'content_sha256': sha256, 'size_bytes': size_bytes})
+
+    # ---------------- extract stage --------------------------------------------
+
+    def is_extract_current(self, file_name: str, sha256: Optional[str]) -> bool:
+        """True when the RAW table exists and was loaded from content with this hash"""
+        entry = self.get(file_name)
+        return bool(sha256 and entry and entry.get('raw_table_exists')
+                    and entry.get('extracted_sha256') == sha256)
+
+    def record_extract(self, file_name: str, raw_table: str, sha256: str, rows: int) -> None:
+        """Store the content hash a RAW table was just loaded from"""
+        db.execute(f"""
+            MERGE dbo.{MANIFEST_TABLE} WITH (HOLDLOCK) AS tgt
+            USING (SELECT ? AS [file_name]) AS src ON tgt.[file_name] = src.[file_name]
+            WHEN MATCHED THEN UPDATE SET
+                [raw_table] = ?, [extracted_sha256] = ?, [extracted_rows] = ?, [extracted_at] = SYSUTCDATETIME()
+            WHEN NOT MATCHED THEN INSERT
+                ([file_name], [raw_table], [content_sha256], [extracted_sha256], [extracted_rows], [extracted_at])
+                VALUES (src.[file_name], ?, ?, ?, ?, SYSUTCDATETIME());
+        """, self.db_key, params=(file_name,
+                                  raw_table, sha256, rows,
+                                  raw_table, sha256, sha256, rows))
+        with self._lock:
+            entry = self.entries.setdefault(file_name, {'file_name': file_name})
+            entry.update({'raw_table': raw_table, 'extracted_sha256': sha256,
+                          'extracted_rows': rows, 'raw_table_exists': 1})
+
+    # ---------------- transform stage ------------------------------------------
+
+    def pending_transform_tables(self) -> List[str]:
+        """RAW tables whose extracted content has not been published to ORDER_LIST yet"""
+        with self._lock:
+            return sorted(entry['raw_table'] for entry in self.entries.values()
+                          if entry.get('raw_table') and entry.get('raw_table_exists')
+                          and entry.get('extracted_sha256')
+                          and entry.get('transformed_sha256') != entry['extracted_sha256'])
+
+    def record_transform(self, raw_tables: List[str]) -> None:
+        """Mark RAW tables as published from their extracted content - call only after the ORDER_LIST swap"""
+        if not raw_tables:
+            return
+        placeholders = ", ".join("?" for _ in raw_tables)
+        db.execute(f"""
+            UPDATE dbo.{MANIFEST_TABLE}
+            SET [transformed_sha256] = [extracted_sha256], [transformed_at] = SYSUTCDATETIME()
+            WHERE [extracted_sha256] IS NOT NULL AND [raw_table] IN ({placeholders})
+        """, self.db_key, params=tuple(raw_tables))
+        tables = set(raw_tables)
+        with self._lock:
+            for entry in self.entries.values():
+                if entry.get('raw_table') in tables and entry.get('extracted_sha256'):
+                    entry['transformed_sha256'] = entry['extracted_sha256']
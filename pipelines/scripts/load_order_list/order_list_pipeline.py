@@ -17,7 +17,7 @@ import time
 import argparse
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 def find_repo_root() -> Path:
@@ -122,10 +122,13 @@ class OrderListPipeline:
             self.log_stage_failure("PREREQUISITES VALIDATION", str(e))
             return {'success': False, 'stage': 'prerequisites', 'error': str(e)}
     
-    def run_blob_upload_stage(self) -> Dict[str, Any]:
+    def run_blob_upload_stage(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Run the blob upload stage: SharePoint discovery → Azure Blob Storage
         
+        Args:
+            force_refresh: Re-transfer files the manifest reports as unchanged
+            
         Returns:
             Blob upload results with metrics
         """
@@ -139,7 +142,7 @@ class OrderListPipeline:
             import order_list_blob
             
             # Initialize blob uploader
-            blob_uploader = order_list_blob.OrderListBlobUploader()
+            blob_uploader = order_list_blob.OrderListBlobUploader(force=force_refresh)
             
             # Run the upload process
             self.logger.info("Starting SharePoint file discovery and blob upload")
@@ -150,6 +153,7 @@ class OrderListPipeline:
             # Extract metrics from upload results
             files_found = upload_results.get('files_found', 0)
             files_uploaded = upload_results.get('files_uploaded', 0)
+            files_skipped = upload_results.get('files_skipped', 0)
             total_size_mb = upload_results.get('total_size_mb', 0)
             success_rate = upload_results.get('success_rate', 0)
             
@@ -159,6 +163,7 @@ class OrderListPipeline:
             metrics = {
                 'files_found': files_found,
                 'files_uploaded': files_uploaded,
+                'files_skipped': files_skipped,
                 'upload_success_rate': success_rate,
                 'total_size_mb': total_size_mb,
                 'duration': duration,
@@ -190,12 +195,15 @@ class OrderListPipeline:
             self.log_stage_failure("BLOB UPLOAD", error_msg)
             return {'success': False, 'stage': 'blob_upload', 'error': error_msg}
 
-    def run_extract_stage(self, limit_files: int = None) -> Dict[str, Any]:
+    def run_extract_stage(self, limit_files: int = None, force_refresh: bool = False,
+                          load_method: Optional[str] = None) -> Dict[str, Any]:
         """
         Run the extract stage: blob storage → raw tables
         
         Args:
             limit_files: Optional limit on number of files to process (for testing)
+            force_refresh: Reload RAW tables the manifest reports as unchanged
+            load_method: 'blob' or 'direct' RAW table load (default ORDER_LIST_LOAD_METHOD)
             
         Returns:
             Extract results with metrics
@@ -219,7 +227,7 @@ class OrderListPipeline:
             
             # Call extract main function directly
             self.logger.info("Calling extract main function directly (no subprocess)")
-            extract_result = order_list_extract.main()
+            extract_result = order_list_extract.main(force=force_refresh, load_method=load_method)
             
             duration = time.time() - start_time
             
@@ -227,11 +235,13 @@ class OrderListPipeline:
             files_processed = extract_result.get('files_processed', 0)
             total_records = extract_result.get('total_rows', 0)
             success_count = extract_result.get('success_count', 0)
+            skipped_count = extract_result.get('skipped_count', 0)
             
             metrics = {
                 'files_processed': files_processed,
                 'total_records': total_records,
                 'success_count': success_count,
+                'skipped_count': skipped_count,
                 'duration': duration,
                 'performance': total_records / duration if duration > 0 else 0
             }
@@ -250,7 +260,8 @@ class OrderListPipeline:
             return {
                 'success': success, 
                 'stage': 'extract',
-                'output': f"Processed {files_processed} files, {total_records:,} total rows",
+                'output': f"Processed {files_processed} files ({skipped_count} unchanged), {total_records:,} total rows",
+                'changed_tables': extract_result.get('changed_tables', []),
                 **metrics
             }
                 
@@ -259,10 +270,17 @@ class OrderListPipeline:
             self.log_stage_failure("EXTRACT", error_msg)
             return {'success': False, 'stage': 'extract', 'error': error_msg}
     
-    def run_transform_stage(self) -> Dict[str, Any]:
+    def run_transform_stage(self, changed_tables: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Run the transform stage: raw tables → staging table with precision fixes
         
+        Args:
+            changed_tables: RAW tables reloaded by this run's extract plus those the manifest
+                reports as not yet transformed from their current content. When given, only these
+                customers are re-transformed (server-side, the rest carried over); an empty
+                list means every RAW table is already published and ORDER_LIST is left as is.
+                None = full transform.
+        
         Returns:
             Transform results with comprehensive metrics
         """
@@ -273,10 +291,20 @@ class OrderListPipeline:
             sys.path.insert(0, str(Path(__file__).parent))
             from order_list_transform import OrderListTransformer
             
+            if changed_tables is not None and not changed_tables:
+                self.logger.info("[>>] No ORDER_LIST workbooks changed - ORDER_LIST is current")
+                self.log_stage_success("TRANSFORM", {'total_rows': 0, 'duration': 0})
+                return {'success': True, 'stage': 'transform', 'skipped': True,
+                        'total_customers_processed': 0, 'total_rows': 0, 'duration': 0}
+            
             transformer = OrderListTransformer()
             
+            if changed_tables is not None:
+                # Only the changed customers; everyone else is carried over from ORDER_LIST
+                self.logger.info(f"Transforming {len(changed_tables)} changed customers: {', '.join(changed_tables)}")
+            
             # Use the server-side optimized transform method
-            results = transformer.run_transform_server_side_optimized()
+            results = transformer.run_transform_server_side_optimized(changed_tables=changed_tables)
             
             if results.get('success', False):
                 metrics = {
@@ -285,12 +313,16 @@ class OrderListPipeline:
                     'total_rows': results.get('total_rows', 0),
                     'duration': results.get('duration', 0),
                     'performance': results.get('total_rows', 0) / results.get('duration', 1),
-                    'server_side_optimized': results.get('server_side_optimized', False)
+                    'server_side_optimized': results.get('server_side_optimized', False),
+                    'unchanged_customers': results.get('unchanged_customers', 0)
                 }
                 
                 self.metrics['total_records_processed'] = metrics['total_rows']
                 self.metrics['performance_metrics']['transform'] = metrics
                 
+                # ORDER_LIST is swapped - only now is this RAW content transform-current
+                self.record_transformed_tables(results.get('transformed_tables', []))
+                
                 self.log_stage_success("TRANSFORM", metrics)
                 
                 return {'success': True, 'stage': 'transform', **results}
@@ -303,6 +335,20 @@ class OrderListPipeline:
             self.log_stage_failure("TRANSFORM", str(e))
             return {'success': False, 'stage': 'transform', 'error': str(e)}
     
+    def record_transformed_tables(self, raw_tables: List[str]) -> None:
+        """Mark RAW tables as transformed in ORDER_LIST_FILE_MANIFEST (after a successful swap)"""
+        if not raw_tables:
+            return
+        try:
+            from order_list_manifest import OrderListManifest
+            manifest = OrderListManifest(self.db_key)
+            manifest.ensure_table()
+            manifest.record_transform(raw_tables)
+            self.logger.info(f"[MANIFEST] {len(raw_tables)} RAW tables marked as transformed")
+        except Exception as e:
+            # Not fatal: those customers are simply re-transformed on the next run
+            self.logger.warning(f"[!] Could not record transformed RAW tables in the manifest: {e}")
+    
     def run_validation_stage(self) -> Dict[str, Any]:
         """
         Run data quality validation on the final ORDER_LIST table
@@ -470,15 +516,21 @@ class OrderListPipeline:
         
         return "\n".join(report_lines)
     
-    def run_complete_pipeline(self, extract_limit: int = None, skip_blob: bool = False, skip_extract: bool = False, skip_validation: bool = False) -> Dict[str, Any]:
+    def run_complete_pipeline(self, extract_limit: int = None, skip_blob: bool = False, skip_extract: bool = False, skip_validation: bool = False,
+                              force_refresh: bool = False, load_method: Optional[str] = None) -> Dict[str, Any]:
         """
         Run the complete ORDER_LIST pipeline with comprehensive monitoring
         
+        Unchanged workbooks (ORDER_LIST_FILE_MANIFEST) are skipped by the blob and extract
+        stages, and only the changed customers are re-transformed.
+        
         Args:
             extract_limit: Optional limit on files to extract (for testing)
             skip_blob: Skip SharePoint blob upload stage (use existing blob files)
             skip_extract: Skip extract stage (for transform-only runs)
             skip_validation: Skip validation stage (for faster runs)
+            force_refresh: Ignore the manifest - transfer, reload and transform every file
+            load_method: RAW table load for the extract stage ('blob' or 'direct')
             
         Returns:
             Complete pipeline results with metrics
@@ -512,7 +564,7 @@ class OrderListPipeline:
             
             # Stage 1: Blob Upload - SharePoint to Azure Blob Storage (optional skip)
             if not skip_blob:
-                blob_results = self.run_blob_upload_stage()
+                blob_results = self.run_blob_upload_stage(force_refresh=force_refresh)
                 pipeline_results['stages']['blob_upload'] = blob_results
                 if not blob_results.get('success', False):
                     pipeline_results['failed_stage'] = 'blob_upload'
@@ -523,19 +575,24 @@ class OrderListPipeline:
                 self.logger.info("[>>] BLOB UPLOAD STAGE SKIPPED - Using existing blob files")
             
             # Stage 2: Extract - Blob storage to Raw Tables (optional skip)
+            changed_tables = None
             if not skip_extract:
-                extract_results = self.run_extract_stage(limit_files=extract_limit)
+                extract_results = self.run_extract_stage(limit_files=extract_limit, force_refresh=force_refresh,
+                                                         load_method=load_method)
                 pipeline_results['stages']['extract'] = extract_results
                 if not extract_results.get('success', False):
                     pipeline_results['failed_stage'] = 'extract'
                     pipeline_results['error'] = extract_results.get('error')
                     return self._finalize_pipeline_results(pipeline_results)
+                # Some workbooks unchanged: only re-transform the ones reloaded or not yet transformed
+                if extract_results.get('skipped_count', 0) > 0:
+                    changed_tables = extract_results.get('changed_tables', [])
             else:
                 self.logger.info("[>>] EXTRACT STAGE SKIPPED")
                 self.logger.info("[>>] EXTRACT STAGE SKIPPED - Using existing raw tables")
             
             # Stage 3: Transform (required)
-            transform_results = self.run_transform_stage()
+            transform_results = self.run_transform_stage(changed_tables=changed_tables)
             pipeline_results['stages']['transform'] = transform_results
             if not transform_results.get('success', False):
                 pipeline_results['failed_stage'] = 'transform'
@@ -572,6 +629,10 @@ class OrderListPipeline:
         self.metrics['duration_seconds'] = time.time() - self.start_time
         pipeline_results['duration'] = self.metrics['duration_seconds']
         pipeline_results['metrics'] = self.metrics
+        pipeline_results['schema_cache'] = db.get_schema_cache_stats()
+        self.logger.info(f"[*] Schema cache: {pipeline_results['schema_cache']['hits']} hits / "
+                         f"{pipeline_results['schema_cache']['misses']} misses "
+                         f"(hit rate {pipeline_results['schema_cache']['hit_rate']:.1%})")
         
         # Generate and log final report
         final_report = self.generate_final_report(pipeline_results)
@@ -606,6 +667,12 @@ Examples:
   
   # Skip validation (faster)
   python order_list_pipeline.py --skip-validation
+  
+  # Reload every workbook, even unchanged ones
+  python order_list_pipeline.py --force-refresh
+  
+  # Load RAW tables directly (no CSV/blob round trip)
+  python order_list_pipeline.py --load-method direct
         """
     )
     
@@ -624,6 +691,11 @@ Examples:
                        help='Skip extract stage (use existing raw tables)')
     parser.add_argument('--skip-validation', action='store_true',
                        help='Skip validation stage (faster execution)')
+    parser.add_argument('--force-refresh', action='store_true',
+                       help='Ignore the file manifest and reload every ORDER_LIST workbook')
+    parser.add_argument('--load-method', choices=['blob', 'direct'],
+                       help='RAW table load: CSV via blob + BULK INSERT, or direct fast_executemany '
+                            '(default: ORDER_LIST_LOAD_METHOD or blob)')
     
     # Testing options
     parser.add_argument('--limit-files', type=int, metavar='N',
@@ -656,7 +728,8 @@ Examples:
         # Handle single-stage execution
         if args.extract_only:
             logger.info("[*] RUNNING EXTRACT STAGE ONLY")
-            results = pipeline.run_extract_stage(limit_files=args.limit_files)
+            results = pipeline.run_extract_stage(limit_files=args.limit_files, force_refresh=args.force_refresh,
+                                                 load_method=args.load_method)
             success = results.get('success', False)
             
             logger.info(f"\n{'='*60}")
@@ -709,7 +782,9 @@ Examples:
                 extract_limit=args.limit_files,
                 skip_blob=args.skip_blob,
                 skip_extract=args.skip_extract,
-                skip_validation=args.skip_validation
+                skip_validation=args.skip_validation,
+                force_refresh=args.force_refresh,
+                load_method=args.load_method
             )
             
             success = results.get('success', False)
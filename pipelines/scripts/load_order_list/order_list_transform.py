@@ -16,7 +16,7 @@ import time
 import re
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # --- repo utils path setup ----------------------------------------------------
 def find_repo_root() -> Path:
@@ -74,10 +74,15 @@ class OrderListTransformer:
         # Cache for problematic columns per table (smart transformation)
         self.problematic_columns_cache = {}
         
-    def run_transform_server_side_optimized(self) -> Dict[str, Any]:
+    def run_transform_server_side_optimized(self, changed_tables: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         OPTIMIZED: Process all customers with server-side data cleaning
         No 41M cell Python processing - let SQL Server do the heavy lifting!
+        
+        Args:
+            changed_tables: Only re-transform these RAW tables (workbooks that changed since the
+                last extract). Rows of every other customer already in ORDER_LIST are copied into
+                staging as-is. None = transform every customer.
         """
         start_time = time.time()
         
@@ -91,6 +96,10 @@ class OrderListTransformer:
         if raw_tables_df.empty:
             return {"success": False, "error": "No RAW tables found"}
         
+        unchanged_tables = []
+        if changed_tables is not None:
+            raw_tables_df, unchanged_tables = self.split_changed_raw_tables(raw_tables_df, changed_tables)
+        
         self.logger.info(f"\n[OPTIMIZED] SERVER-SIDE PROCESSING: {len(raw_tables_df)} customer tables")
         self.logger.info(f"Strategy: Let SQL Server handle data cleaning, avoid 41M cell Python operations")
         self.logger.info(f"DDL Path: {self.ddl_file_path}")
@@ -110,8 +119,13 @@ class OrderListTransformer:
         # Step 2: Process each customer directly to staging using SQL
         successful_customers = []
         failed_customers = []
+        transformed_tables = []
         total_rows = 0
         
+        # Unchanged customers: carry their current ORDER_LIST rows over in one INSERT ... SELECT
+        carried_rows = self.copy_unchanged_customers_to_staging(unchanged_tables) if unchanged_tables else 0
+        total_rows += carried_rows
+        
         for idx, row in raw_tables_df.iterrows():
             table_name = row['TABLE_NAME']
             customer_name = table_name.replace('_ORDER_LIST_RAW', '').replace('x', '')
@@ -134,6 +148,7 @@ class OrderListTransformer:
                 
                 total_rows += rows_affected
                 successful_customers.append(customer_name)
+                transformed_tables.append(table_name)
                 self.logger.info(f"   ✅ Inserted {rows_affected} rows (server-side cleaned)")
                 
             except Exception as e:
@@ -144,14 +159,17 @@ class OrderListTransformer:
         
         
         # Step 3: Atomic swap
-        if successful_customers:
+        if successful_customers or carried_rows:
             self.logger.info(f"\n[STEP 3] Atomic swap: {self.staging_table} → {self.target_table}")
             try:
-                staging_manager.atomic_swap_tables(
+                swap_result = staging_manager.atomic_swap_tables(
                     staging_table=self.staging_table,
                     production_table=self.target_table,
                     db_name=self.db_key
                 )
+                if not swap_result.get('success', True):
+                    self.logger.error(f"Atomic swap failed: {swap_result.get('error')}")
+                    return {"success": False, "error": f"Atomic swap failed: {swap_result.get('error')}"}
                 self.logger.info(f"✅ Atomic swap completed successfully")
             except Exception as e:
                 self.logger.error(f"Atomic swap failed: {e}")
@@ -159,6 +177,30 @@ class OrderListTransformer:
         
 
         # STEP 4: Create/refresh sync table for downstream consumers
+        sync_table_created = self.refresh_sync_table()
+
+        duration = time.time() - start_time
+        
+        return {
+            "success": len(successful_customers) > 0 or carried_rows > 0,
+            "total_customers_processed": len(successful_customers),
+            "failed_customers": len(failed_customers),
+            "total_rows": total_rows,
+            "duration": duration,
+            "successful_customers": successful_customers,
+            "failed_customers": failed_customers,
+            "transformed_tables": transformed_tables,
+            "unchanged_customers": len(unchanged_tables),
+            "carried_over_rows": carried_rows,
+            "server_side_optimized": True,
+            "sync_table_created": sync_table_created
+        }
+    
+    def refresh_sync_table(self) -> bool:
+        """
+        Rebuild swp_ORDER_LIST_SYNC from ORDER_LIST (source_table of sync_order_list)
+        Run after every swap so changed orders reach Monday.com
+        """
         self.logger.info(f"\n[STEP 4] Creating/Refreshing {self.staging_table_sync} table for downstream consumers")
         sync_table_created = False
         try:
@@ -178,22 +220,7 @@ class OrderListTransformer:
         except Exception as e:
             self.logger.error(f"   ❌ Failed to create {self.staging_table_sync}: {e}")
             sync_table_created = False
-
-
-
-        duration = time.time() - start_time
-        
-        return {
-            "success": len(successful_customers) > 0,
-            "total_customers_processed": len(successful_customers),
-            "failed_customers": len(failed_customers),
-            "total_rows": total_rows,
-            "duration": duration,
-            "successful_customers": successful_customers,
-            "failed_customers": failed_customers,
-            "server_side_optimized": True,
-            "sync_table_created": sync_table_created
-        }
+        return sync_table_created
     
     def generate_direct_insert_sql(self, table_name: str) -> str:
         """
@@ -203,12 +230,7 @@ class OrderListTransformer:
         self.logger.info(f"Generating server-side INSERT for {table_name}")
         
         # Get table columns
-        columns_df = db.run_query(f"""
-            SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'dbo' AND TABLE_NAME = '{table_name}'
-            ORDER BY ORDINAL_POSITION
-        """, self.db_key)
-        table_columns = set(columns_df['COLUMN_NAME'].tolist())
+        table_columns = set(db.get_column_names(table_name, self.db_key))
 
         select_expressions = []
         
@@ -285,13 +307,7 @@ class OrderListTransformer:
         
         # Get columns from first table
         first_table = raw_tables_df.iloc[0]['TABLE_NAME']
-        columns_df = db.run_query(f"""
-            SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'dbo' AND TABLE_NAME = '{first_table}'
-            ORDER BY ORDINAL_POSITION
-        """, self.db_key)
-        
-        columns = columns_df['COLUMN_NAME'].tolist()
+        columns = db.get_column_names(first_table, self.db_key)
         self.logger.info(f"Discovered {len(columns)} columns from {first_table}")
         return columns
     
@@ -306,12 +322,7 @@ class OrderListTransformer:
         problematic_columns = {}
         
         # Get columns for this table
-        columns_df = db.run_query(f"""
-            SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'dbo' AND TABLE_NAME = '{table_name}'
-            ORDER BY ORDINAL_POSITION
-        """, self.db_key)
-        existing_columns = set(columns_df['COLUMN_NAME'].tolist())
+        existing_columns = set(db.get_column_names(table_name, self.db_key))
         
         # Check INT, DECIMAL, and DATE columns from schema
         for col_name, schema_type in self.precision_transformer.schema_types.items():
@@ -409,12 +420,7 @@ class OrderListTransformer:
         """
         self.logger.info(f"Processing customer table: {table_name}")
         
-        columns_df = db.run_query(f"""
-            SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'dbo' AND TABLE_NAME = '{table_name}'
-            ORDER BY ORDINAL_POSITION
-        """, self.db_key)
-        table_columns = set(columns_df['COLUMN_NAME'].tolist())
+        table_columns = set(db.get_column_names(table_name, self.db_key))
 
         select_expressions = []
         yaml_match_count = 0
@@ -810,6 +816,7 @@ class OrderListTransformer:
                 
                 if swap_result['success']:
                     self.logger.info(f"[SUCCESS] Atomic swap completed successfully")
+                    self.refresh_sync_table()
                 else:
                     self.logger.info(f"[ERROR] Atomic swap failed: {swap_result.get('error')}")
                     return {"success": False, "error": swap_result.get('error')}
@@ -833,6 +840,43 @@ class OrderListTransformer:
             "incremental_processing": True
         }
     
+    def split_changed_raw_tables(self, raw_tables_df: pd.DataFrame, changed_tables: List[str]):
+        """
+        Split RAW tables into (to transform, unchanged). A RAW table with no rows in
+        ORDER_LIST (new customer, or its last transform failed) is transformed regardless.
+        """
+        loaded_df = db.run_query(f"SELECT DISTINCT [_SOURCE_TABLE] FROM [{self.target_table}]", self.db_key)
+        loaded_tables = set(loaded_df['_SOURCE_TABLE'])
+        changed = set(changed_tables)
+        
+        transform_mask = raw_tables_df['TABLE_NAME'].isin(changed) | ~raw_tables_df['TABLE_NAME'].isin(loaded_tables)
+        unchanged_tables = raw_tables_df.loc[~transform_mask, 'TABLE_NAME'].tolist()
+        
+        self.logger.info(f"[INCREMENTAL] {int(transform_mask.sum())} changed customers to transform, "
+                         f"{len(unchanged_tables)} unchanged carried over from {self.target_table}")
+        return raw_tables_df[transform_mask].reset_index(drop=True), unchanged_tables
+    
+    def copy_unchanged_customers_to_staging(self, unchanged_tables: List[str]) -> int:
+        """Copy unchanged customers' current ORDER_LIST rows into the staging table"""
+        columns_df = db.run_query("""
+            SELECT s.COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS s
+            JOIN INFORMATION_SCHEMA.COLUMNS t
+              ON t.TABLE_SCHEMA = 'dbo' AND t.TABLE_NAME = ? AND t.COLUMN_NAME = s.COLUMN_NAME
+            WHERE s.TABLE_SCHEMA = 'dbo' AND s.TABLE_NAME = ?
+            ORDER BY s.ORDINAL_POSITION
+        """, self.db_key, params=(self.target_table, self.staging_table))
+        column_list = ", ".join(f"[{c}]" for c in columns_df['COLUMN_NAME'])
+        placeholders = ", ".join("?" for _ in unchanged_tables)
+        
+        rows = db.execute(f"""
+            INSERT INTO [{self.staging_table}] WITH (TABLOCK) ({column_list})
+            SELECT {column_list} FROM [{self.target_table}]
+            WHERE [_SOURCE_TABLE] IN ({placeholders})
+        """, self.db_key, params=tuple(unchanged_tables))
+        
+        self.logger.info(f"[INCREMENTAL] Carried over {rows:,} rows for {len(unchanged_tables)} unchanged customers")
+        return rows
+    
     def run(self) -> Dict[str, Any]:
         """Main execution method with schema awareness"""
         self.logger.info("=" * 80)
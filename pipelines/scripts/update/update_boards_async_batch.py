@@ -17,7 +17,7 @@ Features:
 Performance:
 - Initial batch size: 15 items (balance of speed vs timeout risk)
 - Concurrent batches: 3-5 simultaneous
-- Rate limiting: 100ms between batches
+- Rate limiting: shared adaptive limiter (Monday.com complexity budget)
 - Fallback strategy: 15 → 5 → 1 item batches
 """
 
@@ -55,6 +55,7 @@ from country_mapper import format_country_for_monday
 # Import Monday.com configuration system
 sys.path.insert(0, str(repo_root / "src"))
 from pipelines.utils.monday_config import MondayConfig
+from pipelines.utils.monday_rate_limiter import get_shared_rate_limiter, with_complexity
 
 class AsyncBatchMondayUpdater:
     def load_query_from_config(self, query_config: dict) -> str:
@@ -95,6 +96,7 @@ class AsyncBatchMondayUpdater:
         
         # Initialize Monday.com configuration system
         self.monday_config = MondayConfig()
+        self.rate_limiter = get_shared_rate_limiter(self.monday_config)
         
         # Override max_concurrent_batches if not provided or use MondayConfig defaults
         if max_concurrent_batches == 3:  # Default value, check if we should use MondayConfig
@@ -124,7 +126,6 @@ class AsyncBatchMondayUpdater:
         # Get batch configuration from MondayConfig (will be overridden per board)
         self.initial_batch_size = 15  # Default, will be optimized per board
         self.fallback_batch_sizes = [5, 1]  # Fallback to smaller sizes on timeout
-        self.batch_delay = 0.1  # Default, will be optimized per board
         self.request_timeout = self.monday_config.get_timeout()
         
         # Load update configuration
@@ -176,7 +177,7 @@ class AsyncBatchMondayUpdater:
     async def execute_graphql_async(self, session: aiohttp.ClientSession, query: str, variables: dict = None) -> dict:
         """Execute GraphQL query against Monday.com API asynchronously with MondayConfig retry logic"""
         
-        payload = {'query': query}
+        payload = {'query': with_complexity(query)}
         if variables:
             payload['variables'] = variables
         
@@ -185,7 +186,7 @@ class AsyncBatchMondayUpdater:
         
         for attempt in range(retry_settings.max_retries):
             try:
-                async with session.post(
+                async with self.rate_limiter.slot(), session.post(
                     self.api_url,
                     headers=self.headers,
                     json=payload,
@@ -193,18 +194,23 @@ class AsyncBatchMondayUpdater:
                     ssl=False
                 ) as response:
                     
+                    if response.status == 429:
+                        # Limiter pauses all requests until Monday.com's Retry-After
+                        self.rate_limiter.observe(None, status=response.status, headers=response.headers)
+                        self.logger.warning(f"HTTP 429: rate limited (attempt {attempt + 1}/{retry_settings.max_retries})")
+                        continue
+                    
                     if response.status != 200:
                         error_text = await response.text()
                         raise Exception(f"API request failed: {response.status} - {error_text}")
                     
                     result = await response.json()
+                    rate_limited = self.rate_limiter.observe(result, status=response.status, headers=response.headers)
                     
                     if 'errors' in result and result['errors']:
-                        # Check for Monday.com rate limit errors
-                        if self.monday_config.is_rate_limit_error(result):
-                            retry_delay = self.monday_config.get_retry_delay(result)
-                            self.logger.warning(f"MONDAY RATE LIMIT: retry_in_seconds={retry_delay:.1f}s (attempt {attempt + 1}/{retry_settings.max_retries})")
-                            await asyncio.sleep(retry_delay)
+                        # Check for Monday.com rate limit errors - the limiter waits out retry_in_seconds
+                        if rate_limited or self.monday_config.is_rate_limit_error(result):
+                            self.logger.warning(f"MONDAY RATE LIMIT: waiting for budget reset (attempt {attempt + 1}/{retry_settings.max_retries})")
                             continue
                         else:
                             raise Exception(f"GraphQL errors: {result['errors']}")
@@ -296,9 +302,6 @@ class AsyncBatchMondayUpdater:
                     results.extend(sub_result['results'])
                     success_count += sub_result['success_count']
                     error_count += sub_result['error_count']
-                    
-                    # Small delay between sub-batches
-                    await asyncio.sleep(self.batch_delay)
                 
                 return {
                     'success_count': success_count,
@@ -360,9 +363,6 @@ class AsyncBatchMondayUpdater:
                         success_count += sub_result['success_count']
                         error_count += sub_result['error_count']
                         
-                        # Delay between fallback batches
-                        await asyncio.sleep(self.batch_delay * 2)
-                        
                     except Exception as e:
                         # Even fallback failed - mark all as errors
                         self.logger.error(f"Fallback batch failed: {e}")
@@ -535,13 +535,11 @@ class AsyncBatchMondayUpdater:
             
             # Use MondayConfig for optimal settings
             optimal_batch_size = self.monday_config.get_optimal_batch_size(board_id=board_id, operation="updates")
-            rate_limits = self.monday_config.get_rate_limits()
             
             # Update instance settings with optimal values
             self.initial_batch_size = optimal_batch_size
-            self.batch_delay = rate_limits.delay_between_batches
             
-            self.logger.info(f"Using MondayConfig settings - batch_size: {optimal_batch_size}, delay: {self.batch_delay}s, concurrency: {self.max_concurrent_batches}")
+            self.logger.info(f"Using MondayConfig settings - batch_size: {optimal_batch_size}, concurrency: {self.max_concurrent_batches} (rate limiter: {self.rate_limiter.concurrency})")
             
             # Prepare all batch updates
             all_batch_updates = self.prepare_batch_updates(df)
@@ -614,48 +612,43 @@ class AsyncBatchMondayUpdater:
         
         async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
             
-            # Process batches in groups with concurrency control
-            for batch_group_start in range(0, len(batch_groups), self.max_concurrent_batches):
-                batch_group_end = min(batch_group_start + self.max_concurrent_batches, len(batch_groups))
-                current_batch_group = batch_groups[batch_group_start:batch_group_end]
-                
-                self.logger.info(f"Processing batch group {batch_group_start//self.max_concurrent_batches + 1}: batches {batch_group_start+1}-{batch_group_end}")
-                
-                # Execute batches concurrently within this group
-                tasks = []
-                for i, batch_updates in enumerate(current_batch_group):
-                    batch_num = batch_group_start + i + 1
-                    task = self.execute_batch_with_fallback(session, batch_updates, batch_num)
-                    tasks.append(task)
-                
-                # Wait for all batches in this group to complete
-                group_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results from this group
-                for i, result in enumerate(group_results):
-                    if isinstance(result, Exception):
-                        batch_num = batch_group_start + i + 1
-                        self.logger.error(f"Batch {batch_num} failed with exception: {result}")
-                        # Count as errors
-                        batch_size_failed = len(current_batch_group[i])
-                        total_errors += batch_size_failed
-                        all_results.extend([{
-                            'success': False,
-                            'error': str(result),
-                            'batch_num': batch_num
-                        }] * batch_size_failed)
-                    else:
-                        all_results.extend(result['results'])
-                        total_success += result['success_count']
-                        total_errors += result['error_count']
-                
-                # Delay between batch groups to respect rate limiting using MondayConfig
-                if batch_group_end < len(batch_groups):
-                    await asyncio.sleep(self.batch_delay)
-                
-                # Progress update
-                progress = (batch_group_end / len(batch_groups)) * 100
-                self.logger.info(f"Progress: {progress:.1f}% ({batch_group_end}/{len(batch_groups)} batches)")
+            # max_concurrent_batches caps batches in flight; the shared rate limiter paces the
+            # actual requests against Monday.com's complexity budget (no fixed group delays)
+            semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+            completed = 0
+            
+            async def run_batch(batch_updates, batch_num):
+                nonlocal completed
+                async with semaphore:
+                    result = await self.execute_batch_with_fallback(session, batch_updates, batch_num)
+                completed += 1
+                if completed % self.max_concurrent_batches == 0 or completed == len(batch_groups):
+                    progress = (completed / len(batch_groups)) * 100
+                    self.logger.info(f"Progress: {progress:.1f}% ({completed}/{len(batch_groups)} batches, "
+                                     f"limiter concurrency: {self.rate_limiter.concurrency})")
+                return result
+            
+            tasks = [run_batch(batch_updates, i + 1) for i, batch_updates in enumerate(batch_groups)]
+            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for i, result in enumerate(batch_results):
+                if isinstance(result, Exception):
+                    batch_num = i + 1
+                    self.logger.error(f"Batch {batch_num} failed with exception: {result}")
+                    # Count as errors
+                    batch_size_failed = len(batch_groups[i])
+                    total_errors += batch_size_failed
+                    all_results.extend([{
+                        'success': False,
+                        'error': str(result),
+                        'batch_num': batch_num
+                    }] * batch_size_failed)
+                else:
+                    all_results.extend(result['results'])
+                    total_success += result['success_count']
+                    total_errors += result['error_count']
+        
+        self.logger.info(f"Rate limiter: {self.rate_limiter.get_stats()}")
         
         success_rate = (total_success / len(all_batch_updates) * 100) if len(all_batch_updates) > 0 else 0
         duration = time.time() - start_time
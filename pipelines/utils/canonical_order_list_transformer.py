@@ -147,14 +147,7 @@ class CanonicalOrderListTransformer:
     def _get_table_columns(self, table_name: str) -> list:
         """Get column names from a table"""
         try:
-            with db.get_connection('orders') as conn:
-                schema_query = f"""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = '{table_name}'
-                """
-                columns_df = pd.read_sql(schema_query, conn)
-                return [f"[{col}]" for col in columns_df['COLUMN_NAME'].tolist()]
+            return [f"[{col}]" for col in db.get_column_names(table_name, 'orders')]
         except Exception as e:
             self.logger.error(f"Error getting columns for table {table_name}: {e}")
             return []
@@ -162,15 +155,7 @@ class CanonicalOrderListTransformer:
     def _find_column_match(self, table_name: str, candidates: list) -> str:
         """Find first matching column in raw table"""
         try:
-            # Query table schema
-            with db.get_connection('orders') as conn:
-                schema_query = f"""
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = '{table_name}'
-                """
-                columns_df = pd.read_sql(schema_query, conn)
-                available_columns = [col.upper() for col in columns_df['COLUMN_NAME'].tolist()]
+            available_columns = [col.upper() for col in db.get_column_names(table_name, 'orders')]
             
             # Find first match
             for candidate in candidates:
@@ -2,15 +2,21 @@
 Lightweight SQL helper for Kestra/data pipelines.
 - Loads DB credentials from config.yaml in the working directory
 - Uses ODBC Driver 17 for SQL Server
+- Pools connections per db_key (thread-safe, health-checked, idle timeout)
+- Caches table schemas per (db_key, schema, table) with a TTL
 - Provides canonical customer name transformation
 """
 
 import os
+import re
+import time
+import atexit
+import threading
 import pyodbc
 import pandas as pd
 import yaml
 from pathlib import Path
-from typing import Union, Optional
+from typing import Union, Optional, Dict, List, Any, Tuple
 
 import warnings
 warnings.filterwarnings("ignore", message="pandas only supports SQLAlchemy connectable")
@@ -42,6 +48,15 @@ except ImportError:
 DEFAULT_DRIVER = "{ODBC Driver 17 for SQL Server}"
 logger = logger_helper.get_logger(__name__)
 
+# Connection pool settings (environment overrides)
+POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "1").lower() in ("1", "true", "yes")
+POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "5"))                    # idle connections kept per db_key
+POOL_IDLE_TIMEOUT = float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300"))        # close connections idle longer than this
+POOL_HEALTH_CHECK_AFTER = float(os.getenv("DB_POOL_HEALTH_CHECK_AFTER", "30"))  # SELECT 1 before reusing older idle connections
+
+# Schema cache settings (environment overrides)
+SCHEMA_CACHE_TTL = float(os.getenv("DB_SCHEMA_CACHE_TTL", "600"))           # seconds a cached table schema is trusted (0 disables)
+
 # --------------------------
 # CONFIG LOADING
 # --------------------------
@@ -71,20 +86,12 @@ DB_CONFIG = get_database_config()
 # --------------------------
 # CONNECTION FACTORY
 # --------------------------
-def get_connection(db_key: str) -> pyodbc.Connection:
-    """
-    Create a pyodbc connection using config.yaml block for the given db_key.
-    Tries ODBC Driver 17 first, falls back to SQL Server if not available.
-    """
-    cfg = DB_CONFIG[db_key.lower()]
-    driver = cfg.get("driver", DEFAULT_DRIVER)
-    
-    # If using default driver, try ODBC Driver 17 first, then fall back to SQL Server
-    if driver == DEFAULT_DRIVER:
-        drivers_to_try = ["{ODBC Driver 17 for SQL Server}", "{SQL Server}"]
-    else:
-        drivers_to_try = [driver]
-    
+# db_key -> ODBC driver that connected successfully (skips the driver fallback loop)
+_WORKING_DRIVERS: Dict[str, str] = {}
+
+
+def _build_connection_parts(cfg: dict) -> List[str]:
+    """Connection string parts (everything except DRIVER) for a config.yaml database block"""
     conn_parts_base = [
         f"SERVER={cfg['host']},{cfg['port']}",
         f"DATABASE={cfg['database']}"
@@ -103,6 +110,28 @@ def get_connection(db_key: str) -> pyodbc.Connection:
     conn_parts_base.append(f"TrustServerCertificate={'yes' if trust_cert in ('yes', 'true', '1') else 'no'}")
 
     conn_parts_base.append("Connection Timeout=30")
+    return conn_parts_base
+
+
+def _connect(db_key: str) -> pyodbc.Connection:
+    """
+    Open a new pyodbc connection using config.yaml block for the given db_key.
+    Tries ODBC Driver 17 first, falls back to SQL Server if not available.
+    The driver that works is remembered per db_key.
+    """
+    key = db_key.lower()
+    cfg = DB_CONFIG[key]
+    driver = cfg.get("driver", DEFAULT_DRIVER)
+    
+    # If using default driver, try ODBC Driver 17 first, then fall back to SQL Server
+    if key in _WORKING_DRIVERS:
+        drivers_to_try = [_WORKING_DRIVERS[key]]
+    elif driver == DEFAULT_DRIVER:
+        drivers_to_try = ["{ODBC Driver 17 for SQL Server}", "{SQL Server}"]
+    else:
+        drivers_to_try = [driver]
+    
+    conn_parts_base = _build_connection_parts(cfg)
     
     # Try each driver in order
     last_error = None
@@ -110,7 +139,9 @@ def get_connection(db_key: str) -> pyodbc.Connection:
         try:
             conn_parts = [f"DRIVER={driver_attempt}"] + conn_parts_base
             conn_str = ";".join(conn_parts) + ";"
-            return pyodbc.connect(conn_str)
+            connection = pyodbc.connect(conn_str)
+            _WORKING_DRIVERS[key] = driver_attempt
+            return connection
         except pyodbc.InterfaceError as e:
             last_error = e
             # If this is a driver not found error, try the next driver
@@ -126,6 +157,248 @@ def get_connection(db_key: str) -> pyodbc.Connection:
     # If we get here, all drivers failed
     raise last_error if last_error else Exception("No suitable ODBC driver found")
 
+
+class PooledConnection:
+    """
+    pyodbc connection checked out of a ConnectionPool.
+
+    Behaves like pyodbc.Connection (attributes are delegated). ``close()`` returns the
+    connection to the pool instead of closing it; ``with`` commits on success / rolls back
+    on error like pyodbc and then returns the connection to the pool.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', connection: pyodbc.Connection):
+        self._pool = pool
+        self._connection = connection
+
+    @property
+    def raw_connection(self) -> pyodbc.Connection:
+        """Underlying pyodbc connection"""
+        if self._connection is None:
+            raise pyodbc.ProgrammingError("Attempt to use a closed connection.")
+        return self._connection
+
+    @property
+    def closed(self) -> bool:
+        return self._connection is None
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.raw_connection, name)
+
+    def __setattr__(self, name, value):
+        if name in ('_pool', '_connection'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.raw_connection, name, value)
+
+    def close(self) -> None:
+        """Return the connection to the pool (uncommitted work is rolled back)"""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            self._pool.release(connection)
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._connection is not None:
+            if exc_type is None:
+                self._connection.commit()
+            else:
+                self._connection.rollback()
+        self.close()
+
+    def __del__(self):
+        # Connections that are never closed go back to the pool when garbage collected
+        try:
+            if self.__dict__.get('_connection') is not None:
+                self.close()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of pyodbc connections for one db_key.
+
+    - max_size bounds the idle connections kept; extra checkouts are not blocked
+      (legacy callers that never close must not deadlock) and are closed on release
+    - connections idle longer than idle_timeout are closed
+    - connections idle longer than health_check_after are validated with SELECT 1
+    """
+
+    def __init__(self, db_key: str, max_size: int = POOL_MAX_SIZE, idle_timeout: float = POOL_IDLE_TIMEOUT,
+                 health_check_after: float = POOL_HEALTH_CHECK_AFTER, connect=None):
+        self.db_key = db_key.lower()
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self._connect = connect or (lambda: _connect(self.db_key))
+        self._idle: List[tuple] = []  # (connection, returned_at) - LIFO keeps hot connections hot
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self.stats = {
+            'checkouts': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'health_check_failures': 0,
+            'closed_idle_timeout': 0,
+            'closed_pool_full': 0,
+        }
+
+    def acquire(self) -> PooledConnection:
+        """Check out a healthy connection (reused if possible)"""
+        while True:
+            with self._lock:
+                self.stats['checkouts'] += 1
+                self._in_use += 1
+                expired = self._drain_expired()
+                candidate = self._idle.pop() if self._idle else None
+            for connection in expired:
+                self._close_quietly(connection)
+
+            if candidate is None:
+                try:
+                    connection = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._in_use -= 1
+                    raise
+                with self._lock:
+                    self.stats['connections_created'] += 1
+                return PooledConnection(self, connection)
+
+            connection, returned_at = candidate
+            if time.monotonic() - returned_at < self.health_check_after or self._is_healthy(connection):
+                with self._lock:
+                    self.stats['connections_reused'] += 1
+                return PooledConnection(self, connection)
+
+            logger.warning(f"Discarding unhealthy pooled connection for '{self.db_key}'")
+            self._close_quietly(connection)
+            with self._lock:
+                self.stats['health_check_failures'] += 1
+                self.stats['checkouts'] -= 1
+                self._in_use -= 1
+
+    def release(self, connection: pyodbc.Connection) -> None:
+        """Return a connection: roll back open work, reset autocommit, keep it if there is room"""
+        try:
+            connection.rollback()
+            if connection.autocommit:
+                connection.autocommit = False
+        except Exception:
+            # Broken connection - drop it
+            self._close_quietly(connection)
+            with self._lock:
+                self._in_use -= 1
+                self.stats['health_check_failures'] += 1
+            return
+
+        with self._lock:
+            self._in_use -= 1
+            if len(self._idle) < self.max_size:
+                self._idle.append((connection, time.monotonic()))
+                return
+            self.stats['closed_pool_full'] += 1
+        self._close_quietly(connection)
+
+    def close_all(self) -> None:
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._close_quietly(connection)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats.update({
+                'db_key': self.db_key,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'max_size': self.max_size,
+                'driver': _WORKING_DRIVERS.get(self.db_key),
+            })
+        checkouts = stats['checkouts']
+        stats['reuse_rate_percent'] = (stats['connections_reused'] / checkouts * 100) if checkouts else 0.0
+        return stats
+
+    def _drain_expired(self) -> List[pyodbc.Connection]:
+        """Remove idle connections past idle_timeout (caller holds the lock)"""
+        now = time.monotonic()
+        expired = [conn for conn, returned_at in self._idle if now - returned_at > self.idle_timeout]
+        if expired:
+            self._idle = [(conn, returned_at) for conn, returned_at in self._idle if now - returned_at <= self.idle_timeout]
+            self.stats['closed_idle_timeout'] += len(expired)
+        return expired
+
+    @staticmethod
+    def _is_healthy(connection: pyodbc.Connection) -> bool:
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(connection: pyodbc.Connection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+_POOLS: Dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(db_key: str) -> ConnectionPool:
+    """Process-wide connection pool for a db_key"""
+    key = db_key.lower()
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = ConnectionPool(key)
+        return pool
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Pool statistics per db_key (checkouts, reuse, health check failures, driver)"""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    return {pool.db_key: pool.get_stats() for pool in pools}
+
+
+def close_all_pools() -> None:
+    """Close all idle pooled connections (registered at exit)"""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_all_pools)
+
+
+def get_connection(db_key: str, pooled: Optional[bool] = None) -> Union[PooledConnection, pyodbc.Connection]:
+    """
+    Get a pyodbc connection for the given db_key (config.yaml block).
+
+    Pooled by default (DB_POOL_ENABLED): ``close()`` / leaving a ``with`` block returns
+    the connection to the pool. Pass pooled=False for a dedicated, unpooled connection.
+    """
+    if pooled is None:
+        pooled = POOL_ENABLED
+    if not pooled:
+        return _connect(db_key)
+    return get_pool(db_key).acquire()
+
 # --------------------------
 # QUERY HELPERS
 # --------------------------
@@ -211,7 +484,127 @@ def execute(
         rowcount = cur.rowcount
         if commit:
             conn.commit()
-        return rowcount
+    if _DDL_PATTERN.search(query):
+        # CREATE/ALTER/DROP/rename (incl. atomic swaps) - cached column lists may be stale
+        invalidate_schema(db_key)
+    return rowcount
+
+# --------------------------
+# SCHEMA METADATA CACHE
+# --------------------------
+_DDL_PATTERN = re.compile(r"\b(?:CREATE|ALTER|DROP)\s+TABLE\b|\bsp_rename\b|\bSELECT\b[^;]*?\bINTO\s+(?!#)", re.IGNORECASE)
+
+_TABLE_SCHEMA_SQL = """
+    SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
+           NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE, ORDINAL_POSITION
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
+    ORDER BY ORDINAL_POSITION
+"""
+
+
+def _schema_key(table_name: str, db_key: str, schema: str) -> Tuple[str, str, str]:
+    """(db_key, schema, table) cache key; accepts 'schema.table' and [bracketed] names"""
+    parts = [part.strip().strip("[]") for part in table_name.split(".")]
+    if len(parts) > 1:
+        schema = parts[-2]
+    # SQL Server identifiers are case-insensitive under the default collation
+    return db_key.lower(), schema.lower(), parts[-1].lower()
+
+
+class SchemaCache:
+    """
+    INFORMATION_SCHEMA.COLUMNS rows per (db_key, schema, table), trusted for ttl seconds.
+
+    Tables that do not exist (no columns) are never cached, so a table created
+    later is picked up on the next lookup. Call invalidate() after DDL that
+    bypasses execute() (raw cursors).
+    """
+
+    def __init__(self, ttl: float = SCHEMA_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'invalidated': 0}
+
+    def get(self, table_name: str, db_key: str, schema: str = "dbo") -> List[Dict[str, Any]]:
+        """Column rows of schema.table in ordinal order (empty if the table does not exist)"""
+        key = _schema_key(table_name, db_key, schema)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                self.stats['hits'] += 1
+                return cached[1]
+            if cached:
+                del self._entries[key]
+                self.stats['expired'] += 1
+            self.stats['misses'] += 1
+
+        columns = self._read(key)
+        if columns and self.ttl > 0:
+            with self._lock:
+                self._entries[key] = (time.monotonic(), columns)
+        return columns
+
+    @staticmethod
+    def _read(key: Tuple[str, str, str]) -> List[Dict[str, Any]]:
+        db_key, schema, table = key
+        with get_connection(db_key) as conn:
+            cursor = conn.cursor()
+            cursor.execute(_TABLE_SCHEMA_SQL, (schema, table))
+            names = [column[0] for column in cursor.description]
+            columns = [dict(zip(names, row)) for row in cursor.fetchall()]
+            cursor.close()
+        return columns
+
+    def invalidate(self, db_key: Optional[str] = None, table_name: Optional[str] = None,
+                   schema: str = "dbo") -> int:
+        """Drop one table, every table of a db_key, or everything (no arguments); returns entries dropped"""
+        with self._lock:
+            if table_name is not None and db_key is not None:
+                keys = [_schema_key(table_name, db_key, schema)]
+            elif db_key is not None:
+                keys = [key for key in self._entries if key[0] == db_key.lower()]
+            else:
+                keys = list(self._entries)
+            dropped = sum(self._entries.pop(key, None) is not None for key in keys)
+            self.stats['invalidated'] += dropped
+            return dropped
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats, tables=len(self._entries))
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+_SCHEMA_CACHE = SchemaCache()
+
+
+def get_table_schema(table_name: str, db_key: str, schema: str = "dbo") -> List[Dict[str, Any]]:
+    """
+    Cached INFORMATION_SCHEMA.COLUMNS rows for schema.table in ordinal order
+    (COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH, NUMERIC_PRECISION, NUMERIC_SCALE,
+    IS_NULLABLE, ORDINAL_POSITION). Empty list if the table does not exist.
+    """
+    return [dict(column) for column in _SCHEMA_CACHE.get(table_name, db_key, schema)]
+
+
+def get_column_names(table_name: str, db_key: str, schema: str = "dbo") -> List[str]:
+    """Cached column names of schema.table in ordinal order"""
+    return [column['COLUMN_NAME'] for column in _SCHEMA_CACHE.get(table_name, db_key, schema)]
+
+
+def invalidate_schema(db_key: Optional[str] = None, table_name: Optional[str] = None,
+                      schema: str = "dbo") -> int:
+    """Forget cached schemas after DDL / atomic swaps (one table, one db_key, or all)"""
+    return _SCHEMA_CACHE.invalidate(db_key, table_name, schema)
+
+
+def get_schema_cache_stats() -> Dict[str, Any]:
+    """Schema cache hits, misses, expiries, invalidations, cached tables and hit_rate"""
+    return _SCHEMA_CACHE.get_stats()
 
 # --------------------------
 # MIGRATION HELPERS
@@ -1,6 +1,16 @@
 # utils/staging_helper.py - Performance optimized version with mode-based execution
 
+import datetime
+import decimal
+import json
 import logging
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import tempfile
+import numpy as np
 import pandas as pd
 import time
 from typing import Generator
@@ -25,6 +35,28 @@ def get_staging_mode() -> str:
     """Get current staging mode"""
     return _STAGING_MODE
 
+# Bulk-copy backend for load_to_staging_table (environment overrides)
+#   auto        -> bcp for loads of at least BULK_COPY_MIN_ROWS rows when the bcp utility is installed
+#                  and the database uses a trusted connection
+#   executemany -> always INSERT ... VALUES with fast_executemany
+#   bcp         -> always bcp (falls back to executemany if bcp is missing). With SQL authentication
+#                  the password is passed as bcp -P and is visible in the process list while it runs
+_BULK_BACKEND = os.getenv("STAGING_BULK_BACKEND", "auto").lower()
+BULK_COPY_MIN_ROWS = int(os.getenv("STAGING_BULK_COPY_MIN_ROWS", "100000"))
+BCP_PATH = os.getenv("BCP_PATH", "bcp")
+
+def set_bulk_backend(backend: str, min_rows: int = None):
+    """Set the load_to_staging_table backend ('auto', 'executemany' or 'bcp') from calling script"""
+    global _BULK_BACKEND, BULK_COPY_MIN_ROWS
+    if backend.lower() in ['auto', 'executemany', 'bcp']:
+        _BULK_BACKEND = backend.lower()
+        logger.info(f"Staging bulk backend set to: {_BULK_BACKEND.upper()}")
+    else:
+        logger.warning(f"Invalid bulk backend '{backend}', using default 'auto'")
+        _BULK_BACKEND = 'auto'
+    if min_rows is not None:
+        BULK_COPY_MIN_ROWS = min_rows
+
 def prepare_staging_table(
     df: pd.DataFrame,
     staging_table: str,
@@ -159,15 +191,197 @@ def _row_generator_robust(df_chunk: pd.DataFrame) -> Generator[tuple, None, None
         yield tuple(converted_row)
 
 
+_NULL_STRING_TOKENS = ['nan', 'none', 'null', '']
+
+# infer_dtype results whose values never need the per-cell .date() check
+_COLUMNAR_INFERRED_TYPES = {'string', 'empty', 'integer', 'floating', 'mixed-integer-float', 'boolean', 'decimal'}
+
+
+def _column_values(series: pd.Series, robust: bool):
+    """
+    Convert one column to executemany values in a single pass: datetime -> date,
+    NaN/NaT/None -> None, null-string tokens -> None. Returns None for mixed-type
+    object columns, which go through the per-cell generators instead.
+    """
+    dtype = series.dtype
+    is_string = False
+    if isinstance(dtype, pd.DatetimeTZDtype) or (isinstance(dtype, np.dtype) and dtype.kind == 'M'):
+        values = series.dt.date.to_numpy(dtype=object, copy=True)
+    elif isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+        values = series.to_numpy(dtype=object, copy=True)
+    elif dtype == object or isinstance(dtype, pd.StringDtype):
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred not in _COLUMNAR_INFERRED_TYPES:
+            return None
+        values = series.to_numpy(dtype=object, copy=True)
+        is_string = inferred == 'string'
+    else:
+        return None
+
+    null_mask = pd.isna(values)
+    if is_string and robust:
+        null_mask |= series.str.lower().isin(_NULL_STRING_TOKENS).to_numpy()
+    elif is_string and dtype == object:
+        # fast mode only replaced tokens (case-sensitive) in object columns
+        null_mask |= series.isin(_NULL_STRING_TOKENS).to_numpy()
+    values[null_mask] = None
+    return values
+
+
+def _row_generator_columnar(df_chunk: pd.DataFrame, robust: bool) -> Generator[tuple, None, None]:
+    """
+    COLUMNAR: Convert each column once, then zip the arrays into row tuples.
+    Mixed-type columns fall back to the fast/robust per-cell generators.
+    """
+    if len(df_chunk.columns) == 0:
+        yield from (() for _ in range(len(df_chunk)))
+        return
+
+    fallback = _row_generator_robust if robust else _row_generator_fast
+    columns = []
+    for position in range(len(df_chunk.columns)):
+        series = df_chunk.iloc[:, position]
+        values = _column_values(series, robust)
+        if values is None:
+            values = [row[0] for row in fallback(series.to_frame())]
+        columns.append(values)
+
+    yield from zip(*columns)
+
+
 def _row_generator(df_chunk: pd.DataFrame) -> Generator[tuple, None, None]:
     """
     Mode-aware row generation based on script configuration
-    Routes to appropriate generator based on _STAGING_MODE
+    Converts column-wise with the null/date semantics of _STAGING_MODE
     """
-    if _STAGING_MODE == 'fast':
-        return _row_generator_fast(df_chunk)
+    return _row_generator_columnar(df_chunk, robust=_STAGING_MODE != 'fast')
+
+
+def build_insert_sql(staging_table: str, columns: list) -> str:
+    """Parameterized INSERT for executemany into dbo.staging_table"""
+    collist = ", ".join(f"[{c}]" for c in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO dbo.{staging_table} ({collist}) VALUES ({placeholders})"
+
+
+def dataframe_to_rows(df_chunk: pd.DataFrame) -> list[tuple]:
+    """Materialize a DataFrame chunk as executemany rows using the current staging mode"""
+    return list(_row_generator(df_chunk))
+
+
+# bcp character-mode terminators: control characters that never occur in staged text
+BCP_FIELD_TERMINATOR = "\x1f"
+BCP_ROW_TERMINATOR = "\x1e"
+_BCP_ROWS_COPIED = re.compile(r"(\d+) rows copied")
+
+
+def _is_trusted_connection(cfg: dict) -> bool:
+    """True when a config.yaml database block authenticates with Windows / Kerberos credentials"""
+    return str(cfg.get('trusted_connection', '')).lower() in ('yes', 'true', '1')
+
+
+def choose_staging_backend(row_count: int, db_name: str = None) -> str:
+    """Pick 'bcp' or 'executemany' for a load of row_count rows into db_name"""
+    if _BULK_BACKEND == 'executemany':
+        return 'executemany'
+    if _BULK_BACKEND == 'auto':
+        if row_count < BULK_COPY_MIN_ROWS:
+            return 'executemany'
+        # bcp only takes a SQL login password on the command line (-P), so auto never picks it for one
+        if db_name is not None and not _is_trusted_connection(db.DB_CONFIG.get(db_name.lower(), {})):
+            return 'executemany'
+    if shutil.which(BCP_PATH) is None:
+        if _BULK_BACKEND == 'bcp':
+            logger.warning("bcp utility '%s' not found, using fast_executemany", BCP_PATH)
+        return 'executemany'
+    return 'bcp'
+
+
+def _bcp_field(value) -> str:
+    """Character-mode text for one executemany value (empty field loads as NULL)"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float):
+        return np.format_float_positional(value, trim='-')
+    if isinstance(value, decimal.Decimal):
+        return format(value, 'f')
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    text = str(value)
+    if BCP_FIELD_TERMINATOR in text or BCP_ROW_TERMINATOR in text:
+        raise ValueError("value contains a bcp terminator character")
+    return text
+
+
+def build_bcp_command(staging_table: str, db_name: str, data_file: str, error_file: str) -> list[str]:
+    """bcp in command line for a config.yaml database block (wide-character, single transaction)"""
+    cfg = db.DB_CONFIG[db_name.lower()]
+    command = [
+        BCP_PATH, f"dbo.{staging_table}", "in", data_file,
+        "-S", f"{cfg['host']},{cfg['port']}", "-d", cfg['database'],
+        "-w", "-t", BCP_FIELD_TERMINATOR, "-r", BCP_ROW_TERMINATOR,
+        "-h", "TABLOCK", "-m", "1", "-e", error_file,
+    ]
+    if _is_trusted_connection(cfg):
+        command.append("-T")
     else:
-        return _row_generator_robust(df_chunk)
+        # Only reached with STAGING_BULK_BACKEND=bcp: the password shows up in the process list
+        command += ["-U", cfg['username'], "-P", cfg['password']]
+    # e.g. bcp_options: "-u" (mssql-tools18, trust server certificate)
+    command += shlex.split(cfg.get('bcp_options', ''))
+    return command
+
+
+def bulk_copy_to_staging(
+    df: pd.DataFrame,
+    staging_table: str,
+    db_name: str,
+    batch_size: int = 50000
+) -> int:
+    """
+    Load df into dbo.staging_table with the bcp utility instead of INSERT ... VALUES.
+    Rows are converted with the current staging mode, written to a UTF-16 data file
+    and copied in one transaction. Fields map to table columns by position, so the
+    staging table must have been created from df (prepare_staging_table).
+    Raises ValueError if a value cannot be represented in the data file.
+    """
+    start_time = time.time()
+    fd, data_file = tempfile.mkstemp(prefix=f"{staging_table}_", suffix=".bcp")
+    error_file = data_file + ".err"
+    try:
+        with os.fdopen(fd, "w", encoding="utf-16-le", newline="") as handle:
+            for start in range(0, len(df), batch_size):
+                handle.write("".join(
+                    BCP_FIELD_TERMINATOR.join(_bcp_field(v) for v in row) + BCP_ROW_TERMINATOR
+                    for row in _row_generator(df.iloc[start:start + batch_size])
+                ))
+        write_elapsed = time.time() - start_time
+
+        result = subprocess.run(build_bcp_command(staging_table, db_name, data_file, error_file),
+                                capture_output=True, text=True)
+        errors = ""
+        if os.path.exists(error_file):
+            with open(error_file, encoding="utf-8", errors="replace") as handle:
+                errors = handle.read().strip()
+        copied = _BCP_ROWS_COPIED.search(result.stdout or "")
+        if result.returncode != 0 or errors or not copied or int(copied.group(1)) != len(df):
+            raise RuntimeError(f"bcp load into {staging_table} failed (exit {result.returncode}): "
+                               f"{(errors or result.stdout or result.stderr).strip()[:2000]}")
+    finally:
+        for path in (data_file, error_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+    total_elapsed = time.time() - start_time
+    logger.info("🚀 BCP BULK COPY COMPLETE: %d rows in %.2fs (data file %.2fs, %.0f rows/sec)",
+                len(df), total_elapsed, write_elapsed, len(df) / total_elapsed if total_elapsed > 0 else 0)
+    return len(df)
 
 
 def load_to_staging_table(
@@ -179,6 +393,7 @@ def load_to_staging_table(
     """
     MODE-BASED: Direct execution based on staging mode - no try-catch overhead.
     - Uses appropriate row generator based on _STAGING_MODE
+    - Large loads use the bcp bulk-copy backend (see choose_staging_backend)
     - Larger batch sizes (5000 vs 1000)
     - Better connection management
     """
@@ -186,6 +401,13 @@ def load_to_staging_table(
         logger.warning("No data to load into %s", staging_table)
         return
 
+    if choose_staging_backend(len(df), db_name) == 'bcp':
+        try:
+            bulk_copy_to_staging(df, staging_table, db_name)
+            return
+        except ValueError as e:
+            logger.warning("bcp cannot load %s (%s), using fast_executemany", staging_table, e)
+
     start_time = time.time()
     total = len(df)
     
@@ -193,10 +415,7 @@ def load_to_staging_table(
                 total, batch_size, _STAGING_MODE.upper())
     
     # Pre-build SQL statement
-    cols = list(df.columns)
-    collist = ", ".join(f"[{c}]" for c in cols)
-    placeholders = ", ".join("?" for _ in cols)
-    insert_sql = f"INSERT INTO dbo.{staging_table} ({collist}) VALUES ({placeholders})"
+    insert_sql = build_insert_sql(staging_table, list(df.columns))
 
     # Single connection for entire operation (more efficient)
     conn = db.get_connection(db_name)
@@ -279,18 +498,131 @@ def atomic_swap_tables(
         raise  # Re-raise the exception to maintain error handling upstream
 
 
-# Placeholder for future upsert logic
+def get_table_columns(table_name: str, db_name: str) -> list[str]:
+    """Return the column names of dbo.table_name in ordinal order (empty if the table does not exist)"""
+    columns = db.run_query(
+        "SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS "
+        "WHERE TABLE_SCHEMA = 'dbo' AND TABLE_NAME = ? ORDER BY ORDINAL_POSITION",
+        db_name,
+        params=(table_name,)
+    )
+    return columns["COLUMN_NAME"].tolist()
+
+
+def get_table_column_types(table_name: str, db_name: str) -> dict:
+    """Return {column: (DATA_TYPE, CHARACTER_MAXIMUM_LENGTH, NUMERIC_PRECISION, NUMERIC_SCALE)} of dbo.table_name in ordinal order"""
+    columns = db.run_query(
+        "SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH, NUMERIC_PRECISION, NUMERIC_SCALE "
+        "FROM INFORMATION_SCHEMA.COLUMNS "
+        "WHERE TABLE_SCHEMA = 'dbo' AND TABLE_NAME = ? ORDER BY ORDINAL_POSITION",
+        db_name,
+        params=(table_name,)
+    )
+    sizes = columns[["CHARACTER_MAXIMUM_LENGTH", "NUMERIC_PRECISION", "NUMERIC_SCALE"]].astype(object)
+    sizes = sizes.where(sizes.notna(), None)
+    return {
+        name: (data_type.lower(), *(None if size is None else int(size) for size in row))
+        for name, data_type, row in zip(columns["COLUMN_NAME"], columns["DATA_TYPE"], sizes.itertuples(index=False))
+    }
+
+
+def _column_type_fits(staging_type: tuple, production_type: tuple) -> bool:
+    """True when values of staging_type load into production_type unchanged (same type, no narrower column)"""
+    data_type, length, precision, scale = staging_type
+    production_data_type, production_length, production_precision, production_scale = production_type
+    if data_type != production_data_type:
+        return False
+    if length is not None and production_length != -1 and (length == -1 or length > (production_length or 0)):
+        return False
+    if data_type in ("decimal", "numeric"):
+        return precision == production_precision and scale == production_scale
+    return True
+
+
 def upsert_into_production(
     staging_table: str,
     production_table: str,
     db_name: str,
     key_columns: list[str]
-) -> None:
+) -> int:
+    """
+    MERGE staging_table into production_table on key_columns (incremental loads).
+    Matched rows are updated, new rows inserted; production rows missing from
+    staging are left alone (see delete_missing_rows). Drops the staging table on success.
+
+    Raises ValueError when staging has columns production does not, or a staging column's
+    type would not load unchanged into production (schema drift) - callers should fall back
+    to a full reload + atomic_swap_tables.
+    """
+    start_time = time.time()
+
+    staging_types = get_table_column_types(staging_table, db_name)
+    production_types = get_table_column_types(production_table, db_name)
+    staging_columns = list(staging_types)
+    missing = [c for c in staging_columns if c not in production_types]
+    if missing:
+        raise ValueError(f"Schema drift: {production_table} is missing staging columns {missing}")
+    mismatched = [c for c in staging_columns if not _column_type_fits(staging_types[c], production_types[c])]
+    if mismatched:
+        raise ValueError(f"Schema drift: {production_table} column types differ from staging for {mismatched}")
+
+    on_clause = " AND ".join(f"tgt.[{c}] = src.[{c}]" for c in key_columns)
+    update_columns = [c for c in staging_columns if c not in key_columns]
+    set_clause = ", ".join(f"tgt.[{c}] = src.[{c}]" for c in update_columns)
+    collist = ", ".join(f"[{c}]" for c in staging_columns)
+    src_collist = ", ".join(f"src.[{c}]" for c in staging_columns)
+
+    matched_clause = f"WHEN MATCHED THEN UPDATE SET {set_clause}" if update_columns else ""
+    sql = f"""
+    MERGE dbo.{production_table} WITH (HOLDLOCK) AS tgt
+    USING dbo.{staging_table} AS src
+        ON {on_clause}
+    {matched_clause}
+    WHEN NOT MATCHED BY TARGET THEN
+        INSERT ({collist}) VALUES ({src_collist});
+    """
+
+    try:
+        affected = db.execute(sql, db_name)
+    except Exception as e:
+        logger.error("Upsert failed: %s → %s. Staging table preserved for debugging.",
+                     staging_table, production_table)
+        logger.error("Upsert error: %s", str(e))
+        raise
+
+    db.execute(f"DROP TABLE IF EXISTS dbo.{staging_table};", db_name)
+
+    elapsed = time.time() - start_time
+    logger.info("Upsert complete: %s → %s on %s, %d rows merged, staging table dropped (%.2fs)",
+                staging_table, production_table, key_columns, affected, elapsed)
+    return affected
+
+
+def delete_missing_rows(
+    production_table: str,
+    db_name: str,
+    key_column: str,
+    live_keys: list
+) -> int:
     """
-    Perform a MERGE from staging_table to production_table on key_columns.
-    Not implemented yet—reserved for upsert workflows.
+    Delete production rows whose key_column is not in live_keys (e.g. item IDs
+    from an ID-only harvest). The key list is sent as one JSON parameter.
     """
-    raise NotImplementedError("Upsert logic not yet implemented")
+    if not live_keys:
+        logger.warning("No live keys for %s - skipping delete detection", production_table)
+        return 0
+
+    start_time = time.time()
+    sql = f"""
+    DELETE FROM dbo.{production_table}
+    WHERE [{key_column}] NOT IN (SELECT CAST([value] AS BIGINT) FROM OPENJSON(?))
+    """
+    deleted = db.execute(sql, db_name, params=(json.dumps([int(k) for k in live_keys]),))
+
+    elapsed = time.time() - start_time
+    logger.info("Delete detection: %d rows removed from %s (%d live keys, %.2fs)",
+                deleted, production_table, len(live_keys), elapsed)
+    return deleted
 
 
 def apply_column_duplications(df, metadata):
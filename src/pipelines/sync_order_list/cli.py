@@ -60,7 +60,8 @@ class UltraLightweightSyncCLI:
     def sync_command(self, dry_run: bool = False, limit: Optional[int] = None, 
                      customer: Optional[str] = None, createitem_mode: str = 'batch',
                      skip_subitems: bool = False, retry_errors: bool = False,
-                     generate_report: bool = False, sequential: bool = False) -> Dict[str, Any]:
+                     generate_report: bool = False, sequential: bool = False,
+                     customer_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Enhanced sync command with customer processing and retry functionality.
         
@@ -73,6 +74,7 @@ class UltraLightweightSyncCLI:
             retry_errors: If True, retry failed records before processing new ones
             generate_report: If True, generate customer summary report after processing
             sequential: If True, process customers one at a time with isolated group creation
+            customer_workers: Per-customer mode only - customers processed concurrently (default from TOML)
             
         Returns:
             Enhanced sync execution results including retry statistics and customer reports
@@ -119,7 +121,8 @@ class UltraLightweightSyncCLI:
                     skip_subitems=skip_subitems,
                     customer_name=customer,
                     retry_errors=retry_errors,
-                    generate_report=generate_report
+                    generate_report=generate_report,
+                    customer_workers=customer_workers
                 )
             else:
                 self.logger.info("🚀 STEP 2: Running Enhanced Monday.com Sync (Default Mode - Cross Customer)...")
@@ -272,6 +275,7 @@ class UltraLightweightSyncCLI:
                 self.logger.info(f"✅ Retry processing completed")
                 self.logger.info(f"   Records identified: {retry_results['records_identified']}")
                 self.logger.info(f"   Records reset: {retry_results['records_reset']}")
+                self.logger.info(f"   Records deferred (not yet due): {retry_results.get('records_deferred', 0)}")
                 
                 # Generate customer report if requested
                 if generate_report and customer and not dry_run:
@@ -437,6 +441,8 @@ Examples:
                            help='Generate customer summary report after processing (requires --customer)')
     sync_parser.add_argument('--sequential', action='store_true',
                            help='Process customers one at a time with isolated group creation (vs cross-customer batch mode)')
+    sync_parser.add_argument('--customer-workers', type=int,
+                           help='With --sequential: number of customers to sync concurrently (default: max_concurrent_customers from TOML)')
     
     # Retry command
     retry_parser = subparsers.add_parser('retry', help='Retry failed records')
@@ -487,7 +493,8 @@ Examples:
                 skip_subitems=args.skip_subitems,
                 retry_errors=args.retry_errors,
                 generate_report=args.generate_report,
-                sequential=args.sequential
+                sequential=args.sequential,
+                customer_workers=args.customer_workers
             )
         elif args.command == 'retry':
             dry_run = args.dry_run
@@ -246,6 +246,16 @@ class DeltaSyncConfig:
         """Maximum concurrent batches"""
         return self._config.get('monday', {}).get('rate_limits', {}).get('max_concurrent_batches', 1)
     
+    @property
+    def max_pending_writes(self) -> int:
+        """Completed batches allowed to wait for their DB write-back before new API calls pause (back-pressure)"""
+        return self._config.get('monday', {}).get('rate_limits', {}).get('max_pending_writes', 2 * self.max_concurrent_batches)
+    
+    @property
+    def max_concurrent_customers(self) -> int:
+        """Customers processed concurrently by per-customer sync (each worker shares the Monday.com rate limiter)"""
+        return self._config.get('monday', {}).get('rate_limits', {}).get('max_concurrent_customers', 1)
+    
     @property
     def request_timeout(self) -> float:
         """API request timeout in seconds"""
@@ -331,40 +341,36 @@ class DeltaSyncConfig:
     
     def get_dynamic_merge_columns(self) -> List[str]:
         """
-        Get matching columns between source and target tables using stored procedure
+        Get matching columns between source and target tables (sp_get_matching_columns logic,
+        evaluated against the cached table schemas)
         
         Returns:
             List of column names that exist in both source and target tables
             Excludes uniqueidentifier columns automatically
         """
         try:
-            from pipelines.utils import db
-            
             # Get table names from environment config
             source_table = self.source_table.split('.')[-1]  # Remove schema if present
             target_table = self.target_table.split('.')[-1]  # Remove schema if present
             
             self.logger.info(f"🔍 Detecting matching columns between {source_table} and {target_table}")
             
-            # Execute stored procedure to get matching columns
-            with db.get_connection(self.db_key) as connection:
-                cursor = connection.cursor()
-                
-                # Call the stored procedure
-                query = "EXEC sp_get_matching_columns ?, ?"
-                cursor.execute(query, (source_table, target_table))
-                
-                # Fetch results
-                results = cursor.fetchall()
-                cursor.close()
-                
-                # Extract column names from results
-                matching_columns = [row[0] for row in results]  # COLUMN_NAME is first column
-                
-                self.logger.info(f"✅ Found {len(matching_columns)} matching columns")
-                self.logger.debug(f"Matching columns: {matching_columns[:10]}..." if len(matching_columns) > 10 else f"Matching columns: {matching_columns}")
-                
-                return matching_columns
+            # Same result as EXEC sp_get_matching_columns, from the process-wide schema cache
+            target_columns = {
+                column['COLUMN_NAME'].lower()
+                for column in db.get_table_schema(target_table, self.db_key, self.database_schema)
+                if column['DATA_TYPE'] != 'uniqueidentifier'
+            }
+            matching_columns = [
+                column['COLUMN_NAME']
+                for column in db.get_table_schema(source_table, self.db_key, self.database_schema)
+                if column['DATA_TYPE'] != 'uniqueidentifier' and column['COLUMN_NAME'].lower() in target_columns
+            ]
+            
+            self.logger.info(f"✅ Found {len(matching_columns)} matching columns")
+            self.logger.debug(f"Matching columns: {matching_columns[:10]}..." if len(matching_columns) > 10 else f"Matching columns: {matching_columns}")
+            
+            return matching_columns
                 
         except Exception as e:
             self.logger.error(f"❌ Failed to get dynamic merge columns: {e}")
@@ -416,7 +422,7 @@ class DeltaSyncConfig:
     def get_dynamic_size_columns(self) -> List[str]:
         """
         Get dynamic size columns from actual source table schema (TOML-driven)
-        Uses INFORMATION_SCHEMA to discover columns between markers
+        Uses the cached INFORMATION_SCHEMA columns to discover columns between markers
         
         Returns:
             List of actual size column names from database (e.g., ['XS', 'S', 'M', 'L', 'XL', '[2T]', '[3T]', etc.])
@@ -441,50 +447,22 @@ class DeltaSyncConfig:
             
             self.logger.info(f"Discovering size columns from {source_table} between '{start_after}' and '{end_before}' (env: {self._environment})")
             
-            # Query INFORMATION_SCHEMA for actual column names and ordinal positions
-            with db.get_connection(self.db_key) as conn:
-                size_discovery_sql = """
-                SELECT COLUMN_NAME, ORDINAL_POSITION
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_NAME = ? 
-                  AND TABLE_SCHEMA = ?
-                  AND ORDINAL_POSITION > (
-                      SELECT ORDINAL_POSITION 
-                      FROM INFORMATION_SCHEMA.COLUMNS 
-                      WHERE TABLE_NAME = ? AND TABLE_SCHEMA = ? 
-                        AND COLUMN_NAME = ?
-                  )
-                  AND ORDINAL_POSITION < (
-                      SELECT ORDINAL_POSITION 
-                      FROM INFORMATION_SCHEMA.COLUMNS 
-                      WHERE TABLE_NAME = ? AND TABLE_SCHEMA = ? 
-                        AND COLUMN_NAME = ?
-                  )
-                ORDER BY ORDINAL_POSITION
-                """
-                
-                import pandas as pd
-                result_df = pd.read_sql(
-                    size_discovery_sql, 
-                    conn, 
-                    params=[
-                        source_table, self.database_schema,  # Main table
-                        source_table, self.database_schema, start_after,  # Start marker
-                        source_table, self.database_schema, end_before   # End marker
-                    ]
-                )
-                
-                if result_df.empty:
-                    self.logger.warning(f"No size columns found between '{start_after}' and '{end_before}'")
-                    return []
-                
-                # Get column names and apply size limit
-                size_columns = result_df['COLUMN_NAME'].tolist()[:max_sizes]
-                
-                self.logger.info(f"Discovered {len(size_columns)} size columns from database schema")
-                self.logger.debug(f"First 5 size columns: {size_columns[:5]}")
-                
-                return size_columns
+            # Column names in ordinal order from the process-wide schema cache
+            columns = db.get_column_names(source_table, self.db_key, self.database_schema)
+            positions = {name.lower(): position for position, name in enumerate(columns)}
+            start, end = positions.get(start_after.lower()), positions.get(end_before.lower())
+            
+            # Get column names and apply size limit
+            size_columns = columns[start + 1:end][:max_sizes] if start is not None and end is not None else []
+            
+            if not size_columns:
+                self.logger.warning(f"No size columns found between '{start_after}' and '{end_before}'")
+                return []
+            
+            self.logger.info(f"Discovered {len(size_columns)} size columns from database schema")
+            self.logger.debug(f"First 5 size columns: {size_columns[:5]}")
+            
+            return size_columns
                 
         except Exception as e:
             self.logger.error(f"Failed to discover dynamic size columns from database: {e}")
@@ -366,22 +366,29 @@ class EnhancedMergeOrchestrator:
             'total_duration_seconds': time.time() - self.total_start_time if self.total_start_time else 0
         }
         
-    def detect_new_orders(self) -> Dict[str, Any]:
+    def detect_new_orders(self, mode: Optional[str] = None) -> Dict[str, Any]:
         """
         Python preprocessing: Detect NEW orders via AAG ORDER NUMBER existence check
         Updates source table sync_state before SQL template execution
         
         Business Logic:
-        1. Query existing AAG ORDER NUMBERs from target table
-        2. Query all records from source table 
-        3. Compare AAG ORDER NUMBERs to classify as NEW or EXISTING
-        4. Update source table sync_state column based on classification
-        5. Provide comprehensive logging with production data validation
+        1. Classify source records as NEW (AAG ORDER NUMBER not in target table) or EXISTING
+        2. Update source table sync_state column based on classification
+        3. Provide comprehensive logging with production data validation
+        
+        Modes (new_order_detection.mode in TOML):
+        - "server" (default): one set-based UPDATE...FROM with a LEFT JOIN to the target table,
+          per-customer counts taken from its OUTPUT rows (GROUP BY) - no rows leave SQL Server
+        - "pandas": vectorized isin() classification in Python, one UPDATE per sync_state
+        
+        Args:
+            mode: Override the configured classification mode
         
         Returns:
             Dictionary with detection results and statistics
         """
-        self.logger.info("🔍 Detecting NEW orders via AAG ORDER NUMBER matching")
+        mode = mode or self.transformation_config.get('new_order_detection', {}).get('mode', 'server')
+        self.logger.info(f"🔍 Detecting NEW orders via AAG ORDER NUMBER matching (mode: {mode})")
         
         start_time = time.time()
         
@@ -389,116 +396,26 @@ class EnhancedMergeOrchestrator:
             with db.get_connection(self.config.database_connection) as conn:
                 cursor = conn.cursor()
                 
-                # Step 1: Get existing AAG ORDER NUMBERs from target table
-                existing_orders = self.get_existing_aag_orders()
-                self.logger.info(f"Found {len(existing_orders)} existing orders in {self.config.target_table}")
-                
-                # Step 2: Query source table records
-                source_query = f"""
-                SELECT record_uuid, [AAG ORDER NUMBER], [CUSTOMER NAME], [PO NUMBER]
-                FROM {self.config.source_table}
-                WHERE [AAG ORDER NUMBER] IS NOT NULL
-                """
-                
-                cursor.execute(source_query)
-                source_records = cursor.fetchall()
-                
-                self.logger.info(f"Found {len(source_records)} records in source table {self.config.source_table}")
+                if mode == 'pandas':
+                    customer_stats, existing_in_target = self._classify_new_orders_pandas(cursor)
+                else:
+                    customer_stats, existing_in_target = self._classify_new_orders_server(cursor)
                 
-                # Step 3: Classify records as NEW or EXISTING
-                new_orders = []
-                existing_orders_list = []
-                # Track new orders by customer for production reporting
-                customer_stats = {}
-                new_count = 0
-                existing_count = 0
+                conn.commit()
                 
-                for record in source_records:
-                    record_uuid, aag_order_number, customer_name, po_number = record
-                    
-                    # Check if AAG ORDER NUMBER exists in target table
-                    if aag_order_number not in existing_orders:
-                        new_orders.append({
-                            'record_uuid': record_uuid,
-                            'aag_order_number': aag_order_number,
-                            'customer_name': customer_name,
-                            'po_number': po_number
-                        })
-                        new_count += 1
-                        
-                        # Track by customer for production reporting
-                        customer_key = str(customer_name).upper() if customer_name else 'UNKNOWN'
-                        if customer_key not in customer_stats:
-                            customer_stats[customer_key] = {'new': 0, 'existing': 0}
-                        customer_stats[customer_key]['new'] += 1
-                        
-                    else:
-                        existing_orders_list.append({
-                            'record_uuid': record_uuid,
-                            'aag_order_number': aag_order_number,
-                            'customer_name': customer_name,
-                            'po_number': po_number
-                        })
-                        existing_count += 1
-                        
-                        # Track by customer for production reporting
-                        customer_key = str(customer_name).upper() if customer_name else 'UNKNOWN'
-                        if customer_key not in customer_stats:
-                            customer_stats[customer_key] = {'new': 0, 'existing': 0}
-                        customer_stats[customer_key]['existing'] += 1
-                
-                # Step 4: Update sync_state in source table based on classification
-                update_count = 0
-                batch_size = 1000  # SQL Server parameter limit safety
-                
-                if new_orders or existing_orders_list:
-                    # Batch update NEW orders
-                    if new_orders:
-                        new_uuids = [order['record_uuid'] for order in new_orders]
-                        total_batches = (len(new_uuids) + batch_size - 1) // batch_size
-                        self.logger.info(f"   Updating {len(new_uuids)} NEW orders in batches of {batch_size} ({total_batches} batches)")
-                        
-                        for i in range(0, len(new_uuids), batch_size):
-                            batch_uuids = new_uuids[i:i + batch_size]
-                            batch_num = i//batch_size + 1
-                            
-                            update_new_query = f"""
-                            UPDATE {self.config.source_table}
-                            SET sync_state = 'NEW', updated_at = GETUTCDATE()
-                            WHERE record_uuid IN ({','.join(['?' for _ in batch_uuids])})
-                            """
-                            cursor.execute(update_new_query, batch_uuids)
-                            self.logger.info(f"   ✅ NEW batch {batch_num}/{total_batches}: Updated {len(batch_uuids)} records")
-                        
-                    # Batch update EXISTING orders
-                    if existing_orders_list:
-                        existing_uuids = [order['record_uuid'] for order in existing_orders_list]
-                        total_batches = (len(existing_uuids) + batch_size - 1) // batch_size
-                        self.logger.info(f"   Updating {len(existing_uuids)} EXISTING orders in batches of {batch_size} ({total_batches} batches)")
-                        
-                        for i in range(0, len(existing_uuids), batch_size):
-                            batch_uuids = existing_uuids[i:i + batch_size]
-                            batch_num = i//batch_size + 1
-                            
-                            update_existing_query = f"""
-                            UPDATE {self.config.source_table}
-                            SET sync_state = 'EXISTING', updated_at = GETUTCDATE()
-                            WHERE record_uuid IN ({','.join(['?' for _ in batch_uuids])})
-                            """
-                            cursor.execute(update_existing_query, batch_uuids)
-                            self.logger.info(f"   ✅ EXISTING batch {batch_num}/{total_batches}: Updated {len(batch_uuids)} records")
-                    
-                    conn.commit()
-                    update_count = len(new_orders) + len(existing_orders_list)
+                new_count = sum(stats['new'] for stats in customer_stats.values())
+                existing_count = sum(stats['existing'] for stats in customer_stats.values())
+                total_source_records = new_count + existing_count
+                update_count = total_source_records
                 
                 duration = time.time() - start_time
                 
-                # Step 5: Comprehensive logging and results
+                # Comprehensive logging and results
                 self.logger.info(f"✅ NEW order detection complete:")
-                self.logger.info(f"   📊 Total source records: {len(source_records)}")
-                self.logger.info(f"   🆕 NEW orders: {len(new_orders)}")
-                self.logger.info(f"   📋 EXISTING orders: {len(existing_orders_list)}")
-                self.logger.info(f"   🎯 Target table existing: {len(existing_orders)}")
+                self.logger.info(f"   📊 Total source records: {total_source_records}")
+                self.logger.info(f"   🆕 NEW orders: {new_count}")
+                self.logger.info(f"   📋 EXISTING orders: {existing_count}")
+                self.logger.info(f"   🎯 Target table existing: {existing_in_target}")
                 self.logger.info(f"   ⚡ Updated records: {update_count}")
                 self.logger.info(f"   ⏱️ Duration: {duration:.2f}s")
                 
@@ -509,14 +426,14 @@ class EnhancedMergeOrchestrator:
                     self.logger.info(f"     → {customer}: {total_customer} orders (New: {stats['new']}, Existing: {stats['existing']})")
                 
                 # Calculate accuracy (should be >95%)
-                accuracy = (update_count / len(source_records)) * 100 if source_records else 100
+                accuracy = (update_count / total_source_records) * 100 if total_source_records else 100
                 
                 result = {
                     'success': True,
-                    'total_source_records': len(source_records),
-                    'new_orders': len(new_orders),
-                    'existing_orders': len(existing_orders_list),
-                    'existing_in_target': len(existing_orders),
+                    'total_source_records': total_source_records,
+                    'new_orders': new_count,
+                    'existing_orders': existing_count,
+                    'existing_in_target': existing_in_target,
                     'updated_records': update_count,
                     'customer_breakdown': customer_stats,
                     'accuracy_percentage': round(accuracy, 2),
@@ -542,6 +459,118 @@ class EnhancedMergeOrchestrator:
                 'operation': 'detect_new_orders'
             }
     
+    def _classify_new_orders_server(self, cursor) -> Tuple[Dict[str, Dict[str, int]], int]:
+        """
+        Set-based NEW/EXISTING classification inside SQL Server
+        
+        Matches the pandas path exactly: AAG ORDER NUMBERs are compared binary (case- and
+        trailing-space-sensitive, like Python set membership) and the customer key is
+        UPPER(name) with only NULL / '' mapped to UNKNOWN.
+        
+        Returns:
+            (customer_stats {CUSTOMER: {'new': n, 'existing': n}}, distinct AAG ORDER NUMBERs in target)
+        """
+        cursor.execute(f"""
+        SELECT COUNT(DISTINCT [AAG ORDER NUMBER])
+        FROM {self.config.target_table}
+        WHERE [AAG ORDER NUMBER] IS NOT NULL
+        """)
+        existing_in_target = cursor.fetchone()[0]
+        
+        # OUTPUT ... INTO (not a bare OUTPUT) so the UPDATE also works when the source table has triggers.
+        # Keys carry a '|' sentinel: SQL Server ignores trailing spaces in = / GROUP BY under every
+        # collation, BIN2 alone only makes the comparison case-sensitive.
+        cursor.execute("""
+        CREATE TABLE #new_order_classification (
+            [customer_key] NVARCHAR(256) COLLATE Latin1_General_BIN2 NOT NULL,
+            [sync_state] VARCHAR(10) NOT NULL
+        )
+        """)
+        cursor.execute(f"""
+        UPDATE s
+        SET s.sync_state = CASE WHEN t.[order_key] IS NULL THEN 'NEW' ELSE 'EXISTING' END,
+            s.updated_at = GETUTCDATE()
+        OUTPUT CASE WHEN inserted.[CUSTOMER NAME] IS NULL OR LEN(inserted.[CUSTOMER NAME] + N'|') = 1
+                    THEN N'UNKNOWN'
+                    ELSE UPPER(CAST(inserted.[CUSTOMER NAME] AS NVARCHAR(255)))
+               END + N'|',
+               inserted.sync_state
+        INTO #new_order_classification ([customer_key], [sync_state])
+        FROM {self.config.source_table} s
+        LEFT JOIN (
+            SELECT DISTINCT ([AAG ORDER NUMBER] + N'|') COLLATE Latin1_General_BIN2 AS [order_key]
+            FROM {self.config.target_table}
+            WHERE [AAG ORDER NUMBER] IS NOT NULL
+        ) t ON t.[order_key] = (s.[AAG ORDER NUMBER] + N'|') COLLATE Latin1_General_BIN2
+        WHERE s.[AAG ORDER NUMBER] IS NOT NULL
+        """)
+        cursor.execute("""
+        SELECT [customer_key],
+               SUM(CASE WHEN [sync_state] = 'NEW' THEN 1 ELSE 0 END) AS new_orders,
+               SUM(CASE WHEN [sync_state] = 'EXISTING' THEN 1 ELSE 0 END) AS existing_orders
+        FROM #new_order_classification
+        GROUP BY [customer_key]
+        """)
+        customer_stats = {
+            customer_key[:-1]: {'new': int(new_orders), 'existing': int(existing_orders)}
+            for customer_key, new_orders, existing_orders in cursor.fetchall()
+        }
+        cursor.execute("DROP TABLE #new_order_classification")
+        
+        return customer_stats, existing_in_target
+    
+    def _classify_new_orders_pandas(self, cursor) -> Tuple[Dict[str, Dict[str, int]], int]:
+        """
+        Vectorized NEW/EXISTING classification fallback (pandas isin, no per-row Python loop)
+        
+        Returns:
+            (customer_stats {CUSTOMER: {'new': n, 'existing': n}}, distinct AAG ORDER NUMBERs in target)
+        """
+        import json
+        import pandas as pd
+        
+        existing_orders = self.get_existing_aag_orders()
+        self.logger.info(f"Found {len(existing_orders)} existing orders in {self.config.target_table}")
+        
+        cursor.execute(f"""
+        SELECT record_uuid, [AAG ORDER NUMBER], [CUSTOMER NAME]
+        FROM {self.config.source_table}
+        WHERE [AAG ORDER NUMBER] IS NOT NULL
+        """)
+        source_df = pd.DataFrame.from_records(
+            [tuple(row) for row in cursor.fetchall()],
+            columns=['record_uuid', 'aag_order_number', 'customer_name']
+        )
+        self.logger.info(f"Found {len(source_df)} records in source table {self.config.source_table}")
+        
+        if source_df.empty:
+            return {}, len(existing_orders)
+        
+        is_new = ~source_df['aag_order_number'].isin(existing_orders)
+        customer_key = source_df['customer_name'].fillna('').astype(str).str.upper().replace('', 'UNKNOWN')
+        breakdown = pd.crosstab(customer_key, is_new)
+        customer_stats = {
+            customer: {
+                'new': int(breakdown.at[customer, True]) if True in breakdown.columns else 0,
+                'existing': int(breakdown.at[customer, False]) if False in breakdown.columns else 0
+            }
+            for customer in breakdown.index
+        }
+        
+        # One UPDATE per sync_state - UUID list travels as a single JSON parameter
+        update_query = f"""
+        UPDATE {self.config.source_table}
+        SET sync_state = ?, updated_at = GETUTCDATE()
+        WHERE record_uuid IN (SELECT TRY_CAST([value] AS UNIQUEIDENTIFIER) FROM OPENJSON(?))
+        """
+        for sync_state, mask in (('NEW', is_new), ('EXISTING', ~is_new)):
+            uuids = source_df.loc[mask, 'record_uuid'].astype(str).tolist()
+            if uuids:
+                cursor.execute(update_query, sync_state, json.dumps(uuids))
+                self.logger.info(f"   ✅ {sync_state}: Updated {len(uuids)} records")
+        
+        return customer_stats, len(existing_orders)
+    
     def get_existing_aag_orders(self) -> set:
         """
         Query existing AAG ORDER NUMBERs from target table
@@ -21,12 +21,13 @@ import asyncio
 import aiohttp
 import os
 import sys
+import threading
 from typing import Dict, List, Any, Optional, Union, Tuple
 from pathlib import Path
 from datetime import datetime
 
 # Modern Python package imports - ultra-minimal dependencies
-from src.pipelines.utils import logger, config, db
+from src.pipelines.utils import logger, config, db, monday_rate_limiter
 from src.pipelines.integrations.monday.graphql_loader import GraphQLLoader
 
 
@@ -80,6 +81,25 @@ class MondayAPIClient:
         self.subitem_board_id = delta_config.monday_subitems_board_id
         
         self.logger.info(f"Monday API Client initialized for {delta_config.environment} (items board: {self.board_id}, subitems board: {self.subitem_board_id})")
+        
+        # HTTP connection settings (monday.connection) - persistent session mode keeps
+        # one event loop + keep-alive connection pool alive for a whole sync run
+        connection_config = self.toml_config.get('monday', {}).get('connection', {})
+        self.persistent_session_enabled = connection_config.get('persistent_session', True)
+        self.pool_limit = connection_config.get('pool_limit', 10)
+        self.pool_limit_per_host = connection_config.get('pool_limit_per_host', 3)
+        self.keepalive_timeout = connection_config.get('keepalive_timeout', 30.0)
+        
+        # Event loop + aiohttp session are per thread (concurrent per-customer workers each
+        # open their own); connection stats are shared across all of them
+        self._thread_state = threading.local()
+        self._session_lock = threading.Lock()
+        self._open_sessions = 0
+        self._stats_lock = threading.Lock()
+        self.connection_stats = self._new_connection_stats()
+        
+        # Process-wide adaptive limiter (monday_boards.toml [rate_limits]) - replaces fixed sleeps
+        self.rate_limiter = monday_rate_limiter.get_shared_rate_limiter()
     
     def _load_toml_config(self) -> Dict[str, Any]:
         """Load and parse TOML configuration"""
@@ -94,6 +114,163 @@ class MondayAPIClient:
     def _get_environment(self) -> str:
         """Get current environment"""
         return self.environment
+    
+    # ------------------------------------------------------------------
+    # Persistent session mode (one event loop + keep-alive pool per run)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _new_connection_stats() -> Dict[str, Any]:
+        """Fresh connection reuse counters"""
+        return {
+            'mode': 'per_call',
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'sessions_created': 0,
+            'total_request_seconds': 0.0
+        }
+    
+    def _add_connection_stat(self, key: str, amount: Union[int, float] = 1) -> None:
+        """Thread-safe increment of a shared connection stats counter"""
+        with self._stats_lock:
+            self.connection_stats[key] += amount
+    
+    @property
+    def _loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Persistent event loop of the calling thread (None = per-call mode)"""
+        return getattr(self._thread_state, 'loop', None)
+    
+    @_loop.setter
+    def _loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        self._thread_state.loop = loop
+    
+    @property
+    def _session(self) -> Optional[aiohttp.ClientSession]:
+        """Pooled aiohttp session of the calling thread (bound to that thread's loop)"""
+        return getattr(self._thread_state, 'session', None)
+    
+    @_session.setter
+    def _session(self, session: Optional[aiohttp.ClientSession]) -> None:
+        self._thread_state.session = session
+    
+    @property
+    def session_open(self) -> bool:
+        """True while a persistent session (event loop + connection pool) is open in this thread"""
+        return self._loop is not None
+    
+    def open_session(self) -> None:
+        """
+        Open a long-lived event loop for all subsequent execute() calls in this thread.
+        
+        The aiohttp ClientSession/TCPConnector is created lazily on the first API call
+        (inside the loop) and reused until close_session() - so TLS handshakes, DNS
+        lookups and loop creation are paid once per sync run instead of once per batch.
+        """
+        if self._loop is not None:
+            return
+        
+        self._loop = asyncio.new_event_loop()
+        with self._session_lock:
+            if self._open_sessions == 0:
+                with self._stats_lock:
+                    self.connection_stats = self._new_connection_stats()
+                    self.connection_stats['mode'] = 'persistent'
+            self._open_sessions += 1
+        self.logger.info(f"🔌 Monday.com persistent session opened (pool limit: {self.pool_limit}, per host: {self.pool_limit_per_host})")
+    
+    def close_session(self) -> Dict[str, Any]:
+        """
+        Close the persistent session and event loop.
+        
+        Returns:
+            Connection reuse statistics for the session
+        """
+        if self._loop is None:
+            return self.get_connection_stats()
+        
+        try:
+            if self._session is not None and not self._session.closed:
+                self._loop.run_until_complete(self._session.close())
+                # Give SSL transports a moment to shut down cleanly
+                self._loop.run_until_complete(asyncio.sleep(0.25))
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        except Exception as e:
+            self.logger.warning(f"Error while closing Monday.com session: {e}")
+        finally:
+            self._loop.close()
+            self._loop = None
+            self._session = None
+            with self._session_lock:
+                self._open_sessions = max(0, self._open_sessions - 1)
+        
+        stats = self.get_connection_stats()
+        self.logger.info(f"🔌 Monday.com persistent session closed: {stats['requests']} requests, "
+                         f"{stats['connections_created']} connections created, "
+                         f"{stats['connections_reused']} reused ({stats['reuse_rate_percent']:.1f}%)")
+        return stats
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Connection reuse statistics (requests, connections created/reused, avg latency)"""
+        with self._stats_lock:
+            stats = dict(self.connection_stats)
+        requests = stats['requests']
+        stats['reuse_rate_percent'] = (stats['connections_reused'] / requests * 100) if requests else 0.0
+        stats['avg_request_seconds'] = (stats['total_request_seconds'] / requests) if requests else 0.0
+        return stats
+    
+    def __enter__(self) -> 'MondayAPIClient':
+        self.open_session()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close_session()
+    
+    def _run(self, coroutine):
+        """Run a coroutine on the persistent loop if open, otherwise on a fresh loop"""
+        if self._loop is not None:
+            return self._loop.run_until_complete(coroutine)
+        return asyncio.run(coroutine)
+    
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp trace hooks that count new vs reused connections"""
+        trace_config = aiohttp.TraceConfig()
+        
+        async def on_connection_create_end(session, trace_config_ctx, params):
+            self._add_connection_stat('connections_created')
+        
+        async def on_connection_reuseconn(session, trace_config_ctx, params):
+            self._add_connection_stat('connections_reused')
+        
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    def _create_client_session(self, keepalive: bool) -> aiohttp.ClientSession:
+        """Create an aiohttp session (must be called from inside a running loop)"""
+        timeout = aiohttp.ClientTimeout(total=25.0, connect=5.0)
+        if keepalive:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_limit,
+                limit_per_host=self.pool_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+        else:
+            connector = aiohttp.TCPConnector(limit=10, limit_per_host=3)
+        
+        self._add_connection_stat('sessions_created')
+        return aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector,
+            headers={"User-Agent": "DataOrchestration/1.0 Monday.com Sync"},
+            trace_configs=[self._build_trace_config()]
+        )
+    
+    def _get_persistent_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = self._create_client_session(keepalive=True)
+        return self._session
 
 # REMOVED DUPLICATE METHOD - Using the comprehensive version below that returns tuple (config, default)
     
@@ -245,28 +422,46 @@ class MondayAPIClient:
         if dry_run:
             return self._dry_run_response(operation_type, data_list)
         
-        # Dynamic execution strategy based on operation type
+        return self._run(self._dispatch(operation_type, data_list))
+    
+    async def execute_async(self, operation_type: str, data: Union[Dict, List[Dict]], dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Awaitable execute() for callers already running on the client's event loop
+        (see run_coroutine) - lets several operations be in flight at once
+        """
+        data_list = data if isinstance(data, list) else [data]
+        
+        if dry_run:
+            return self._dry_run_response(operation_type, data_list)
+        
+        return await self._dispatch(operation_type, data_list)
+    
+    def run_coroutine(self, coroutine):
+        """Run a coroutine on the persistent session loop (or a fresh loop if no session is open)"""
+        return self._run(coroutine)
+    
+    async def _dispatch(self, operation_type: str, data_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Dynamic execution strategy based on operation type"""
         if operation_type == 'batch_create_items':
             # Use GraphQL batch template for items
-            return asyncio.run(self._execute_batch(operation_type, data_list))
+            return await self._execute_batch(operation_type, data_list)
         elif operation_type == 'async_batch_create_items':
             # Use high-performance async batch execution for items
-            return asyncio.run(self._execute_async_batch(operation_type, data_list))
+            return await self._execute_async_batch(operation_type, data_list)
         elif operation_type == 'create_subitems' and len(data_list) > 1:
             # Default batch subitems for performance
-            return asyncio.run(self._execute_batch(operation_type, data_list))
+            return await self._execute_batch(operation_type, data_list)
         else:
             # Single item operations (default)
-            return asyncio.run(self._execute_all_single(operation_type, data_list))
+            return await self._execute_all_single(operation_type, data_list)
     
     async def _execute_all_single(self, operation_type: str, data_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute all records as single item operations with rate limiting and API logging aggregation"""
         results = []
         for record in data_list:
+            # Pacing is handled by the shared rate limiter in _post_graphql
             result = await self._execute_single(operation_type, record)
             results.append(result)
-            # Small delay to respect API rate limits
-            await asyncio.sleep(0.1)
         
         # Aggregate results
         total_processed = sum(r.get('records_processed', 0) for r in results)
@@ -422,8 +617,9 @@ class MondayAPIClient:
     
     async def _execute_async_batch(self, operation_type: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Execute large dataset with conservative async batch processing
-        Uses proven rate limiting patterns: 15→5→1 fallback, 100ms delays, 25s timeouts
+        Execute large dataset with async batch processing
+        Uses 15→5→1 fallback and 25s timeouts; request rate and concurrency come from the
+        shared adaptive rate limiter (Monday.com complexity budget)
         """
         # Get batch size from configuration
         initial_batch_size = self.toml_config.get('monday', {}).get('rate_limits', {}).get('item_batch_size', 5)
@@ -435,16 +631,14 @@ class MondayAPIClient:
         failed_records = 0
         all_monday_ids = []
         
-        # Ultra-conservative concurrency - max 3 concurrent batches for testing
-        semaphore = asyncio.Semaphore(3)
+        # Batches in flight track the limiter's adaptive concurrency (bounded so queued
+        # batches don't burn their 25s timeout waiting for a slot)
+        concurrency = self.rate_limiter.concurrency
+        semaphore = asyncio.Semaphore(concurrency)
         
         async def process_batch_with_backoff(batch_records, batch_index):
-            """Process batch with exponential backoff and rate limiting"""
+            """Process batch with fallback; pacing comes from the shared rate limiter"""
             async with semaphore:
-                # Rate limiting: 100ms delay between batches
-                if batch_index > 0:
-                    await asyncio.sleep(0.1)
-                
                 try:
                     # Execute with 25s timeout per batch
                     result = await asyncio.wait_for(
@@ -466,7 +660,6 @@ class MondayAPIClient:
                                     timeout=10.0
                                 )
                                 single_results.append(single_result)
-                                await asyncio.sleep(0.05)  # 50ms between single calls
                             except Exception as e:
                                 self.logger.error(f"Single record failed: {e}")
                                 single_results.append({'success': False, 'error': str(e), 'records_processed': 0})
@@ -493,7 +686,7 @@ class MondayAPIClient:
                     return {'success': False, 'error': str(e), 'records_processed': 0}
         
         # Execute batches with conservative rate limiting
-        self.logger.info(f"📊 Executing {len(batches)} batches with 3-concurrent limit and 100ms delays")
+        self.logger.info(f"📊 Executing {len(batches)} batches with {concurrency}-concurrent limit (adaptive rate limiter)")
         batch_tasks = [process_batch_with_backoff(batch, i) for i, batch in enumerate(batches)]
         batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
         
@@ -1144,91 +1337,15 @@ mutation BatchCreateItems({var_definitions_str}) {{{mutation_calls_str}
         request_timestamp = datetime.utcnow()
         
         try:
-            # Conservative timeout and connection settings
-            timeout = aiohttp.ClientTimeout(total=25.0, connect=5.0)
-            connector = aiohttp.TCPConnector(limit=10, limit_per_host=3)
-            
-            async with aiohttp.ClientSession(
-                timeout=timeout, 
-                connector=connector,
-                headers={"User-Agent": "DataOrchestration/1.0 Monday.com Sync"}
-            ) as session:
-                
-                # Rate limiting: Small delay before request
-                await asyncio.sleep(0.01)  # 10ms baseline delay
+            if self._loop is not None:
+                # Persistent mode: reuse pooled keep-alive connections
+                session = self._get_persistent_session()
+                return await self._post_graphql(session, payload, headers, request_timestamp)
+            
+            # Per-call mode: conservative short-lived session
+            async with self._create_client_session(keepalive=False) as session:
+                return await self._post_graphql(session, payload, headers, request_timestamp)
                 
-                variables_count = len(variables) if variables else 0
-                self.logger.debug(f"Making API call to Monday.com: {len(query)} chars, {variables_count} variables")
-                
-                async with session.post(self.api_url, json=payload, headers=headers) as response:
-                    # Capture response timestamp
-                    response_timestamp = datetime.utcnow()
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Check for GraphQL errors
-                        if 'errors' in data and data['errors']:
-                            error_details = data['errors']
-                            self.logger.error(f"Monday.com GraphQL errors: {error_details}")
-                            
-                            # Check for rate limit errors
-                            for error in error_details:
-                                if 'rate limit' in str(error).lower() or 'too many requests' in str(error).lower():
-                                    self.logger.warning("Rate limit detected - implementing exponential backoff")
-                                    await asyncio.sleep(1.0)  # Wait 1 second for rate limits
-                            
-                            # Return error with full API logging data
-                            return {
-                                'success': False, 
-                                'error': error_details,
-                                'api_request': payload,
-                                'api_response': data,
-                                'request_timestamp': request_timestamp,
-                                'response_timestamp': response_timestamp
-                            }
-                        
-                        # Successful response with full API logging data
-                        self.logger.debug(f"API call successful: {response.status}")
-                        return {
-                            'success': True, 
-                            'data': data.get('data', {}),
-                            'api_request': payload,
-                            'api_response': data,
-                            'request_timestamp': request_timestamp,
-                            'response_timestamp': response_timestamp
-                        }
-                    
-                    elif response.status == 429:  # Too Many Requests
-                        self.logger.warning(f"Rate limited by Monday.com (429) - backing off")
-                        await asyncio.sleep(2.0)  # Extended backoff for explicit rate limits
-                        
-                        # Return rate limit error with API logging data
-                        error_response = {"status": response.status, "message": "Rate limited"}
-                        return {
-                            'success': False, 
-                            'error': f"Rate limited: HTTP {response.status}",
-                            'api_request': payload,
-                            'api_response': error_response,
-                            'request_timestamp': request_timestamp,
-                            'response_timestamp': response_timestamp
-                        }
-                    
-                    else:
-                        error_text = await response.text()
-                        self.logger.error(f"Monday.com API error {response.status}: {error_text}")
-                        
-                        # Return HTTP error with API logging data
-                        error_response = {"status": response.status, "error": error_text}
-                        return {
-                            'success': False, 
-                            'error': f"HTTP {response.status}: {error_text}",
-                            'api_request': payload,
-                            'api_response': error_response,
-                            'request_timestamp': request_timestamp,
-                            'response_timestamp': response_timestamp
-                        }
-                        
         except asyncio.TimeoutError:
             self.logger.error("Monday.com API call timed out after 25s")
             
@@ -1275,6 +1392,86 @@ mutation BatchCreateItems({var_definitions_str}) {{{mutation_calls_str}
             }
             return {'success': False, 'error': f'Unexpected error: {str(e)}'}
     
+    async def _post_graphql(self, session: aiohttp.ClientSession, payload: Dict[str, Any],
+                            headers: Dict[str, str], request_timestamp: datetime) -> Dict[str, Any]:
+        """POST a GraphQL payload on the given session and normalise the response"""
+        request_start = datetime.utcnow()
+        self._add_connection_stat('requests')
+        try:
+            variables_count = len(payload.get('variables') or {})
+            self.logger.debug(f"Making API call to Monday.com: {len(payload['query'])} chars, {variables_count} variables")
+            
+            # Ask Monday.com for the complexity budget so the shared limiter can pace requests
+            request_payload = dict(payload, query=monday_rate_limiter.with_complexity(payload['query']))
+            
+            async with self.rate_limiter.slot(), session.post(self.api_url, json=request_payload, headers=headers) as response:
+                # Capture response timestamp
+                response_timestamp = datetime.utcnow()
+                
+                if response.status == 200:
+                    data = await response.json()
+                    # Feeds budget/concurrency back to the limiter; rate limit errors pause
+                    # all callers until Monday.com's reset instead of a fixed sleep
+                    self.rate_limiter.observe(data, status=response.status, headers=response.headers)
+                    
+                    # Check for GraphQL errors
+                    if 'errors' in data and data['errors']:
+                        error_details = data['errors']
+                        self.logger.error(f"Monday.com GraphQL errors: {error_details}")
+                        
+                        # Return error with full API logging data
+                        return {
+                            'success': False, 
+                            'error': error_details,
+                            'api_request': payload,
+                            'api_response': data,
+                            'request_timestamp': request_timestamp,
+                            'response_timestamp': response_timestamp
+                        }
+                    
+                    # Successful response with full API logging data
+                    self.logger.debug(f"API call successful: {response.status}")
+                    return {
+                        'success': True, 
+                        'data': data.get('data', {}),
+                        'api_request': payload,
+                        'api_response': data,
+                        'request_timestamp': request_timestamp,
+                        'response_timestamp': response_timestamp
+                    }
+                
+                elif response.status == 429:  # Too Many Requests
+                    self.logger.warning(f"Rate limited by Monday.com (429) - backing off")
+                    self.rate_limiter.observe(None, status=response.status, headers=response.headers)
+                    
+                    # Return rate limit error with API logging data
+                    error_response = {"status": response.status, "message": "Rate limited"}
+                    return {
+                        'success': False, 
+                        'error': f"Rate limited: HTTP {response.status}",
+                        'api_request': payload,
+                        'api_response': error_response,
+                        'request_timestamp': request_timestamp,
+                        'response_timestamp': response_timestamp
+                    }
+                
+                else:
+                    error_text = await response.text()
+                    self.logger.error(f"Monday.com API error {response.status}: {error_text}")
+                    
+                    # Return HTTP error with API logging data
+                    error_response = {"status": response.status, "error": error_text}
+                    return {
+                        'success': False, 
+                        'error': f"HTTP {response.status}: {error_text}",
+                        'api_request': payload,
+                        'api_response': error_response,
+                        'request_timestamp': request_timestamp,
+                        'response_timestamp': response_timestamp
+                    }
+        finally:
+            self._add_connection_stat('total_request_seconds', (datetime.utcnow() - request_start).total_seconds())
+    
     def _extract_monday_id(self, data: Dict[str, Any], operation_type: str) -> Optional[Union[int, str]]:
         """
         Extract Monday.com ID from API response
@@ -21,6 +21,8 @@ import sys
 import tomli
 import time
 import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -31,6 +33,46 @@ from .monday_api_client import MondayAPIClient
 from .api_logging_archiver import APILoggingArchiver
 
 
+# Base retry backoff (seconds) per APILoggingArchiver.extract_error_category - doubled per retry_count
+DEFAULT_RETRY_DELAY_SECONDS = {
+    'RATE_LIMIT': 60.0,
+    'UNKNOWN_ERROR': 2.0,
+    'PAYLOAD_PARSE_ERROR': 2.0,
+    'RESOURCE_NOT_FOUND': 300.0,
+    'DROPDOWN_VALIDATION': 900.0,
+    'DROPDOWN_VALUE_MISSING': 900.0,
+    'AUTH_ERROR': 1800.0
+}
+
+
+class StatementCache:
+    """
+    Parameterized SQL text per statement name (+ table/shape key), built once per engine
+    
+    Hot-path statements keep identical text across calls so SQL Server reuses one cached
+    plan per statement (and pyodbc skips re-preparing on a reused cursor), instead of
+    compiling a new ad-hoc plan for every record_uuid / monday_item_id literal.
+    """
+    
+    def __init__(self):
+        self._statements: Dict[Tuple, str] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Tuple, build) -> str:
+        """Return cached SQL for key, building it with build() on first use"""
+        sql = self._statements.get(key)
+        if sql is None:
+            sql = self._statements[key] = build()
+            self.misses += 1
+        else:
+            self.hits += 1
+        return sql
+    
+    def get_stats(self) -> Dict[str, int]:
+        return {'statements': len(self._statements), 'hits': self.hits, 'misses': self.misses}
+
+
 class SyncEngine:
     """
     Ultra-lightweight sync engine for ORDER_LIST → Monday.com pipeline
@@ -83,6 +125,9 @@ class SyncEngine:
         # Database connection key
         self.db_key = self.config.db_key
         
+        # Parameterized hot-path SQL (stable text → plan cache reuse)
+        self.sql_cache = StatementCache()
+        
         # Sync configuration
         sync_config = self.toml_config.get('monday', {}).get('sync', {})
         self.sync_config = sync_config  # Store for later use
@@ -487,6 +532,9 @@ class SyncEngine:
         enhanced_results['sync_folder'] = str(sync_folder)
         enhanced_results['sync_timestamp'] = datetime.now().strftime("%Y%m%d_%H%M%S")
         
+        # One event loop + keep-alive connection pool for the whole run
+        monday_session_opened = self._open_monday_session(dry_run)
+        
         try:
             # Step 1: Handle retry processing if requested (Fix #3: Retry Functionality)
             milestone_time = performance_start_time
@@ -583,28 +631,11 @@ class SyncEngine:
             # Create true batches across multiple record_uuids  
             true_batches = self._create_true_batch_groups(all_pending_headers, self.batch_size)
             
-            total_synced = 0
-            all_results = []
-            
-            # Process each true batch (multiple record_uuids per API call)
-            for batch_index, batch_records in enumerate(true_batches, 1):
-                try:
-                    # Process this true batch atomically (groups already pre-created)
-                    batch_result = self._process_true_batch(batch_records, batch_index, dry_run, 
-                                                          createitem_mode=createitem_mode, skip_subitems=skip_subitems)
-                    all_results.append(batch_result)
-                    
-                    if batch_result.get('success', False):
-                        total_synced += batch_result.get('records_processed', 0)
-                        
-                except Exception as e:
-                    self.logger.error(f"Failed to process batch {batch_index}: {e}")
-                    all_results.append({
-                        'success': False,
-                        'batch_number': batch_index,
-                        'error': str(e),
-                        'records_processed': 0
-                    })
+            # Process true batches (multiple record_uuids per API call) - pipelined when
+            # max_concurrent_batches > 1, sequential otherwise
+            all_results = self._execute_true_batches(true_batches, dry_run, createitem_mode=createitem_mode,
+                                                     skip_subitems=skip_subitems)
+            total_synced = sum(r.get('records_processed', 0) for r in all_results if r.get('success', False))
             
             milestone_time = log_performance_milestone("Monday.com Sync Operations", milestone_time)
             
@@ -724,6 +755,31 @@ class SyncEngine:
                 self._persist_executive_summary(enhanced_results, self.sync_session_dir, sync_id)
             
             return enhanced_results
+        
+        finally:
+            if monday_session_opened:
+                enhanced_results['monday_connection_stats'] = self._close_monday_session()
+    
+    def _open_monday_session(self, dry_run: bool) -> bool:
+        """
+        Open the Monday.com client's persistent session for a sync run
+        
+        Returns:
+            True if a session was opened by this call (caller must close it)
+        """
+        if dry_run or not self.monday_client.persistent_session_enabled or self.monday_client.session_open:
+            return False
+        
+        self.monday_client.open_session()
+        return True
+    
+    def _close_monday_session(self) -> Dict[str, Any]:
+        """Close the persistent Monday.com session and return its connection reuse stats"""
+        stats = self.monday_client.close_session()
+        self.logger.info(f"🔌 Monday.com connections: {stats['requests']} requests, "
+                         f"{stats['connections_reused']} reused, {stats['connections_created']} created, "
+                         f"avg {stats['avg_request_seconds']:.3f}s/request")
+        return stats
     
     def _group_by_customer_and_uuid(self, headers: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
         """
@@ -789,11 +845,12 @@ class SyncEngine:
     
     def run_sync_per_customer_sequential(self, dry_run: bool = False, limit: Optional[int] = None, action_types: List[str] = None, 
                                        createitem_mode: str = 'batch', skip_subitems: bool = False, customer_name: Optional[str] = None,
-                                       retry_errors: bool = False, generate_report: bool = False) -> Dict[str, Any]:
+                                       retry_errors: bool = False, generate_report: bool = False,
+                                       customer_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         EXPERIMENTAL: Per-Customer Sequential Sync Processing
         
-        This method processes customers one at a time with isolated group creation:
+        This method processes customers with isolated group creation:
         1. Loop through each customer individually
         2. Create groups for THIS customer only  
         3. Process THIS customer's batches
@@ -806,8 +863,13 @@ class SyncEngine:
         - Better debugging and error tracking
         - Can skip problematic customers
         
+        With customer_workers > 1 (default: monday.rate_limits.max_concurrent_customers), K customers
+        run at once on worker threads - small customers no longer queue behind large ones. Each worker
+        has its own Monday.com session and DB connections; all share the global Monday.com rate limiter.
+        
         Args:
             Same as run_sync() but with per-customer isolation
+            customer_workers: Customers processed concurrently (1 = strictly one after another)
             
         Returns:
             Enhanced results with per-customer breakdown
@@ -815,8 +877,12 @@ class SyncEngine:
         # Default to INSERT operations for backwards compatibility
         if action_types is None:
             action_types = ['INSERT']
+        
+        if customer_workers is None:
+            customer_workers = self.config.max_concurrent_customers
+        customer_workers = max(1, int(customer_workers or 1))
             
-        self.logger.info(f"🚀 EXPERIMENTAL: Per-Customer Sequential Sync Processing")
+        self.logger.info(f"🚀 EXPERIMENTAL: Per-Customer {'Concurrent' if customer_workers > 1 else 'Sequential'} Sync Processing")
         self.logger.info(f"   Dry run: {dry_run}, Limit: {limit}, Customer: {customer_name or 'ALL'}")
         self.logger.info(f"   Action types: {action_types}, Mode: {createitem_mode}, Skip subitems: {skip_subitems}")
         
@@ -841,9 +907,12 @@ class SyncEngine:
             'total_synced': 0,
             'execution_time_seconds': 0,
             'per_customer_results': {},  # NEW: Track each customer individually
-            'processing_mode': 'PER_CUSTOMER_SEQUENTIAL'
+            'processing_mode': 'PER_CUSTOMER_CONCURRENT' if customer_workers > 1 else 'PER_CUSTOMER_SEQUENTIAL',
+            'customer_workers': customer_workers
         }
         
+        monday_session_opened = self._open_monday_session(dry_run)
+        
         try:
             # Step 1: Determine customers to process
             if customer_name:
@@ -863,170 +932,45 @@ class SyncEngine:
                 })
                 return enhanced_results
             
-            # Step 2: Process each customer sequentially with isolation
+            # Step 2: Process customers with isolation - one at a time, or K at once (max_concurrent_customers)
+            customer_kwargs = {
+                'limit': limit,
+                'action_types': action_types,
+                'createitem_mode': createitem_mode,
+                'skip_subitems': skip_subitems,
+                'generate_report': generate_report,
+                'sync_id': sync_id,
+                'sync_folder': sync_folder
+            }
+            
+            if customer_workers > 1:
+                self.logger.info(f"🧵 Concurrent customer workers: {customer_workers} (shared Monday.com rate limiter)")
+                with ThreadPoolExecutor(max_workers=customer_workers, thread_name_prefix="sync-customer") as workers:
+                    futures = {
+                        current_customer: workers.submit(self._sync_customer_worker, current_customer, dry_run, **customer_kwargs)
+                        for current_customer in customers_to_process
+                    }
+                    customer_results_by_name = {name: future.result() for name, future in futures.items()}
+            else:
+                customer_results_by_name = {
+                    current_customer: self._sync_customer_isolated(current_customer, dry_run, **customer_kwargs)
+                    for current_customer in customers_to_process
+                }
+            
+            # Merge per-customer results (customer order, regardless of completion order)
             total_synced_all_customers = 0
             successful_customers = 0
             failed_customers = 0
             
             for current_customer in customers_to_process:
-                customer_start_time = datetime.now()
-                self.logger.info(f"🔄 [{current_customer}] Starting isolated customer processing...")
-                
-                try:
-                    # Phase 1: Get this customer's headers
-                    customer_headers = self._get_pending_headers(limit, action_types, current_customer)
-                    
-                    if not customer_headers:
-                        self.logger.info(f"📝 [{current_customer}] No pending headers found, skipping")
-                        enhanced_results['per_customer_results'][current_customer] = {
-                            'success': True,
-                            'status': 'NO_RECORDS',
-                            'records_synced': 0,
-                            'execution_time': 0,
-                            'message': 'No pending headers'
-                        }
-                        continue
-                    
-                    self.logger.info(f"📊 [{current_customer}] Found {len(customer_headers)} pending headers")
-                    
-                    # Phase 2: Create groups for THIS customer only (ISOLATION)
-                    self.logger.info(f"🏗️ [{current_customer}] Creating groups (isolated from other customers)")
-                    customer_groups_result = self._create_customer_groups(customer_headers, current_customer, dry_run)
-                    
-                    if not customer_groups_result.get('success', False):
-                        self.logger.error(f"❌ [{current_customer}] Group creation failed: {customer_groups_result.get('error')}")
-                        enhanced_results['per_customer_results'][current_customer] = {
-                            'success': False,
-                            'status': 'GROUP_CREATION_FAILED',
-                            'error': customer_groups_result.get('error'),
-                            'records_synced': 0,
-                            'execution_time': (datetime.now() - customer_start_time).total_seconds()
-                        }
-                        failed_customers += 1
-                        continue  # Skip to next customer (ISOLATION)
-                    
-                    groups_created = customer_groups_result.get('groups_created', 0)
-                    created_group_ids = customer_groups_result.get('created_group_ids', [])
-                    self.logger.info(f"✅ [{current_customer}] Created {groups_created} groups successfully: {created_group_ids}")
-                    
-                    # Phase 3: Process THIS customer's batches
-                    customer_batches = self._create_true_batch_groups(customer_headers, self.batch_size)
-                    self.logger.info(f"🚀 [{current_customer}] Processing {len(customer_batches)} batches")
-                    
-                    customer_results = []
-                    customer_synced = 0
-                    
-                    for batch_index, batch_records in enumerate(customer_batches, 1):
-                        try:
-                            # Groups already created, so skip group creation in batch processing
-                            batch_result = self._process_true_batch(batch_records, batch_index, dry_run,
-                                                                  createitem_mode=createitem_mode, skip_subitems=skip_subitems)
-                            customer_results.append(batch_result)
-                            
-                            if batch_result.get('success', False):
-                                customer_synced += batch_result.get('records_processed', 0)
-                                
-                        except Exception as batch_error:
-                            self.logger.error(f"❌ [{current_customer}] Batch {batch_index} failed: {batch_error}")
-                            customer_results.append({
-                                'success': False,
-                                'batch_number': batch_index,
-                                'error': str(batch_error),
-                                'records_processed': 0
-                            })
-                    
-                    # Phase 4: Calculate customer results with TASK030 success thresholds
-                    customer_execution_time = (datetime.now() - customer_start_time).total_seconds()
-                    customer_successful_batches = len([r for r in customer_results if r.get('success', False)])
-                    
-                    # TASK030: Fix broken success logic - use success rate thresholds
-                    total_batches = len(customer_results)
-                    if total_batches > 0:
-                        batch_success_rate = customer_successful_batches / total_batches
-                        
-                        # Get success thresholds from TOML config (with defaults)
-                        success_threshold = self.toml_config.get('monday', {}).get('sync', {}).get('success_thresholds', {}).get('success_rate', 0.95)
-                        partial_threshold = self.toml_config.get('monday', {}).get('sync', {}).get('success_thresholds', {}).get('partial_rate', 0.80)
-                        
-                        # Determine customer success based on thresholds
-                        if batch_success_rate >= success_threshold:
-                            customer_success = True
-                            customer_status = 'SUCCESS'
-                            customer_status_emoji = '✅'
-                        elif batch_success_rate >= partial_threshold:
-                            customer_success = False  # Changed: Partial is not full success
-                            customer_status = 'PARTIAL'
-                            customer_status_emoji = '⚠️'
-                        else:
-                            customer_success = False
-                            customer_status = 'FAILED'
-                            customer_status_emoji = '❌'
-                            
-                        self.logger.info(f"🎯 [{current_customer}] Batch Success Rate: {batch_success_rate:.1%} ({customer_successful_batches}/{total_batches}) = {customer_status_emoji} {customer_status}")
-                    else:
-                        # No batches processed
-                        batch_success_rate = 0.0
-                        customer_success = False
-                        customer_status = 'FAILED'
-                        customer_status_emoji = '❌'
-                    
-                    # Store per-customer results with TASK030 enhanced status
-                    enhanced_results['per_customer_results'][current_customer] = {
-                        'success': customer_success,
-                        'status': customer_status,
-                        'status_emoji': customer_status_emoji,
-                        'batch_success_rate': batch_success_rate,
-                        'records_synced': customer_synced,
-                        'execution_time': customer_execution_time,
-                        'batches_processed': len(customer_results),
-                        'successful_batches': customer_successful_batches,
-                        'groups_created': groups_created,
-                        'created_group_ids': created_group_ids,
-                        'group_creation_result': customer_groups_result,
-                        'batch_results': customer_results
-                    }
-                    
-                    # Phase 5: Generate report for THIS customer immediately
-                    if generate_report:
-                        try:
-                            customer_report = self.generate_customer_processing_report(current_customer, {
-                                'customer_summary': self._generate_customer_summary_data(customer_headers, customer_results, current_customer),
-                                'sync_id': sync_id,
-                                'sync_folder': sync_folder,
-                                'success': customer_success,  # TASK030: Fixed sync status reporting
-                                'status': customer_status,  # TASK030: Enhanced status with PARTIAL/FAILED/SUCCESS
-                                'status_emoji': customer_status_emoji,  # TASK030: Status emoji
-                                'batch_success_rate': batch_success_rate,  # TASK030: Actual success percentage  
-                                'successful_batches': customer_successful_batches,
-                                'total_batches': len(customer_results),
-                                'execution_time_seconds': customer_execution_time
-                            })
-                            enhanced_results['per_customer_results'][current_customer]['report_generated'] = True
-                            enhanced_results['per_customer_results'][current_customer]['report_path'] = customer_report
-                            self.logger.info(f"📊 [{current_customer}] Report generated: {customer_report}")
-                        except Exception as report_error:
-                            self.logger.error(f"❌ [{current_customer}] Report generation failed: {report_error}")
-                            enhanced_results['per_customer_results'][current_customer]['report_error'] = str(report_error)
-                    
-                    # Update totals
-                    total_synced_all_customers += customer_synced
-                    if customer_success:
-                        successful_customers += 1
-                        self.logger.info(f"✅ [{current_customer}] Completed successfully: {customer_synced} records in {customer_execution_time:.2f}s")
-                    else:
-                        failed_customers += 1
-                        self.logger.error(f"❌ [{current_customer}] Failed processing")
-                    
-                except Exception as customer_error:
-                    customer_execution_time = (datetime.now() - customer_start_time).total_seconds()
-                    self.logger.exception(f"❌ [{current_customer}] Unexpected error: {customer_error}")
-                    enhanced_results['per_customer_results'][current_customer] = {
-                        'success': False,
-                        'status': 'EXCEPTION',
-                        'error': str(customer_error),
-                        'records_synced': 0,
-                        'execution_time': customer_execution_time
-                    }
+                customer_result = customer_results_by_name[current_customer]
+                enhanced_results['per_customer_results'][current_customer] = customer_result
+                if customer_result.get('status') == 'NO_RECORDS':
+                    continue
+                total_synced_all_customers += customer_result.get('records_synced', 0)
+                if customer_result.get('success', False):
+                    successful_customers += 1
+                else:
                     failed_customers += 1
             
             # Step 3: Calculate final results
@@ -1065,6 +1009,304 @@ class SyncEngine:
             })
             
             return enhanced_results
+        
+        finally:
+            if monday_session_opened:
+                enhanced_results['monday_connection_stats'] = self._close_monday_session()
+    
+    def _sync_customer_isolated(self, current_customer: str, dry_run: bool, limit: Optional[int], action_types: List[str],
+                                createitem_mode: str, skip_subitems: bool, generate_report: bool,
+                                sync_id: str, sync_folder: Path) -> Dict[str, Any]:
+        """
+        Sync ONE customer with isolated group creation and reporting
+        
+        Used by run_sync_per_customer_sequential for both sequential and concurrent mode.
+        Failures are contained: every outcome is returned as the customer's per_customer_results entry.
+        """
+        customer_start_time = datetime.now()
+        self.logger.info(f"🔄 [{current_customer}] Starting isolated customer processing...")
+        
+        try:
+            # Phase 1: Get this customer's headers
+            customer_headers = self._get_pending_headers(limit, action_types, current_customer)
+            
+            if not customer_headers:
+                self.logger.info(f"📝 [{current_customer}] No pending headers found, skipping")
+                return {
+                    'success': True,
+                    'status': 'NO_RECORDS',
+                    'records_synced': 0,
+                    'execution_time': 0,
+                    'message': 'No pending headers'
+                }
+            
+            self.logger.info(f"📊 [{current_customer}] Found {len(customer_headers)} pending headers")
+            
+            # Phase 2: Create groups for THIS customer only (ISOLATION)
+            self.logger.info(f"🏗️ [{current_customer}] Creating groups (isolated from other customers)")
+            customer_groups_result = self._create_customer_groups(customer_headers, current_customer, dry_run)
+            
+            if not customer_groups_result.get('success', False):
+                self.logger.error(f"❌ [{current_customer}] Group creation failed: {customer_groups_result.get('error')}")
+                return {
+                    'success': False,
+                    'status': 'GROUP_CREATION_FAILED',
+                    'error': customer_groups_result.get('error'),
+                    'records_synced': 0,
+                    'execution_time': (datetime.now() - customer_start_time).total_seconds()
+                }  # Skip this customer (ISOLATION)
+            
+            groups_created = customer_groups_result.get('groups_created', 0)
+            created_group_ids = customer_groups_result.get('created_group_ids', [])
+            self.logger.info(f"✅ [{current_customer}] Created {groups_created} groups successfully: {created_group_ids}")
+            
+            # Phase 3: Process THIS customer's batches
+            customer_batches = self._create_true_batch_groups(customer_headers, self.batch_size)
+            self.logger.info(f"🚀 [{current_customer}] Processing {len(customer_batches)} batches")
+            
+            # Groups already created, so skip group creation in batch processing
+            customer_results = self._execute_true_batches(customer_batches, dry_run, createitem_mode=createitem_mode,
+                                                          skip_subitems=skip_subitems, log_prefix=f"[{current_customer}] ")
+            customer_synced = sum(r.get('records_processed', 0) for r in customer_results if r.get('success', False))
+            
+            # Phase 4: Calculate customer results with TASK030 success thresholds
+            customer_execution_time = (datetime.now() - customer_start_time).total_seconds()
+            customer_successful_batches = len([r for r in customer_results if r.get('success', False)])
+            
+            # TASK030: Fix broken success logic - use success rate thresholds
+            total_batches = len(customer_results)
+            if total_batches > 0:
+                batch_success_rate = customer_successful_batches / total_batches
+                
+                # Get success thresholds from TOML config (with defaults)
+                success_threshold = self.toml_config.get('monday', {}).get('sync', {}).get('success_thresholds', {}).get('success_rate', 0.95)
+                partial_threshold = self.toml_config.get('monday', {}).get('sync', {}).get('success_thresholds', {}).get('partial_rate', 0.80)
+                
+                # Determine customer success based on thresholds
+                if batch_success_rate >= success_threshold:
+                    customer_success = True
+                    customer_status = 'SUCCESS'
+                    customer_status_emoji = '✅'
+                elif batch_success_rate >= partial_threshold:
+                    customer_success = False  # Changed: Partial is not full success
+                    customer_status = 'PARTIAL'
+                    customer_status_emoji = '⚠️'
+                else:
+                    customer_success = False
+                    customer_status = 'FAILED'
+                    customer_status_emoji = '❌'
+                
+                self.logger.info(f"🎯 [{current_customer}] Batch Success Rate: {batch_success_rate:.1%} ({customer_successful_batches}/{total_batches}) = {customer_status_emoji} {customer_status}")
+            else:
+                # No batches processed
+                batch_success_rate = 0.0
+                customer_success = False
+                customer_status = 'FAILED'
+                customer_status_emoji = '❌'
+            
+            # Store per-customer results with TASK030 enhanced status
+            customer_result = {
+                'success': customer_success,
+                'status': customer_status,
+                'status_emoji': customer_status_emoji,
+                'batch_success_rate': batch_success_rate,
+                'records_synced': customer_synced,
+                'execution_time': customer_execution_time,
+                'batches_processed': len(customer_results),
+                'successful_batches': customer_successful_batches,
+                'groups_created': groups_created,
+                'created_group_ids': created_group_ids,
+                'group_creation_result': customer_groups_result,
+                'batch_results': customer_results
+            }
+            
+            # Phase 5: Generate report for THIS customer immediately
+            if generate_report:
+                try:
+                    customer_report = self.generate_customer_processing_report(current_customer, {
+                        'customer_summary': self._generate_customer_summary_data(customer_headers, customer_results, current_customer),
+                        'sync_id': sync_id,
+                        'sync_folder': sync_folder,
+                        'success': customer_success,  # TASK030: Fixed sync status reporting
+                        'status': customer_status,  # TASK030: Enhanced status with PARTIAL/FAILED/SUCCESS
+                        'status_emoji': customer_status_emoji,  # TASK030: Status emoji
+                        'batch_success_rate': batch_success_rate,  # TASK030: Actual success percentage  
+                        'successful_batches': customer_successful_batches,
+                        'total_batches': len(customer_results),
+                        'execution_time_seconds': customer_execution_time
+                    })
+                    customer_result['report_generated'] = True
+                    customer_result['report_path'] = customer_report
+                    self.logger.info(f"📊 [{current_customer}] Report generated: {customer_report}")
+                except Exception as report_error:
+                    self.logger.error(f"❌ [{current_customer}] Report generation failed: {report_error}")
+                    customer_result['report_error'] = str(report_error)
+            
+            if customer_success:
+                self.logger.info(f"✅ [{current_customer}] Completed successfully: {customer_synced} records in {customer_execution_time:.2f}s")
+            else:
+                self.logger.error(f"❌ [{current_customer}] Failed processing")
+            
+            return customer_result
+        
+        except Exception as customer_error:
+            customer_execution_time = (datetime.now() - customer_start_time).total_seconds()
+            self.logger.exception(f"❌ [{current_customer}] Unexpected error: {customer_error}")
+            return {
+                'success': False,
+                'status': 'EXCEPTION',
+                'error': str(customer_error),
+                'records_synced': 0,
+                'execution_time': customer_execution_time
+            }
+    
+    def _sync_customer_worker(self, current_customer: str, dry_run: bool, **customer_kwargs) -> Dict[str, Any]:
+        """
+        Concurrent per-customer worker: runs _sync_customer_isolated on a worker thread
+        
+        Each worker opens its own Monday.com session (event loop + keep-alive pool) and takes
+        its own pooled DB connections; all workers share the process-wide Monday.com rate limiter.
+        """
+        session_opened = self._open_monday_session(dry_run)
+        try:
+            return self._sync_customer_isolated(current_customer, dry_run, **customer_kwargs)
+        finally:
+            if session_opened:
+                self.monday_client.close_session()
+    
+    def _execute_true_batches(self, true_batches: List[List[Dict]], dry_run: bool, createitem_mode: str = 'batch',
+                              skip_subitems: bool = False, log_prefix: str = "") -> List[Dict[str, Any]]:
+        """
+        Execute true batches either sequentially or through the pipelined executor.
+        
+        Pipelining is used when monday.rate_limits.max_concurrent_batches > 1 (live runs only):
+        up to N Monday.com batch calls are kept in flight while earlier batches write their
+        results to SQL Server.
+        
+        Returns:
+            Batch results in batch order (one dict per batch, same shape as _process_true_batch)
+        """
+        concurrency = max(1, int(self.config.max_concurrent_batches or 1))
+        
+        if dry_run or concurrency == 1 or len(true_batches) <= 1:
+            return self._execute_true_batches_sequential(true_batches, dry_run, createitem_mode, skip_subitems, log_prefix)
+        
+        self.logger.info(f"{log_prefix}🚀 PIPELINED EXECUTION: {len(true_batches)} batches, {concurrency} in flight, "
+                         f"{self.config.max_pending_writes} pending writes max")
+        return self.monday_client.run_coroutine(
+            self._execute_true_batches_pipelined(true_batches, createitem_mode, concurrency, self.config.max_pending_writes, log_prefix)
+        )
+    
+    def _execute_true_batches_sequential(self, true_batches: List[List[Dict]], dry_run: bool, createitem_mode: str,
+                                         skip_subitems: bool, log_prefix: str = "") -> List[Dict[str, Any]]:
+        """Process true batches one at a time (API call → DB update → commit → next batch)"""
+        all_results = []
+        
+        for batch_index, batch_records in enumerate(true_batches, 1):
+            try:
+                # Process this true batch atomically (groups already pre-created)
+                batch_result = self._process_true_batch(batch_records, batch_index, dry_run, 
+                                                      createitem_mode=createitem_mode, skip_subitems=skip_subitems)
+                all_results.append(batch_result)
+                
+            except Exception as e:
+                self.logger.error(f"{log_prefix}Failed to process batch {batch_index}: {e}")
+                all_results.append({
+                    'success': False,
+                    'batch_number': batch_index,
+                    'error': str(e),
+                    'records_processed': 0
+                })
+        
+        return all_results
+    
+    async def _execute_true_batches_pipelined(self, true_batches: List[List[Dict]], createitem_mode: str,
+                                              concurrency: int, max_pending_writes: int, log_prefix: str = "") -> List[Dict[str, Any]]:
+        """
+        Pipelined executor: Monday.com calls run concurrently, DB write-backs run on one writer thread.
+        
+        - At most `concurrency` API calls are in flight at once
+        - Back-pressure: at most `concurrency + max_pending_writes` batches are dispatched but not yet written
+        - Write-backs are applied strictly in batch order, so per-customer ordering holds
+        - Each batch commits (or fails) on its own, exactly like _process_true_batch
+        """
+        loop = asyncio.get_running_loop()
+        api_slots = asyncio.Semaphore(concurrency)
+        pipeline_slots = asyncio.Semaphore(concurrency + max(0, max_pending_writes))
+        api_done = [loop.create_future() for _ in true_batches]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(true_batches)
+        api_operation = self._get_item_api_operation(createitem_mode)
+        
+        async def call_api(batch_index: int, batch_records: List[Dict]) -> None:
+            async with api_slots:
+                batch_start_time = datetime.now()
+                try:
+                    self.logger.info(f"{log_prefix}📤 API REQUEST - Batch #{batch_index + 1}: Sending {len(batch_records)} records to Monday.com")
+                    api_result = await self.monday_client.execute_async(api_operation, batch_records)
+                    error = None
+                except Exception as e:
+                    api_result, error = None, e
+            api_duration = (datetime.now() - batch_start_time).total_seconds()
+            api_done[batch_index].set_result((api_result, error, api_duration, batch_start_time))
+        
+        async def dispatch() -> None:
+            tasks = []
+            for batch_index, batch_records in enumerate(true_batches):
+                await pipeline_slots.acquire()
+                tasks.append(asyncio.create_task(call_api(batch_index, batch_records)))
+            await asyncio.gather(*tasks)
+        
+        async def write_in_order(writer: ThreadPoolExecutor) -> None:
+            for batch_index, batch_records in enumerate(true_batches):
+                api_result, error, api_duration, batch_start_time = await api_done[batch_index]
+                batch_number = batch_index + 1
+                try:
+                    if error is not None:
+                        results[batch_index] = await loop.run_in_executor(
+                            writer, self._fail_true_batch, batch_records, batch_number, error, batch_start_time, False)
+                    else:
+                        self.logger.info(f"{log_prefix}📥 API RESPONSE - Batch #{batch_number}: Received in {api_duration:.3f}s")
+                        results[batch_index] = await loop.run_in_executor(
+                            writer, self._write_true_batch_result, batch_records, batch_number,
+                            api_result, api_duration, createitem_mode, batch_start_time)
+                except Exception as e:
+                    self.logger.error(f"{log_prefix}Failed to process batch {batch_number}: {e}")
+                    results[batch_index] = {
+                        'success': False,
+                        'batch_number': batch_number,
+                        'error': str(e),
+                        'records_processed': 0
+                    }
+                finally:
+                    pipeline_slots.release()
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sync-db-writer") as writer:
+            await asyncio.gather(dispatch(), write_in_order(writer))
+        
+        return results
+    
+    def _get_item_api_operation(self, createitem_mode: str) -> str:
+        """Map createitem_mode to the Monday.com API operation"""
+        return {
+            'batch': 'batch_create_items',
+            'asyncBatch': 'async_batch_create_items',
+            'single': 'create_items'
+        }.get(createitem_mode, 'batch_create_items')
+    
+    def _index_batch_by_record_uuid(self, batch_records: List[Dict]) -> Tuple[List[str], Dict[str, List[Dict]]]:
+        """Extract ordered unique record_uuids and the records belonging to each"""
+        record_uuids = []
+        uuid_to_records = {}
+        
+        for record in batch_records:
+            record_uuid = record.get('record_uuid')
+            if record_uuid and record_uuid not in uuid_to_records:
+                record_uuids.append(record_uuid)
+                uuid_to_records[record_uuid] = []
+            if record_uuid:
+                uuid_to_records[record_uuid].append(record)
+        
+        return record_uuids, uuid_to_records
     
     def _process_true_batch(self, batch_records: List[Dict], batch_number: int, dry_run: bool, 
                            createitem_mode: str = 'batch', skip_subitems: bool = False) -> Dict[str, Any]:
@@ -1087,20 +1329,11 @@ class SyncEngine:
         Returns:
             Dictionary with batch processing results
         """
+        batch_start_time = datetime.now()
+        
         try:
-            batch_start_time = datetime.now()
-            
             # Extract record_uuids from batch
-            record_uuids = []
-            uuid_to_records = {}
-            
-            for record in batch_records:
-                record_uuid = record.get('record_uuid')
-                if record_uuid and record_uuid not in uuid_to_records:
-                    record_uuids.append(record_uuid)
-                    uuid_to_records[record_uuid] = []
-                if record_uuid:
-                    uuid_to_records[record_uuid].append(record)
+            record_uuids, uuid_to_records = self._index_batch_by_record_uuid(batch_records)
                     
             self.logger.info(f"🚀 BATCH #{batch_number}: Processing {len(batch_records)} records across {len(record_uuids)} record_uuids")
             
@@ -1117,25 +1350,34 @@ class SyncEngine:
                     'batch_duration': batch_duration
                 }
             
+            # Step 1: Send batch API call to Monday.com
+            api_start_time = datetime.now()
+            self.logger.info(f"📤 API REQUEST - Batch #{batch_number}: Sending {len(batch_records)} records to Monday.com")
+            
+            api_result = self.monday_client.execute(self._get_item_api_operation(createitem_mode), batch_records, dry_run=False)
+            
+            api_duration = (datetime.now() - api_start_time).total_seconds()
+            self.logger.info(f"📥 API RESPONSE - Batch #{batch_number}: Received in {api_duration:.3f}s")
+            
+        except Exception as e:
+            return self._fail_true_batch(batch_records, batch_number, e, batch_start_time, dry_run)
+        
+        return self._write_true_batch_result(batch_records, batch_number, api_result, api_duration, createitem_mode, batch_start_time)
+    
+    def _write_true_batch_result(self, batch_records: List[Dict], batch_number: int, api_result: Dict[str, Any],
+                                 api_duration: float, createitem_mode: str, batch_start_time: datetime) -> Dict[str, Any]:
+        """
+        Write a true batch's Monday.com API result back to the database (one connection, one commit)
+        
+        Failed API results mark the batch records FAILED; successful results map
+        record_uuids → monday_item_ids and commit the batch as a unit.
+        """
+        record_uuids, uuid_to_records = self._index_batch_by_record_uuid(batch_records)
+        
+        try:
             # Get database connection for batch
             with db.get_connection(self.config.db_key) as connection:
                 try:
-                    # Step 1: Send batch API call to Monday.com
-                    api_start_time = datetime.now()
-                    self.logger.info(f"📤 API REQUEST - Batch #{batch_number}: Sending {len(batch_records)} records to Monday.com")
-                    
-                    # Map createitem_mode to correct API operation
-                    api_operation = {
-                        'batch': 'batch_create_items',
-                        'asyncBatch': 'async_batch_create_items',
-                        'single': 'create_items'
-                    }.get(createitem_mode, 'batch_create_items')
-                    
-                    api_result = self.monday_client.execute(api_operation, batch_records, dry_run=False)
-                    
-                    api_duration = (datetime.now() - api_start_time).total_seconds()
-                    self.logger.info(f"📥 API RESPONSE - Batch #{batch_number}: Received in {api_duration:.3f}s")
-                    
                     if not api_result.get('success', False):
                         # TASK030 Phase 3.3: Extract error message from API response
                         error_message = self._extract_api_error_message(api_result)
@@ -1151,9 +1393,9 @@ class SyncEngine:
                     if len(monday_item_ids) != len(record_uuids):
                         raise Exception(f"Monday.com response mismatch: {len(record_uuids)} record_uuids but {len(monday_item_ids)} item_ids")
                     
-                    # Step 3: Map record_uuids to monday_item_ids and update database
+                    # Step 3: Map record_uuids to monday_item_ids and update database (one set-based UPDATE)
                     update_start_time = datetime.now()
-                    updated_records = 0
+                    item_id_rows = []
                     
                     for i, record_uuid in enumerate(record_uuids):
                         monday_item_id = monday_item_ids[i]
@@ -1164,14 +1406,13 @@ class SyncEngine:
                             uuid_to_records[record_uuid], 
                             api_result.get('api_response', {})
                         )
-                        
-                        # Update database with monday_item_id
-                        self._update_headers_delta_with_item_ids_conn(record_uuid, [str(monday_item_id)], connection, api_logging_data)
-                        updated_records += 1
+                        item_id_rows.append((record_uuid, monday_item_id, api_logging_data))
                         
                         # Log the mapping
                         self.logger.info(f"🔗 MAPPING - Batch #{batch_number}: {record_uuid} → monday_item_id: {monday_item_id}")
                     
+                    updated_records = self._bulk_update_headers_with_item_ids_conn(item_id_rows, connection)
+                    
                     # Commit all database updates for this batch
                     connection.commit()
                     
@@ -1201,35 +1442,40 @@ class SyncEngine:
                     raise
                     
         except Exception as e:
-            batch_duration = (datetime.now() - batch_start_time).total_seconds()
-            self.logger.error(f"❌ BATCH #{batch_number} FAILED: {e} (duration: {batch_duration:.3f}s)")
-            
-            # TASK030 Phase 3.2: Update batch records to FAILED state for general exceptions
-            if not dry_run:
-                try:
-                    # Extract record_uuids from batch_records
-                    record_uuids = []
-                    for record in batch_records:
-                        if 'record_uuid' in record:
-                            record_uuids.append(record['record_uuid'])
-                    
-                    if record_uuids:
-                        error_message = f"Batch processing failed: {str(e)}"
-                        api_result = {'error': str(e), 'type': 'batch_exception'}
-                        self._update_batch_records_to_failed(record_uuids, error_message, api_result)
-                except Exception as cleanup_error:
-                    self.logger.error(f"Failed to update records to FAILED state during exception cleanup: {cleanup_error}")
-            
-            return {
-                'success': False,
-                'batch_number': batch_number,
-                'records_processed': 0,
-                'error': str(e),
-                'batch_duration': batch_duration,
-                'dry_run': dry_run
-            }
+            return self._fail_true_batch(batch_records, batch_number, e, batch_start_time, False)
+    
+    def _fail_true_batch(self, batch_records: List[Dict], batch_number: int, error: Exception,
+                         batch_start_time: datetime, dry_run: bool) -> Dict[str, Any]:
+        """Mark a failed true batch's records as FAILED and build its failure result"""
+        batch_duration = (datetime.now() - batch_start_time).total_seconds()
+        self.logger.error(f"❌ BATCH #{batch_number} FAILED: {error} (duration: {batch_duration:.3f}s)")
+        
+        # TASK030 Phase 3.2: Update batch records to FAILED state for general exceptions
+        if not dry_run:
+            try:
+                # Extract record_uuids from batch_records
+                record_uuids = []
+                for record in batch_records:
+                    if 'record_uuid' in record:
+                        record_uuids.append(record['record_uuid'])
+                
+                if record_uuids:
+                    error_message = f"Batch processing failed: {str(error)}"
+                    api_result = {'error': str(error), 'type': 'batch_exception'}
+                    self._update_batch_records_to_failed(record_uuids, error_message, api_result)
+            except Exception as cleanup_error:
+                self.logger.error(f"Failed to update records to FAILED state during exception cleanup: {cleanup_error}")
+        
+        return {
+            'success': False,
+            'batch_number': batch_number,
+            'records_processed': 0,
+            'error': str(error),
+            'batch_duration': batch_duration,
+            'dry_run': dry_run
+        }
 
-    def _process_record_uuid_batch(self, record_uuid: str, headers: List[Dict[str, Any]], dry_run: bool, 
+    def _process_record_uuid_batch(self, record_uuid: str, headers: List[Dict[str, Any]], dry_run: bool,
                                    skip_group_creation: bool = False, createitem_mode: str = 'single', skip_subitems: bool = False) -> Dict[str, Any]:
         """
         Process a single record_uuid batch atomically with SINGLE DATABASE CONNECTION:
@@ -1389,7 +1635,7 @@ class SyncEngine:
                 try:
                     # Update record with API logging data but keep sync_state as PENDING
                     connection = db.get_connection(self.db_key)
-                    update_query = f"""
+                    update_query = self.sql_cache.get(('headers_api_logging', self.headers_table), lambda: f"""
                     UPDATE [{self.headers_table}]
                     SET [api_request_payload] = ?,
                         [api_response_payload] = ?,
@@ -1397,8 +1643,8 @@ class SyncEngine:
                         [api_response_timestamp] = ?,
                         [api_operation_type] = ?,
                         [api_status] = ?
-                    WHERE [record_uuid] = '{record_uuid}'
-                    """
+                    WHERE [record_uuid] = ?
+                    """)
                     
                     cursor = connection.cursor()
                     cursor.execute(update_query, 
@@ -1407,7 +1653,8 @@ class SyncEngine:
                         api_logging_data.get('api_request_timestamp'),
                         api_logging_data.get('api_response_timestamp'),
                         api_logging_data.get('api_operation_type'),
-                        api_logging_data.get('api_status')
+                        api_logging_data.get('api_status'),
+                        record_uuid
                     )
                     connection.commit()
                     connection.close()
@@ -1764,16 +2011,16 @@ class SyncEngine:
             with db.get_connection(self.db_key) as connection:
                 cursor = connection.cursor()
                 
-                for group_name, group_id in group_name_to_id.items():
-                    update_query = f"""
+                update_query = self.sql_cache.get(('headers_group_id', self.headers_table), lambda: f"""
                     UPDATE [{self.headers_table}]
-                    SET [group_id] = '{group_id}',
+                    SET [group_id] = ?,
                         [updated_at] = GETUTCDATE()
-                    WHERE [group_name] = '{group_name}' 
+                    WHERE [group_name] = ? 
                       AND ([group_id] IS NULL OR [group_id] = '')
-                    """
-                    
-                    cursor.execute(update_query)
+                    """)
+                
+                for group_name, group_id in group_name_to_id.items():
+                    cursor.execute(update_query, group_id, group_name)
                     rows_updated = cursor.rowcount
                     
                     self.logger.info(f"✅ Updated {rows_updated} records with group_id '{group_id}' for group '{group_name}'")
@@ -2015,16 +2262,16 @@ class SyncEngine:
     def _get_lines_by_record_uuid_conn(self, record_uuid: str, connection) -> List[Dict[str, Any]]:
         """Get lines from ORDER_LIST_LINES (main table - DELTA-FREE) for specific record_uuid - CONNECTION PASSING"""
         try:
-            lines_query = f"""
+            lines_query = self.sql_cache.get(('lines_by_record_uuid', self.lines_table), lambda: f"""
             SELECT {', '.join(self._get_lines_columns())}
             FROM [{self.lines_table}]
-            WHERE [record_uuid] = '{record_uuid}'
+            WHERE [record_uuid] = ?
             AND [sync_state] = 'PENDING'
             ORDER BY [size_code]
-            """
+            """)
             
             cursor = connection.cursor()
-            cursor.execute(lines_query)
+            cursor.execute(lines_query, record_uuid)
             
             columns = [column[0] for column in cursor.description]
             records = [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -2071,9 +2318,9 @@ class SyncEngine:
             
             # 🎯 NEW: Build UPDATE query with API logging columns
             if api_logging_data:
-                update_query = f"""
+                update_query = self.sql_cache.get(('headers_item_id_with_logging', self.headers_table), lambda: f"""
                 UPDATE [{self.headers_table}]
-                SET [monday_item_id] = {monday_item_id_int},
+                SET [monday_item_id] = ?,
                     [sync_state] = 'SYNCED',
                     [sync_completed_at] = GETUTCDATE(),
                     [api_request_payload] = ?,
@@ -2082,32 +2329,34 @@ class SyncEngine:
                     [api_response_timestamp] = ?,
                     [api_operation_type] = ?,
                     [api_status] = ?
-                WHERE [record_uuid] = '{record_uuid}'
-                """
+                WHERE [record_uuid] = ?
+                """)
                 
                 cursor = connection.cursor()
                 cursor.execute(update_query, 
+                    monday_item_id_int,
                     api_logging_data.get('api_request_payload'),
                     api_logging_data.get('api_response_payload'),
                     api_logging_data.get('api_request_timestamp'),
                     api_logging_data.get('api_response_timestamp'),
                     api_logging_data.get('api_operation_type'),
-                    api_logging_data.get('api_status')
+                    api_logging_data.get('api_status'),
+                    record_uuid
                 )
                 
                 self.logger.info(f"Updated headers with Monday ID {monday_item_id} and API logging data (operation: {api_logging_data.get('api_operation_type')})")
             else:
                 # Fallback: Original query without API logging
-                update_query = f"""
+                update_query = self.sql_cache.get(('headers_item_id', self.headers_table), lambda: f"""
                 UPDATE [{self.headers_table}]
-                SET [monday_item_id] = {monday_item_id_int},
+                SET [monday_item_id] = ?,
                     [sync_state] = 'SYNCED',
                     [sync_completed_at] = GETUTCDATE()
-                WHERE [record_uuid] = '{record_uuid}'
-                """
+                WHERE [record_uuid] = ?
+                """)
                 
                 cursor = connection.cursor()
-                cursor.execute(update_query)
+                cursor.execute(update_query, monday_item_id_int, record_uuid)
                 
                 self.logger.info(f"Updated headers with Monday ID {monday_item_id} (no API logging data)")
             
@@ -2120,18 +2369,108 @@ class SyncEngine:
             self.logger.exception(f"Failed to update headers with item IDs: {e}")
             raise
 
+    def _bulk_update_headers_with_item_ids_conn(self, item_id_rows: List[Tuple[str, Any, Optional[Dict[str, Any]]]], connection) -> int:
+        """
+        Set-based FACT_ORDER_LIST write-back of Monday.com item IDs - CONNECTION PASSING
+        
+        Loads (record_uuid, monday_item_id, api_* columns) into a session temp table with
+        fast_executemany and applies them with a single UPDATE...FROM join, replacing one
+        UPDATE round trip per record_uuid.
+        
+        Args:
+            item_id_rows: (record_uuid, monday_item_id, api_logging_data) tuples
+            connection: Open connection - caller handles commit/rollback
+            
+        Returns:
+            Number of header rows updated
+        """
+        if not item_id_rows:
+            return 0
+        
+        rows = []
+        for record_uuid, monday_item_id, api_logging_data in item_id_rows:
+            has_api_logging = 1 if api_logging_data else 0
+            api_logging_data = api_logging_data or {}
+            rows.append((
+                str(record_uuid),
+                int(monday_item_id),
+                has_api_logging,
+                api_logging_data.get('api_request_payload'),
+                api_logging_data.get('api_response_payload'),
+                api_logging_data.get('api_request_timestamp'),
+                api_logging_data.get('api_response_timestamp'),
+                api_logging_data.get('api_operation_type'),
+                api_logging_data.get('api_status')
+            ))
+        
+        try:
+            cursor = connection.cursor()
+            cursor.execute("""
+            IF OBJECT_ID('tempdb..#monday_item_id_writeback') IS NOT NULL DROP TABLE #monday_item_id_writeback;
+            CREATE TABLE #monday_item_id_writeback (
+                [record_uuid] NVARCHAR(36) NOT NULL PRIMARY KEY,
+                [monday_item_id] BIGINT NOT NULL,
+                [has_api_logging] BIT NOT NULL,
+                [api_request_payload] NVARCHAR(MAX) NULL,
+                [api_response_payload] NVARCHAR(MAX) NULL,
+                [api_request_timestamp] DATETIME2 NULL,
+                [api_response_timestamp] DATETIME2 NULL,
+                [api_operation_type] NVARCHAR(50) NULL,
+                [api_status] NVARCHAR(20) NULL
+            )
+            """)
+            
+            cursor.fast_executemany = True
+            cursor.executemany("""
+            INSERT INTO #monday_item_id_writeback
+                ([record_uuid], [monday_item_id], [has_api_logging], [api_request_payload], [api_response_payload],
+                 [api_request_timestamp], [api_response_timestamp], [api_operation_type], [api_status])
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            cursor.fast_executemany = False
+            
+            # Like the per-row update: API logging columns are assigned as captured (NULLs included)
+            # when logging data was passed, and left untouched when it was not
+            cursor.execute(f"""
+            UPDATE h
+            SET h.[monday_item_id] = t.[monday_item_id],
+                h.[sync_state] = 'SYNCED',
+                h.[sync_completed_at] = GETUTCDATE(),
+                h.[api_request_payload] = CASE WHEN t.[has_api_logging] = 1 THEN t.[api_request_payload] ELSE h.[api_request_payload] END,
+                h.[api_response_payload] = CASE WHEN t.[has_api_logging] = 1 THEN t.[api_response_payload] ELSE h.[api_response_payload] END,
+                h.[api_request_timestamp] = CASE WHEN t.[has_api_logging] = 1 THEN t.[api_request_timestamp] ELSE h.[api_request_timestamp] END,
+                h.[api_response_timestamp] = CASE WHEN t.[has_api_logging] = 1 THEN t.[api_response_timestamp] ELSE h.[api_response_timestamp] END,
+                h.[api_operation_type] = CASE WHEN t.[has_api_logging] = 1 THEN t.[api_operation_type] ELSE h.[api_operation_type] END,
+                h.[api_status] = CASE WHEN t.[has_api_logging] = 1 THEN t.[api_status] ELSE h.[api_status] END
+            FROM [{self.headers_table}] h
+            INNER JOIN #monday_item_id_writeback t ON h.[record_uuid] = t.[record_uuid]
+            """)
+            rows_updated = cursor.rowcount
+            
+            cursor.execute("DROP TABLE #monday_item_id_writeback")
+            # Don't commit here - let caller handle transaction
+            
+            if rows_updated != len(rows):
+                self.logger.warning(f"Bulk write-back updated {rows_updated} headers for {len(rows)} record_uuids")
+            self.logger.info(f"Updated {rows_updated} headers in main table (DELTA-FREE) with Monday item IDs (set-based)")
+            return rows_updated
+            
+        except Exception as e:
+            self.logger.exception(f"Failed to bulk update headers with item IDs: {e}")
+            raise
+
     def _update_sync_status_only_conn(self, record_uuid: str, connection) -> None:
         """Update sync status only for UPDATE operations (don't change monday_item_id)"""
         try:
-            update_query = f"""
+            update_query = self.sql_cache.get(('headers_sync_status', self.headers_table), lambda: f"""
             UPDATE [{self.headers_table}]
             SET [sync_state] = 'SYNCED',
                 [sync_completed_at] = GETUTCDATE()
-            WHERE [record_uuid] = '{record_uuid}'
-            """
+            WHERE [record_uuid] = ?
+            """)
             
             cursor = connection.cursor()
-            cursor.execute(update_query)
+            cursor.execute(update_query, record_uuid)
             # Don't commit here - let caller handle transaction
             
             rows_updated = cursor.rowcount
@@ -2157,62 +2496,66 @@ class SyncEngine:
                 self.logger.warning(f"No lines found for record_uuid: {record_uuid}")
                 return
             
-            # Build batch UPDATE query using CASE statements (ELIMINATES NESTING)
-            case_statements = []
-            where_conditions = []
-            api_columns = ""
-            api_values = ""
-            
-            # Handle API logging data if provided
-            if api_logging_data:
-                api_columns = """,
-                [api_operation_type] = ?,
-                [api_request_payload] = ?,
-                [api_response_payload] = ?,
-                [api_request_timestamp] = ?,
-                [api_response_timestamp] = ?,
-                [api_status] = ?"""
+            # Build line_uuid → subitem_id mapping (sent as one JSON parameter - ELIMINATES NESTING)
+            subitem_mapping = []
             
             for i, line in enumerate(lines):
                 if i < len(subitem_ids):
-                    lines_uuid = line.get('line_uuid')
-                    subitem_id = subitem_ids[i]
-                    
-                    case_statements.append(f"WHEN '{lines_uuid}' THEN '{subitem_id}'")
-                    where_conditions.append(f"'{lines_uuid}'")
+                    subitem_mapping.append({
+                        'line_uuid': str(line.get('line_uuid')),
+                        'monday_subitem_id': int(subitem_ids[i])
+                    })
             
-            if not case_statements:
+            if not subitem_mapping:
                 self.logger.warning(f"No valid line updates to process for record_uuid: {record_uuid}")
                 return
             
-            # Single batch UPDATE query (NO NESTED CONNECTIONS)
-            batch_update_query = f"""
-            UPDATE [{self.lines_table}]
-            SET [monday_subitem_id] = CASE [line_uuid]
-                    {' '.join(case_statements)}
-                    ELSE [monday_subitem_id] 
-                END,
-                [sync_state] = 'SYNCED',
-                [sync_completed_at] = GETUTCDATE(){api_columns}
-            WHERE [line_uuid] IN ({', '.join(where_conditions)})
+            # Single batch UPDATE query (NO NESTED CONNECTIONS) - stable text for any number of lines
+            def build_lines_update(with_api_columns: bool) -> str:
+                api_columns = ""
+                if with_api_columns:
+                    api_columns = """,
+                l.[api_operation_type] = ?,
+                l.[api_request_payload] = ?,
+                l.[api_response_payload] = ?,
+                l.[api_request_timestamp] = ?,
+                l.[api_response_timestamp] = ?,
+                l.[api_status] = ?"""
+                return f"""
+            UPDATE l
+            SET l.[monday_subitem_id] = m.[monday_subitem_id],
+                l.[sync_state] = 'SYNCED',
+                l.[sync_completed_at] = GETUTCDATE(){api_columns}
+            FROM [{self.lines_table}] l
+            INNER JOIN OPENJSON(?) WITH (
+                [line_uuid] UNIQUEIDENTIFIER '$.line_uuid',
+                [monday_subitem_id] BIGINT '$.monday_subitem_id'
+            ) m ON l.[line_uuid] = m.[line_uuid]
             """
             
+            with_api_columns = bool(api_logging_data)
+            batch_update_query = self.sql_cache.get(
+                ('lines_subitem_ids', self.lines_table, with_api_columns),
+                lambda: build_lines_update(with_api_columns)
+            )
+            query_params = []
+            if api_logging_data:
+                query_params.extend([
+                    api_logging_data.get('api_operation_type'),
+                    api_logging_data.get('api_request_payload'),
+                    api_logging_data.get('api_response_payload'),
+                    api_logging_data.get('api_request_timestamp'),
+                    api_logging_data.get('api_response_timestamp'),
+                    api_logging_data.get('api_status')
+                ])
+            query_params.append(json.dumps(subitem_mapping))
+            
             # Use provided connection or create new one (CONNECTION PASSING PATTERN)
             if connection:
                 cursor = connection.cursor()
                 
                 # Execute with API logging parameters if provided
-                if api_logging_data:
-                    cursor.execute(batch_update_query, 
-                        api_logging_data.get('api_operation_type'),
-                        api_logging_data.get('api_request_payload'),
-                        api_logging_data.get('api_response_payload'),
-                        api_logging_data.get('api_request_timestamp'),
-                        api_logging_data.get('api_response_timestamp'),
-                        api_logging_data.get('api_status')
-                    )
-                else:
-                    cursor.execute(batch_update_query)
+                cursor.execute(batch_update_query, *query_params)
                     
                 # Don't commit here - let caller handle transaction
                 rows_updated = cursor.rowcount
@@ -2223,17 +2566,7 @@ class SyncEngine:
                     cursor = standalone_connection.cursor()
                     
                     # Execute with API logging parameters if provided
-                    if api_logging_data:
-                        cursor.execute(batch_update_query, 
-                            api_logging_data.get('api_operation_type'),
-                            api_logging_data.get('api_request_payload'),
-                            api_logging_data.get('api_response_payload'),
-                            api_logging_data.get('api_request_timestamp'),
-                            api_logging_data.get('api_response_timestamp'),
-                            api_logging_data.get('api_status')
-                        )
-                    else:
-                        cursor.execute(batch_update_query)
+                    cursor.execute(batch_update_query, *query_params)
                         
                     standalone_connection.commit()
                     
@@ -2455,14 +2788,30 @@ class SyncEngine:
         
         return [f"[{col}]" for col in sorted(lines_columns)]
     
+    def _get_retry_delay_seconds(self, error_category: Optional[str], retry_count: int) -> int:
+        """
+        Backoff before an ERROR record is due for retry (sync.retry_schedule in TOML)
+        
+        Base delay per APILoggingArchiver error category, doubled per previous retry, capped.
+        """
+        retry_schedule = self.toml_config.get('sync', {}).get('retry_schedule', {})
+        category_delays = {**DEFAULT_RETRY_DELAY_SECONDS, **retry_schedule.get('category_delay_seconds', {})}
+        base_delay = category_delays.get(error_category or 'UNKNOWN_ERROR',
+                                         retry_schedule.get('base_delay_seconds', DEFAULT_RETRY_DELAY_SECONDS['UNKNOWN_ERROR']))
+        max_delay = retry_schedule.get('max_delay_seconds', 3600.0)
+        return int(min(base_delay * (2 ** retry_count), max_delay))
+    
     def retry_failed_records(self, customer_name: Optional[str] = None, max_retries: int = 3, 
                            dry_run: bool = False) -> Dict[str, Any]:
         """
-        Retry ERROR records with exponential backoff (Fix #3: Retry Functionality).
+        Retry ERROR records on a persisted backoff schedule (Fix #3: Retry Functionality).
+        
+        Non-blocking retry scheduler - a retry pass never sleeps:
+        1. ERROR records without next_retry_at are scheduled: failure time + backoff by
+           error category (APILoggingArchiver.extract_error_category) and retry_count
+        2. Records whose next_retry_at has passed are reset to PENDING with one set-based UPDATE
+        3. Records not yet due are left for a later pass (records_deferred)
         
-        Implements intelligent retry for Monday.com sync failures:
-        - Exponential backoff for rate limits
-        - Error categorization for targeted retry strategies
         - Customer-specific retry processing
         - TASK027 Phase 1 compliant output organization with sync folder structure
         
@@ -2474,9 +2823,6 @@ class SyncEngine:
         Returns:
             Dict: Retry processing results and statistics with sync folder information
         """
-        import time
-        from datetime import datetime
-        
         self.logger.info(f"🔁 Starting retry processing (customer: {customer_name or 'ALL'})")
         
         start_time = datetime.now()
@@ -2488,7 +2834,10 @@ class SyncEngine:
         retry_stats = {
             'customer': customer_name or 'ALL',
             'records_identified': 0,
+            'records_scheduled': 0,
             'records_reset': 0,
+            'records_deferred': 0,
+            'error_categories': {},
             'errors': 0,
             'success': False,
             'sync_id': sync_id,
@@ -2496,74 +2845,97 @@ class SyncEngine:
             'execution_time_seconds': 0
         }
         
+        customer_filter = " AND [CUSTOMER NAME] = ?" if customer_name else ""
+        customer_params = [customer_name] if customer_name else []
+        
         try:
             with db.get_connection(self.db_key) as connection:
                 cursor = connection.cursor()
                 
                 # Query for retry candidates
-                base_query = """
+                base_query = f"""
                 SELECT 
                     record_uuid,
                     [CUSTOMER NAME] as customer_name,
                     [AAG ORDER NUMBER] as aag_order_number,
-                    api_status,
                     COALESCE(retry_count, 0) as retry_count,
-                    sync_error_message
-                FROM FACT_ORDER_LIST
+                    api_response_payload,
+                    next_retry_at
+                FROM [{self.headers_table}]
                 WHERE api_status = 'ERROR' 
-                AND COALESCE(retry_count, 0) < ?
+                AND COALESCE(retry_count, 0) < ?{customer_filter}
+                ORDER BY [CUSTOMER NAME], [AAG ORDER NUMBER]
                 """
                 
-                params = [max_retries]
-                
-                if customer_name:
-                    base_query += " AND [CUSTOMER NAME] = ?"
-                    params.append(customer_name)
-                
-                base_query += " ORDER BY [CUSTOMER NAME], [AAG ORDER NUMBER]"
-                
-                cursor.execute(base_query, params)
+                cursor.execute(base_query, [max_retries] + customer_params)
                 retry_candidates = cursor.fetchall()
                 
                 retry_stats['records_identified'] = len(retry_candidates)
                 self.logger.info(f"📋 Found {len(retry_candidates)} records for retry")
                 
+                # Step 1: Schedule newly failed records (backoff by error category, no sleeping)
+                archiver = APILoggingArchiver(self.config)
+                schedule = []
+                for record_uuid, customer, order, retry_count, response_payload, next_retry_at in retry_candidates:
+                    if next_retry_at is not None:
+                        continue
+                    error_category, _ = archiver.extract_error_category(response_payload)
+                    error_category = error_category or 'UNKNOWN_ERROR'
+                    retry_stats['error_categories'][error_category] = retry_stats['error_categories'].get(error_category, 0) + 1
+                    schedule.append({
+                        'record_uuid': str(record_uuid),
+                        'delay_seconds': self._get_retry_delay_seconds(error_category, retry_count)
+                    })
+                
                 if dry_run:
-                    self.logger.info("🔍 DRY RUN - Would reset the following records:")
+                    self.logger.info("🔍 DRY RUN - Would schedule/reset the following records:")
                     for record in retry_candidates[:5]:  # Show first 5
-                        uuid, customer, order, status, retry_count, error = record
-                        self.logger.info(f"   {customer} | {order} | Retry #{retry_count + 1}")
+                        uuid, customer, order, retry_count, _, next_retry_at = record
+                        self.logger.info(f"   {customer} | {order} | Retry #{retry_count + 1} | next retry: {next_retry_at or 'scheduling'}")
                     
+                    retry_stats['records_scheduled'] = len(schedule)
                     retry_stats['success'] = True
                     return retry_stats
                 
-                # Reset records for retry
-                for record in retry_candidates:
-                    record_uuid, customer, order, status, retry_count, error_msg = record
-                    
-                    # Calculate exponential backoff delay
-                    delay = min(2.0 * (2 ** retry_count), 60.0)
-                    time.sleep(delay)
-                    
-                    # Reset record for retry
-                    update_query = """
-                    UPDATE FACT_ORDER_LIST
-                    SET sync_state = 'PENDING',
-                        api_status = NULL,
-                        retry_count = COALESCE(retry_count, 0) + 1,
-                        sync_error_message = NULL,
-                        updated_at = GETUTCDATE()
-                    WHERE record_uuid = ?
+                if schedule:
+                    schedule_query = f"""
+                    UPDATE h
+                    SET h.[next_retry_at] = DATEADD(SECOND, s.[delay_seconds], COALESCE(h.[api_response_timestamp], GETUTCDATE()))
+                    FROM [{self.headers_table}] h
+                    INNER JOIN OPENJSON(?) WITH (
+                        [record_uuid] UNIQUEIDENTIFIER '$.record_uuid',
+                        [delay_seconds] INT '$.delay_seconds'
+                    ) s ON h.[record_uuid] = s.[record_uuid]
+                    WHERE h.[next_retry_at] IS NULL
                     """
-                    
-                    cursor.execute(update_query, (record_uuid,))
-                    retry_stats['records_reset'] += 1
-                    
-                    self.logger.info(f"🔄 Reset for retry: {customer} | {order} | Attempt #{retry_count + 1}")
+                    cursor.execute(schedule_query, json.dumps(schedule))
+                    retry_stats['records_scheduled'] = len(schedule)
+                    self.logger.info(f"🗓️ Scheduled {len(schedule)} records for retry: {retry_stats['error_categories']}")
+                
+                # Step 2: Reset every due record in one set-based UPDATE
+                reset_query = f"""
+                UPDATE [{self.headers_table}]
+                SET sync_state = 'PENDING',
+                    api_status = NULL,
+                    retry_count = COALESCE(retry_count, 0) + 1,
+                    sync_error_message = NULL,
+                    next_retry_at = NULL,
+                    updated_at = GETUTCDATE()
+                WHERE api_status = 'ERROR'
+                AND COALESCE(retry_count, 0) < ?
+                AND next_retry_at <= GETUTCDATE(){customer_filter}
+                """
+                
+                cursor.execute(reset_query, [max_retries] + customer_params)
+                retry_stats['records_reset'] = max(cursor.rowcount, 0)
+                retry_stats['records_deferred'] = retry_stats['records_identified'] - retry_stats['records_reset']
                 
                 connection.commit()
                 retry_stats['success'] = True
                 
+                self.logger.info(f"🔄 Reset {retry_stats['records_reset']} due records for retry, "
+                                 f"{retry_stats['records_deferred']} deferred to a later pass")
+                
                 execution_time = (datetime.now() - start_time).total_seconds()
                 retry_stats['execution_time_seconds'] = execution_time
                 self.logger.info(f"✅ Retry processing completed in {execution_time:.2f}s")
@@ -2585,6 +2957,7 @@ class SyncEngine:
                     'customer_scope': customer_name or 'ALL',
                     'records_processed': retry_stats['records_identified'],
                     'records_reset': retry_stats['records_reset'],
+                    'records_deferred': retry_stats['records_deferred'],
                     'success_rate': (retry_stats['records_reset'] / max(retry_stats['records_identified'], 1)) * 100,
                     'execution_time_seconds': retry_stats['execution_time_seconds'],
                     'status': 'SUCCESS' if retry_stats['success'] else 'ERROR'
@@ -2922,24 +3295,22 @@ class SyncEngine:
             connection = db.get_connection(self.db_key)
             cursor = connection.cursor()
             
-            # Build comma-separated list of UUIDs for IN clause
-            uuid_list = "', '".join(record_uuids)
-            
             # TASK030: Update sync_state to FAILED and add error message
-            update_query = f"""
+            # UUID list travels as one JSON parameter so the statement text is the same for any batch size
+            update_query = self.sql_cache.get(('headers_failed_batch', self.headers_table), lambda: f"""
             UPDATE [{self.headers_table}]
             SET [sync_state] = 'FAILED',
                 [api_error_message] = ?,
                 [api_response_payload] = ?,
                 [api_response_timestamp] = GETUTCDATE(),
                 [api_status] = 'ERROR'
-            WHERE [record_uuid] IN ('{uuid_list}')
-            """
+            WHERE [record_uuid] IN (SELECT TRY_CAST([value] AS UNIQUEIDENTIFIER) FROM OPENJSON(?))
+            """)
             
             # Prepare API response payload for logging
             api_response_payload = json.dumps(api_result, default=str, ensure_ascii=False)
             
-            cursor.execute(update_query, error_message, api_response_payload)
+            cursor.execute(update_query, error_message, api_response_payload, json.dumps([str(u) for u in record_uuids]))
             connection.commit()
             
             self.logger.error(f"🚨 TASK030: Updated {len(record_uuids)} records to FAILED state")
@@ -10,6 +10,7 @@ from . import db
 from . import logger  
 from . import config
 from . import monday_config
+from . import monday_rate_limiter
 
 # Export commonly used functions for convenient imports
 # Usage: from pipelines.utils import get_connection, get_logger, MondayConfig
@@ -17,8 +18,9 @@ try:
     from .db import get_connection, load_config
     from .logger import get_logger
     from .monday_config import MondayConfig, load_monday_config, get_board_settings
+    from .monday_rate_limiter import MondayRateLimiter, get_shared_rate_limiter
 except ImportError:
     # Graceful fallback if underlying utils aren't available
     pass
 
-__all__ = ['db', 'logger', 'config', 'monday_config', 'get_connection', 'get_logger', 'load_config', 'MondayConfig', 'load_monday_config', 'get_board_settings']
+__all__ = ['db', 'logger', 'config', 'monday_config', 'get_connection', 'get_logger', 'load_config', 'MondayConfig', 'load_monday_config', 'get_board_settings', 'monday_rate_limiter', 'MondayRateLimiter', 'get_shared_rate_limiter']
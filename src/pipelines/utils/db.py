@@ -12,6 +12,12 @@ if pipelines_utils_path.exists():
         # Re-export for new package structure
         get_connection = get_connection
         load_config = load_config
+        get_pool_stats = get_pool_stats
+        close_all_pools = close_all_pools
+        get_table_schema = get_table_schema
+        get_column_names = get_column_names
+        invalidate_schema = invalidate_schema
+        get_schema_cache_stats = get_schema_cache_stats
     except ImportError as e:
         print(f"Warning: Could not import from pipelines/utils/db_helper: {e}")
 
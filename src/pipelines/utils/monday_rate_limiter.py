@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Monday.com Adaptive Rate Limiter
+================================
+
+Token-bucket limiter shared by every Monday.com caller in a process (sync client,
+async batch updater, async board loader).
+
+Two buckets are tracked against the limits in monday_boards.toml [rate_limits]:
+- requests per minute
+- GraphQL complexity per minute (corrected from the ``complexity { after reset_in_x_seconds }``
+  field Monday.com returns, so the limiter spends the real remaining budget instead of a guess)
+
+Concurrency is adapted between [performance] min_concurrency / max_concurrency:
+additive increase after a run of clean responses, multiplicative decrease on rate limit
+errors (429, COMPLEXITY_BUDGET_EXHAUSTED, FIELD_MINUTE_RATE_LIMIT_EXCEEDED...). A rate limit
+error with ``retry_in_seconds`` / ``reset in N seconds`` pauses all callers until the reset.
+
+Usage:
+    from pipelines.utils.monday_rate_limiter import get_shared_rate_limiter, with_complexity
+
+    limiter = get_shared_rate_limiter()
+    async with limiter.slot():
+        async with session.post(url, json={'query': with_complexity(query)}) as response:
+            data = await response.json()
+            limiter.observe(data, status=response.status, headers=response.headers)
+"""
+
+import re
+import time
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, Mapping
+
+logger = logging.getLogger(__name__)
+
+COMPLEXITY_FIELD = "complexity { before after query reset_in_x_seconds }"
+
+RATE_LIMIT_ERROR_CODES = {
+    "ComplexityException",
+    "COMPLEXITY_BUDGET_EXHAUSTED",
+    "RATE_LIMIT_EXCEEDED",
+    "FIELD_MINUTE_RATE_LIMIT_EXCEEDED",
+    "DAILY_LIMIT_EXCEEDED",
+    "maxConcurrencyExceeded",
+}
+
+_RESET_IN_SECONDS = re.compile(r"reset in (\d+(?:\.\d+)?) seconds", re.IGNORECASE)
+_OPERATION_START = re.compile(r"^\s*(query|mutation)\b[^{]*\{", re.IGNORECASE)
+
+
+def with_complexity(query: str) -> str:
+    """Add the top-level complexity field to a GraphQL query/mutation (idempotent)"""
+    if "complexity" in query:
+        return query
+    match = _OPERATION_START.match(query)
+    if match:
+        insert_at = match.end()
+    else:
+        # Anonymous shorthand query: "{ boards { ... } }"
+        insert_at = query.find("{") + 1
+        if insert_at == 0:
+            return query
+    return f"{query[:insert_at]} {COMPLEXITY_FIELD} {query[insert_at:]}"
+
+
+class MondayRateLimiter:
+    """
+    Adaptive token-bucket limiter for the Monday.com API
+
+    Thread-safe: state is guarded by a threading lock and waiting is done with
+    asyncio.sleep, so one instance can be shared by coroutines running on different
+    event loops (e.g. per-customer worker threads).
+    """
+
+    def __init__(self, requests_per_minute: int = 500, complexity_per_minute: int = 1000000,
+                 min_concurrency: int = 1, max_concurrency: int = 20, initial_concurrency: int = 5,
+                 default_query_complexity: int = 5000, increase_after_successes: int = 10,
+                 decrease_factor: float = 0.5, complexity_reserve: float = 0.05,
+                 max_wait_seconds: float = 300.0):
+        self.requests_per_minute = requests_per_minute
+        self.complexity_per_minute = complexity_per_minute
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.increase_after_successes = max(1, increase_after_successes)
+        self.decrease_factor = decrease_factor
+        self.complexity_reserve = complexity_per_minute * complexity_reserve
+        self.max_wait_seconds = max_wait_seconds
+
+        self._lock = threading.Lock()
+        self._concurrency = min(max(initial_concurrency, self.min_concurrency), self.max_concurrency)
+        self._in_flight = 0
+        self._request_tokens = float(requests_per_minute)
+        self._complexity_tokens = float(complexity_per_minute)
+        self._complexity_reset_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._last_refill = time.monotonic()
+        self._estimated_complexity = float(default_query_complexity)
+        self._success_streak = 0
+
+        self.stats = {
+            'requests': 0,
+            'rate_limit_hits': 0,
+            'wait_seconds': 0.0,
+            'concurrency_increases': 0,
+            'concurrency_decreases': 0,
+            'complexity_observations': 0,
+        }
+
+    @classmethod
+    def from_config(cls, monday_config) -> "MondayRateLimiter":
+        """Build a limiter from a MondayConfig ([rate_limits], [rate_limits.adaptive], [performance])"""
+        rate_limits = monday_config.config.get('rate_limits', {})
+        adaptive = rate_limits.get('adaptive', {})
+        perf = monday_config.config.get('performance', {})
+        return cls(
+            requests_per_minute=rate_limits.get('requests_per_minute', 500),
+            complexity_per_minute=rate_limits.get('complexity_per_minute', 1000000),
+            min_concurrency=perf.get('min_concurrency', 1),
+            max_concurrency=perf.get('max_concurrency', 20),
+            initial_concurrency=adaptive.get('initial_concurrency', perf.get('optimal_concurrency_updates', 5)),
+            default_query_complexity=adaptive.get('default_query_complexity', 5000),
+            increase_after_successes=adaptive.get('increase_after_successes', 10),
+            decrease_factor=adaptive.get('decrease_factor', 0.5),
+            complexity_reserve=adaptive.get('complexity_reserve', 0.05),
+            max_wait_seconds=monday_config.config.get('retry', {}).get('max_retry_in_seconds', 300),
+        )
+
+    # ─────────────────── Acquire / Release ───────────────────
+
+    @property
+    def concurrency(self) -> int:
+        """Current adaptive concurrency limit"""
+        return self._concurrency
+
+    def _refill(self, now: float):
+        """Refill both buckets for the elapsed time (caller holds the lock)"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_tokens = min(self.requests_per_minute,
+                                   self._request_tokens + elapsed * self.requests_per_minute / 60.0)
+        if self._complexity_reset_at is not None:
+            # Monday.com budgets are windowed: the observed remaining budget holds until the reset
+            if now >= self._complexity_reset_at:
+                self._complexity_tokens = float(self.complexity_per_minute)
+                self._complexity_reset_at = None
+        else:
+            self._complexity_tokens = min(self.complexity_per_minute,
+                                          self._complexity_tokens + elapsed * self.complexity_per_minute / 60.0)
+
+    def _try_acquire(self, complexity: float) -> float:
+        """Reserve a slot and tokens; return 0 on success or the seconds to wait (caller holds the lock)"""
+        now = time.monotonic()
+        self._refill(now)
+
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._in_flight >= self._concurrency:
+            return 0.01
+
+        request_shortfall = 1.0 - self._request_tokens
+        complexity_shortfall = complexity + self.complexity_reserve - self._complexity_tokens
+        if request_shortfall > 0 or complexity_shortfall > 0:
+            wait = max(request_shortfall * 60.0 / self.requests_per_minute,
+                       complexity_shortfall * 60.0 / self.complexity_per_minute, 0.01)
+            if self._complexity_reset_at is not None and complexity_shortfall > 0:
+                wait = max(self._complexity_reset_at - now, 0.01)
+            return wait
+
+        self._in_flight += 1
+        self._request_tokens -= 1.0
+        self._complexity_tokens -= complexity
+        self.stats['requests'] += 1
+        return 0.0
+
+    async def acquire(self, complexity: Optional[float] = None) -> float:
+        """Wait for a concurrency slot and budget; returns the seconds spent waiting"""
+        cost = float(complexity) if complexity is not None else None
+        waited = 0.0
+        while True:
+            with self._lock:
+                wait = self._try_acquire(cost if cost is not None else self._estimated_complexity)
+            if wait <= 0:
+                break
+            wait = min(wait, 1.0, self.max_wait_seconds)
+            await asyncio.sleep(wait)
+            waited += wait
+        if waited:
+            with self._lock:
+                self.stats['wait_seconds'] += waited
+        return waited
+
+    def release(self):
+        """Return a concurrency slot"""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+
+    @asynccontextmanager
+    async def slot(self, complexity: Optional[float] = None):
+        """``async with limiter.slot():`` around a single Monday.com request"""
+        await self.acquire(complexity)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    # ─────────────────── Response Feedback ───────────────────
+
+    def observe(self, response: Optional[Dict[str, Any]], status: int = 200,
+                headers: Optional[Mapping[str, str]] = None) -> bool:
+        """
+        Update budget and concurrency from a Monday.com response
+
+        Removes the ``complexity`` field from ``response['data']`` so callers parsing
+        aliases see the original payload. Returns True if the response was rate limited.
+        """
+        data = response.get('data') if isinstance(response, dict) else None
+        complexity = data.pop('complexity', None) if isinstance(data, dict) else None
+
+        retry_in = self._extract_retry_seconds(response, headers)
+        rate_limited = status == 429 or retry_in is not None or self._has_rate_limit_error(response)
+
+        with self._lock:
+            now = time.monotonic()
+            if isinstance(complexity, dict) and complexity.get('after') is not None:
+                self._record_complexity(complexity, now)
+
+            if rate_limited:
+                self.stats['rate_limit_hits'] += 1
+                self._success_streak = 0
+                reduced = max(self.min_concurrency, int(self._concurrency * self.decrease_factor))
+                if reduced < self._concurrency:
+                    self._concurrency = reduced
+                    self.stats['concurrency_decreases'] += 1
+                pause = min(retry_in if retry_in is not None else 1.0, self.max_wait_seconds)
+                self._blocked_until = max(self._blocked_until, now + pause)
+                logger.warning(f"Monday.com rate limit: pausing {pause:.1f}s, concurrency -> {self._concurrency}")
+            elif status == 200:
+                self._success_streak += 1
+                if (self._success_streak >= self.increase_after_successes
+                        and self._concurrency < self.max_concurrency
+                        and self._complexity_tokens > self.complexity_reserve + self._estimated_complexity * self._concurrency):
+                    self._concurrency += 1
+                    self._success_streak = 0
+                    self.stats['concurrency_increases'] += 1
+        return rate_limited
+
+    def _record_complexity(self, complexity: Dict[str, Any], now: float):
+        """Apply Monday.com's authoritative remaining budget (caller holds the lock)"""
+        self.stats['complexity_observations'] += 1
+        self._complexity_tokens = float(complexity['after'])
+        self._last_refill = now
+        reset_in = complexity.get('reset_in_x_seconds')
+        if reset_in is not None:
+            self._complexity_reset_at = now + float(reset_in)
+        query_cost = complexity.get('query')
+        if query_cost is None and complexity.get('before') is not None:
+            query_cost = complexity['before'] - complexity['after']
+        if query_cost:
+            # Exponential moving average used to reserve budget for requests without a known cost
+            self._estimated_complexity = 0.8 * self._estimated_complexity + 0.2 * float(query_cost)
+
+    @staticmethod
+    def _iter_errors(response: Any):
+        if not isinstance(response, dict):
+            return
+        for error in response.get('errors') or []:
+            if isinstance(error, dict):
+                yield error
+        if response.get('error_code') or response.get('error_message'):
+            yield {'message': response.get('error_message', ''),
+                   'extensions': {'code': response.get('error_code')}}
+
+    def _has_rate_limit_error(self, response: Any) -> bool:
+        for error in self._iter_errors(response):
+            code = (error.get('extensions') or {}).get('code')
+            if code in RATE_LIMIT_ERROR_CODES:
+                return True
+        return False
+
+    def _extract_retry_seconds(self, response: Any, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """Find the server-suggested wait: extensions.retry_in_seconds, 'reset in N seconds' or Retry-After"""
+        for error in self._iter_errors(response):
+            extensions = error.get('extensions') or {}
+            if extensions.get('retry_in_seconds') is not None:
+                return float(extensions['retry_in_seconds'])
+            match = _RESET_IN_SECONDS.search(str(error.get('message', '')))
+            if match:
+                return float(match.group(1))
+        if headers:
+            retry_after = headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of limiter statistics and current budget"""
+        with self._lock:
+            self._refill(time.monotonic())
+            stats = dict(self.stats)
+            stats.update({
+                'concurrency': self._concurrency,
+                'in_flight': self._in_flight,
+                'complexity_remaining': int(self._complexity_tokens),
+                'estimated_query_complexity': int(self._estimated_complexity),
+            })
+        return stats
+
+
+# ─────────────────── Shared Instance ───────────────────
+
+_shared_limiter: Optional[MondayRateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(monday_config=None) -> MondayRateLimiter:
+    """Process-wide limiter (the Monday.com budget is per account, not per client)"""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            if monday_config is None:
+                from .monday_config import MondayConfig
+                monday_config = MondayConfig()
+            _shared_limiter = MondayRateLimiter.from_config(monday_config)
+            logger.info(f"Monday.com rate limiter: {_shared_limiter.requests_per_minute} req/min, "
+                        f"{_shared_limiter.complexity_per_minute} complexity/min, "
+                        f"concurrency {_shared_limiter.concurrency} "
+                        f"({_shared_limiter.min_concurrency}-{_shared_limiter.max_concurrency})")
+        return _shared_limiter
+
+
+def reset_shared_rate_limiter():
+    """Drop the shared limiter (tests / config reload)"""
+    global _shared_limiter
+    with _shared_lock:
+        _shared_limiter = None
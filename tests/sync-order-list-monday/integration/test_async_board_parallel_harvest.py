@@ -0,0 +1,225 @@
+"""
+Integration Test: Parallel Cursor-Page Harvest for Item IDs
+===========================================================
+Purpose: Validate that load_boards_async harvests item IDs with one cursor chain per
+         group concurrently, dedupes them and feeds detail fetching while still harvesting
+Requirement: Parallel cursor-page harvest for item IDs
+
+Test Scenarios:
+- Per-group chains run concurrently (wall time ~ longest chain, not the sum)
+- IDs seen in two groups (moved mid-harvest) are returned once
+- Detail batches start before the harvest has finished
+- The ID queue is always closed, so the streaming loader never waits forever
+- A failed streaming load cancels the harvest instead of leaving it running
+- A watermark filter queries from the day before (Monday.com compares by account-timezone day)
+
+Success Criteria:
+- 4 groups x 5 pages x 20ms harvest in well under the sequential 400ms
+"""
+
+import os
+import re
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "ingestion"))
+os.environ.setdefault("MONDAY_API_KEY", "test-token")
+
+import staging_helper
+
+# load_boards_async resolves pipelines.utils.monday_config from src/ (as when run as a script),
+# so drop the repo-root pipelines namespace db_helper may have cached
+for module_name in [name for name in sys.modules if name == "pipelines" or name.startswith("pipelines.")]:
+    del sys.modules[module_name]
+sys.path.insert(0, str(repo_root / "src"))
+
+import load_boards_async
+
+PAGE_LIMIT = 10
+
+
+class GroupedBoard:
+    """Monday.com GraphQL double: 4 groups x 50 items, item 1 also listed in the last group"""
+
+    def __init__(self, group_count=4, items_per_group=50, page_delay=0.02):
+        self.groups = {f"group_{g}": list(range(g * items_per_group + 1, (g + 1) * items_per_group + 1))
+                       for g in range(group_count)}
+        self.groups[f"group_{group_count - 1}"].append(1)
+        self.page_delay = page_delay
+        self.pages_served = 0
+        self.finished_at = None
+
+    async def gql_request(self, session, query, variables=None):
+        if "groups { id }" in query:
+            return {"boards": [{"groups": [{"id": group_id} for group_id in self.groups]}]}
+        await asyncio.sleep(self.page_delay)
+        self.pages_served += 1
+        cursor = re.search(r'cursor: "(\w+):(\d+)"', query)
+        if cursor:
+            group_id, offset = cursor.group(1), int(cursor.group(2))
+        else:
+            group_id, offset = re.search(r'groups\(ids: \["(\w+)"\]\)', query).group(1), 0
+        ids = self.groups[group_id][offset:offset + PAGE_LIMIT]
+        next_offset = offset + PAGE_LIMIT
+        next_cursor = f"{group_id}:{next_offset}" if next_offset < len(self.groups[group_id]) else None
+        page = {"cursor": next_cursor, "items": [{"id": str(i)} for i in ids]}
+        self.finished_at = time.perf_counter()
+        if cursor:
+            return {"next_items_page": page}
+        return {"boards": [{"groups": [{"items_page": page}]}]}
+
+
+@pytest.fixture
+def board(monkeypatch):
+    grouped_board = GroupedBoard()
+    monkeypatch.setattr(load_boards_async, "gql_request", grouped_board.gql_request)
+    return grouped_board
+
+
+class TestParallelHarvest:
+
+    def test_watermark_query_starts_a_day_early(self, monkeypatch):
+        queries = []
+
+        async def gql_request(session, query, variables=None):
+            queries.append(query)
+            return {"boards": [{"items_page": {"cursor": None, "items": []}}]}
+
+        monkeypatch.setattr(load_boards_async, "gql_request", gql_request)
+
+        asyncio.run(load_boards_async.fetch_cursor_page(None, 123, updated_since="2025-08-21T00:10:00Z"))
+
+        assert 'compare_value: ["EXACT", "2025-08-20"]' in queries[0]
+
+    def test_group_chains_run_concurrently_and_dedupe(self, board):
+        start = time.perf_counter()
+        item_ids = asyncio.run(load_boards_async.harvest_item_ids_by_group(None, 123, page_limit=PAGE_LIMIT))
+        elapsed = time.perf_counter() - start
+
+        assert sorted(item_ids) == list(range(1, 201)), "item 1 appears in two groups but is returned once"
+        assert board.pages_served == 21
+        assert elapsed < 0.25, f"4 chains x 5-6 pages took {elapsed:.2f}s"
+        print(f"✅ 4 groups / {board.pages_served} pages harvested in {elapsed:.3f}s (sequential ~0.42s)")
+
+    def test_queue_is_closed_when_a_chain_fails(self, board, monkeypatch):
+        async def failing_request(session, query, variables=None):
+            if "group_2" in query:
+                raise RuntimeError("Internal server error")
+            return await board.gql_request(session, query, variables)
+
+        monkeypatch.setattr(load_boards_async, "gql_request", failing_request)
+
+        async def run():
+            id_queue = asyncio.Queue()
+            with pytest.raises(RuntimeError):
+                await load_boards_async.harvest_item_ids_by_group(None, 123, PAGE_LIMIT, id_queue=id_queue)
+            pages_at_failure = board.pages_served
+            batches = [batch async for batch in load_boards_async.iter_id_batches(id_queue, 25)]
+            await asyncio.sleep(0.05)
+            return batches, pages_at_failure
+
+        batches, pages_at_failure = asyncio.run(run())
+        assert batches == [], "the end marker is queued even though the harvest failed"
+        assert board.pages_served == pages_at_failure, "sibling chains are cancelled"
+
+    def test_queue_is_closed_when_group_lookup_fails(self, monkeypatch):
+        async def failing_request(session, query, variables=None):
+            raise RuntimeError("Internal server error")
+
+        monkeypatch.setattr(load_boards_async, "gql_request", failing_request)
+
+        async def run():
+            id_queue = asyncio.Queue()
+            with pytest.raises(RuntimeError):
+                await load_boards_async.harvest_item_ids_by_group(None, 123, PAGE_LIMIT, id_queue=id_queue)
+            return id_queue.get_nowait()
+
+        assert asyncio.run(run()) is None
+
+    def test_stream_failure_cancels_harvest(self, board, monkeypatch):
+        board.page_delay = 0.05
+
+        async def failing_stream(session, id_queue, *args):
+            await id_queue.get()
+            raise RuntimeError("staging insert failed")
+
+        monkeypatch.setattr(load_boards_async, "load_board_metadata",
+                            lambda board_id: {"table_name": "MON_Test", "database": "orders"})
+        monkeypatch.setattr(load_boards_async, "stream_items_to_staging", failing_stream)
+
+        async def run():
+            with pytest.raises(RuntimeError, match="staging insert failed"):
+                await load_boards_async.execute_async_etl_pipeline(123, batch_size=25, max_concurrency=4)
+            pages_at_failure = board.pages_served
+            await asyncio.sleep(0.2)
+            return pages_at_failure, asyncio.all_tasks() - {asyncio.current_task()}
+
+        pages_at_failure, pending = asyncio.run(run())
+        assert pending == set(), "harvest task and its group chains are cancelled and awaited"
+        assert board.pages_served == pages_at_failure < 21
+
+    def test_detail_fetch_starts_during_harvest(self, board, monkeypatch):
+        fetch_started = []
+
+        async def fake_fetch_details_batch(session, item_ids):
+            fetch_started.append(time.perf_counter())
+            return [{"id": str(i), "name": f"Item {i}", "updated_at": "2025-08-20T10:00:00Z",
+                     "group": None, "column_values": []} for i in item_ids]
+
+        class Cursor:
+            fast_executemany = False
+            rows = []
+
+            def executemany(self, sql, rows):
+                self.rows.extend(rows)
+
+            def close(self):
+                pass
+
+        class Connection:
+            def cursor(self):
+                return Cursor()
+
+            def commit(self):
+                pass
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(load_boards_async, "fetch_details_batch", fake_fetch_details_batch)
+        monkeypatch.setattr(load_boards_async.db, "get_connection", lambda *args, **kwargs: Connection())
+        monkeypatch.setattr(staging_helper, "prepare_staging_table", lambda *args, **kwargs: None)
+
+        async def run():
+            id_queue = asyncio.Queue()
+            harvest = asyncio.create_task(
+                load_boards_async.harvest_item_ids_by_group(None, 123, PAGE_LIMIT, id_queue=id_queue))
+            stats = await load_boards_async.stream_items_to_staging(
+                None, id_queue, {"table_name": "MON_Test", "columns": []}, "swp_MON_Test", "orders",
+                batch_size=25, max_concurrency=4)
+            return await harvest, stats
+
+        item_ids, stats = asyncio.run(run())
+
+        assert stats["rows_written"] == stats["ids_received"] == len(item_ids) == 200
+        assert fetch_started[0] < board.finished_at, "details must not wait for the whole harvest"
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,173 @@
+"""
+Integration Test: Streaming Page-to-Database Async Board Ingestion
+==================================================================
+Purpose: Validate that load_boards_async streams detail batches into the swp_ staging
+         table through a bounded queue while other batches are still being fetched
+Requirement: Streaming page-to-database pipeline for async board ingestion
+
+Test Scenarios:
+- Every fetched item is written once via fast_executemany on a single connection
+- Batches held in memory never exceed concurrency + queue size (independent of board size)
+- Inserts start before the last detail batch is fetched
+- A failed insert rolls back and never deadlocks the fetchers
+
+Success Criteria:
+- 3,000 items in 60 batches: 3,000 rows written, 1 commit, bounded in-flight batches
+"""
+
+import os
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "ingestion"))
+os.environ.setdefault("MONDAY_API_KEY", "test-token")
+
+import staging_helper
+
+# load_boards_async resolves pipelines.utils.monday_config from src/ (as when run as a script),
+# so drop the repo-root pipelines namespace db_helper may have cached
+for module_name in [name for name in sys.modules if name == "pipelines" or name.startswith("pipelines.")]:
+    del sys.modules[module_name]
+sys.path.insert(0, str(repo_root / "src"))
+
+import load_boards_async
+
+METADATA = {
+    "table_name": "MON_Test",
+    "columns": [
+        {"monday_id": "numbers", "monday_title": "Quantity", "monday_type": "numbers",
+         "extraction_field": "text", "sql_type": "DECIMAL(18,2)"},
+        {"monday_id": "date", "monday_title": "Due Date", "monday_type": "date",
+         "extraction_field": "text", "sql_type": "DATE"},
+        {"monday_id": "text", "monday_title": "Notes", "monday_type": "text",
+         "extraction_field": "text", "sql_type": "NVARCHAR(MAX)"},
+    ]
+}
+
+
+def make_item(item_id):
+    return {"id": str(item_id), "name": f"Item {item_id}", "updated_at": "2025-08-20T10:00:00Z",
+            "group": {"id": "topics", "title": "Group"},
+            "column_values": [{"id": "numbers", "text": str(item_id) if item_id % 10 else ""},
+                              {"id": "date", "text": "2025-08-20"},
+                              {"id": "text", "text": None}]}
+
+
+class StagingCursor:
+    """pyodbc cursor double: slow executemany, tracks rows and timing"""
+
+    def __init__(self, tracker, fail=False):
+        self.tracker = tracker
+        self.fail = fail
+        self.fast_executemany = False
+        self.rows = []
+
+    def executemany(self, sql, rows):
+        assert self.fast_executemany
+        self.tracker["first_write"] = self.tracker.get("first_write") or time.perf_counter()
+        time.sleep(0.005)
+        if self.fail:
+            raise RuntimeError("String or binary data would be truncated")
+        self.rows.extend(rows)
+        self.tracker["in_flight"] -= 1
+
+    def close(self):
+        pass
+
+
+class StagingConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = {"in_flight": 0, "max_in_flight": 0, "last_fetch": 0.0}
+
+    async def fake_fetch_details_batch(session, item_ids):
+        await asyncio.sleep(0.002)
+        tracker["in_flight"] += 1
+        tracker["max_in_flight"] = max(tracker["max_in_flight"], tracker["in_flight"])
+        tracker["last_fetch"] = time.perf_counter()
+        return [make_item(i) for i in item_ids]
+
+    monkeypatch.setattr(load_boards_async, "fetch_details_batch", fake_fetch_details_batch)
+    monkeypatch.setattr(staging_helper, "prepare_staging_table",
+                        lambda df, stg, prod, db_name, column_type_map=None: tracker.setdefault("schema", column_type_map))
+    return tracker
+
+
+def run_stream(monkeypatch, tracker, fail=False, item_count=3000):
+    connection = StagingConnection(StagingCursor(tracker, fail))
+    monkeypatch.setattr(load_boards_async.db, "get_connection", lambda *args, **kwargs: connection)
+    stats = asyncio.run(load_boards_async.stream_items_to_staging(
+        None, list(range(1, item_count + 1)), METADATA, "swp_MON_Test", "orders",
+        batch_size=50, max_concurrency=4, queue_size=2))
+    return stats, connection
+
+
+class TestStreamingStagingLoad:
+
+    def test_all_rows_written_with_bounded_memory(self, monkeypatch, tracker):
+        stats, connection = run_stream(monkeypatch, tracker)
+
+        rows = connection.cursor().rows
+        assert stats["rows_written"] == stats["items_fetched"] == 3000
+        assert len({row[0] for row in rows}) == 3000
+        assert connection.commits == 1
+        assert tracker["max_in_flight"] <= 4 + 2 + 1, "fetchers must block on the bounded queue"
+        print(f"✅ 3,000 items / 60 batches: max {tracker['max_in_flight']} batches in memory, "
+              f"{stats['stream_time_seconds']:.2f}s")
+
+    def test_inserts_overlap_with_fetching(self, monkeypatch, tracker):
+        run_stream(monkeypatch, tracker)
+
+        assert tracker["first_write"] < tracker["last_fetch"]
+
+    def test_rows_match_staging_schema(self, monkeypatch, tracker):
+        stats, connection = run_stream(monkeypatch, tracker, item_count=10)
+
+        columns = list(tracker["schema"])
+        assert columns[:5] == list(load_boards_async.STAGING_ITEM_COLUMNS)
+        row = dict(zip(columns, sorted(connection.cursor().rows)[0]))
+        assert row["item_id"] == 1 and row["Quantity"] == 1.0
+        assert str(row["Due Date"]) == "2025-08-20" and row["Notes"] is None
+        assert dict(zip(columns, sorted(connection.cursor().rows)[-1]))["Quantity"] is None
+
+    def test_failed_insert_rolls_back_without_deadlock(self, monkeypatch, tracker):
+        with pytest.raises(RuntimeError):
+            run_stream(monkeypatch, tracker, fail=True)
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
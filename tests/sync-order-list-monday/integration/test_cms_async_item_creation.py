@@ -0,0 +1,258 @@
+"""
+Integration Test: Concurrent CMS Item Creation with Streamed Subitems
+=====================================================================
+Purpose: Validate BatchProcessor.create_monday_items_and_subitems_from_staging, which resolves
+         groups once, creates item batches concurrently under the shared rate limiter and
+         creates each batch's subitems as soon as that batch's item IDs are written back
+Requirement: Concurrent Monday.com item creation with per-batch subitem streaming
+
+Test Scenarios:
+- Every distinct group is resolved exactly once, before any item is sent
+- A subitem call only carries parents of one item batch whose write-back already ran
+- No subitem is sent twice by the per-batch stream plus the final sweep
+- Counts and final staging statuses equal the sequential path (all items, then all subitems)
+- Failed / rate-limited API calls are reported to the rate limiter
+
+Success Criteria:
+- Same staging end state as the sequential path, with subitems overlapping item creation
+"""
+
+import asyncio
+import importlib.util
+import sys
+import time
+import types
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+load_cms_path = repo_root / "pipelines" / "scripts" / "load_cms"
+sys.path.insert(0, str(repo_root / "pipelines"))  # batch_processor: from utils import db_helper
+
+# Register load_cms as a package without running its __init__ (which pulls in the Monday.com client)
+package_spec = importlib.util.spec_from_file_location("load_cms", load_cms_path / "__init__.py",
+                                                      submodule_search_locations=[str(load_cms_path)])
+sys.modules.setdefault("load_cms", importlib.util.module_from_spec(package_spec))
+
+# The Monday.com client and the customer_master_schedule mapping are not importable in this
+# environment; the API is replaced by FakeMondayClient below anyway
+for module_name, attributes in {
+    "load_cms.monday_api_client": ["MondayApiClient"],
+    "customer_master_schedule": [],
+    "customer_master_schedule.order_mapping": ["transform_orders_batch", "create_staging_dataframe",
+                                               "get_monday_column_values_dict", "transform_order_data",
+                                               "load_mapping_config", "load_customer_mapping"],
+}.items():
+    if module_name not in sys.modules:
+        module = types.ModuleType(module_name)
+        for attribute in attributes:
+            setattr(module, attribute, None)
+        sys.modules[module_name] = module
+
+from load_cms import batch_processor  # noqa: E402
+from pipelines.utils.monday_rate_limiter import MondayRateLimiter  # noqa: E402
+
+ORDERS = 47           # 3 item batches of 20 (last one partial)
+SUBITEMS_PER_ORDER = 3
+FAILED_ORDER = 25     # Monday.com returns no item ID for this order
+
+
+class FakeStaging:
+    """StagingOperations double: STG_MON_CustMasterSchedule(_Subitems) in memory"""
+
+    def __init__(self, events):
+        self.events = events
+        self.orders = pd.DataFrame({"stg_id": range(1, ORDERS + 1),
+                                    "CUSTOMER": "GREYSON",
+                                    "AAG SEASON": [f"2026 {['SPRING', 'SUMMER', 'FALL'][i % 3]}" for i in range(ORDERS)]})
+        self.order_status = {stg_id: "PENDING" for stg_id in self.orders["stg_id"]}
+        self.subitems = {parent * 10 + k: {"parent": parent, "parent_item_id": None, "status": "PENDING",
+                                           "Size": ["S", "M", "L"][k]}
+                         for parent in self.orders["stg_id"] for k in range(SUBITEMS_PER_ORDER)}
+        self.written_back = set()
+
+    def get_pending_staging_orders(self, batch_id):
+        return self.orders.copy()
+
+    def update_staging_with_monday_ids(self, item_ids):
+        stg_ids = [stg_id for stg_id, _, _ in item_ids]
+        self.events.append(("writeback", stg_ids))
+        for stg_id, monday_item_id, _ in item_ids:
+            self.order_status[stg_id] = "API_SUCCESS"
+            self.written_back.add(monday_item_id)
+            for subitem in self.subitems.values():
+                if subitem["parent"] == stg_id:
+                    subitem["parent_item_id"] = monday_item_id
+        return len(item_ids), len(item_ids) * SUBITEMS_PER_ORDER
+
+    def update_subitems_with_monday_ids(self, subitem_ids):
+        for stg_id, _ in subitem_ids:
+            self.subitems[stg_id]["status"] = "API_SUCCESS"
+        return len(subitem_ids)
+
+    def mark_subitems_as_failed(self, failures):
+        for stg_id, _ in failures:
+            self.subitems[stg_id]["status"] = "API_FAILED"
+        return len(failures)
+
+    def get_pending_subitems(self, batch_id, parent_stg_ids=None):
+        """_get_pending_subitems: PENDING subitems whose parent item ID is known"""
+        rows = [{"stg_subitem_id": stg_id, "stg_parent_stg_id": s["parent"],
+                 "stg_monday_parent_item_id": s["parent_item_id"], "AAG_ORDER_NUMBER": f"MWE-{s['parent']}",
+                 "Size": s["Size"], "ORDER_QTY": 6, "Order Qty": "6"}
+                for stg_id, s in sorted(self.subitems.items())
+                if s["status"] == "PENDING" and s["parent_item_id"] is not None
+                and (parent_stg_ids is None or s["parent"] in parent_stg_ids)]
+        return pd.DataFrame(rows)
+
+
+class FakeMondayClient:
+    """MondayApiClient double: (success, data, error) tuples like the real client"""
+
+    def __init__(self, staging, events):
+        self.staging = staging
+        self.events = events
+        self.groups_resolved = []
+        self.subitem_parents_sent = []
+        self.subitems_before_writeback = 0
+
+    def ensure_group_exists(self, group_name):
+        self.groups_resolved.append(group_name)
+        return True, f"group_{len(self.groups_resolved)}", None
+
+    def create_items_batch(self, items):
+        time.sleep(0.05 * (items[0]["stg_id"] // 20))  # later batches answer later
+        self.events.append(("items", [item["stg_id"] for item in items]))
+        return True, [None if item["stg_id"] == FAILED_ORDER else 9000 + item["stg_id"] for item in items], None
+
+    def create_subitems_batch(self, subitems):
+        parents = [subitem["parent_item_id"] for subitem in subitems]
+        self.subitems_before_writeback += sum(1 for parent in parents if parent not in self.staging.written_back)
+        self.subitem_parents_sent.append(parents)
+        self.events.append(("subitems", parents))
+        return True, [{"subitem_id": 50_000 + i} for i in range(len(subitems))], None
+
+
+def make_processor(rate_limiter=None):
+    events = []
+    staging = FakeStaging(events)
+    processor = batch_processor.BatchProcessor.__new__(batch_processor.BatchProcessor)
+    processor.staging_ops = staging
+    processor.monday_client = FakeMondayClient(staging, events)
+    processor.rate_limiter = rate_limiter or MondayRateLimiter()
+    processor.create_group_name = lambda record: f"{record['CUSTOMER']} {record['AAG SEASON']}"
+    processor.create_item_name = lambda record: f"MWE-{record['stg_id']}"
+    processor.get_monday_column_values_for_staged_order = lambda record: {}
+    processor._get_pending_subitems = staging.get_pending_subitems
+    return processor
+
+
+def staging_state(processor):
+    staging = processor.staging_ops
+    return staging.order_status, {stg_id: s["status"] for stg_id, s in staging.subitems.items()}
+
+
+class TestStreamedItemCreation:
+
+    def test_groups_resolved_once(self):
+        processor = make_processor()
+
+        processor.create_monday_items_and_subitems_from_staging("batch-1")
+
+        resolved = Counter(processor.monday_client.groups_resolved)
+        assert set(resolved) == {"GREYSON 2026 SPRING", "GREYSON 2026 SUMMER", "GREYSON 2026 FALL"}
+        assert set(resolved.values()) == {1}
+
+    def test_subitems_follow_their_batch_writeback(self):
+        processor = make_processor()
+
+        processor.create_monday_items_and_subitems_from_staging("batch-1")
+
+        events = processor.staging_ops.events
+        item_batches = [set(stg_ids) for kind, stg_ids in events if kind == "items"]
+        assert processor.monday_client.subitems_before_writeback == 0
+        for parents in processor.monday_client.subitem_parents_sent:
+            parent_stg_ids = {parent - 9000 for parent in parents}
+            assert any(parent_stg_ids <= batch for batch in item_batches), "one item batch per subitem call"
+        first_subitems = next(i for i, (kind, _) in enumerate(events) if kind == "subitems")
+        last_writeback = max(i for i, (kind, _) in enumerate(events) if kind == "writeback")
+        assert first_subitems < last_writeback, "subitems start before every item batch is written back"
+
+    def test_no_subitem_sent_twice(self):
+        processor = make_processor()
+
+        result = processor.create_monday_items_and_subitems_from_staging("batch-1")
+
+        sent = Counter(parent for parents in processor.monday_client.subitem_parents_sent for parent in parents)
+        expected_subitems = (ORDERS - 1) * SUBITEMS_PER_ORDER
+        assert sum(sent.values()) == expected_subitems and set(sent.values()) == {SUBITEMS_PER_ORDER}
+        assert result == (ORDERS - 1, 1, expected_subitems, 0)
+        assert processor.create_monday_subitems_from_staging("batch-1") == (0, 0), "nothing left for the sweep"
+
+    def test_matches_sequential_path(self):
+        streamed = make_processor()
+        sequential = make_processor()
+
+        streamed_result = streamed.create_monday_items_and_subitems_from_staging("batch-1")
+        items_success, items_errors = sequential.create_monday_items_from_staging("batch-1")
+        subitems_success, subitems_errors = sequential.create_monday_subitems_from_staging("batch-1")
+
+        assert streamed_result == (items_success, items_errors, subitems_success, subitems_errors)
+        assert staging_state(streamed) == staging_state(sequential)
+        order_status, subitem_status = staging_state(streamed)
+        assert order_status[FAILED_ORDER] == "PENDING"
+        assert Counter(subitem_status.values()) == {"API_SUCCESS": (ORDERS - 1) * SUBITEMS_PER_ORDER,
+                                                    "PENDING": SUBITEMS_PER_ORDER}
+
+
+class TestRateLimiterFeedback:
+
+    def test_outcomes_reach_the_rate_limiter(self):
+        limiter = MondayRateLimiter(max_wait_seconds=0.05)
+        processor = make_processor(limiter)
+        attempts = []
+
+        def rate_limited_once(items):
+            attempts.append(len(items))
+            if len(attempts) == 1:
+                return False, None, "ComplexityException: Complexity budget exhausted, reset in 30 seconds"
+            return FakeMondayClient.create_items_batch(processor.monday_client, items)
+
+        processor.monday_client.create_items_batch = rate_limited_once
+
+        success, errors = processor.create_monday_items_from_staging("batch-1")
+
+        assert limiter.get_stats()["rate_limit_hits"] == 1
+        assert success + errors == ORDERS and errors >= 1
+
+    def test_client_exception_is_observed(self):
+        limiter = MondayRateLimiter(max_wait_seconds=0.05)
+        processor = make_processor(limiter)
+
+        def raising(group_name):
+            raise RuntimeError("429 Too Many Requests: RATE_LIMIT_EXCEEDED")
+
+        processor.monday_client.ensure_group_exists = raising
+
+        group_ids = asyncio.run(processor._resolve_groups({"GREYSON 2026 FALL"}))
+
+        assert limiter.get_stats()["rate_limit_hits"] == 1
+        from load_cms.staging_config import MONDAY_CONFIG
+        assert group_ids == {"GREYSON 2026 FALL": MONDAY_CONFIG.get('default_group_id', 'topics')}
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
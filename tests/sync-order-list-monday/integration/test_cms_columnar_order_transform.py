@@ -0,0 +1,150 @@
+"""
+Integration Test: Columnar Order Transformation for the CMS Loader
+==================================================================
+Purpose: Validate that order_mapping.transform_orders_batch, now compiled from the YAML
+         mapping into per-column operations, produces the same frame as the row-wise
+         transform_order_data + flatten loop it replaces
+Requirement: Vectorized ORDERS_UNIFIED → MON_CustMasterSchedule transformation
+
+Test Scenarios:
+- Real mapping config: typed, object and missing columns, NULLs, value mapping, TRUE cleanup
+- Customer mapping via distinct names; orders the row-wise path failed on are still skipped
+- Computed fields: Title concatenation and TOTAL QTY / summed aggregations
+- Benchmark over an ORDERS_UNIFIED-sized batch
+
+Success Criteria:
+- Identical output frames; columnar path faster than the row-wise loop
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "load_cms"))
+
+import order_mapping
+
+BENCHMARK_ROWS = 10000
+
+
+@pytest.fixture(scope="module")
+def mapping_config():
+    with open(repo_root / "docs" / "mapping" / "orders_unified_monday_mapping.yaml", encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+
+@pytest.fixture(scope="module")
+def customer_lookup():
+    return {"GREYSON CLOTHIERS": "GREYSON", "GREYSON": "GREYSON", "JOHNNIE O": "JOHNNIE O", "TITLE NINE": "TITLE 9"}
+
+
+def rowwise_transform(orders_df, mapping_config, customer_lookup):
+    """transform_orders_batch as it was before the columnar engine (iterrows + flatten)"""
+    records = []
+    for _, order_row in orders_df.iterrows():
+        try:
+            transformed = order_mapping.transform_order_data(order_row, mapping_config, customer_lookup)
+        except Exception:
+            continue
+        records.append({name: data.get('value') for name, data in transformed.items() if not name.startswith('_')})
+    return pd.DataFrame(records)
+
+
+def make_orders(rows):
+    """ORDERS_UNIFIED-shaped batch: object text, float / object numbers, datetime64 and string dates"""
+    i = np.arange(rows)
+    return pd.DataFrame({
+        "AAG ORDER NUMBER": [f"MWE-{n:05d}" for n in i],
+        "CUSTOMER NAME": np.array(["GREYSON", "johnnie o", "TITLE NINE", "NEW CUSTOMER", "GREYSON CLOTHIERS"])[i % 5],
+        "CUSTOMER STYLE": [f" M01Y{n % 40:02d} " if n % 13 else None for n in i],
+        "CUSTOMER COLOUR DESCRIPTION": np.array(["DEAN BLUE/WHITE", "", "BLACK", None], dtype=object)[i % 4],
+        "AAG SEASON": np.array(["2026 SPRING", "2026 FALL", None], dtype=object)[i % 3],
+        "ORDER TYPE": np.array(["ACTIVE", "development", "RE-ORDER", None], dtype=object)[i % 4],
+        "ORDER DATE PO RECEIVED": pd.to_datetime(["2026-01-15", None, "2026-03-02"] * (rows // 3) + ["2026-01-15"] * (rows % 3)),
+        "EX FACTORY DATE": np.array(["2026-05-01", "05/20/2026", "not a date", None], dtype=object)[i % 4],
+        "CUSTOMER PRICE": np.where(i % 6 == 0, np.nan, i * 0.25),
+        "FINAL FOB (USD)": np.array(["12.50", " ", "", "1,000", "7"], dtype=object)[i % 5],
+        "US TARIFF RATE": np.array(["TRUE", "0.25", "true", None], dtype=object)[i % 4],
+        "US DUTY RATE": np.array([0, 1, 2], dtype=np.int64)[i % 3],
+        "HS CODE": np.where(i % 2 == 0, 6110.20, np.nan),
+        "NOTES": np.array(["  rush  ", "", None, 42], dtype=object)[i % 4],
+        "TOTAL QTY": np.array([120, 0, None, "36"], dtype=object)[i % 4],
+    })
+
+
+class TestColumnarTransform:
+
+    def test_matches_rowwise_transform(self, mapping_config, customer_lookup):
+        orders = make_orders(400)
+
+        result = order_mapping.transform_orders_batch(orders, mapping_config, customer_lookup)
+
+        pd.testing.assert_frame_equal(result, rowwise_transform(orders, mapping_config, customer_lookup))
+        assert result["ORDER TYPE"].iloc[:3].tolist() == ["RECEIVED", "development", "RE-ORDER"]
+        assert result["US TARIFF RATE"].iloc[:2].tolist() == [0.0, 0.25]
+        assert result["Title"].iloc[1] == "M01Y01 MWE-00001"
+
+    def test_failed_orders_skipped(self, mapping_config, customer_lookup):
+        orders = make_orders(20)
+        orders.loc[[3, 7], "CUSTOMER NAME"] = np.nan  # apply_customer_mapping raises on NaN
+
+        result = order_mapping.transform_orders_batch(orders, mapping_config, customer_lookup)
+
+        pd.testing.assert_frame_equal(result, rowwise_transform(orders, mapping_config, customer_lookup))
+        assert len(result) == 18 and "MWE-00003" not in result["AAG ORDER NUMBER"].tolist()
+
+    def test_missing_columns_and_sum_aggregation(self, customer_lookup):
+        config = {
+            "exact_matches": [{"source_field": "PO NUMBER", "target_field": "PO NUMBER",
+                               "target_type": "text", "target_column_id": "text_po"}],
+            "mapped_fields": [{"source_field": "CUSTOMER NAME", "target_field": "CUSTOMER", "target_type": "dropdown",
+                               "target_column_id": "dropdown_c", "transformation": "customer_mapping_lookup"}],
+            "computed_fields": [{"target_field": "SIZE QTY", "source_fields": ["S", "M", "L"],
+                                 "transformation": "sum_aggregation", "target_column_id": "numbers_q",
+                                 "target_type": "numbers"}],
+        }
+        orders = pd.DataFrame({"S": [1, None, 0], "M": ["2", "", "0"], "AAG ORDER NUMBER": ["A", "B", "C"]})
+
+        result = order_mapping.transform_orders_batch(orders, config, customer_lookup)
+
+        pd.testing.assert_frame_equal(result, rowwise_transform(orders, config, customer_lookup))
+        assert result["CUSTOMER"].tolist() == ["UNKNOWN"] * 3
+
+    def test_empty_batch(self, mapping_config, customer_lookup):
+        assert order_mapping.transform_orders_batch(pd.DataFrame(), mapping_config, customer_lookup).empty
+
+    def test_benchmark_orders_unified_batch(self, mapping_config, customer_lookup):
+        orders = make_orders(BENCHMARK_ROWS)
+
+        start = time.perf_counter()
+        result = order_mapping.transform_orders_batch(orders, mapping_config, customer_lookup)
+        columnar = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = rowwise_transform(orders, mapping_config, customer_lookup)
+        rowwise = time.perf_counter() - start
+
+        print(f"✅ {BENCHMARK_ROWS} orders: columnar {columnar:.2f}s vs row-wise {rowwise:.2f}s "
+              f"({rowwise / columnar:.1f}x)")
+        pd.testing.assert_frame_equal(result, expected)
+        assert columnar < rowwise
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,171 @@
+"""
+Integration Test: Set-Based Monday.com ID Write-Back for CMS Staging
+====================================================================
+Purpose: Validate that StagingOperations writes Monday.com item / subitem IDs back to
+         STG_MON_CustMasterSchedule(_Subitems) with one temp-table load and one UPDATE per
+         API batch, then propagating parent item IDs to subitems
+Requirement: Batched staging ID write-back for the CMS loader
+
+Test Scenarios:
+- 5k (stg_id, monday_item_id, payload) rows → 1 executemany, 2 UPDATEs, 2 commits
+- numpy ids are converted, repeated stg_ids keep the last value, empty input is a no-op
+- A failing order UPDATE rolls back and raises; a failing subitem propagation is logged
+  and keeps the committed item IDs (no duplicate Monday.com items on the next run)
+- Subitem successes / failures are written with one statement each
+- Single-item methods delegate to the set-based ones
+
+Success Criteria:
+- Round trips per API batch are constant, not proportional to the number of items
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+load_cms_path = repo_root / "pipelines" / "scripts" / "load_cms"
+
+# Register load_cms as a package without running its __init__ (which pulls in the Monday.com client)
+package_spec = importlib.util.spec_from_file_location("load_cms", load_cms_path / "__init__.py",
+                                                      submodule_search_locations=[str(load_cms_path)])
+sys.modules.setdefault("load_cms", importlib.util.module_from_spec(package_spec))
+
+from load_cms.staging_operations import StagingOperations  # noqa: E402
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.fast_executemany = False
+        self.rowcount = 0
+
+    def execute(self, sql, *params):
+        if self.connection.fail_on and self.connection.fail_on in sql:
+            raise RuntimeError("Deadlock victim")
+        self.connection.statements.append(" ".join(sql.split()))
+        if sql.lstrip().startswith("UPDATE"):
+            self.rowcount = len(self.connection.batches[-1])
+        return self
+
+    def executemany(self, sql, rows):
+        assert self.fast_executemany
+        self.connection.batches.append(list(rows))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements, self.batches = [], []
+        self.commits, self.rollbacks = 0, 0
+        self.fail_on = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def staging_ops(monkeypatch):
+    ops = StagingOperations("orders")
+    ops.connection = FakeConnection()
+    monkeypatch.setattr(ops, "get_connection", lambda: ops.connection)
+    monkeypatch.setattr(ops, "get_table_columns", lambda table_name: ["stg_id", "stg_monday_item_id", "stg_api_payload"])
+    return ops
+
+
+def updates(connection):
+    return [sql for sql in connection.statements if sql.startswith("UPDATE")]
+
+
+class TestItemWriteBack:
+
+    def test_one_round_trip_for_whole_batch(self, staging_ops):
+        item_ids = [(np.int64(i), np.int64(9_000_000 + i), f'{{"item": {i}}}') for i in range(5000)]
+
+        orders_updated, subitems_updated = staging_ops.update_staging_with_monday_ids(item_ids)
+
+        connection = staging_ops.connection
+        assert (orders_updated, subitems_updated) == (5000, 5000)
+        assert len(connection.batches) == 1 and connection.commits == 2
+        assert connection.batches[0][0] == (0, 9_000_000, '{"item": 0}')
+        assert all(type(value) is int for row in connection.batches[0] for value in row[:2])
+        order_update, subitem_update = updates(connection)
+        assert "s.[stg_api_payload] = t.[api_payload]" in order_update
+        assert "[stg_monday_parent_item_id] = t.[monday_item_id]" in subitem_update
+        assert "sub.[stg_parent_stg_id] = t.[stg_id]" in subitem_update
+
+    def test_payload_column_optional(self, staging_ops, monkeypatch):
+        monkeypatch.setattr(staging_ops, "get_table_columns", lambda table_name: ["stg_id", "stg_monday_item_id"])
+
+        staging_ops.update_staging_with_monday_ids([(1, 100, None)])
+
+        assert "stg_api_payload" not in updates(staging_ops.connection)[0]
+
+    def test_repeated_ids_and_empty_input(self, staging_ops):
+        assert staging_ops.update_staging_with_monday_ids([]) == (0, 0)
+        assert staging_ops.connection.statements == []
+
+        staging_ops.update_staging_with_monday_ids([(1, 100, None), (2, 200, None), (1, 101, "retry")])
+        assert staging_ops.connection.batches[0] == [(1, 101, "retry"), (2, 200, None)]
+
+    def test_failed_propagation_keeps_item_ids(self, staging_ops):
+        staging_ops.connection.fail_on = "STG_MON_CustMasterSchedule_Subitems"
+
+        assert staging_ops.update_staging_with_monday_ids([(1, 100, None)]) == (1, 0)
+        assert staging_ops.connection.commits == 1 and staging_ops.connection.rollbacks == 1
+        assert len(updates(staging_ops.connection)) == 1, "the item ID UPDATE is committed"
+
+    def test_failed_item_update_rolls_back(self, staging_ops):
+        staging_ops.connection.fail_on = "SET s.[stg_status] = 'API_SUCCESS'"
+
+        with pytest.raises(RuntimeError):
+            staging_ops.update_staging_with_monday_ids([(1, 100, None)])
+        assert staging_ops.connection.commits == 0 and staging_ops.connection.rollbacks == 1
+
+    def test_single_item_method_delegates(self, staging_ops):
+        assert staging_ops.update_staging_with_monday_id(np.int64(7), np.int64(700))
+        assert staging_ops.connection.batches == [[(7, 700, None)]]
+
+
+class TestSubitemWriteBack:
+
+    def test_subitem_ids_in_one_statement(self, staging_ops):
+        updated = staging_ops.update_subitems_with_monday_ids([(i, 5_000 + i) for i in range(10)])
+
+        assert updated == 10
+        assert len(updates(staging_ops.connection)) == 1 and staging_ops.connection.commits == 1
+        assert "sub.[stg_status] = 'API_SUCCESS'" in updates(staging_ops.connection)[0]
+
+    def test_failures_in_one_statement(self, staging_ops):
+        failed = staging_ops.mark_subitems_as_failed([(i, "No subitem ID returned from API") for i in range(10)])
+
+        assert failed == 10
+        assert "sub.[stg_retry_count] = sub.[stg_retry_count] + 1" in updates(staging_ops.connection)[0]
+        assert staging_ops.mark_subitems_as_failed([]) == 0
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,168 @@
+"""
+Integration Test: db_helper Connection Pool
+===========================================
+Purpose: Validate the pooled connection provider behind db_helper.get_connection
+Requirement: Thread-safe connection pool keyed by db_key
+
+Test Scenarios:
+- close() / leaving a `with` block returns the connection to the pool for reuse
+- Idle connections past idle_timeout are closed, unhealthy ones are replaced
+- Idle connections kept never exceed max_size; checkouts never block
+- Concurrent checkouts from worker threads never share a connection
+
+Success Criteria:
+- N sequential checkouts open exactly 1 physical connection
+- Pool stats report reuse, idle timeouts and health check failures
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+
+import db_helper
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, sql, *params):
+        if self.connection.broken:
+            raise RuntimeError("Communication link failure")
+        return self
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """pyodbc.Connection double"""
+
+    def __init__(self):
+        self.autocommit = False
+        self.broken = False
+        self.closed = False
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        if self.broken:
+            raise RuntimeError("Communication link failure")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def pool():
+    created = []
+
+    def connect():
+        connection = FakeConnection()
+        created.append(connection)
+        return connection
+
+    connection_pool = db_helper.ConnectionPool('orders', max_size=2, idle_timeout=60,
+                                               health_check_after=60, connect=connect)
+    connection_pool.created = created
+    return connection_pool
+
+
+class TestConnectionPool:
+
+    def test_sequential_checkouts_reuse_one_connection(self, pool):
+        for _ in range(5):
+            with pool.acquire() as conn:
+                conn.cursor().execute("SELECT 1")
+        stats = pool.get_stats()
+        assert len(pool.created) == 1
+        assert stats['connections_reused'] == 4
+        assert pool.created[0].commits == 5, "with-block must commit like pyodbc"
+
+    def test_close_returns_and_autocommit_is_reset(self, pool):
+        conn = pool.acquire()
+        conn.autocommit = True
+        conn.close()
+        conn.close()  # idempotent
+        assert pool.get_stats()['idle'] == 1
+        assert pool.created[0].autocommit is False
+
+    def test_idle_timeout_and_health_check(self, pool):
+        pool.acquire().close()
+        pool.idle_timeout = 0
+        time.sleep(0.01)
+        pool.acquire().close()
+        assert pool.created[0].closed
+        assert pool.get_stats()['closed_idle_timeout'] == 1
+
+        pool.idle_timeout = 60
+        pool.health_check_after = 0
+        pool.created[1].broken = False
+        conn = pool.acquire()
+        conn.close()
+        pool.created[1].broken = True
+        conn = pool.acquire()
+        assert conn.raw_connection is not pool.created[1]
+        assert pool.get_stats()['health_check_failures'] == 1
+
+    def test_max_size_bounds_idle_connections(self, pool):
+        held = [pool.acquire() for _ in range(4)]
+        for conn in held:
+            conn.close()
+        stats = pool.get_stats()
+        assert stats['idle'] == 2
+        assert stats['closed_pool_full'] == 2
+        assert stats['in_use'] == 0
+
+    def test_threads_never_share_a_connection(self, pool):
+        in_use = set()
+        lock = threading.Lock()
+        errors = []
+
+        def worker():
+            for _ in range(20):
+                with pool.acquire() as conn:
+                    raw = id(conn.raw_connection)
+                    with lock:
+                        if raw in in_use:
+                            errors.append(raw)
+                        in_use.add(raw)
+                    time.sleep(0.001)
+                    with lock:
+                        in_use.discard(raw)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert pool.get_stats()['in_use'] == 0
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
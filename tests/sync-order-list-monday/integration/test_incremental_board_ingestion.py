@@ -0,0 +1,231 @@
+"""
+Integration Test: Incremental (Delta) Board Ingestion
+=====================================================
+Purpose: Validate load_boards --incremental: updated_at watermark in the registry,
+         changed-items fetch, MERGE into MON_* and ID-only delete detection
+Requirement: Incremental board ingestion using updated_at watermarks
+
+Test Scenarios:
+- Only items updated since the watermark are built, staged and merged (no atomic swap)
+- Deleted items are detected from the ID-only harvest
+- The watermark advances to the newest updated_at; other registry fields are kept
+- A watermark near midnight still finds items whose account-timezone date is the day before
+- staging_helper.upsert_into_production MERGEs on the key and refuses schema drift (columns and types)
+
+Success Criteria:
+- 2,000 item board with 3 changed items: 3 rows staged, 1 MERGE, 1 DELETE
+"""
+
+import os
+import sys
+import json
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "ingestion"))
+os.environ.setdefault("MONDAY_API_KEY", "test-token")
+
+import staging_helper
+import load_boards
+
+WATERMARK = "2025-08-20T10:00:00Z"
+BOARD_ID = 123
+
+
+class FakeBoard:
+    """Monday.com GraphQL double: 2,000 items, 3 changed after the watermark"""
+
+    def __init__(self, item_count=2000, utc_offset_hours=0):
+        self.items = [
+            {"id": str(i), "name": f"Item {i}", "updated_at": "2025-08-01T08:00:00Z",
+             "group": {"title": "Group"}, "column_values": []}
+            for i in range(1, item_count + 1)
+        ]
+        self.items[5]["updated_at"] = "2025-08-20T09:00:00Z"   # same day, before watermark
+        for index, updated_at in ((10, "2025-08-20T10:00:00Z"), (11, "2025-08-21T07:30:00Z"),
+                                  (12, "2025-08-22T12:00:00Z")):
+            self.items[index]["updated_at"] = updated_at
+        self.utc_offset_hours = utc_offset_hours
+        self.queries = []
+
+    def account_date(self, updated_at):
+        """Day of updated_at in the account timezone (what Monday.com compares UPDATED_AT on)"""
+        timestamp = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+        return (timestamp + timedelta(hours=self.utc_offset_hours)).strftime("%Y-%m-%d")
+
+    def gql_request(self, query, variables=None):
+        self.queries.append(query)
+        items = self.items
+        since = re.search(r'compare_value: \["EXACT", "([\d-]+)"\]', query)
+        if since:
+            items = [item for item in items if self.account_date(item["updated_at"]) >= since.group(1)]
+        limit = int(re.search(r'limit: (\d+)', query).group(1))
+        cursor = re.search(r'cursor: "(\d+)"', query)
+        offset = int(cursor.group(1)) if cursor else 0
+        page = items[offset:offset + limit]
+        next_cursor = str(offset + limit) if offset + limit < len(items) else None
+        if "items { id }" in query:
+            page = [{"id": item["id"]} for item in page]
+        return {"boards": [{"items_page": {"cursor": next_cursor, "items": page}}]}
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    registry_path = tmp_path / "registry.json"
+    registry_path.write_text(json.dumps({
+        "boards": {str(BOARD_ID): {"board_name": "Test", "status": "discovered", "last_updated_at": WATERMARK}},
+        "metadata": {"version": "1.0", "updated_at": WATERMARK}
+    }))
+    monkeypatch.setattr(load_boards, "get_registry_path", lambda: registry_path)
+    return registry_path
+
+
+@pytest.fixture
+def board(monkeypatch):
+    fake_board = FakeBoard()
+    monkeypatch.setattr(load_boards, "gql_request", fake_board.gql_request)
+    monkeypatch.setattr(load_boards.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(load_boards, "fetch_board_schema_from_metadata", lambda board_id: ("Item", {}))
+    return fake_board
+
+
+@pytest.fixture
+def staging_calls(monkeypatch):
+    calls = {}
+    monkeypatch.setattr(load_boards, "prepare_staging_table", lambda df, metadata: calls.setdefault("prepared", len(df)))
+    monkeypatch.setattr(load_boards, "load_to_staging_table", lambda df, metadata: calls.setdefault("staged", df))
+    monkeypatch.setattr(load_boards, "atomic_swap_tables", lambda metadata: calls.setdefault("swapped", True))
+    monkeypatch.setattr(staging_helper, "get_table_columns", lambda table, db_name: ["Item", "Item ID"])
+    monkeypatch.setattr(staging_helper, "upsert_into_production",
+                        lambda stg, prod, db_name, keys: calls.setdefault("merged", (stg, prod, keys)) and 3)
+    monkeypatch.setattr(staging_helper, "delete_missing_rows",
+                        lambda prod, db_name, key, live: calls.setdefault("live_ids", live) and 0)
+    return calls
+
+
+METADATA = {"board_name": "Test", "table_name": "MON_Test", "database": "orders", "columns": []}
+
+
+class TestIncrementalBoardIngestion:
+
+    def test_only_changed_items_are_merged(self, registry, board, staging_calls):
+        load_boards.execute_etl_pipeline(BOARD_ID, METADATA, incremental=True)
+
+        assert "swapped" not in staging_calls, "incremental runs must not drop and recreate the table"
+        assert staging_calls["merged"] == ("swp_MON_Test", "MON_Test", ["Item ID"])
+        assert sorted(staging_calls["staged"]["Item ID"]) == [11, 12, 13]
+        assert len(staging_calls["live_ids"]) == 2000
+        assert 'compare_attribute: "UPDATED_AT"' in board.queries[0]
+        print(f"✅ 2,000 item board: {len(staging_calls['staged'])} changed rows merged, "
+              f"{len(board.queries)} API pages")
+
+    def test_watermark_advances_and_registry_entry_is_kept(self, registry, board, staging_calls):
+        load_boards.execute_etl_pipeline(BOARD_ID, METADATA, incremental=True)
+
+        entry = json.loads(registry.read_text())["boards"][str(BOARD_ID)]
+        assert entry["last_updated_at"] == "2025-08-22T12:00:00Z"
+        assert entry["board_name"] == "Test" and entry["status"] == "discovered"
+
+    def test_watermark_near_midnight_in_account_timezone(self, registry, board, staging_calls):
+        board.utc_offset_hours = -5
+        board.items[20]["updated_at"] = "2025-08-21T00:20:00Z"   # 2025-08-20 19:20 in the account timezone
+        registry.write_text(json.dumps({"boards": {str(BOARD_ID): {"last_updated_at": "2025-08-21T00:10:00Z"}},
+                                        "metadata": {"version": "1.0"}}))
+
+        load_boards.execute_etl_pipeline(BOARD_ID, METADATA, incremental=True)
+
+        assert '"2025-08-20"' in board.queries[0], "query starts a day before the watermark"
+        assert sorted(staging_calls["staged"]["Item ID"]) == [12, 13, 21]
+        assert load_boards.get_board_watermark(BOARD_ID) == "2025-08-22T12:00:00Z"
+
+    def test_no_watermark_runs_full_load(self, registry, board, staging_calls):
+        registry.write_text(json.dumps({"boards": {}, "metadata": {"version": "1.0"}}))
+
+        load_boards.execute_etl_pipeline(BOARD_ID, METADATA, incremental=True)
+
+        assert staging_calls["swapped"] and "merged" not in staging_calls
+        assert len(staging_calls["staged"]) == 2000
+        assert load_boards.get_board_watermark(BOARD_ID) == "2025-08-22T12:00:00Z"
+
+
+class TestStagingUpsert:
+
+    @pytest.fixture
+    def database(self, monkeypatch):
+        columns = [("Item", "nvarchar", 255, None, None), ("Item ID", "bigint", None, 19, 0),
+                   ("Status", "nvarchar", 100, None, None)]
+        tables = {"swp_MON_Test": list(columns), "MON_Test": list(columns)}
+        statements = []
+        monkeypatch.setattr(staging_helper.db, "run_query", lambda sql, db_name, params=None: pd.DataFrame(
+            tables.get(params[0], []), columns=["COLUMN_NAME", "DATA_TYPE", "CHARACTER_MAXIMUM_LENGTH",
+                                                "NUMERIC_PRECISION", "NUMERIC_SCALE"]))
+        monkeypatch.setattr(staging_helper.db, "execute",
+                            lambda sql, db_name, params=None: statements.append((' '.join(sql.split()), params)) or 3)
+        return tables, statements
+
+    def test_merge_on_key_columns(self, database):
+        tables, statements = database
+
+        affected = staging_helper.upsert_into_production("swp_MON_Test", "MON_Test", "orders", ["Item ID"])
+
+        merge_sql = statements[0][0]
+        assert affected == 3
+        assert "ON tgt.[Item ID] = src.[Item ID]" in merge_sql
+        assert "UPDATE SET tgt.[Item] = src.[Item], tgt.[Status] = src.[Status]" in merge_sql
+        assert "WHEN NOT MATCHED BY TARGET" in merge_sql
+        assert statements[1][0] == "DROP TABLE IF EXISTS dbo.swp_MON_Test;"
+
+    def test_schema_drift_raises(self, database):
+        tables, statements = database
+        tables["swp_MON_Test"].append(("New Column", "nvarchar", 255, None, None))
+
+        with pytest.raises(ValueError):
+            staging_helper.upsert_into_production("swp_MON_Test", "MON_Test", "orders", ["Item ID"])
+        assert statements == [], "staging table is preserved for the full-reload fallback"
+
+    @pytest.mark.parametrize("staging_column, drifts", [
+        (("Status", "nvarchar", 255, None, None), True),    # wider than production: truncation
+        (("Status", "nvarchar", -1, None, None), True),     # NVARCHAR(MAX) into NVARCHAR(100)
+        (("Status", "int", None, 10, 0), True),             # type inferred from the changed subset
+        (("Status", "nvarchar", 50, None, None), False),    # narrower fits
+    ])
+    def test_column_type_drift_raises(self, database, staging_column, drifts):
+        tables, statements = database
+        tables["swp_MON_Test"][2] = staging_column
+
+        if drifts:
+            with pytest.raises(ValueError, match="column types"):
+                staging_helper.upsert_into_production("swp_MON_Test", "MON_Test", "orders", ["Item ID"])
+            assert statements == []
+        else:
+            assert staging_helper.upsert_into_production("swp_MON_Test", "MON_Test", "orders", ["Item ID"]) == 3
+
+    def test_delete_missing_rows_sends_one_json_parameter(self, database):
+        tables, statements = database
+
+        staging_helper.delete_missing_rows("MON_Test", "orders", "Item ID", [1, 2, 3])
+        staging_helper.delete_missing_rows("MON_Test", "orders", "Item ID", [])
+
+        assert len(statements) == 1, "an empty harvest must never wipe the table"
+        assert "OPENJSON(?)" in statements[0][0]
+        assert json.loads(statements[0][1][0]) == [1, 2, 3]
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,159 @@
+"""
+Integration Test: Vectorized Type Coercion in load_boards.clean_dataframe
+=========================================================================
+Purpose: Validate that the vectorized date/numeric/string coercion produces exactly the
+         same DataFrame as the per-cell safe_*_convert functions it replaces
+Requirement: Vectorized type coercion in load_boards.clean_dataframe
+
+Test Scenarios:
+- Every Monday.com value shape (JSON dates, ISO datetimes, null tokens, 1,200 / $5 / 1e5,
+  whitespace, out-of-range years, mixed types) matches Series.apply(safe_*_convert)
+- Column plan comes from process_metadata_columns (custom_sql_type wins, excluded skipped)
+- Benchmark: synthetic 100k x 80 board frame (RUN_BENCHMARKS=1), per-cell vs vectorized
+
+Success Criteria:
+- DataFrames (values and dtypes) identical after clean_dataframe + make_sql_safe
+"""
+
+import os
+import sys
+import time
+import datetime
+import logging
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "ingestion"))
+os.environ.setdefault("MONDAY_API_KEY", "test-token")
+
+import load_boards
+
+DATE_VALUES = ['2025-06-13', ' 2025-06-13 ', '{"date":"2025-06-13","icon":""}', '{"date":"2025-06-13"}',
+               '{"date":"2025-06-13","time":null}', '{"date":"","icon":""}', '{"date":"2025-13-01","icon":""}',
+               '2025-08-20T10:00:00Z', '2025-08-20T10:00:00.123Z', '2025-08-20T10:00:00', '06/13/2025',
+               '1700-01-01', '3000-01-01', '2025-02-30', 'None', 'null', 'NaT', '', '   ', 'nan', None, np.nan,
+               'not a date', '2025-6-1', 'June 13, 2025', '20250613']
+NUMERIC_VALUES = ['1', ' 42 ', '-7', '+5', '007', '1.5', '.5', '5.', '-0.25', '1.5e3', '1e5', '1,200', '$5',
+                  '1_000', '12345678901234567890', 'None', 'NULL', 'nan', '', ' ', 'abc', '1.2.3', None, np.nan,
+                  'inf', '٣', '3.0']
+STRING_VALUES = ['Open', '  padded  ', 'None', 'null', 'nan', '', '   ', 'NaN', 'none', None, np.nan, 'Ünïcödé']
+
+# Typical board: mostly well-formed values, a few irregular ones per column
+BENCHMARK_POOLS = {
+    "date": ['2025-06-13', '2024-12-01', '{"date":"2025-06-13","icon":""}', '2025-08-20T10:00:00Z', '', None,
+             '06/13/2025'],
+    "numbers": ['1', '250', '1.5', '-0.25', '', None, '1,200'],
+}
+
+
+def legacy_clean_dataframe(df, metadata):
+    """clean_dataframe as it was: Series.apply with the scalar converters on every column"""
+    for title, kind, sql_type, monday_type in load_boards.build_coercion_plan(metadata):
+        if title not in df.columns:
+            continue
+        converter = {"date": load_boards.safe_date_convert, "numeric": load_boards.safe_numeric_convert,
+                     "string": load_boards.safe_string_convert}[kind]
+        df[title] = df[title].apply(converter)
+    return df.where(pd.notna(df), None)
+
+
+def make_metadata(column_count):
+    kinds = [("date", "DATE"), ("numbers", "DECIMAL(18,2)"), ("text", "NVARCHAR(255)"), ("status", "NVARCHAR(50)")]
+    columns = []
+    for i in range(column_count):
+        monday_type, sql_type = kinds[i % len(kinds)]
+        columns.append({"monday_id": f"col_{i}", "monday_title": f"Column {i}", "monday_type": monday_type,
+                        "sql_type": sql_type, "extraction_field": "text"})
+    return {"columns": columns}
+
+
+def make_board_frame(rows, metadata, seed=7, pools=None):
+    rng = np.random.default_rng(seed)
+    pools = pools or {"date": DATE_VALUES, "numbers": NUMERIC_VALUES}
+    frame = {}
+    for column in metadata["columns"]:
+        pool = pools.get(column["monday_type"], STRING_VALUES)
+        frame[column["monday_title"]] = pd.Series([pool[i] for i in rng.integers(0, len(pool), rows)], dtype=object)
+    return pd.DataFrame(frame)
+
+
+def assert_frames_identical(expected, actual):
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+    for column in expected.columns:
+        assert [repr(v) for v in actual[column]] == [repr(v) for v in expected[column]], column
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs():
+    logging.getLogger("load_boards").setLevel(logging.WARNING)
+    yield
+    logging.getLogger("load_boards").setLevel(logging.INFO)
+
+
+class TestVectorizedCoercion:
+
+    @pytest.mark.parametrize("coerce, scalar, values", [
+        (load_boards.coerce_date_series, load_boards.safe_date_convert, DATE_VALUES),
+        (load_boards.coerce_numeric_series, load_boards.safe_numeric_convert, NUMERIC_VALUES),
+        (load_boards.coerce_string_series, load_boards.safe_string_convert, STRING_VALUES),
+    ])
+    def test_series_match_scalar_converters(self, coerce, scalar, values):
+        for series in (pd.Series(values, dtype=object), pd.Series([v for v in values if isinstance(v, str)]),
+                       pd.Series(values[:3], dtype=object), pd.Series([None, None], dtype=object),
+                       pd.Series([], dtype=object), pd.Series([1.5, np.nan, 3.0]), pd.Series([1, 2, 3]),
+                       pd.Series([datetime.date(2025, 1, 1), '2025-01-02', 7, None], dtype=object)):
+            expected = series.apply(scalar)
+            pd.testing.assert_series_equal(coerce(series), expected, check_exact=True)
+            assert [repr(v) for v in coerce(series)] == [repr(v) for v in expected]
+
+    def test_clean_dataframe_identical_to_per_cell(self):
+        metadata = make_metadata(16)
+        metadata["columns"][2]["custom_sql_type"] = "INT"
+        metadata["columns"][3]["exclude"] = True
+        df = make_board_frame(2000, metadata)
+
+        expected = load_boards.make_sql_safe(legacy_clean_dataframe(df.copy(), metadata))
+        actual = load_boards.make_sql_safe(load_boards.clean_dataframe(df.copy(), metadata))
+
+        assert_frames_identical(expected, actual)
+        assert load_boards.build_coercion_plan(metadata)[2][1] == "numeric", "custom_sql_type drives the plan"
+        assert "Column 3" not in [title for title, *_ in load_boards.build_coercion_plan(metadata)]
+
+    @pytest.mark.skipif(not os.getenv("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run the 100k x 80 benchmark")
+    def test_benchmark_100k_by_80(self):
+        metadata = make_metadata(80)
+        df = make_board_frame(100_000, metadata, pools=BENCHMARK_POOLS)
+        sample = df.head(10_000)
+
+        # Per-cell path on a 10k-row sample (the full frame takes minutes), scaled to 100k
+        start = time.perf_counter()
+        expected = legacy_clean_dataframe(sample.copy(), metadata)
+        per_cell = (time.perf_counter() - start) * len(df) / len(sample)
+
+        start = time.perf_counter()
+        actual = load_boards.clean_dataframe(df.copy(), metadata)
+        vectorized = time.perf_counter() - start
+
+        assert_frames_identical(expected, actual.head(len(sample)))
+        print(f"✅ 100k x 80 board frame: per-cell ~{per_cell:.1f}s (10k sample x10), vectorized {vectorized:.2f}s "
+              f"(~{per_cell / vectorized:.0f}x)")
+        assert vectorized < per_cell
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,138 @@
+"""
+Integration Test: Monday.com Persistent Session & Connection Reuse
+==================================================================
+Purpose: Validate the long-lived client mode of MondayAPIClient (one event loop +
+         one keep-alive connection pool per sync run)
+Requirement: Persistent pooled aiohttp session and event loop for MondayAPIClient
+
+Test Scenarios:
+- Per-call mode creates a new session/connection for every GraphQL call
+- Persistent mode reuses one session and its pooled connections across execute() calls
+- close_session() releases the loop and reports connection reuse statistics
+- Worker threads sharing one client count every request (stats updates are locked)
+
+Success Criteria:
+- Persistent mode: exactly 1 session created for N calls
+- Persistent mode: connection reuse rate >= 75% over 5+ sequential calls
+- Per-call mode: 0% reuse (baseline for per-batch latency comparison)
+"""
+
+import sys
+import socket
+import asyncio
+import threading
+import pytest
+from pathlib import Path
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from aiohttp import web
+from src.pipelines.sync_order_list.monday_api_client import MondayAPIClient
+
+
+@pytest.fixture(scope="module")
+def local_graphql_server():
+    """Minimal local GraphQL endpoint returning a create_item payload"""
+    async def handler(request):
+        return web.json_response({"data": {"create_item": {"id": "1234567890"}}})
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_post("/v2", handler)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    started.wait(timeout=10)
+    yield f"http://127.0.0.1:{port}/v2"
+    loop.call_soon_threadsafe(loop.stop)
+
+
+@pytest.fixture
+def client(local_graphql_server):
+    """MondayAPIClient using the repository sync config, pointed at the local endpoint"""
+    config_path = repo_root / "configs" / "pipelines" / "sync_order_list.toml"
+    api_client = MondayAPIClient(str(config_path), environment="development")
+    api_client.api_url = local_graphql_server
+    return api_client
+
+
+class TestMondayPersistentSession:
+    """Connection reuse behaviour of the Monday.com API client"""
+
+    def test_per_call_mode_creates_new_connections(self, client):
+        for _ in range(3):
+            result = client._run(client._make_api_call("query { me { id } }", {}))
+            assert result['success']
+
+        stats = client.get_connection_stats()
+        assert stats['mode'] == 'per_call'
+        assert stats['sessions_created'] == 3
+        assert stats['connections_reused'] == 0
+        print(f"✅ Per-call baseline: {stats['connections_created']} connections for {stats['requests']} requests")
+
+    def test_persistent_mode_reuses_connections(self, client):
+        with client:
+            assert client.session_open
+            for _ in range(5):
+                result = client._run(client._make_api_call("query { me { id } }", {}))
+                assert result['success']
+
+        assert not client.session_open
+        stats = client.get_connection_stats()
+        assert stats['mode'] == 'persistent'
+        assert stats['sessions_created'] == 1
+        assert stats['requests'] == 5
+        assert stats['reuse_rate_percent'] >= 75.0, f"Reuse rate too low: {stats['reuse_rate_percent']:.1f}%"
+        print(f"✅ Persistent mode: {stats['connections_reused']}/{stats['requests']} requests reused a pooled connection")
+
+    def test_close_session_is_idempotent(self, client):
+        client.open_session()
+        first = client.close_session()
+        second = client.close_session()
+        assert first['requests'] == second['requests'] == 0
+        assert not client.session_open
+
+    def test_worker_threads_share_stats_without_lost_updates(self, client):
+        def worker():
+            with client:
+                for _ in range(3):
+                    result = client._run(client._make_api_call("query { me { id } }", {}))
+                    assert result['success']
+
+        workers = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        stats = client.get_connection_stats()
+        assert stats['requests'] == 12
+        assert stats['sessions_created'] == 4
+        assert stats['connections_created'] + stats['connections_reused'] == 12
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,120 @@
+"""
+Integration Test: Monday.com Adaptive Rate Limiter
+==================================================
+Purpose: Validate the shared token-bucket limiter used by the sync client, the async
+         batch updater and the async board loader
+Requirement: Adaptive rate limiter driven by Monday.com complexity budget
+
+Test Scenarios:
+- Complexity field is injected into queries/mutations and stripped from responses
+- Remaining budget from `complexity { after reset_in_x_seconds }` gates new requests
+- Rate limit errors (retry_in_seconds / 429) pause callers and halve concurrency
+- Clean responses grow concurrency back up to [performance] max_concurrency
+
+Success Criteria:
+- No request is released while the complexity budget is exhausted
+- Concurrency never exceeds the adaptive limit
+"""
+
+import sys
+import time
+import asyncio
+import pytest
+from pathlib import Path
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from src.pipelines.utils.monday_config import MondayConfig
+from src.pipelines.utils.monday_rate_limiter import MondayRateLimiter, with_complexity
+
+
+def make_limiter(**overrides) -> MondayRateLimiter:
+    settings = dict(requests_per_minute=6000, complexity_per_minute=1000000, min_concurrency=1,
+                    max_concurrency=8, initial_concurrency=4, default_query_complexity=1000,
+                    increase_after_successes=3, complexity_reserve=0.0)
+    settings.update(overrides)
+    return MondayRateLimiter(**settings)
+
+
+class TestMondayRateLimiter:
+
+    def test_complexity_field_injection(self):
+        mutation = "mutation BatchUpdateItems($itemId_0: ID!) { update_0: change_multiple_column_values(item_id: $itemId_0) { id } }"
+        instrumented = with_complexity(mutation)
+        assert instrumented.startswith("mutation BatchUpdateItems($itemId_0: ID!) { complexity {")
+        assert with_complexity(instrumented) == instrumented
+        assert "complexity {" in with_complexity("{ boards(ids: 1) { id } }")
+
+    def test_observe_strips_complexity_and_applies_budget(self):
+        limiter = make_limiter()
+        response = {'data': {'update_0': {'id': '1'},
+                             'complexity': {'before': 1000000, 'after': 400, 'query': 999600, 'reset_in_x_seconds': 0.3}}}
+        assert not limiter.observe(response)
+        assert 'complexity' not in response['data']
+        assert limiter.get_stats()['complexity_remaining'] < 1000
+
+        async def timed_acquire():
+            start = time.monotonic()
+            async with limiter.slot(complexity=500):
+                return time.monotonic() - start
+
+        waited = asyncio.run(timed_acquire())
+        assert waited >= 0.2, f"Request released before budget reset ({waited:.2f}s)"
+
+    def test_rate_limit_error_pauses_and_reduces_concurrency(self):
+        limiter = make_limiter()
+        error = {'errors': [{'message': 'Rate limit exceeded',
+                             'extensions': {'code': 'FIELD_MINUTE_RATE_LIMIT_EXCEEDED', 'retry_in_seconds': 0.3}}]}
+        assert limiter.observe(error)
+        assert limiter.concurrency == 2
+
+        start = time.monotonic()
+        asyncio.run(limiter.acquire(complexity=1))
+        assert time.monotonic() - start >= 0.2
+        limiter.release()
+
+        assert limiter.observe(None, status=429, headers={'Retry-After': '0'})
+        assert limiter.concurrency == 1
+
+    def test_concurrency_grows_and_is_enforced(self):
+        limiter = make_limiter(initial_concurrency=2)
+        for _ in range(3):
+            limiter.observe({'data': {}})
+        assert limiter.concurrency == 3
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def request():
+            nonlocal in_flight, max_in_flight
+            async with limiter.slot(complexity=1):
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.02)
+                in_flight -= 1
+
+        async def run_all():
+            await asyncio.gather(*(request() for _ in range(12)))
+
+        asyncio.run(run_all())
+        assert max_in_flight == 3
+
+    def test_from_repository_config(self):
+        limiter = MondayRateLimiter.from_config(MondayConfig(repo_root / "configs" / "pipelines" / "monday_boards.toml"))
+        assert limiter.complexity_per_minute == 1000000
+        assert limiter.min_concurrency <= limiter.concurrency <= limiter.max_concurrency
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,189 @@
+"""
+Integration Test: Set-Based NEW/EXISTING Order Classification
+=============================================================
+Purpose: Validate detect_new_orders server-side (UPDATE...FROM + OUTPUT/GROUP BY) and
+         pandas (vectorized isin) modes against the same data
+Requirement: Vectorized NEW/EXISTING classification in EnhancedMergeOrchestrator.detect_new_orders
+
+Test Scenarios:
+- Server mode classifies with one UPDATE, no source rows are fetched into Python
+- Pandas mode issues at most one UPDATE per sync_state (no IN (?,?,...) chunks)
+- Both modes report the same stats dict
+
+Success Criteria:
+- 5,000 source records: statement count constant, identical customer_breakdown
+"""
+
+import sys
+import json
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from src.pipelines.sync_order_list import merge_orchestrator as merge_orchestrator_module
+from src.pipelines.sync_order_list.merge_orchestrator import EnhancedMergeOrchestrator
+
+CUSTOMERS = ['GREYSON', 'tracksmith', None, 'JOHNNIE-O']
+
+
+def make_source(count):
+    return [(f"00000000-0000-0000-0000-{i:012d}", f"AAG-{i % 3000}", CUSTOMERS[i % len(CUSTOMERS)])
+            for i in range(count)]
+
+
+class FakeOrdersDatabase:
+    """SQL Server double: source/target tables in memory, emulates the detection statements"""
+
+    def __init__(self, source, target_orders):
+        self.source = source
+        self.target_orders = target_orders
+        self.sync_state = {}
+        self.statements = []
+        self.rows_fetched = 0
+        self._result = []
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, *params):
+        text = ' '.join(sql.split())
+        self.statements.append(text)
+        if text.startswith('SELECT COUNT(DISTINCT'):
+            self._result = [(len(self.target_orders),)]
+        elif text.startswith('SELECT DISTINCT [AAG ORDER NUMBER]'):
+            self._result = [(order,) for order in self.target_orders]
+        elif text.startswith('SELECT record_uuid'):
+            self._result = list(self.source)
+        elif text.startswith('UPDATE s SET'):
+            self.customer_keys = {}
+            for record_uuid, order, customer in self.source:
+                self.sync_state[record_uuid] = 'EXISTING' if self._order_exists(text, order) else 'NEW'
+                self.customer_keys[record_uuid] = self._customer_key(text, customer)
+        elif text.startswith('SELECT [customer_key]'):
+            counts = {}
+            for record_uuid, key in self.customer_keys.items():
+                column = 0 if self.sync_state[record_uuid] == 'NEW' else 1
+                counts.setdefault(key, [0, 0])[column] += 1
+            self._result = [(key, new, existing) for key, (new, existing) in counts.items()]
+        elif text.startswith('UPDATE'):
+            for record_uuid in json.loads(params[1]):
+                self.sync_state[record_uuid] = params[0]
+        return self
+
+    def _order_exists(self, text, order):
+        """Join semantics: BIN2 + '|' sentinel is exact, the column collation ignores case and trailing spaces"""
+        if "+ N'|') COLLATE Latin1_General_BIN2" in text:
+            return order in self.target_orders
+        return order.rstrip().upper() in {target.rstrip().upper() for target in self.target_orders}
+
+    def _customer_key(self, text, customer):
+        """OUTPUT key as stored in #new_order_classification"""
+        if "LEN(inserted.[CUSTOMER NAME] + N'|') = 1" in text:
+            return ('UNKNOWN' if not customer else customer.upper()) + '|'
+        return customer.upper() if customer and customer.strip() else 'UNKNOWN'
+
+    def fetchall(self):
+        self.rows_fetched += len(self._result)
+        return self._result
+
+    def fetchone(self):
+        return self._result[0]
+
+    def commit(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.fixture
+def orchestrator():
+    merge_orchestrator = EnhancedMergeOrchestrator.__new__(EnhancedMergeOrchestrator)
+    merge_orchestrator.logger = logging.getLogger(__name__)
+    merge_orchestrator.transformation_config = {}
+    merge_orchestrator.config = SimpleNamespace(source_table='swp_ORDER_LIST_SYNC', target_table='FACT_ORDER_LIST',
+                                                database_connection='orders')
+    return merge_orchestrator
+
+
+def run_detection(orchestrator, monkeypatch, mode, source=None, target_orders=None):
+    database = FakeOrdersDatabase(make_source(5000) if source is None else source,
+                                  {f"AAG-{i}" for i in range(0, 3000, 2)} if target_orders is None else target_orders)
+    monkeypatch.setattr(merge_orchestrator_module.db, 'get_connection', lambda *args, **kwargs: database)
+    return orchestrator.detect_new_orders(mode=mode), database
+
+
+class TestSetBasedNewOrderDetection:
+
+    def test_server_mode_keeps_rows_in_sql_server(self, orchestrator, monkeypatch):
+        result, database = run_detection(orchestrator, monkeypatch, 'server')
+
+        updates = [s for s in database.statements if s.startswith('UPDATE')]
+        assert result['success']
+        assert len(updates) == 1 and 'LEFT JOIN' in updates[0] and 'OUTPUT' in updates[0]
+        assert database.rows_fetched == len(result['customer_breakdown']), "Only per-customer counts are fetched"
+        assert result['total_source_records'] == 5000
+        assert set(database.sync_state.values()) == {'NEW', 'EXISTING'}
+
+    def test_pandas_mode_one_update_per_state(self, orchestrator, monkeypatch):
+        result, database = run_detection(orchestrator, monkeypatch, 'pandas')
+
+        updates = [s for s in database.statements if s.startswith('UPDATE')]
+        assert result['success']
+        assert len(updates) == 2 and all('OPENJSON(?)' in u for u in updates)
+        assert len(database.sync_state) == 5000
+
+    def test_modes_report_identical_stats(self, orchestrator, monkeypatch):
+        server, server_db = run_detection(orchestrator, monkeypatch, 'server')
+        pandas_result, pandas_db = run_detection(orchestrator, monkeypatch, 'pandas')
+
+        for key in ('total_source_records', 'new_orders', 'existing_orders', 'existing_in_target',
+                    'updated_records', 'customer_breakdown', 'accuracy_percentage'):
+            assert server[key] == pandas_result[key], key
+        assert server_db.sync_state == pandas_db.sync_state
+        assert server['customer_breakdown']['UNKNOWN']['new'] + server['customer_breakdown']['UNKNOWN']['existing'] == 1250
+        print(f"✅ 5,000 records: server {len(server_db.statements)} statements / {server_db.rows_fetched} rows fetched, "
+              f"pandas {len(pandas_db.statements)} statements / {pandas_db.rows_fetched} rows fetched")
+
+    def test_modes_agree_on_case_and_trailing_spaces(self, orchestrator, monkeypatch):
+        source = [
+            ("00000000-0000-0000-0000-000000000001", "AAG-1", "greyson"),
+            ("00000000-0000-0000-0000-000000000002", "aag-1", "GREYSON"),
+            ("00000000-0000-0000-0000-000000000003", "AAG-2 ", "  "),
+            ("00000000-0000-0000-0000-000000000004", "AAG-2", ""),
+            ("00000000-0000-0000-0000-000000000005", "AAG-3", "TRACKSMITH "),
+        ]
+        target_orders = {"AAG-1", "AAG-2", "AAG-3"}
+
+        server, server_db = run_detection(orchestrator, monkeypatch, 'server', source, target_orders)
+        pandas_result, pandas_db = run_detection(orchestrator, monkeypatch, 'pandas', source, target_orders)
+
+        update = next(s for s in server_db.statements if s.startswith('UPDATE s SET'))
+        assert 'COLLATE Latin1_General_BIN2' in update
+        assert server_db.sync_state == pandas_db.sync_state
+        assert server_db.sync_state["00000000-0000-0000-0000-000000000002"] == 'NEW'
+        assert server_db.sync_state["00000000-0000-0000-0000-000000000003"] == 'NEW'
+        assert server['customer_breakdown'] == pandas_result['customer_breakdown']
+        assert set(server['customer_breakdown']) == {'GREYSON', '  ', 'UNKNOWN', 'TRACKSMITH '}
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,214 @@
+"""
+Integration Test: Concurrent Per-File ORDER_LIST Extract and Blob Upload
+========================================================================
+Purpose: Validate that order_list_extract processes customer workbooks with a bounded
+         worker pool (threads for blob/DB I/O, processes for Excel parsing) and that
+         OrderListBlobUploader transfers files concurrently
+Requirement: Concurrent per-file processing in the ORDER_LIST extract stage
+
+Test Scenarios:
+- 8 workbooks with slow download + load finish in ~ceil(8/4) file times, not 8
+- Excel parsing in the process pool returns the same cleaned DataFrame as in-thread parsing
+- Forked parse workers are all started before the first file thread exists
+- A file whose load fails once is retried and reported once, in input order
+- Blob uploads run concurrently and keep the summary keys used by the pipeline
+
+Success Criteria:
+- One aggregated result list with the same per-file keys as the sequential loop
+"""
+
+import io
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "load_order_list"))
+
+import order_list_extract
+import order_list_blob
+
+IO_DELAY = 0.1
+
+
+def make_workbook(customer, rows=50):
+    workbook = Workbook()
+    workbook.active.title = "Notes"
+    sheet = workbook.create_sheet("MASTER")
+    sheet.append(["AAG ORDER NUMBER", "CUSTOMER NAME", "  ORDER   QTY ", None])
+    for i in range(rows):
+        sheet.append([f"AAG-{i}", customer, str(i), None])
+    sheet.append([None, None, None, None])
+    sheet.append(["  ", "", " ", None])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+class FakeSourceContainer:
+    """Blob container double: every download takes IO_DELAY"""
+
+    def __init__(self, files):
+        self.files = files
+
+    def get_blob_client(self, name):
+        container = self
+
+        class Download:
+            def readall(self):
+                time.sleep(IO_DELAY)
+                return container.files[name]
+
+        class BlobClient:
+            def download_blob(self):
+                return Download()
+
+        return BlobClient()
+
+
+@pytest.fixture
+def files():
+    return {f"CUSTOMER {i} ORDER LIST (M3).xlsx": make_workbook(f"CUSTOMER {i}") for i in range(8)}
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    loaded = {"tables": [], "failures": {}}
+
+    def fake_bulk_load(df, table, trg_client):
+        time.sleep(IO_DELAY)
+        if loaded["failures"].get(table, 0) > 0:
+            loaded["failures"][table] -= 1
+            raise RuntimeError("Transaction was deadlocked")
+        loaded["tables"].append(table)
+        return len(df)
+
+    monkeypatch.setattr(order_list_extract, "bulk_load", fake_bulk_load)
+    return loaded
+
+
+class TestConcurrentExtract:
+
+    def test_files_processed_concurrently(self, files, loads):
+        start = time.perf_counter()
+        results = order_list_extract.process_blobs(list(files), FakeSourceContainer(files), None,
+                                                   max_workers=4, parse_workers=0)
+        elapsed = time.perf_counter() - start
+
+        assert [r['file'] for r in results] == list(files)
+        assert all(r['success'] and r['match'] and r['rows_src'] == 50 for r in results)
+        sequential = len(files) * 2 * IO_DELAY
+        assert elapsed < sequential * 0.6, f"{elapsed:.2f}s vs sequential {sequential:.2f}s"
+        print(f"✅ {len(files)} workbooks in {elapsed:.2f}s with 4 workers (sequential I/O alone {sequential:.2f}s)")
+
+    def test_process_pool_parse_matches_in_thread(self, files, loads, monkeypatch):
+        frames = {}
+
+        def capture_bulk_load(df, table, trg_client):
+            frames[table] = df.drop(columns=['_EXTRACTED_AT'])
+            return len(df)
+
+        monkeypatch.setattr(order_list_extract, "bulk_load", capture_bulk_load)
+        order_list_extract.process_blobs(list(files)[:2], FakeSourceContainer(files), None,
+                                         max_workers=2, parse_workers=2)
+
+        name = list(files)[0]
+        expected = order_list_extract.clean_df(order_list_extract.read_excel_with_retry(files[name], "MASTER", name))
+        pd.testing.assert_frame_equal(frames[order_list_extract.safe_table_name(name)].drop(columns=['_SOURCE_FILE']),
+                                      expected)
+        assert list(expected.columns) == ["AAG ORDER NUMBER", "CUSTOMER NAME", "ORDER QTY"]
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="only fork copies thread state")
+    def test_parse_workers_forked_before_file_threads(self, files, loads, monkeypatch):
+        workers_at_thread_start = []
+        thread_pool = order_list_extract.ThreadPoolExecutor
+
+        def recording_thread_pool(*args, **kwargs):
+            workers_at_thread_start.append(len(multiprocessing.active_children()))
+            return thread_pool(*args, **kwargs)
+
+        monkeypatch.setattr(order_list_extract, "ThreadPoolExecutor", recording_thread_pool)
+        results = order_list_extract.process_blobs(list(files)[:2], FakeSourceContainer(files), None,
+                                                   max_workers=2, parse_workers=2)
+
+        assert workers_at_thread_start == [2]
+        assert all(result['success'] for result in results)
+
+    def test_failed_file_is_retried_once(self, files, loads):
+        flaky = list(files)[3]
+        loads["failures"][order_list_extract.safe_table_name(flaky)] = 1
+
+        results = order_list_extract.process_blobs(list(files), FakeSourceContainer(files), None,
+                                                   max_workers=4, parse_workers=0)
+
+        assert [r['file'] for r in results] == list(files)
+        assert results[3]['success'] and results[3]['attempts'] == 2
+        assert all(r['attempts'] == 1 for i, r in enumerate(results) if i != 3)
+        assert len(loads["tables"]) == len(files)
+
+
+class TestConcurrentBlobUpload:
+
+    def test_uploads_run_concurrently(self, monkeypatch):
+        uploaded = []
+        file_infos = [{"Region": "USA", "Subfolder": "ORDER LIST", "FileName": f"C{i} ORDER LIST (M3).xlsx",
+                       "FileURL": "", "DownloadURL": f"https://download/{i}", "Size": 2048} for i in range(8)]
+
+        class Response:
+            content = b"PK\x03\x04" + b"0" * 2048
+
+            def raise_for_status(self):
+                pass
+
+        class BlobClient:
+            def __init__(self, name):
+                self.name = name
+
+            def get_blob_properties(self):
+                raise LookupError("BlobNotFound")
+
+            def upload_blob(self, data, overwrite, metadata):
+                time.sleep(IO_DELAY)
+                uploaded.append(self.name)
+
+        class Container:
+            def get_blob_client(self, name):
+                return BlobClient(name)
+
+        def fake_get(url, headers=None):
+            time.sleep(IO_DELAY)
+            return Response()
+
+        uploader = order_list_blob.OrderListBlobUploader()
+        monkeypatch.setattr(order_list_blob.requests, "get", fake_get)
+        monkeypatch.setattr(uploader, "initialize_services", lambda: setattr(uploader, "blob_client", Container()))
+        monkeypatch.setattr(uploader, "find_and_accumulate_files",
+                            lambda *args, **kwargs: uploader.results.extend(file_infos) if not uploader.results else None)
+
+        start = time.perf_counter()
+        summary = uploader.process_all_files()
+        elapsed = time.perf_counter() - start
+
+        assert summary['files_found'] == summary['files_uploaded'] == 8 and summary['success_rate'] == 100
+        assert [r['blob_name'] for r in summary['results']] == [f['FileName'] for f in file_infos]
+        assert elapsed < 8 * 2 * IO_DELAY * 0.6
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,190 @@
+"""
+Integration Test: Direct In-Memory RAW Table Load for ORDER_LIST Extract
+========================================================================
+Purpose: Validate that order_list_extract.direct_load streams typed rows straight into
+         the x*_ORDER_LIST_RAW table with fast_executemany (no CSV, no blob, no external
+         data source) and that the load method is selectable per run
+Requirement: Direct in-memory bulk load that skips the CSV-to-blob round trip
+
+Test Scenarios:
+- Rows are sent in DIRECT_CHUNK_ROWS chunks in one transaction, then row count verified
+- NULL semantics match the CSV path: '' / NaN / NaT → NULL, tz-aware datetimes → naive UTC
+- process_blobs(load_method='direct') never touches bulk_load / the target container
+- Unknown load methods are rejected
+- Against a real SQL Server (ORDER_LIST_DIRECT_TEST_DB=<config.yaml db key>): round trip, no Azure
+
+Success Criteria:
+- Same table schema and row count as bulk_load; blob path still the default
+"""
+
+import io
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "load_order_list"))
+
+import order_list_extract
+
+
+def make_frame(rows):
+    return pd.DataFrame({
+        "AAG ORDER NUMBER": [f"AAG-{i}" for i in range(rows)],
+        "ORDER QTY": [str(i) if i % 7 else "" for i in range(rows)],
+        "NOTES": ["Ünïcödé, \"quoted\"" if i % 3 else "" for i in range(rows)],
+        "_SOURCE_FILE": ["GREYSON ORDER LIST (M3).xlsx"] * rows,
+        "_EXTRACTED_AT": [datetime(2026, 10, 16, 7, 30, tzinfo=timezone.utc)] * rows,
+    })
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.fast_executemany = False
+
+    def execute(self, sql, *params):
+        self.connection.statements.append(sql)
+
+    def executemany(self, sql, rows):
+        assert self.fast_executemany
+        self.connection.batches.append(list(rows))
+        self.connection.insert_sql = sql
+
+    def fetchone(self):
+        return (sum(len(batch) for batch in self.connection.batches),)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements, self.batches, self.commits, self.rollbacks = [], [], 0, 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def connection(monkeypatch):
+    connection = FakeConnection()
+    monkeypatch.setattr(order_list_extract.db_helper, "get_connection", lambda db_key: connection)
+    return connection
+
+
+class TestDirectLoad:
+
+    def test_rows_sent_in_chunks(self, connection, monkeypatch):
+        monkeypatch.setattr(order_list_extract, "DIRECT_CHUNK_ROWS", 400)
+
+        loaded = order_list_extract.direct_load(make_frame(1000), "xGREYSON_ORDER_LIST_RAW")
+
+        assert loaded == 1000
+        assert [len(batch) for batch in connection.batches] == [400, 400, 200]
+        assert any(s.startswith("CREATE TABLE dbo.xGREYSON_ORDER_LIST_RAW") for s in connection.statements)
+        assert connection.insert_sql.startswith("INSERT INTO dbo.xGREYSON_ORDER_LIST_RAW ([AAG ORDER NUMBER]")
+
+    @pytest.mark.filterwarnings("error::FutureWarning")
+    def test_null_and_datetime_semantics(self, connection):
+        order_list_extract.direct_load(make_frame(8), "xGREYSON_ORDER_LIST_RAW")
+
+        rows = connection.batches[0]
+        assert rows[0] == ("AAG-0", None, None, "GREYSON ORDER LIST (M3).xlsx", datetime(2026, 10, 16, 7, 30))
+        assert rows[1][1:3] == ("1", "Ünïcödé, \"quoted\"")
+        assert all(type(value) in (str, datetime, type(None)) for row in rows for value in row)
+
+    @pytest.mark.filterwarnings("error::FutureWarning")
+    def test_raw_table_rows_numeric_nulls(self):
+        df = pd.DataFrame({"qty": [1.5, np.nan], "due": pd.to_datetime(["2026-01-01", None])})
+
+        assert order_list_extract.raw_table_rows(df) == [(1.5, datetime(2026, 1, 1)), (None, None)]
+
+    def test_failed_load_rolls_back(self, connection, monkeypatch):
+        def fail(sql, rows):
+            raise RuntimeError("String or binary data would be truncated")
+
+        monkeypatch.setattr(FakeCursor, "executemany", lambda self, sql, rows: fail(sql, rows))
+
+        with pytest.raises(RuntimeError):
+            order_list_extract.direct_load(make_frame(10), "xGREYSON_ORDER_LIST_RAW")
+        assert connection.rollbacks == 1
+
+
+class TestLoadMethodSelection:
+
+    def test_direct_method_skips_blob_loader(self, connection, monkeypatch):
+        workbook = Workbook()
+        workbook.active.title = "MASTER"
+        workbook.active.append(["AAG ORDER NUMBER", "CUSTOMER NAME"])
+        workbook.active.append(["AAG-1", "GREYSON"])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        files = {"GREYSON ORDER LIST (M3).xlsx": buffer.getvalue()}
+
+        class Container:
+            def get_blob_client(self, name):
+                class Download:
+                    def readall(self):
+                        return files[name]
+
+                class BlobClient:
+                    def download_blob(self):
+                        return Download()
+
+                return BlobClient()
+
+        monkeypatch.setattr(order_list_extract, "bulk_load", lambda *args: pytest.fail("blob path used"))
+        results = order_list_extract.process_blobs(list(files), Container(), None, max_workers=1, parse_workers=0,
+                                                   load_method='direct')
+
+        assert results[0]['success'] and results[0]['match'] and results[0]['rows_db'] == 1
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError):
+            order_list_extract.main(load_method='csv')
+
+    @pytest.mark.skipif(not os.getenv("ORDER_LIST_DIRECT_TEST_DB"),
+                        reason="set ORDER_LIST_DIRECT_TEST_DB to a config.yaml db key (e.g. a local SQL Server)")
+    def test_live_round_trip(self, monkeypatch):
+        db_key = os.environ["ORDER_LIST_DIRECT_TEST_DB"]
+        monkeypatch.setattr(order_list_extract, "DB_KEY", db_key)
+        table = "xDIRECT_LOAD_TEST_ORDER_LIST_RAW"
+        try:
+            loaded = order_list_extract.direct_load(make_frame(50000), table)
+            nulls = order_list_extract.db_helper.run_query(
+                f"SELECT COUNT(*) AS n FROM dbo.{table} WHERE [ORDER QTY] IS NULL", db_key)
+            assert loaded == 50000
+            assert int(nulls['n'].iloc[0]) == len([i for i in range(50000) if i % 7 == 0])
+        finally:
+            order_list_extract.db_helper.execute(f"DROP TABLE IF EXISTS dbo.{table}", db_key)
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
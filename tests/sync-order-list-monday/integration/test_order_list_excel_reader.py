@@ -0,0 +1,145 @@
+"""
+Integration Test: Single-Pass Streaming Excel Reader for ORDER_LIST Workbooks
+=============================================================================
+Purpose: Validate that order_list_extract opens each workbook once in read-only mode,
+         picks the sheet from its header row / dimensions and reads only that sheet,
+         producing the same DataFrame as the pandas path
+Requirement: Faster Excel ingestion engine for ORDER_LIST workbooks
+
+Test Scenarios:
+- Mixed cell types, duplicate/blank headers and blank rows match pd.read_excel(dtype=str) + clean_df
+- Without a MASTER sheet, the sheet with ORDER_LIST headers wins over a larger notes sheet
+- Vectorized clean_df drops the same rows as the old row-wise apply
+- Extract results report parse_time per file
+
+Success Criteria:
+- Identical frames; parse time reported; streaming reader not slower than the pandas path
+"""
+
+import io
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "load_order_list"))
+
+import order_list_extract
+
+
+def make_workbook(rows=200, master=True):
+    workbook = Workbook()
+    notes = workbook.active
+    notes.title = "Notes"
+    for i in range(rows * 2):
+        notes.append([f"note {i}", i])
+    sheet = workbook.create_sheet("MASTER" if master else "ORDERS 2026")
+    sheet.append(["AAG ORDER NUMBER", "CUSTOMER NAME", "ORDER QTY", "ORDER QTY", None, "PRICE", "DATE PO RECEIVED", 2026])
+    for i in range(rows):
+        sheet.append([f"AAG-{i}", "GREYSON", i, i * 2, None, i + 0.25, datetime(2026, 1, 1 + i % 28), None])
+        if i % 50 == 0:
+            sheet.append([None] * 8)
+            sheet.append(["  ", "", " ", None, None, None, None, None])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def old_clean_df(df):
+    """clean_df as it was before vectorization (row-wise apply)"""
+    cols = [c for c in df.columns if c and not str(c).lower().startswith("unnamed")]
+    df = df[cols]
+    df.columns = [re.sub(r"\s+", " ", str(c)).strip() for c in cols]
+    df = df.dropna(how="all")
+    return df.loc[~df.apply(lambda r: r.astype(str).str.strip().eq("").all(), axis=1)]
+
+
+class TestStreamingReader:
+
+    def test_matches_pandas_reader(self):
+        data = make_workbook()
+
+        sheet, streamed = order_list_extract.read_workbook_single_pass(data, "GREYSON ORDER LIST (M3).xlsx")
+        expected = pd.read_excel(io.BytesIO(data), sheet_name="MASTER", dtype=str, na_filter=False, engine="openpyxl")
+
+        assert sheet == "MASTER"
+        pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+        pd.testing.assert_frame_equal(order_list_extract.clean_df(streamed), old_clean_df(expected), check_dtype=False)
+
+    def test_sheet_picked_from_headers_without_master(self):
+        data = make_workbook(master=False)
+
+        sheet, df = order_list_extract.read_workbook_single_pass(data, "GREYSON ORDER LIST (M3).xlsx")
+
+        assert sheet == "ORDERS 2026"
+        assert list(df.columns[:4]) == ["AAG ORDER NUMBER", "CUSTOMER NAME", "ORDER QTY", "ORDER QTY.1"]
+
+    def test_header_labels_keep_cell_values(self):
+        header = ["A", 2026, 2026, "", "A", 1.5]
+
+        assert order_list_extract._header_names(header) == ["A", 2026, "2026.1", "Unnamed: 3", "A.1", 1.5]
+
+    def test_vectorized_clean_df_matches_row_wise(self):
+        df = pd.DataFrame({"A": ["x", "", " ", None, "y"], "B": ["", "", "\t", None, "1"], "Unnamed: 2": [""] * 5})
+
+        pd.testing.assert_frame_equal(order_list_extract.clean_df(df), old_clean_df(df))
+
+    def test_streaming_reader_not_slower(self):
+        data = make_workbook(rows=3000)
+
+        start = time.perf_counter()
+        order_list_extract.read_workbook_single_pass(data, "GREYSON ORDER LIST (M3).xlsx")
+        streaming = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sheet = order_list_extract.best_sheet_with_retry(data, "GREYSON ORDER LIST (M3).xlsx")
+        order_list_extract.read_excel_with_retry(data, sheet, "GREYSON ORDER LIST (M3).xlsx")
+        pandas_path = time.perf_counter() - start
+
+        print(f"✅ streaming {streaming:.2f}s vs pandas (sheet scan + read) {pandas_path:.2f}s")
+        assert streaming < pandas_path * 1.2
+
+
+class TestParseTimeReported:
+
+    def test_results_carry_parse_time(self, monkeypatch):
+        files = {"GREYSON ORDER LIST (M3).xlsx": make_workbook(rows=50)}
+
+        class Container:
+            def get_blob_client(self, name):
+                class Download:
+                    def readall(self):
+                        return files[name]
+
+                class BlobClient:
+                    def download_blob(self):
+                        return Download()
+
+                return BlobClient()
+
+        monkeypatch.setattr(order_list_extract, "bulk_load", lambda df, table, trg: len(df))
+        results = order_list_extract.process_blobs(list(files), Container(), None, max_workers=1, parse_workers=0)
+
+        assert results[0]['success'] and results[0]['rows_src'] == 50
+        assert 0 < results[0]['parse_time'] <= results[0]['elapsed']
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
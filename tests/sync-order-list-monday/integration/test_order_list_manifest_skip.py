@@ -0,0 +1,351 @@
+"""
+Integration Test: Skip Unchanged ORDER_LIST Workbooks via File Manifest
+=======================================================================
+Purpose: Validate that ORDER_LIST_FILE_MANIFEST fingerprints (SharePoint eTag + content hash)
+         let the blob and extract stages skip unchanged workbooks and the transform
+         re-process only the changed customers
+Requirement: Skip unchanged ORDER_LIST workbooks using content fingerprints
+
+Test Scenarios:
+- Blob stage skips the download when the SharePoint eTag matches the manifest
+- Blob stage downloads but skips the upload when the bytes hash to the stored content_sha256
+- Extract stage skips parse + load when the blob's hash matches the last extract, reloads otherwise
+- force=True reloads everything and still records the manifest
+- Transform splits RAW tables into changed (plus never-loaded) and carried-over customers
+- Incremental transform stays server-side and rebuilds swp_ORDER_LIST_SYNC after the swap
+- A RAW table stays pending until the pipeline records a transform after a successful swap
+
+Success Criteria:
+- Only changed files are transferred / parsed / loaded; changed_tables lists exactly those
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+sys.path.insert(0, str(repo_root / "pipelines" / "scripts" / "load_order_list"))
+
+import order_list_manifest
+import order_list_extract
+import order_list_blob
+import order_list_transform
+import order_list_pipeline
+
+
+def make_workbook(customer, rows=20):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "MASTER"
+    sheet.append(["AAG ORDER NUMBER", "CUSTOMER NAME"])
+    for i in range(rows):
+        sheet.append([f"AAG-{i}", customer])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+class Properties:
+    def __init__(self, metadata):
+        self.metadata = metadata
+
+
+class FakeContainer:
+    """Blob container double recording downloads; metadata carries content_sha256 like order_list_blob sets"""
+
+    def __init__(self, files):
+        self.files = files
+        self.downloads = []
+
+    def get_blob_client(self, name):
+        container = self
+
+        class Download:
+            def readall(self):
+                return container.files[name]
+
+        class BlobClient:
+            def get_blob_properties(self):
+                return Properties({'content_sha256': order_list_manifest.content_hash(container.files[name])})
+
+            def download_blob(self):
+                container.downloads.append(name)
+                return Download()
+
+        return BlobClient()
+
+
+@pytest.fixture
+def manifest(monkeypatch):
+    statements = []
+    monkeypatch.setattr(order_list_manifest.db, "execute", lambda sql, db_key, params=None: statements.append(params))
+    manifest = order_list_manifest.OrderListManifest()
+    manifest.statements = statements
+    return manifest
+
+
+@pytest.fixture
+def files():
+    return {f"CUSTOMER {i} ORDER LIST (M3).xlsx": make_workbook(f"CUSTOMER {i}") for i in range(4)}
+
+
+class TestExtractSkip:
+
+    def test_only_changed_files_are_loaded(self, files, manifest, monkeypatch):
+        loaded = []
+        monkeypatch.setattr(order_list_extract, "bulk_load", lambda df, table, trg: loaded.append(table) or len(df))
+        names = list(files)
+        for name in names[:3]:
+            manifest.entries[name] = {'file_name': name, 'raw_table_exists': 1,
+                                      'extracted_sha256': order_list_manifest.content_hash(files[name])}
+        manifest.entries[names[0]]['extracted_sha256'] = "0" * 64  # workbook 0 changed since last extract
+        container = FakeContainer(files)
+
+        results = order_list_extract.process_blobs(names, container, None, max_workers=2, parse_workers=0,
+                                                   manifest=manifest)
+
+        assert [r.get('skipped', False) for r in results] == [False, True, True, False]
+        assert all(r['success'] and r['match'] for r in results)
+        assert sorted(container.downloads) == sorted([names[0], names[3]])
+        assert sorted(loaded) == sorted(order_list_extract.safe_table_name(n) for n in (names[0], names[3]))
+        assert len(manifest.statements) == 2
+        assert manifest.is_extract_current(names[3], order_list_manifest.content_hash(files[names[3]]))
+
+    def test_force_reloads_everything(self, files, manifest, monkeypatch):
+        loaded = []
+        monkeypatch.setattr(order_list_extract, "bulk_load", lambda df, table, trg: loaded.append(table) or len(df))
+        for name in files:
+            manifest.entries[name] = {'file_name': name, 'raw_table_exists': 1,
+                                      'extracted_sha256': order_list_manifest.content_hash(files[name])}
+
+        results = order_list_extract.process_blobs(list(files), FakeContainer(files), None, max_workers=2,
+                                                   parse_workers=0, manifest=manifest, force=True)
+
+        assert not any(r.get('skipped') for r in results)
+        assert len(loaded) == len(files) and len(manifest.statements) == len(files)
+
+    def test_missing_raw_table_is_reloaded(self, files, manifest):
+        name = list(files)[0]
+        manifest.entries[name] = {'file_name': name, 'raw_table_exists': 0,
+                                  'extracted_sha256': order_list_manifest.content_hash(files[name])}
+        assert not manifest.is_extract_current(name, order_list_manifest.content_hash(files[name]))
+
+
+class TestBlobSkip:
+
+    def make_uploader(self, manifest, content, stored_sha=None):
+        uploads = []
+
+        class BlobClient:
+            def get_blob_properties(self):
+                return Properties({'content_sha256': stored_sha} if stored_sha else {})
+
+            def upload_blob(self, data, overwrite, metadata):
+                uploads.append(metadata)
+
+        class Container:
+            def get_blob_client(self, name):
+                return BlobClient()
+
+        uploader = order_list_blob.OrderListBlobUploader()
+        uploader.blob_client = Container()
+        uploader.manifest = manifest
+        uploader.uploads = uploads
+        return uploader
+
+    def file_info(self, etag):
+        return {"Region": "USA", "Subfolder": "ORDER LIST", "FileName": "C ORDER LIST (M3).xlsx", "FileURL": "",
+                "DownloadURL": "https://download/c", "Size": 2048, "ETag": etag, "LastModified": "2026-10-01T00:00:00Z"}
+
+    def test_same_etag_skips_download(self, manifest, monkeypatch):
+        manifest.entries["C ORDER LIST (M3).xlsx"] = {'sharepoint_etag': '"{ABC},7"', 'content_sha256': "a" * 64}
+        monkeypatch.setattr(order_list_blob.requests, "get", lambda *a, **k: pytest.fail("downloaded unchanged file"))
+        uploader = self.make_uploader(manifest, b"", stored_sha="a" * 64)
+
+        result = uploader.download_and_upload_file(self.file_info('"{ABC},7"'))
+
+        assert result['success'] and result['skipped'] and not uploader.uploads
+
+    def test_new_etag_same_bytes_skips_upload(self, manifest, monkeypatch):
+        content = b"PK\x03\x04" + b"1" * 2048
+        sha = order_list_manifest.content_hash(content)
+        manifest.entries["C ORDER LIST (M3).xlsx"] = {'sharepoint_etag': '"{ABC},7"', 'content_sha256': sha}
+        monkeypatch.setattr(order_list_blob.requests, "get",
+                            lambda *a, **k: type("R", (), {"content": content, "raise_for_status": lambda self: None})())
+        uploader = self.make_uploader(manifest, content, stored_sha=sha)
+
+        result = uploader.download_and_upload_file(self.file_info('"{ABC},8"'))
+
+        assert result['skipped'] and not uploader.uploads
+        assert manifest.entries["C ORDER LIST (M3).xlsx"]['sharepoint_etag'] == '"{ABC},8"'
+
+    def test_changed_bytes_are_uploaded_with_hash(self, manifest, monkeypatch):
+        content = b"PK\x03\x04" + b"2" * 2048
+        manifest.entries["C ORDER LIST (M3).xlsx"] = {'sharepoint_etag': '"{ABC},7"', 'content_sha256': "a" * 64}
+        monkeypatch.setattr(order_list_blob.requests, "get",
+                            lambda *a, **k: type("R", (), {"content": content, "raise_for_status": lambda self: None})())
+        uploader = self.make_uploader(manifest, content, stored_sha="a" * 64)
+
+        result = uploader.download_and_upload_file(self.file_info('"{ABC},8"'))
+
+        assert result['success'] and not result.get('skipped')
+        assert uploader.uploads[0]['content_sha256'] == order_list_manifest.content_hash(content)
+
+
+class TestIncrementalTransformSplit:
+
+    def test_changed_and_never_loaded_customers_are_transformed(self, monkeypatch):
+        transformer = order_list_transform.OrderListTransformer.__new__(order_list_transform.OrderListTransformer)
+        transformer.logger = order_list_transform.logger_helper.get_logger("test")
+        transformer.db_key, transformer.target_table = "orders", "ORDER_LIST"
+        monkeypatch.setattr(order_list_transform.db, "run_query", lambda sql, db_key, params=None: pd.DataFrame(
+            {'_SOURCE_TABLE': ["xA_ORDER_LIST_RAW", "xB_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW"]}))
+        raw_tables = pd.DataFrame({'TABLE_NAME': [f"x{c}_ORDER_LIST_RAW" for c in "ABCD"]})
+
+        to_transform, unchanged = transformer.split_changed_raw_tables(raw_tables, ["xB_ORDER_LIST_RAW"])
+
+        assert to_transform['TABLE_NAME'].tolist() == ["xB_ORDER_LIST_RAW", "xD_ORDER_LIST_RAW"]
+        assert unchanged == ["xA_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW"]
+
+
+class FakeStagingTableManager:
+    """schema_aware_staging_helper.StagingTableManager double recording the swap"""
+
+    swap_result = {"success": True}
+
+    def __init__(self, executed):
+        self.executed = executed
+
+    def create_staging_table_from_ddl(self, staging_table, ddl_file_path, db_name):
+        self.executed.append(f"CREATE [{staging_table}]")
+
+    def atomic_swap_tables(self, staging_table, production_table, db_name):
+        self.executed.append(f"SWAP [{staging_table}] -> [{production_table}]")
+        return self.swap_result
+
+
+class TestIncrementalServerSideTransform:
+
+    @pytest.fixture
+    def transformer(self, monkeypatch):
+        executed = []
+        queries = {
+            "INFORMATION_SCHEMA.TABLES": pd.DataFrame({'TABLE_NAME': [f"x{c}_ORDER_LIST_RAW" for c in "ABCD"]}),
+            "SELECT DISTINCT [_SOURCE_TABLE]": pd.DataFrame(
+                {'_SOURCE_TABLE': ["xA_ORDER_LIST_RAW", "xB_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW"]}),
+            "INFORMATION_SCHEMA.COLUMNS": pd.DataFrame({'COLUMN_NAME': ["AAG ORDER NUMBER", "_SOURCE_TABLE"]}),
+            "COUNT(*)": pd.DataFrame({'cnt': [20]}),
+        }
+        monkeypatch.setattr(order_list_transform.db, "run_query", lambda sql, db_key, params=None: next(
+            df for key, df in queries.items() if key in sql))
+        monkeypatch.setattr(order_list_transform.db, "execute",
+                            lambda sql, db_key, params=None: executed.append(" ".join(sql.split())) or 20)
+        monkeypatch.setattr(order_list_transform.db, "get_column_names",
+                            lambda table_name, db_key: ["AAG ORDER NUMBER", "CUSTOMER NAME"])
+        staging_module = type(sys)("schema_aware_staging_helper")
+        staging_module.StagingTableManager = lambda: FakeStagingTableManager(executed)
+        monkeypatch.setitem(sys.modules, "schema_aware_staging_helper", staging_module)
+        transformer = order_list_transform.OrderListTransformer()
+        transformer.executed = executed
+        return transformer
+
+    def test_incremental_run_rebuilds_sync_table(self, transformer):
+        result = transformer.run_transform_server_side_optimized(changed_tables=["xB_ORDER_LIST_RAW"])
+
+        executed = transformer.executed
+        inserts = [sql for sql in executed if sql.startswith("INSERT INTO [swp_ORDER_LIST]")]
+        swap = executed.index("SWAP [swp_ORDER_LIST] -> [ORDER_LIST]")
+        rebuild = executed.index("SELECT * INTO swp_ORDER_LIST_SYNC FROM ORDER_LIST")
+        assert result['success'] and result['sync_table_created']
+        assert result['transformed_tables'] == ["xB_ORDER_LIST_RAW", "xD_ORDER_LIST_RAW"]
+        assert result['carried_over_rows'] == 20 and result['unchanged_customers'] == 2
+        # Carry-over first, then the production server-side INSERT per changed customer
+        assert "WITH (TABLOCK)" in inserts[0] and "FROM [ORDER_LIST]" in inserts[0]
+        assert [sql.rsplit("FROM [dbo].[", 1)[1].split("]")[0] for sql in inserts[1:]] == \
+            ["xB_ORDER_LIST_RAW", "xD_ORDER_LIST_RAW"]
+        assert executed.index(inserts[-1]) < swap < rebuild
+
+    def test_failed_swap_is_reported(self, transformer, monkeypatch):
+        monkeypatch.setattr(FakeStagingTableManager, "swap_result", {"success": False, "error": "lock timeout"})
+
+        result = transformer.run_transform_server_side_optimized(changed_tables=["xB_ORDER_LIST_RAW"])
+
+        assert not result['success'] and "lock timeout" in result['error']
+        assert "SELECT * INTO swp_ORDER_LIST_SYNC FROM ORDER_LIST" not in transformer.executed
+
+
+class TestTransformManifest:
+
+    def make_entries(self, manifest):
+        for customer, transformed in (("A", "a"), ("B", None), ("C", "old")):
+            manifest.entries[f"{customer}.xlsx"] = {'file_name': f"{customer}.xlsx", 'raw_table_exists': 1,
+                                                    'raw_table': f"x{customer}_ORDER_LIST_RAW",
+                                                    'extracted_sha256': customer.lower(),
+                                                    'transformed_sha256': transformed}
+
+    def test_extracted_but_untransformed_tables_are_pending(self, manifest):
+        self.make_entries(manifest)
+
+        assert manifest.pending_transform_tables() == ["xB_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW"]
+
+        manifest.record_extract("A.xlsx", "xA_ORDER_LIST_RAW", "a2", 20)
+        assert manifest.pending_transform_tables() == ["xA_ORDER_LIST_RAW", "xB_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW"]
+
+        manifest.record_transform(["xA_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW"])
+        assert manifest.pending_transform_tables() == ["xB_ORDER_LIST_RAW"]
+        assert manifest.statements[-1] == ("xA_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW")
+
+    @pytest.mark.parametrize("swap_succeeds", [True, False])
+    def test_pipeline_records_transform_only_after_swap(self, manifest, monkeypatch, swap_succeeds):
+        self.make_entries(manifest)
+        recorded = []
+
+        class Transformer:
+            def run_transform_server_side_optimized(self, changed_tables=None):
+                if not swap_succeeds:
+                    return {"success": False, "error": "Atomic swap failed: lock timeout"}
+                return {"success": True, "total_rows": 40, "duration": 1.0, "transformed_tables": changed_tables}
+
+        class Manifest:
+            def __init__(self, db_key):
+                pass
+
+            def ensure_table(self):
+                pass
+
+            def record_transform(self, raw_tables):
+                recorded.append(raw_tables)
+
+        monkeypatch.setattr(order_list_transform, "OrderListTransformer", Transformer)
+        monkeypatch.setattr(order_list_manifest, "OrderListManifest", Manifest)
+        pipeline = order_list_pipeline.OrderListPipeline.__new__(order_list_pipeline.OrderListPipeline)
+        pipeline.db_key = "orders"
+        pipeline.logger = order_list_transform.logger_helper.get_logger("test")
+        pipeline.metrics = {'performance_metrics': {}}
+        monkeypatch.setattr(pipeline, "log_stage_start", lambda *args: None, raising=False)
+        monkeypatch.setattr(pipeline, "log_stage_success", lambda *args: None, raising=False)
+        monkeypatch.setattr(pipeline, "log_stage_failure", lambda *args: None, raising=False)
+
+        result = pipeline.run_transform_stage(changed_tables=manifest.pending_transform_tables())
+
+        assert result['success'] is swap_succeeds
+        assert recorded == ([["xB_ORDER_LIST_RAW", "xC_ORDER_LIST_RAW"]] if swap_succeeds else [])
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
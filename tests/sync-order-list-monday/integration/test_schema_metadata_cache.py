@@ -0,0 +1,193 @@
+"""
+Integration Test: db_helper Table Schema Cache
+==============================================
+Purpose: Validate the process-wide INFORMATION_SCHEMA cache behind db_helper.get_table_schema
+Requirement: Schema metadata cache keyed by (db_key, schema, table) with TTL and invalidation
+
+Test Scenarios:
+- Repeated lookups for the same table hit the cache (one INFORMATION_SCHEMA query)
+- Keys are case-insensitive and accept 'schema.table' / [bracketed] names
+- Entries expire after the TTL; missing tables are never cached
+- DDL through db_helper.execute (CREATE/DROP/sp_rename swaps) invalidates the db_key
+- get_schema_cache_stats reports hits, misses and hit_rate
+
+Success Criteria:
+- N per-item column checks issue exactly 1 schema query
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+
+import db_helper
+
+COLUMNS = ("COLUMN_NAME", "DATA_TYPE", "CHARACTER_MAXIMUM_LENGTH",
+           "NUMERIC_PRECISION", "NUMERIC_SCALE", "IS_NULLABLE", "ORDINAL_POSITION")
+
+TABLES = {
+    ("dbo", "stg_mon_custmasterschedule"): [
+        ("stg_id", "bigint", None, 19, 0, "NO", 1),
+        ("AAG ORDER NUMBER", "nvarchar", 100, None, None, "YES", 2),
+        ("stg_api_payload", "nvarchar", -1, None, None, "YES", 3),
+    ],
+}
+
+
+class FakeCursor:
+    def __init__(self, database):
+        self.database = database
+        self.description = None
+        self.rows = []
+        self.rowcount = 0
+
+    def execute(self, sql, params=()):
+        if "INFORMATION_SCHEMA.COLUMNS" in sql:
+            self.database.schema_queries += 1
+            self.description = [(name,) for name in COLUMNS]
+            self.rows = self.database.tables.get(tuple(params), [])
+        else:
+            self.database.statements.append(sql)
+        return self
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConnection:
+    def __init__(self, database):
+        self.database = database
+
+    def cursor(self):
+        return FakeCursor(self.database)
+
+    def commit(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.tables = dict(TABLES)
+        self.schema_queries = 0
+        self.statements = []
+
+
+@pytest.fixture
+def database(monkeypatch):
+    database = FakeDatabase()
+    monkeypatch.setattr(db_helper, "get_connection", lambda db_key, pooled=None: FakeConnection(database))
+    monkeypatch.setattr(db_helper, "_SCHEMA_CACHE", db_helper.SchemaCache(ttl=600))
+    return database
+
+
+class TestSchemaCache:
+
+    def test_per_item_lookups_hit_cache(self, database):
+        checks = [
+            "stg_api_payload" in db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+            for _ in range(500)
+        ]
+
+        stats = db_helper.get_schema_cache_stats()
+        assert all(checks)
+        assert database.schema_queries == 1
+        assert (stats["hits"], stats["misses"], stats["tables"]) == (499, 1, 1)
+        assert stats["hit_rate"] == pytest.approx(499 / 500)
+
+    def test_key_normalization(self, database):
+        db_helper.get_table_schema("STG_MON_CustMasterSchedule", "orders")
+        db_helper.get_table_schema("[dbo].[stg_mon_custmasterschedule]", "ORDERS")
+        db_helper.get_table_schema("stg_mon_custmasterschedule", "orders", schema="DBO")
+
+        assert database.schema_queries == 1
+
+    def test_schema_rows_and_copies(self, database):
+        schema = db_helper.get_table_schema("STG_MON_CustMasterSchedule", "orders")
+        schema[0]["COLUMN_NAME"] = "mutated"
+
+        columns = db_helper.get_table_schema("STG_MON_CustMasterSchedule", "orders")
+        assert columns[0] == {"COLUMN_NAME": "stg_id", "DATA_TYPE": "bigint", "CHARACTER_MAXIMUM_LENGTH": None,
+                              "NUMERIC_PRECISION": 19, "NUMERIC_SCALE": 0, "IS_NULLABLE": "NO", "ORDINAL_POSITION": 1}
+
+    def test_ttl_expiry(self, database, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr(db_helper.time, "monotonic", lambda: clock[0])
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+
+        clock[0] += 599
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+        clock[0] += 2
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+
+        assert database.schema_queries == 2
+        assert db_helper.get_schema_cache_stats()["expired"] == 1
+
+    def test_missing_table_not_cached(self, database):
+        assert db_helper.get_column_names("xNEW_ORDER_LIST_RAW", "orders") == []
+        database.tables[("dbo", "xnew_order_list_raw")] = [("AAG ORDER NUMBER", "nvarchar", 100, None, None, "YES", 1)]
+
+        assert db_helper.get_column_names("xNEW_ORDER_LIST_RAW", "orders") == ["AAG ORDER NUMBER"]
+
+    @pytest.mark.parametrize("ddl", [
+        "ALTER TABLE dbo.STG_MON_CustMasterSchedule ADD [stg_retry_count] INT",
+        "BEGIN TRAN; DROP TABLE dbo.ORDER_LIST; EXEC sp_rename 'dbo.swp_ORDER_LIST', 'ORDER_LIST'; COMMIT TRAN;",
+        "SELECT * INTO ORDER_LIST_SYNC FROM ORDER_LIST",
+    ])
+    def test_ddl_through_execute_invalidates(self, database, ddl):
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+
+        db_helper.execute(ddl, "orders")
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+
+        assert database.schema_queries == 2
+
+    def test_dml_keeps_cache(self, database):
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+
+        db_helper.execute("UPDATE [dbo].[STG_MON_CustMasterSchedule] SET [stg_status] = 'API_SUCCESS' WHERE [stg_id] = ?",
+                          "orders", params=(1,))
+        db_helper.execute("INSERT INTO dbo.ORDER_LIST_FILE_MANIFEST ([file_name]) SELECT ?", "orders", params=("a",))
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+
+        assert database.schema_queries == 1
+
+    def test_explicit_invalidation(self, database):
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+
+        assert db_helper.invalidate_schema("orders", "dbo.STG_MON_CustMasterSchedule") == 1
+        assert db_helper.invalidate_schema("orders", "STG_MON_CustMasterSchedule") == 0
+        db_helper.get_column_names("STG_MON_CustMasterSchedule", "orders")
+        assert db_helper.invalidate_schema() == 1
+        assert database.schema_queries == 2
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
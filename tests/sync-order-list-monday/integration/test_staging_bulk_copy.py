@@ -0,0 +1,210 @@
+"""
+Integration Test: bcp Bulk-Copy Backend for Staging Loads
+=========================================================
+Purpose: Validate that staging_helper.load_to_staging_table switches to the bcp utility
+         for large loads and writes a data file bcp reads back to the same values
+Requirement: Native SQL Server bulk-copy path for staging loads
+
+Test Scenarios:
+- Backend chosen by row count / STAGING_BULK_BACKEND and bcp availability
+- auto never picks bcp for SQL logins (password would be on the bcp command line)
+- Data file: UTF-16, control-character terminators, NULL as empty field, dates ISO
+- bcp failures (non-zero exit, error file, short row count) raise
+- Values bcp cannot represent fall back to fast_executemany
+- Against a real SQL Server (STAGING_BCP_TEST_DB=<config.yaml db key>): 200k rows round trip
+
+Success Criteria:
+- Same signature, one bcp call per load, row count verified
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+
+import staging_helper
+
+DB_BLOCK = {"host": "localhost", "port": 1433, "database": "orders", "trusted_connection": "yes",
+            "bcp_options": "-u"}
+SQL_LOGIN_BLOCK = {"host": "localhost", "port": 1433, "database": "orders", "username": "sa", "password": "Secret!1"}
+
+
+def make_frame(rows):
+    return pd.DataFrame({
+        "order": pd.Series([f"AAG-{i}" for i in range(rows)], dtype=object),
+        "qty": [float(i) if i % 5 else np.nan for i in range(rows)],
+        "tiny": [1e-7] * rows,
+        "shipped": [bool(i % 2) for i in range(rows)],
+        "due": pd.to_datetime(["2025-06-13 10:30"] * rows),
+        "note": pd.Series(["Ünïcödé, \"quoted\"\ttab", "None", None] * (rows // 3) + [None] * (rows % 3), dtype=object),
+    })
+
+
+class FakeBcp:
+    """subprocess.run double: parses the data file like bcp -w -t -r would"""
+
+    def __init__(self, exit_code=0, error_text="", rows_delta=0):
+        self.exit_code = exit_code
+        self.error_text = error_text
+        self.rows_delta = rows_delta
+        self.commands = []
+        self.rows = []
+
+    def __call__(self, command, capture_output, text):
+        self.commands.append(command)
+        data_file, error_file = command[3], command[command.index("-e") + 1]
+        with open(data_file, encoding="utf-16-le", newline="") as handle:
+            content = handle.read()
+        records = content.split(staging_helper.BCP_ROW_TERMINATOR)
+        assert records[-1] == ""
+        self.rows = [[field or None for field in record.split(staging_helper.BCP_FIELD_TERMINATOR)]
+                     for record in records[:-1]]
+        if self.error_text:
+            with open(error_file, "w") as handle:
+                handle.write(self.error_text)
+
+        class Result:
+            returncode = self.exit_code
+            stdout = f"Starting copy...\n\n{len(self.rows) + self.rows_delta} rows copied.\n"
+            stderr = ""
+        return Result()
+
+
+@pytest.fixture
+def bcp(monkeypatch):
+    fake = FakeBcp()
+    monkeypatch.setattr(staging_helper.subprocess, "run", fake)
+    monkeypatch.setattr(staging_helper.shutil, "which", lambda path: "/opt/mssql-tools/bin/bcp")
+    monkeypatch.setitem(staging_helper.db.DB_CONFIG, "orders", DB_BLOCK)
+    monkeypatch.setattr(staging_helper, "_BULK_BACKEND", "auto")
+    # Importing schema_aware_staging_helper switches the module to 'fast' (keeps literal 'None')
+    monkeypatch.setattr(staging_helper, "_STAGING_MODE", "robust")
+    monkeypatch.setattr(staging_helper, "BULK_COPY_MIN_ROWS", 100)
+    monkeypatch.setattr(staging_helper.db, "get_connection",
+                        lambda *args, **kwargs: pytest.fail("executemany path must not be used"))
+    return fake
+
+
+class TestBulkCopyBackend:
+
+    def test_backend_chosen_by_row_count(self, bcp, monkeypatch):
+        assert staging_helper.choose_staging_backend(99) == "executemany"
+        assert staging_helper.choose_staging_backend(100) == "bcp"
+
+        monkeypatch.setattr(staging_helper, "_BULK_BACKEND", "executemany")
+        assert staging_helper.choose_staging_backend(10_000_000) == "executemany"
+
+        monkeypatch.setattr(staging_helper, "_BULK_BACKEND", "bcp")
+        assert staging_helper.choose_staging_backend(1) == "bcp"
+        monkeypatch.setattr(staging_helper.shutil, "which", lambda path: None)
+        assert staging_helper.choose_staging_backend(10_000_000) == "executemany"
+
+    def test_auto_keeps_sql_logins_on_executemany(self, bcp, monkeypatch):
+        monkeypatch.setitem(staging_helper.db.DB_CONFIG, "orders", SQL_LOGIN_BLOCK)
+        assert staging_helper.choose_staging_backend(10_000_000, "orders") == "executemany"
+
+        monkeypatch.setattr(staging_helper, "_BULK_BACKEND", "bcp")
+        assert staging_helper.choose_staging_backend(10_000_000, "orders") == "bcp"
+        staging_helper.load_to_staging_table(make_frame(300), "swp_TEST", "orders")
+        command = bcp.commands[0]
+        assert command[command.index("-U") + 1] == "sa" and command[command.index("-P") + 1] == "Secret!1"
+        assert "-T" not in command
+
+    def test_data_file_round_trip(self, bcp):
+        df = make_frame(300)
+
+        staging_helper.load_to_staging_table(df, "swp_TEST", "orders")
+
+        command = bcp.commands[0]
+        assert len(bcp.commands) == 1
+        assert command[1:3] == ["dbo.swp_TEST", "in"] and "-w" in command and "TABLOCK" in command
+        assert command[command.index("-S") + 1] == "localhost,1433" and command[-1] == "-u"
+        assert "-T" in command and "-P" not in command
+        assert not os.path.exists(command[3]), "data file is removed after the load"
+        assert len(bcp.rows) == 300
+        assert [row[0] for row in bcp.rows] == list(df["order"])
+        assert bcp.rows[1] == ["AAG-1", "1", "0.0000001", "1", "2025-06-13", None]
+        assert bcp.rows[0][1] is None and bcp.rows[2][5] is None
+
+    @pytest.mark.parametrize("fake", [FakeBcp(exit_code=1), FakeBcp(error_text="Invalid character value"),
+                                      FakeBcp(rows_delta=-1)])
+    def test_bcp_failures_raise(self, bcp, monkeypatch, fake):
+        monkeypatch.setattr(staging_helper.subprocess, "run", fake)
+
+        with pytest.raises(RuntimeError):
+            staging_helper.load_to_staging_table(make_frame(300), "swp_TEST", "orders")
+
+    def test_unrepresentable_values_fall_back_to_executemany(self, bcp, monkeypatch):
+        inserted = []
+
+        class Cursor:
+            fast_executemany = False
+
+            def executemany(self, sql, rows):
+                inserted.extend(rows)
+
+            def close(self):
+                pass
+
+        class Connection:
+            def cursor(self):
+                return Cursor()
+
+            def commit(self):
+                pass
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(staging_helper.db, "get_connection", lambda *args, **kwargs: Connection())
+        df = make_frame(300)
+        df.loc[7, "note"] = "contains \x1e separator"
+
+        staging_helper.load_to_staging_table(df, "swp_TEST", "orders")
+
+        assert bcp.commands == [] and len(inserted) == 300
+
+    @pytest.mark.skipif(not os.getenv("STAGING_BCP_TEST_DB"),
+                        reason="set STAGING_BCP_TEST_DB to a config.yaml database key (e.g. local SQL Server container)")
+    def test_sql_server_round_trip(self):
+        db_key = os.environ["STAGING_BCP_TEST_DB"]
+        staging_helper.set_bulk_backend("bcp")
+        df = make_frame(200_000)
+        staging_helper.prepare_staging_table(df, "swp_BCP_TEST", "BCP_TEST", db_key)
+        try:
+            start = time.perf_counter()
+            staging_helper.load_to_staging_table(df, "swp_BCP_TEST", db_key)
+            elapsed = time.perf_counter() - start
+
+            counts = staging_helper.db.run_query(
+                "SELECT COUNT(*) AS n, COUNT([qty]) AS qty, SUM(CAST([shipped] AS INT)) AS shipped, "
+                "MAX([note]) AS note FROM dbo.swp_BCP_TEST", db_key)
+            assert counts.iloc[0]["n"] == 200_000
+            assert counts.iloc[0]["qty"] == df["qty"].notna().sum()
+            assert counts.iloc[0]["shipped"] == 100_000
+            assert counts.iloc[0]["note"] == "Ünïcödé, \"quoted\"\ttab"
+            print(f"✅ 200k rows via bcp in {elapsed:.2f}s")
+        finally:
+            staging_helper.set_bulk_backend("auto")
+            staging_helper.db.execute("DROP TABLE IF EXISTS dbo.swp_BCP_TEST", db_key)
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,141 @@
+"""
+Integration Test: Columnar Row Conversion for Staging Inserts
+=============================================================
+Purpose: Validate that staging_helper builds executemany rows column-wise with exactly the
+         same values as the per-cell fast/robust row generators
+Requirement: Columnar conversion path in staging_helper row generation
+
+Test Scenarios:
+- Every dtype the loaders stage (object strings, floats with NaN, ints, bools, datetime64,
+  tz-aware datetimes, str dtype, Int64) converts identically in fast and robust mode
+- Null-string tokens: case-sensitive in fast mode, case-insensitive in robust mode
+- Mixed-type object columns (datetimes among strings) fall back to the per-cell generators
+
+Success Criteria:
+- Rows (values and Python types) identical to the legacy generators
+- 50k x 40 chunk converts faster than the per-cell robust generator
+"""
+
+import sys
+import time
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root / "pipelines" / "utils"))
+
+import staging_helper
+
+
+def make_chunk(rows=12):
+    rng = np.random.default_rng(3)
+    strings = ['Open', 'nan', 'None', 'NULL', 'null', '', 'NaN', ' ', 'Ünïcödé', None, np.nan]
+    mixed = ['text', datetime.datetime(2025, 6, 13, 10, 30), pd.Timestamp('2025-01-02'), 7, None, 'none']
+    return pd.DataFrame({
+        "status": pd.Series([strings[i % len(strings)] for i in range(rows)], dtype=object),
+        "quantity": rng.integers(0, 100, rows).astype(float),
+        "quantity_nan": [np.nan if i % 3 else float(i) for i in range(rows)],
+        "item_id": np.arange(rows, dtype=np.int64),
+        "flag": [bool(i % 2) for i in range(rows)],
+        "created": pd.to_datetime(['2025-06-13 10:30'] * (rows - 1) + [None]),
+        "created_tz": pd.to_datetime(['2025-06-13T23:30:00Z'] * rows).tz_convert('America/New_York'),
+        "mixed": pd.Series([mixed[i % len(mixed)] for i in range(rows)], dtype=object),
+        "numbers_obj": pd.Series([1, 2.5, None, np.nan] * (rows // 4), dtype=object),
+        "all_null": pd.Series([None] * rows, dtype=object),
+        "str_dtype": pd.Series([strings[(i + 3) % len(strings)] for i in range(rows)], dtype="string"),
+        "nullable_int": pd.Series([1, None] * (rows // 2), dtype="Int64"),
+    })
+
+
+def legacy_rows(df, mode):
+    generator = staging_helper._row_generator_fast if mode == 'fast' else staging_helper._row_generator_robust
+    return list(generator(df))
+
+
+def assert_rows_identical(expected, actual):
+    assert len(actual) == len(expected)
+    for expected_row, actual_row in zip(expected, actual):
+        assert [(type(v), repr(v)) for v in actual_row] == [(type(v), repr(v)) for v in expected_row]
+
+
+@pytest.fixture(params=['fast', 'robust'])
+def mode(request):
+    previous = staging_helper.get_staging_mode()
+    staging_helper.set_staging_mode(request.param)
+    yield request.param
+    staging_helper.set_staging_mode(previous)
+
+
+class TestColumnarRowConversion:
+
+    def test_rows_match_per_cell_generators(self, mode):
+        df = make_chunk()
+
+        assert_rows_identical(legacy_rows(df, mode), staging_helper.dataframe_to_rows(df))
+
+    def test_null_tokens_follow_mode(self, mode):
+        status = pd.Series(['nan', 'NULL', 'Open'], dtype=object)
+        rows = staging_helper.dataframe_to_rows(pd.DataFrame({"status": status}))
+
+        expected = [None, None, 'Open'] if mode == 'robust' else [None, 'NULL', 'Open']
+        assert [row[0] for row in rows] == expected
+
+    def test_mixed_columns_fall_back_to_per_cell(self, mode):
+        df = make_chunk()
+
+        assert staging_helper._column_values(df["mixed"], mode == 'robust') is None
+        assert staging_helper._column_values(df["status"], mode == 'robust') is not None
+        assert staging_helper.dataframe_to_rows(df)[1][7] == datetime.date(2025, 6, 13)
+
+    def test_sliced_chunks_and_empty_frames(self, mode):
+        df = make_chunk(40)
+
+        assert_rows_identical(legacy_rows(df.iloc[20:30], mode), staging_helper.dataframe_to_rows(df.iloc[20:30]))
+        assert staging_helper.dataframe_to_rows(df.iloc[0:0]) == []
+        assert staging_helper.dataframe_to_rows(pd.DataFrame(index=range(2))) == [(), ()]
+
+    def test_benchmark_50k_by_40(self, mode):
+        rng = np.random.default_rng(11)
+        rows = 50_000
+        frame = {}
+        for i in range(40):
+            if i % 4 == 0:
+                frame[f"text_{i}"] = pd.Series(rng.choice(['Open', 'Closed', '', 'None'], rows), dtype=object)
+            elif i % 4 == 1:
+                frame[f"amount_{i}"] = np.where(rng.random(rows) < 0.1, np.nan, rng.random(rows) * 100)
+            elif i % 4 == 2:
+                frame[f"qty_{i}"] = rng.integers(0, 1000, rows)
+            else:
+                frame[f"date_{i}"] = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D')
+        df = pd.DataFrame(frame)
+
+        start = time.perf_counter()
+        expected = legacy_rows(df, mode)
+        per_cell = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = staging_helper.dataframe_to_rows(df)
+        columnar = time.perf_counter() - start
+
+        assert actual[::997] == expected[::997]
+        print(f"✅ 50k x 40 chunk ({mode}): per-cell {per_cell:.2f}s, columnar {columnar:.2f}s "
+              f"(~{per_cell / columnar:.0f}x)")
+        assert columnar < per_cell
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
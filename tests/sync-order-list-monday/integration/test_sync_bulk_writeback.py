@@ -0,0 +1,130 @@
+"""
+Integration Test: Set-Based monday_item_id Write-Back
+=====================================================
+Purpose: Validate that a true batch writes monday_item_ids back to FACT_ORDER_LIST with
+         one temp-table load + one UPDATE...FROM instead of one UPDATE per record_uuid
+Requirement: Set-based bulk write-back of monday_item_ids via table-valued staging
+
+Test Scenarios:
+- All (record_uuid, monday_item_id, api_*) rows are loaded with a single fast_executemany call
+- Exactly one UPDATE statement is issued against the headers table per batch
+- Statement count does not grow with batch size
+- API logging columns are overwritten as captured (NULLs included) only for rows with logging data
+
+Success Criteria:
+- 1 executemany + 1 UPDATE for batches of 5 and 500 records
+"""
+
+import sys
+import logging
+from pathlib import Path
+from datetime import datetime
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from src.pipelines.sync_order_list.sync_engine import SyncEngine
+
+
+class RecordingCursor:
+    """pyodbc cursor double that records statements"""
+
+    def __init__(self, log):
+        self.log = log
+        self.fast_executemany = False
+        self.rowcount = -1
+
+    def execute(self, sql, *params):
+        self.log.append(('execute', ' '.join(sql.split())))
+        if sql.strip().startswith('UPDATE'):
+            self.rowcount = self.log.pending_rows
+
+    def executemany(self, sql, rows):
+        rows = list(rows)
+        self.log.pending_rows = len(rows)
+        self.log.loaded_rows = rows
+        self.log.append(('executemany', ' '.join(sql.split()), len(rows), self.fast_executemany))
+
+
+class StatementLog(list):
+    pending_rows = 0
+    loaded_rows = []
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.statements = StatementLog()
+
+    def cursor(self):
+        return RecordingCursor(self.statements)
+
+
+@pytest.fixture
+def engine():
+    sync_engine = SyncEngine.__new__(SyncEngine)
+    sync_engine.logger = logging.getLogger(__name__)
+    sync_engine.headers_table = 'FACT_ORDER_LIST'
+    return sync_engine
+
+
+class TestBulkItemIdWriteBack:
+
+    @pytest.mark.parametrize("batch_size", [5, 500])
+    def test_single_set_based_update_per_batch(self, engine, batch_size):
+        logging_data = {
+            'api_operation_type': 'batch_create_items',
+            'api_request_payload': '{}',
+            'api_response_payload': '{}',
+            'api_request_timestamp': datetime.utcnow(),
+            'api_response_timestamp': datetime.utcnow(),
+            'api_status': 'SUCCESS'
+        }
+        rows = [(f"00000000-0000-0000-0000-{i:012d}", 9000000000 + i, logging_data) for i in range(batch_size)]
+        connection = RecordingConnection()
+
+        updated = engine._bulk_update_headers_with_item_ids_conn(rows, connection)
+
+        bulk_loads = [s for s in connection.statements if s[0] == 'executemany']
+        updates = [s for s in connection.statements if s[0] == 'execute' and s[1].startswith('UPDATE')]
+        assert updated == batch_size
+        assert len(bulk_loads) == 1 and bulk_loads[0][2] == batch_size and bulk_loads[0][3] is True
+        assert len(updates) == 1 and 'FROM [FACT_ORDER_LIST] h INNER JOIN #monday_item_id_writeback' in updates[0][1]
+        print(f"✅ {batch_size} headers written back with {len(connection.statements)} statements")
+
+    def test_api_logging_overwritten_only_when_captured(self, engine):
+        logging_data = {'api_operation_type': 'batch_create_items', 'api_status': 'SUCCESS',
+                        'api_request_payload': None}
+        rows = [("00000000-0000-0000-0000-000000000001", 9000000001, logging_data),
+                ("00000000-0000-0000-0000-000000000002", 9000000002, None)]
+        connection = RecordingConnection()
+
+        engine._bulk_update_headers_with_item_ids_conn(rows, connection)
+
+        with_logging, without_logging = connection.statements.loaded_rows
+        assert with_logging[2] == 1 and with_logging[3] is None, "NULL payload is written, not kept"
+        assert without_logging[2] == 0
+        update = next(s[1] for s in connection.statements if s[0] == 'execute' and s[1].startswith('UPDATE'))
+        assert 'COALESCE' not in update
+        assert ("h.[api_request_payload] = CASE WHEN t.[has_api_logging] = 1 "
+                "THEN t.[api_request_payload] ELSE h.[api_request_payload] END") in update
+
+    def test_empty_batch_issues_no_statements(self, engine):
+        connection = RecordingConnection()
+        assert engine._bulk_update_headers_with_item_ids_conn([], connection) == 0
+        assert connection.statements == []
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
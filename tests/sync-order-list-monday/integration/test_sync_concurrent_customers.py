@@ -0,0 +1,131 @@
+"""
+Integration Test: Concurrent Per-Customer Sync Workers
+======================================================
+Purpose: Validate that per-customer sync can run K customers at once while keeping
+         per-customer isolation and the enhanced_results / executive summary structure
+Requirement: Concurrent per-customer sync workers with isolated group creation
+
+Test Scenarios:
+- customer_workers > 1 overlaps customers on worker threads (small customers don't wait)
+- per_customer_results are merged in customer order with the sequential totals
+- One failing customer does not affect the others
+- Each worker thread gets its own Monday.com event loop; connection stats are shared
+
+Success Criteria:
+- 8 customers x 50ms with 4 workers finish in well under the sequential 400ms
+- Totals identical for customer_workers=1 and customer_workers=4
+"""
+
+import sys
+import time
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from src.pipelines.sync_order_list.sync_engine import SyncEngine
+from src.pipelines.sync_order_list.monday_api_client import MondayAPIClient
+
+CUSTOMERS = [f"CUSTOMER_{i}" for i in range(8)]
+
+
+class FakeConfig:
+    max_concurrent_customers = 1
+
+
+@pytest.fixture
+def engine(tmp_path):
+    sync_engine = SyncEngine.__new__(SyncEngine)
+    sync_engine.logger = logging.getLogger(__name__)
+    sync_engine.config = FakeConfig()
+    sync_engine._generate_sync_id = lambda: "SYNC-TEST"
+    sync_engine._create_sync_folder_structure = lambda sync_id: tmp_path
+    sync_engine._persist_executive_summary = lambda *args, **kwargs: None
+    sync_engine._open_monday_session = lambda dry_run: False
+    sync_engine._get_customers_with_pending_records = lambda action_types: list(CUSTOMERS)
+    sync_engine.worker_threads = set()
+
+    def fake_customer_sync(current_customer, dry_run, **kwargs):
+        sync_engine.worker_threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        if current_customer == "CUSTOMER_3":
+            return {'success': False, 'status': 'GROUP_CREATION_FAILED', 'records_synced': 0, 'execution_time': 0.05}
+        if current_customer == "CUSTOMER_5":
+            return {'success': True, 'status': 'NO_RECORDS', 'records_synced': 0, 'execution_time': 0}
+        return {'success': True, 'status': 'SUCCESS', 'records_synced': 10, 'execution_time': 0.05}
+
+    sync_engine._sync_customer_isolated = fake_customer_sync
+    return sync_engine
+
+
+class TestConcurrentCustomerWorkers:
+
+    def test_workers_overlap_customers(self, engine):
+        start = time.perf_counter()
+        results = engine.run_sync_per_customer_sequential(customer_workers=4)
+        elapsed = time.perf_counter() - start
+
+        assert results['processing_mode'] == 'PER_CUSTOMER_CONCURRENT'
+        assert elapsed < 0.3, f"8 customers on 4 workers took {elapsed:.2f}s"
+        assert len(engine.worker_threads) > 1
+        print(f"✅ 8 customers x 50ms on 4 workers: {elapsed:.3f}s (sequential ~0.40s)")
+
+    def test_concurrent_results_match_sequential(self, engine):
+        sequential = engine.run_sync_per_customer_sequential(customer_workers=1)
+        concurrent = engine.run_sync_per_customer_sequential(customer_workers=4)
+
+        assert sequential['processing_mode'] == 'PER_CUSTOMER_SEQUENTIAL'
+        assert list(concurrent['per_customer_results']) == CUSTOMERS
+        for key in ('total_synced', 'successful_customers', 'failed_customers', 'success', 'status'):
+            assert concurrent[key] == sequential[key]
+        assert concurrent['total_synced'] == 60
+        assert concurrent['successful_customers'] == 6
+        assert concurrent['failed_customers'] == 1
+
+    def test_worker_threads_get_own_monday_event_loop(self):
+        client = MondayAPIClient.__new__(MondayAPIClient)
+        client.logger = logging.getLogger(__name__)
+        client.pool_limit = 10
+        client.pool_limit_per_host = 3
+        client._thread_state = threading.local()
+        client._session_lock = threading.Lock()
+        client._stats_lock = threading.Lock()
+        client._open_sessions = 0
+        client.connection_stats = client._new_connection_stats()
+
+        client.open_session()
+        main_loop = client._loop
+        client.connection_stats['requests'] = 5
+        worker_loops = []
+
+        def worker():
+            client.open_session()
+            worker_loops.append(client._loop)
+            client.close_session()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert worker_loops[0] is not main_loop
+        assert client._loop is main_loop, "worker close must not close the main thread's loop"
+        assert client.close_session()['requests'] == 5, "worker open must not reset shared stats"
+        assert not client.session_open
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,113 @@
+"""
+Integration Test: Pipelined Concurrent Batch Execution
+======================================================
+Purpose: Validate SyncEngine's pipelined executor (N Monday.com batches in flight while
+         earlier batches write back to SQL Server)
+Requirement: Pipelined concurrent batch execution in SyncEngine.run_sync
+
+Test Scenarios:
+- Write-backs are applied strictly in batch order (per-customer ordering holds)
+- A failing batch fails on its own without affecting other batches
+- Back-pressure bounds the number of dispatched-but-unwritten batches
+- Wall-clock time ≈ API time / concurrency
+
+Success Criteria:
+- 100% of write-backs in batch order
+- Exactly 1 failed batch for 1 injected API failure
+- Pipelined run >= 2x faster than the sequential API time with concurrency 4
+"""
+
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from src.pipelines.sync_order_list.sync_engine import SyncEngine
+
+API_LATENCY_SECONDS = 0.1
+
+
+class FakeMondayClient:
+    """Monday.com client double: fixed latency, tracks in-flight calls, fails one record_uuid"""
+
+    def __init__(self, failing_uuid: str):
+        self.failing_uuid = failing_uuid
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def run_coroutine(self, coroutine):
+        return asyncio.run(coroutine)
+
+    async def execute_async(self, operation_type, records, dry_run=False):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(API_LATENCY_SECONDS)
+            if records[0]['record_uuid'] == self.failing_uuid:
+                raise RuntimeError("Simulated Monday.com failure")
+            return {'success': True, 'monday_ids': [1000 + i for i in range(len(records))]}
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def engine():
+    """SyncEngine with database write-back replaced by in-memory recorders"""
+    sync_engine = SyncEngine.__new__(SyncEngine)
+    sync_engine.logger = logging.getLogger(__name__)
+    sync_engine.monday_client = FakeMondayClient(failing_uuid="uuid-7")
+    sync_engine.written_batches = []
+
+    def write_result(batch_records, batch_number, api_result, api_duration, createitem_mode, batch_start_time):
+        sync_engine.written_batches.append(batch_number)
+        return {'success': True, 'batch_number': batch_number, 'records_processed': len(batch_records)}
+
+    def fail_batch(batch_records, batch_number, error, batch_start_time, dry_run):
+        sync_engine.written_batches.append(batch_number)
+        return {'success': False, 'batch_number': batch_number, 'records_processed': 0, 'error': str(error)}
+
+    sync_engine._write_true_batch_result = write_result
+    sync_engine._fail_true_batch = fail_batch
+    return sync_engine
+
+
+class TestPipelinedBatchExecution:
+
+    def test_pipelined_ordering_isolation_and_speedup(self, engine):
+        batches = [[{'record_uuid': f"uuid-{i}", 'CUSTOMER NAME': 'GREYSON'}] for i in range(20)]
+        concurrency = 4
+
+        start = time.time()
+        results = engine.monday_client.run_coroutine(
+            engine._execute_true_batches_pipelined(batches, 'batch', concurrency=concurrency, max_pending_writes=2)
+        )
+        elapsed = time.time() - start
+
+        sequential_api_time = len(batches) * API_LATENCY_SECONDS
+        assert engine.written_batches == list(range(1, 21)), "Write-backs must be applied in batch order"
+        assert [r['batch_number'] for r in results] == list(range(1, 21))
+        assert sum(1 for r in results if not r['success']) == 1, "Only the injected failure may fail"
+        assert engine.monday_client.max_in_flight <= concurrency
+        assert elapsed < sequential_api_time / 2, f"Expected pipelined speed-up, took {elapsed:.2f}s"
+        print(f"✅ Pipelined: {elapsed:.2f}s vs {sequential_api_time:.2f}s sequential API time "
+              f"(max in flight: {engine.monday_client.max_in_flight})")
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,149 @@
+"""
+Integration Test: Non-Blocking Retry Scheduler
+==============================================
+Purpose: Validate that retry_failed_records schedules ERROR records with a persisted
+         next_retry_at and resets due records set-based, without sleeping
+Requirement: Non-blocking retry scheduler to replace sleep-per-record in retry_failed_records
+
+Test Scenarios:
+- No time.sleep calls, regardless of candidate count
+- Unscheduled records get a backoff by error category (APILoggingArchiver.extract_error_category)
+- Statement count is constant: 1 SELECT + 1 schedule UPDATE + 1 reset UPDATE
+- Records not yet due are reported as deferred
+
+Success Criteria:
+- 500 ERROR records processed with 3 statements and zero sleeps
+"""
+
+import sys
+import json
+import logging
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from src.pipelines.sync_order_list import sync_engine as sync_engine_module
+from src.pipelines.sync_order_list.sync_engine import SyncEngine, StatementCache
+
+RATE_LIMIT_PAYLOAD = json.dumps({'errors': [{'message': 'Rate limit exceeded'}]})
+DROPDOWN_PAYLOAD = json.dumps({'errors': [{'message': 'ColumnValueException: label not found'}]})
+
+
+class RetryCursor:
+    """pyodbc cursor double: serves ERROR candidates, records statements"""
+
+    def __init__(self, candidates, due_count):
+        self.candidates = candidates
+        self.due_count = due_count
+        self.statements = []
+        self.rowcount = -1
+
+    def execute(self, sql, *params):
+        text = ' '.join(sql.split())
+        self.statements.append((text, params))
+        self.rowcount = self.due_count if text.startswith('UPDATE [') else -1
+        return self
+
+    def fetchall(self):
+        return self.candidates
+
+    def close(self):
+        pass
+
+
+class RetryConnection:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    sync_engine = SyncEngine.__new__(SyncEngine)
+    sync_engine.logger = logging.getLogger(__name__)
+    sync_engine.headers_table = 'FACT_ORDER_LIST'
+    sync_engine.db_key = 'orders'
+    sync_engine.config = None
+    sync_engine.toml_config = {}
+    sync_engine.sql_cache = StatementCache()
+    sync_engine._generate_sync_id = lambda: "SYNC-TEST"
+    sync_engine._create_sync_folder_structure = lambda sync_id: tmp_path
+    sync_engine._persist_executive_summary = lambda *args, **kwargs: None
+    monkeypatch.setattr(sync_engine_module.time, 'sleep',
+                        lambda seconds: pytest.fail(f"retry pass slept {seconds}s"))
+    return sync_engine
+
+
+def make_candidates(count):
+    return [(f"00000000-0000-0000-0000-{i:012d}", 'GREYSON', f"PO-{i}", i % 3,
+             RATE_LIMIT_PAYLOAD if i % 2 else DROPDOWN_PAYLOAD, None)
+            for i in range(count)]
+
+
+class TestRetryScheduler:
+
+    def test_retry_pass_is_set_based_and_never_sleeps(self, engine, monkeypatch):
+        cursor = RetryCursor(make_candidates(500), due_count=200)
+        monkeypatch.setattr(sync_engine_module.db, 'get_connection', lambda *args, **kwargs: RetryConnection(cursor))
+
+        stats = engine.retry_failed_records(max_retries=3)
+
+        assert stats['success']
+        assert len(cursor.statements) == 3, "1 SELECT + 1 schedule UPDATE + 1 reset UPDATE"
+        schedule_sql, schedule_params = cursor.statements[1]
+        assert 'OPENJSON(?)' in schedule_sql and 'next_retry_at' in schedule_sql
+        assert len(json.loads(schedule_params[0])) == 500
+        assert 'next_retry_at <= GETUTCDATE()' in cursor.statements[2][0]
+        assert stats['records_scheduled'] == 500
+        assert stats['records_reset'] == 200
+        assert stats['records_deferred'] == 300
+        assert stats['error_categories'] == {'RATE_LIMIT': 250, 'DROPDOWN_VALUE_MISSING': 250}
+        print(f"✅ 500 ERROR records: {len(cursor.statements)} statements, "
+              f"{stats['execution_time_seconds']:.3f}s, no sleeps")
+
+    def test_already_scheduled_records_are_not_rescheduled(self, engine, monkeypatch):
+        candidates = [(uuid, customer, order, retry, payload, '2025-08-20 10:00:00')
+                      for uuid, customer, order, retry, payload, _ in make_candidates(10)]
+        cursor = RetryCursor(candidates, due_count=10)
+        monkeypatch.setattr(sync_engine_module.db, 'get_connection', lambda *args, **kwargs: RetryConnection(cursor))
+
+        stats = engine.retry_failed_records()
+
+        assert len(cursor.statements) == 2, "No schedule UPDATE when nothing is unscheduled"
+        assert stats['records_reset'] == 10 and stats['records_deferred'] == 0
+
+    def test_backoff_by_error_category(self, engine):
+        assert engine._get_retry_delay_seconds('UNKNOWN_ERROR', 0) == 2
+        assert engine._get_retry_delay_seconds('RATE_LIMIT', 1) == 120
+        assert engine._get_retry_delay_seconds('AUTH_ERROR', 5) == 3600, "Capped at max_delay_seconds"
+        engine.toml_config = {'sync': {'retry_schedule': {'category_delay_seconds': {'RATE_LIMIT': 30.0}}}}
+        assert engine._get_retry_delay_seconds('RATE_LIMIT', 0) == 30
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))
@@ -0,0 +1,151 @@
+"""
+Integration Test / Benchmark: Parameterized Hot-Path SQL in SyncEngine
+======================================================================
+Purpose: Show that SyncEngine hot paths send stable, parameterized SQL text so SQL Server
+         compiles one plan per statement instead of one ad-hoc plan per record
+Requirement: Parameterized, plan-cache-friendly SQL in sync_engine hot paths
+
+Method:
+- A dry-run mock cursor records every statement; each distinct SQL text counts as one
+  compile (one plan cache entry)
+- The "ad-hoc" baseline inlines the parameter values into the text, which is what the
+  previous f-string SQL sent to the server
+
+Success Criteria:
+- Distinct statement texts stay constant as the number of records grows
+- Ad-hoc baseline compiles grow linearly with the number of records
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+import pytest
+
+# ─────────────────── Repository Root & Utils Import ───────────────────
+def find_repo_root() -> Path:
+    """Find repository root by looking for pipelines/utils folder"""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current.parent.parent / "pipelines" / "utils").exists():
+            return current.parent.parent
+        current = current.parent
+    raise RuntimeError("Could not find repository root with utils/ folder")
+
+repo_root = find_repo_root()
+sys.path.insert(0, str(repo_root))
+
+from src.pipelines.sync_order_list import sync_engine as sync_engine_module
+from src.pipelines.sync_order_list.sync_engine import SyncEngine, StatementCache
+
+
+def inline_params(sql: str, params) -> str:
+    """Emulate the previous f-string SQL: literal values embedded in the statement text"""
+    for value in params:
+        sql = sql.replace('?', f"'{value}'", 1)
+    return sql
+
+
+class CompileCountingCursor:
+    """Dry-run cursor: counts plan-cache entries (distinct statement texts)"""
+
+    def __init__(self, stats, inline=False):
+        self.stats = stats
+        self.inline = inline
+        self.description = [('line_uuid',), ('record_uuid',)]
+        self.rowcount = 1
+
+    def execute(self, sql, *params):
+        text = inline_params(sql, params) if self.inline else sql
+        self.stats['executions'] += 1
+        self.stats['plans'].add(' '.join(text.split()))
+        return self
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class MockConnection:
+    def __init__(self, stats, inline=False):
+        self._cursor = CompileCountingCursor(stats, inline)
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    sync_engine = SyncEngine.__new__(SyncEngine)
+    sync_engine.logger = logging.getLogger(__name__)
+    sync_engine.headers_table = 'FACT_ORDER_LIST'
+    sync_engine.lines_table = 'ORDER_LIST_LINES'
+    sync_engine.db_key = 'orders'
+    sync_engine.environment = 'development'
+    sync_engine.toml_config = {}
+    sync_engine.sql_cache = StatementCache()
+    return sync_engine
+
+
+def run_hot_paths(engine, monkeypatch, record_count: int, inline: bool) -> dict:
+    stats = {'executions': 0, 'plans': set()}
+    connection = MockConnection(stats, inline)
+    monkeypatch.setattr(sync_engine_module.db, 'get_connection', lambda *args, **kwargs: connection, raising=False)
+
+    logging_data = {'api_operation_type': 'create_subitems', 'api_request_payload': '{}',
+                    'api_response_payload': '{}', 'api_request_timestamp': None,
+                    'api_response_timestamp': None, 'api_status': 'SUCCESS'}
+    for i in range(record_count):
+        record_uuid = f"00000000-0000-0000-0000-{i:012d}"
+        lines = [{'line_uuid': f"10000000-0000-0000-{i:04d}-{n:012d}"} for n in range(4)]
+        monkeypatch.setattr(engine, '_get_lines_by_record_uuid', lambda _uuid, lines=lines: lines)
+
+        engine._update_headers_delta_with_item_ids_conn(record_uuid, [str(9000000000 + i)], connection)
+        engine._update_sync_status_only_conn(record_uuid, connection)
+        engine._get_lines_by_record_uuid_conn(record_uuid, connection)
+        engine._update_lines_delta_with_subitem_ids(record_uuid, [str(8000000000 + i * 10 + n) for n in range(4)],
+                                                    connection, logging_data)
+    engine._update_batch_records_to_failed([f"uuid-{i}" for i in range(record_count)], "error", {'success': False})
+    return stats
+
+
+class TestStatementCacheBenchmark:
+
+    @pytest.mark.parametrize("record_count", [10, 200])
+    def test_compile_counts_constant_with_parameterized_sql(self, engine, monkeypatch, record_count):
+        parameterized = run_hot_paths(engine, monkeypatch, record_count, inline=False)
+        engine.sql_cache = StatementCache()
+        adhoc = run_hot_paths(engine, monkeypatch, record_count, inline=True)
+
+        assert parameterized['executions'] == adhoc['executions']
+        assert len(parameterized['plans']) == 5, "One plan per hot-path statement"
+        assert len(adhoc['plans']) >= 4 * record_count
+        print(f"✅ {record_count} records / {parameterized['executions']} statements: "
+              f"{len(parameterized['plans'])} compiled plans parameterized vs {len(adhoc['plans'])} ad-hoc "
+              f"(statement cache: {engine.sql_cache.get_stats()})")
+
+    def test_statement_cache_builds_each_statement_once(self):
+        cache = StatementCache()
+        builds = []
+        for _ in range(3):
+            cache.get(('stmt', 'T'), lambda: builds.append(1) or "SELECT 1")
+        assert len(builds) == 1
+        assert cache.get_stats() == {'statements': 1, 'hits': 2, 'misses': 1}
+
+
+if __name__ == "__main__":
+    exit(pytest.main([__file__, "-v", "-s", "--disable-warnings"]))